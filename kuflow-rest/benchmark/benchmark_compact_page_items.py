@@ -0,0 +1,116 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+"""Memory retained by the page items of a large listing, as generated models and as compact models.
+
+Usage:
+    python benchmark/benchmark_compact_page_items.py [--pages 20] [--items 1000] [--rounds 3]
+
+``--pages`` ProcessItemPage are deserialized, as returned by ``find_process_items(size=1000)``, and kept, as an
+application iterating a whole listing would do. The retained memory is the one allocated by the deserialization that
+is still referenced by the pages, the strings of the parsed JSON are not included. The time is the one of the best
+round.
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+
+from kuflow_rest import models
+from kuflow_rest._serialization import KuFlowDeserializer
+
+
+CLIENT_MODELS = {name: getattr(models, name) for name in models.__all__ if isinstance(getattr(models, name), type)}
+
+
+def process_item(index: int) -> dict:
+    return {
+        "id": f"00000000-0000-0000-0000-{index:012d}",
+        "type": "TASK",
+        "processId": "11111111-1111-1111-1111-111111111111",
+        "ownerId": "22222222-2222-2222-2222-222222222222",
+        "tenantId": "33333333-3333-3333-3333-333333333333",
+        "createdBy": "22222222-2222-2222-2222-222222222222",
+        "createdAt": "2024-06-14T10:20:30.123Z",
+        "lastModifiedBy": "22222222-2222-2222-2222-222222222222",
+        "lastModifiedAt": "2024-06-14T10:20:30.123Z",
+        "processItemDefinitionRef": {"id": "44444444-4444-4444-4444-444444444444", "version": "1", "code": "TASK"},
+        "task": {"state": "READY"},
+    }
+
+
+def measure(deserializer: KuFlowDeserializer, payloads: list[str], rounds: int) -> tuple[float, int, list]:
+    best = float("inf")
+    for _ in range(rounds):
+        documents = [json.loads(payload) for payload in payloads]
+        start = time.perf_counter()
+        pages = [deserializer._deserialize("ProcessItemPage", document) for document in documents]
+        best = min(best, time.perf_counter() - start)
+
+    documents = [json.loads(payload) for payload in payloads]
+    gc.collect()
+    tracemalloc.start()
+    pages = [deserializer._deserialize("ProcessItemPage", document) for document in documents]
+    del documents
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return best, retained, pages
+
+
+def main(pages: int, items: int, rounds: int) -> None:
+    payloads = [
+        json.dumps(
+            {
+                "metadata": {"size": items, "page": page, "totalElements": pages * items, "totalPages": pages},
+                "content": [process_item(page * items + i) for i in range(items)],
+            }
+        )
+        for page in range(pages)
+    ]
+
+    eager, eager_retained, expected = measure(KuFlowDeserializer(CLIENT_MODELS), payloads, rounds)
+    compact, compact_retained, actual = measure(
+        KuFlowDeserializer(CLIENT_MODELS, compact_page_items=True), payloads, rounds
+    )
+    assert actual[0].as_dict() == expected[0].as_dict(), "Compact pages differ from the generated ones"
+
+    total = pages * items
+    print(f"pages={pages} items={items} rounds={rounds} (best round)")
+    print(f"{'page items':>16} {'ms':>10} {'retained KB':>12} {'bytes/item':>12}")
+    for name, best, retained in [("generated", eager, eager_retained), ("compact", compact, compact_retained)]:
+        print(f"{name:>16} {best * 1000:>10.1f} {retained // 1024:>12} {retained // total:>12}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    main(args.pages, args.items, args.rounds)
@@ -0,0 +1,113 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Deserialization time of large KuFlow responses with the generic and the compiled deserializer.
+
+Usage:
+    python benchmark/benchmark_deserializer.py [--items 1000] [--rounds 10]
+
+Two payloads are measured:
+    * ProcessItemPage: a page of process items.
+    * ProcessItem[]: process items with task data, context data and logs.
+"""
+
+import argparse
+import json
+import time
+
+from kuflow_rest import Deserializer, models
+from kuflow_rest._serialization import KuFlowDeserializer
+
+
+CLIENT_MODELS = {name: getattr(models, name) for name in models.__all__ if isinstance(getattr(models, name), type)}
+
+
+def process_item(index: int, with_task_data: bool) -> dict:
+    item = {
+        "id": f"00000000-0000-0000-0000-{index:012d}",
+        "type": "TASK",
+        "processId": "11111111-1111-1111-1111-111111111111",
+        "ownerId": "22222222-2222-2222-2222-222222222222",
+        "tenantId": "33333333-3333-3333-3333-333333333333",
+        "createdBy": "22222222-2222-2222-2222-222222222222",
+        "createdAt": "2024-06-14T10:20:30.123Z",
+        "lastModifiedBy": "22222222-2222-2222-2222-222222222222",
+        "lastModifiedAt": "2024-06-14T10:20:30.123Z",
+        "processItemDefinitionRef": {"id": "44444444-4444-4444-4444-444444444444", "version": "1", "code": "TASK"},
+        "task": {"state": "READY"},
+    }
+    if with_task_data:
+        value = {f"field{i}": {"text": "x" * 20, "number": i, "list": [1, 2, 3]} for i in range(20)}
+        item["task"]["data"] = {"valid": True, "value": value}
+        item["task"]["contextData"] = {"valid": True, "value": {"context": "value"}}
+        item["task"]["logs"] = [
+            {
+                "id": f"55555555-5555-5555-5555-{i:012d}",
+                "timestamp": "2024-06-14T10:20:30.123Z",
+                "message": "Log message",
+                "level": "INFO",
+            }
+            for i in range(5)
+        ]
+
+    return item
+
+
+def measure(deserializer: Deserializer, target: str, payload: str, rounds: int) -> tuple[float, object]:
+    best = float("inf")
+    result = None
+    for _ in range(rounds):
+        data = json.loads(payload)
+        start = time.perf_counter()
+        result = deserializer._deserialize(target, data)
+        best = min(best, time.perf_counter() - start)
+
+    return best, result
+
+
+def main(items: int, rounds: int) -> None:
+    page = {
+        "metadata": {"size": items, "page": 0, "totalElements": items, "totalPages": 1},
+        "content": [process_item(i, with_task_data=False) for i in range(items)],
+    }
+    payloads = {
+        "ProcessItemPage": ("ProcessItemPage", json.dumps(page)),
+        "ProcessItem[]": ("[ProcessItem]", json.dumps([process_item(i, with_task_data=True) for i in range(items)])),
+    }
+
+    print(f"items={items} rounds={rounds} (best round)")
+    print(f"{'payload':>16} {'generic ms':>12} {'compiled ms':>12} {'speedup':>8}")
+    for name, (target, payload) in payloads.items():
+        generic, expected = measure(Deserializer(CLIENT_MODELS), target, payload, rounds)
+        compiled, actual = measure(KuFlowDeserializer(CLIENT_MODELS), target, payload, rounds)
+        assert actual == expected, "Compiled deserializer output differs from the generic one"
+        print(f"{name:>16} {generic * 1000:>12.1f} {compiled * 1000:>12.1f} {generic / compiled:>7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    main(args.items, args.rounds)
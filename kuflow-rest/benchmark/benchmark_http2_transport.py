@@ -0,0 +1,254 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+"""Latency and connections of the HTTP/1.1 transports and the HTTP/2 httpx transport under concurrent requests.
+
+Usage:
+    python benchmark/benchmark_http2_transport.py [--requests 2000] [--concurrency 50] [--latency 0.01] [--rounds 3]
+
+Two local servers stand in for the KuFlow API and answer ``retrieve_tenant`` after ``--latency`` seconds: an aiohttp
+server for HTTP/1.1 and an HTTP/2 server built on the ``h2`` package. The HTTP/2 server speaks clear text HTTP/2
+(h2c), so the httpx transports are created with ``http1=False`` to use HTTP/2 with prior knowledge, over TLS it is
+negotiated with ALPN. Sync clients send the requests from ``--concurrency`` threads, async clients from as many
+tasks. The connections are the ones accepted by the server.
+
+It requires the ``http2`` and ``aio`` extras.
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+import h2.config
+import h2.connection
+import h2.events
+import h2.exceptions
+from aiohttp import web
+
+from kuflow_rest import HttpxTransport, KuBotTokenCredential, KuFlowRestClient, PooledRequestsTransport
+from kuflow_rest.aio import AsyncHttpxTransport, PooledAioHttpTransport
+from kuflow_rest.aio import KuFlowRestClient as AsyncKuFlowRestClient
+
+
+# Smaller than the initial HTTP/2 flow control window and frame size, so responses are sent in a single frame
+TENANT = json.dumps({"id": "11111111-1111-1111-1111-111111111111", "name": "Tenant", "plan": "FREE"}).encode()
+
+
+class Server:
+    """Server running in its own thread and event loop."""
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+        self.connections = 0
+        self.port = 0
+        self._loop = asyncio.new_event_loop()
+        self._started = threading.Event()
+
+    @property
+    def endpoint(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def start(self) -> "Server":
+        threading.Thread(target=self._run, daemon=True).start()
+        self._started.wait()
+        return self
+
+    def _run(self) -> None:
+        self._loop.run_until_complete(self._start())
+        self._started.set()
+        self._loop.run_forever()
+
+    async def _start(self) -> None:
+        raise NotImplementedError
+
+
+class Http1Server(Server):
+    async def _start(self) -> None:
+        peers = set()
+
+        async def retrieve_tenant(request: web.Request):
+            peer = request.transport.get_extra_info("peername")
+            if peer not in peers:
+                peers.add(peer)
+                self.connections += 1
+            await asyncio.sleep(self.latency)
+            return web.Response(body=TENANT, content_type="application/json")
+
+        app = web.Application()
+        app.router.add_get("/v2024-06-14/tenants/{id}", retrieve_tenant)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0, backlog=1024)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+
+class Http2Protocol(asyncio.Protocol):
+    """HTTP/2 connection that answers every request with the tenant."""
+
+    def __init__(self, server: "Http2Server") -> None:
+        self._server = server
+        self._connection = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False))
+        self._transport: Any = None
+
+    def connection_made(self, transport) -> None:
+        self._server.connections += 1
+        self._transport = transport
+        self._connection.initiate_connection()
+        self._flush()
+
+    def data_received(self, data: bytes) -> None:
+        try:
+            events = self._connection.receive_data(data)
+        except h2.exceptions.ProtocolError:
+            self._flush()
+            self._transport.close()
+            return
+
+        loop = asyncio.get_running_loop()
+        for event in events:
+            if isinstance(event, h2.events.RequestReceived):
+                loop.call_later(self._server.latency, self._respond, event.stream_id)
+            elif isinstance(event, h2.events.ConnectionTerminated):
+                self._transport.close()
+        self._flush()
+
+    def _respond(self, stream_id: int) -> None:
+        headers = [(":status", "200"), ("content-type", "application/json"), ("content-length", str(len(TENANT)))]
+        try:
+            self._connection.send_headers(stream_id, headers)
+            self._connection.send_data(stream_id, TENANT, end_stream=True)
+        except h2.exceptions.ProtocolError:
+            # Stream reset or connection closed by the client
+            return
+        self._flush()
+
+    def _flush(self) -> None:
+        data = self._connection.data_to_send()
+        if data and not self._transport.is_closing():
+            self._transport.write(data)
+
+
+class Http2Server(Server):
+    async def _start(self) -> None:
+        server = await self._loop.create_server(lambda: Http2Protocol(self), "127.0.0.1", 0, backlog=1024)
+        self.port = server.sockets[0].getsockname()[1]
+
+
+def run_sync(client: KuFlowRestClient, requests: int, concurrency: int) -> list[float]:
+    def call(index: int) -> float:
+        start = time.perf_counter()
+        client.tenant.retrieve_tenant(str(index))
+        return time.perf_counter() - start
+
+    with client, ThreadPoolExecutor(concurrency) as executor:
+        return list(executor.map(call, range(requests)))
+
+
+async def run_async(client: AsyncKuFlowRestClient, requests: int, concurrency: int) -> list[float]:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def call(index: int) -> float:
+        async with semaphore:
+            start = time.perf_counter()
+            await client.tenant.retrieve_tenant(str(index))
+            return time.perf_counter() - start
+
+    async with client:
+        return await asyncio.gather(*(call(index) for index in range(requests)))
+
+
+def measure(run: Callable[[], list[float]], server: Server, rounds: int) -> tuple[float, float, float, int]:
+    best = None
+    for _ in range(rounds):
+        server.connections = 0
+        start = time.perf_counter()
+        latencies = sorted(run())
+        result = (
+            time.perf_counter() - start,
+            statistics.median(latencies),
+            latencies[int(len(latencies) * 0.99) - 1],
+            server.connections,
+        )
+        if best is None or result[0] < best[0]:
+            best = result
+
+    return best
+
+
+def main(requests: int, concurrency: int, latency: float, rounds: int) -> None:
+    http1_server = Http1Server(latency).start()
+    http2_server = Http2Server(latency).start()
+
+    def client(client_class, server: Server, transport):
+        return client_class(
+            credential=KuBotTokenCredential("TOKEN", 0),
+            endpoint=server.endpoint,
+            allow_insecure_connection=True,
+            transport=transport,
+        )
+
+    def sync_case(server: Server, transport_factory: Callable[[], Any]):
+        return lambda: run_sync(client(KuFlowRestClient, server, transport_factory()), requests, concurrency), server
+
+    def async_case(server: Server, transport_factory: Callable[[], Any]):
+        def run():
+            return asyncio.run(
+                run_async(client(AsyncKuFlowRestClient, server, transport_factory()), requests, concurrency)
+            )
+
+        return run, server
+
+    cases = {
+        "requests (HTTP/1.1)": sync_case(
+            http1_server, lambda: PooledRequestsTransport(connection_pool_size_per_host=concurrency)
+        ),
+        "httpx (HTTP/2)": sync_case(http2_server, lambda: HttpxTransport(http1=False)),
+        "aiohttp (HTTP/1.1)": async_case(http1_server, PooledAioHttpTransport),
+        "httpx async (HTTP/2)": async_case(http2_server, lambda: AsyncHttpxTransport(http1=False)),
+    }
+
+    print(f"requests={requests} concurrency={concurrency} latency={latency * 1000:.0f}ms rounds={rounds} (best round)")
+    print(f"{'transport':>22} {'total s':>8} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'connections':>12}")
+    for name, (run, server) in cases.items():
+        total, p50, p99, connections = measure(run, server, rounds)
+        print(
+            f"{name:>22} {total:>8.2f} {requests / total:>8.0f} {p50 * 1000:>8.1f} {p99 * 1000:>8.1f} {connections:>12}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.01)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    main(args.requests, args.concurrency, args.latency, args.rounds)
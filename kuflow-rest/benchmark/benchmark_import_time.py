@@ -0,0 +1,96 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+"""Import time of the kuflow_rest packages, as reported by ``python -X importtime``.
+
+Usage:
+    python benchmark/benchmark_import_time.py [--rounds 5] [--statement "import kuflow_temporal_common"]
+
+Every statement runs in a new interpreter, the time is the cumulative one of the modules it imports, without the
+ones imported by the interpreter startup. Statements of other packages of this repository can be added with
+``--statement``, with their sources in the PYTHONPATH.
+"""
+
+import argparse
+import subprocess
+import sys
+
+
+STATEMENTS = [
+    "import kuflow_rest",
+    "import kuflow_rest.models",
+    "import kuflow_rest.operations",
+    "import kuflow_rest.aio",
+    "from kuflow_rest.models import ProcessItem",
+    "from kuflow_rest import KuFlowRestClient",
+    "from kuflow_rest.aio import KuFlowRestClient",
+]
+
+
+def import_times(statement: str) -> dict[str, tuple[int, bool]]:
+    """Return the cumulative import time, in microseconds, of every module imported by ``statement``.
+
+    The boolean tells whether the module is imported at the top level, its cumulative time includes the nested ones.
+    """
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], check=True, capture_output=True, text=True
+    ).stderr
+
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = (int(cumulative), not name[1:].startswith(" "))
+
+    return times
+
+
+def measure(statement: str, startup_modules: set[str]) -> tuple[int, int]:
+    times = import_times(statement)
+    total = sum(
+        cumulative for name, (cumulative, top_level) in times.items() if top_level and name not in startup_modules
+    )
+
+    return total, len(times.keys() - startup_modules)
+
+
+def main(statements: list[str], rounds: int) -> None:
+    # Modules imported by the interpreter startup (site, encodings...) are reported too
+    startup_modules = set(import_times("pass"))
+
+    print(f"rounds={rounds} (best round)")
+    print(f"{'statement':>45} {'ms':>8} {'modules':>8}")
+    for statement in statements:
+        best, modules = min(measure(statement, startup_modules) for _ in range(rounds))
+        print(f"{statement:>45} {best / 1000:>8.1f} {modules:>8}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--statement", action="append", default=[])
+    args = parser.parse_args()
+
+    main(STATEMENTS + args.statement, args.rounds)
@@ -0,0 +1,103 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+"""JSON parse and write time with the available JSON backends.
+
+Usage:
+    python benchmark/benchmark_json_backend.py [--items 1000] [--rounds 10]
+
+Three operations are measured on a ProcessItem page with task data:
+    * loads: parsing of a REST response.
+    * dumps: writing of a REST request body, as UTF-8.
+    * dumps ascii: writing of a Temporal payload, with sorted keys and escaped non ASCII characters.
+"""
+
+import argparse
+import functools
+import json
+import time
+from typing import Callable
+
+from kuflow_rest.utils import get_json_backend
+
+
+def measure(operation: Callable[[], object], rounds: int) -> tuple[float, object]:
+    best = float("inf")
+    result = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        result = operation()
+        best = min(best, time.perf_counter() - start)
+
+    return best, result
+
+
+def main(items: int, rounds: int) -> None:
+    page = {
+        "metadata": {"size": items, "page": 0, "totalElements": items, "totalPages": 1},
+        "content": [
+            {
+                "id": f"00000000-0000-0000-0000-{i:012d}",
+                "type": "TASK",
+                "processId": "11111111-1111-1111-1111-111111111111",
+                "createdAt": "2024-06-14T10:20:30.123Z",
+                "task": {
+                    "state": "READY",
+                    "data": {
+                        "value": {
+                            "name": f"Ñandú {i}" if i % 10 == 0 else f"Name {i}",
+                            "ratio": i / 7,
+                            "tags": ["a", "b", None, True],
+                        }
+                    },
+                },
+            }
+            for i in range(items)
+        ],
+    }
+    data = json.dumps(page).encode()
+
+    backends = [get_json_backend("json"), get_json_backend("orjson")]
+    operations = {
+        "loads": lambda backend: backend.loads(data),
+        "dumps": lambda backend: backend.dumps(page, ensure_ascii=False),
+        "dumps ascii": lambda backend: backend.dumps(page, encoder=json.JSONEncoder, sort_keys=True),
+    }
+
+    print(f"items={items} ({len(data) // 1024} KB) rounds={rounds} (best round)")
+    print(f"{'operation':>14} {'json ms':>10} {backends[1].name + ' ms':>10} {'speedup':>8}")
+    for name, operation in operations.items():
+        reference, expected = measure(functools.partial(operation, backends[0]), rounds)
+        elapsed, actual = measure(functools.partial(operation, backends[1]), rounds)
+        assert actual == expected, f"{backends[1].name} output differs from the json one"
+        print(f"{name:>14} {reference * 1000:>10.3f} {elapsed * 1000:>10.3f} {reference / elapsed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    main(args.items, args.rounds)
@@ -0,0 +1,115 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+"""Time and peak memory of a large page read with the eager and the lazy deserializer.
+
+Usage:
+    python benchmark/benchmark_lazy_deserializer.py [--items 1000] [--rounds 10]
+
+A ProcessItemPage is deserialized, as returned by ``find_process_items(size=1000)``, and then:
+    * id + task.state: only the id and the task state of every item are read.
+    * as_dict: every attribute is read.
+
+The peak memory is the one allocated by the deserialization and the reads, the parsed JSON is not included.
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Callable
+
+from kuflow_rest import models
+from kuflow_rest._serialization import KuFlowDeserializer
+
+
+CLIENT_MODELS = {name: getattr(models, name) for name in models.__all__ if isinstance(getattr(models, name), type)}
+
+
+def process_item(index: int) -> dict:
+    return {
+        "id": f"00000000-0000-0000-0000-{index:012d}",
+        "type": "TASK",
+        "processId": "11111111-1111-1111-1111-111111111111",
+        "ownerId": "22222222-2222-2222-2222-222222222222",
+        "tenantId": "33333333-3333-3333-3333-333333333333",
+        "createdBy": "22222222-2222-2222-2222-222222222222",
+        "createdAt": "2024-06-14T10:20:30.123Z",
+        "lastModifiedBy": "22222222-2222-2222-2222-222222222222",
+        "lastModifiedAt": "2024-06-14T10:20:30.123Z",
+        "processItemDefinitionRef": {"id": "44444444-4444-4444-4444-444444444444", "version": "1", "code": "TASK"},
+        "task": {"state": "READY"},
+    }
+
+
+def read_id_and_state(page: models.ProcessItemPage) -> object:
+    return [(item.id, item.task.state) for item in page.content]
+
+
+def read_all(page: models.ProcessItemPage) -> object:
+    return page.as_dict()
+
+
+def measure(deserializer: KuFlowDeserializer, payload: str, read: Callable, rounds: int) -> tuple[float, int, object]:
+    best = float("inf")
+    result = None
+    for _ in range(rounds):
+        data = json.loads(payload)
+        start = time.perf_counter()
+        result = read(deserializer._deserialize("ProcessItemPage", data))
+        best = min(best, time.perf_counter() - start)
+
+    data = json.loads(payload)
+    tracemalloc.start()
+    read(deserializer._deserialize("ProcessItemPage", data))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return best, peak, result
+
+
+def main(items: int, rounds: int) -> None:
+    page = {
+        "metadata": {"size": items, "page": 0, "totalElements": items, "totalPages": 1},
+        "content": [process_item(i) for i in range(items)],
+    }
+    payload = json.dumps(page)
+    reads = {"id + task.state": read_id_and_state, "as_dict": read_all}
+
+    print(f"items={items} rounds={rounds} (best round)")
+    print(f"{'read':>16} {'eager ms':>10} {'lazy ms':>10} {'eager KB':>10} {'lazy KB':>10}")
+    for name, read in reads.items():
+        eager, eager_peak, expected = measure(KuFlowDeserializer(CLIENT_MODELS), payload, read, rounds)
+        lazy, lazy_peak, actual = measure(KuFlowDeserializer(CLIENT_MODELS, lazy=True), payload, read, rounds)
+        assert actual == expected, "Lazy deserializer output differs from the eager one"
+        print(f"{name:>16} {eager * 1000:>10.1f} {lazy * 1000:>10.1f} {eager_peak // 1024:>10} {lazy_peak // 1024:>10}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    main(args.items, args.rounds)
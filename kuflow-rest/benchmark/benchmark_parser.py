@@ -0,0 +1,156 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+"""Parse time of kuflow-file, kuflow-principal and kuflow-group references with the previous and the current parser.
+
+Usage:
+    python benchmark/benchmark_parser.py [--references 10000] [--distinct 500] [--rounds 10]
+
+Three workloads are measured:
+    * unique: every reference is different, the parser cache is cleared before every round.
+    * repeated: ``--distinct`` references repeated, as the principals and files of many tasks.
+    * bulk: the repeated references parsed with ``parse_kuflow_references``.
+"""
+
+import argparse
+import functools
+import time
+import urllib.parse
+from typing import Any, Callable, Optional
+
+from kuflow_rest.models import KuFlowFile, KuFlowGroup, KuFlowPrincipal
+from kuflow_rest.utils import parse_kuflow_file, parse_kuflow_group, parse_kuflow_principal, parse_kuflow_references
+from kuflow_rest.utils._parser import _parse_file, _parse_principal_or_group
+
+
+def previous_fields(original: str, prefix: str, keys: tuple[str, ...]) -> Optional[dict[str, str]]:
+    """Key and values of a reference, as the parser of the previous versions read them."""
+    if original is None or not isinstance(original, str) or not original.startswith(prefix):
+        return None
+
+    key_value_map = {}
+    for pair in original.replace(prefix, "").split(";"):
+        if pair.find("=") == -1:
+            continue
+        key, value = pair.split("=")
+        key_value_map[key] = urllib.parse.unquote(value)
+
+    return key_value_map if all(key in key_value_map for key in keys) else None
+
+
+def previous_parse_kuflow_file(original: str) -> Optional[KuFlowFile]:
+    fields = previous_fields(original, "kuflow-file:", ("uri", "type", "name", "size"))
+    if fields is None:
+        return None
+
+    return KuFlowFile(
+        original, fields["uri"], fields["type"], fields["name"], int(fields["size"]), fields.get("original-name")
+    )
+
+
+def previous_parse_kuflow_principal(original: str) -> Optional[KuFlowPrincipal]:
+    fields = previous_fields(original, "kuflow-principal:", ("id", "type", "name"))
+
+    return KuFlowPrincipal(original, fields["id"], fields["type"], fields["name"]) if fields else None
+
+
+def previous_parse_kuflow_group(original: str) -> Optional[KuFlowGroup]:
+    fields = previous_fields(original, "kuflow-group:", ("id", "type", "name"))
+
+    return KuFlowGroup(original, fields["id"], fields["type"], fields["name"]) if fields else None
+
+
+PREVIOUS_PARSERS = {
+    "kuflow-file": previous_parse_kuflow_file,
+    "kuflow-principal": previous_parse_kuflow_principal,
+    "kuflow-group": previous_parse_kuflow_group,
+}
+CURRENT_PARSERS = {
+    "kuflow-file": parse_kuflow_file,
+    "kuflow-principal": parse_kuflow_principal,
+    "kuflow-group": parse_kuflow_group,
+}
+
+
+def reference(index: int) -> str:
+    if index % 3 == 0:
+        return (
+            f"kuflow-file:uri=ku:{index:08d}/aaa-bbb-ccc;type=application/pdf;size={index * 100};"
+            f"name=name-{index}.pdf;original-name=Scan%20{index}.pdf;"
+        )
+    if index % 3 == 1:
+        return f"kuflow-principal:id={index:08d}-0000-0000-0000-000000000000;type=USER;name=User%20{index};"
+
+    return f"kuflow-group:id={index:08d}-0000-0000-0000-000000000000;type=OTHERS;name=Group%20{index};"
+
+
+def parse_each(parsers: dict[str, Callable[[str], Any]], references: list[str]) -> list[Any]:
+    return [parsers[value.partition(":")[0]](value) for value in references]
+
+
+def clear_cache() -> None:
+    _parse_file.cache_clear()
+    _parse_principal_or_group.cache_clear()
+
+
+def measure(operation: Callable[[], list[Any]], rounds: int, setup: Callable[[], None] = clear_cache) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        setup()
+        start = time.perf_counter()
+        operation()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main(references: int, distinct: int, rounds: int) -> None:
+    unique = [reference(index) for index in range(references)]
+    repeated = [reference(index % distinct) for index in range(references)]
+    for values in (unique, repeated):
+        previous = [str(item) for item in parse_each(PREVIOUS_PARSERS, values)]
+        assert [str(item) for item in parse_kuflow_references(values)] == previous, "The parsers differ"
+
+    workloads = {
+        "unique": (unique, lambda: parse_each(CURRENT_PARSERS, unique)),
+        "repeated": (repeated, lambda: parse_each(CURRENT_PARSERS, repeated)),
+        "bulk": (repeated, lambda: parse_kuflow_references(repeated)),
+    }
+
+    print(f"references={references} distinct={distinct} rounds={rounds} (best round)")
+    print(f"{'workload':>10} {'previous ms':>12} {'current ms':>11} {'speedup':>8}")
+    for name, (values, operation) in workloads.items():
+        reference_time = measure(functools.partial(parse_each, PREVIOUS_PARSERS, values), rounds)
+        elapsed = measure(operation, rounds, clear_cache if name == "unique" else lambda: None)
+        print(f"{name:>10} {reference_time * 1000:>12.3f} {elapsed * 1000:>11.3f} {reference_time / elapsed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--references", type=int, default=10000)
+    parser.add_argument("--distinct", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    main(args.references, args.distinct, args.rounds)
@@ -0,0 +1,92 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+"""Request body serialization time with the generic and the compiled serializer.
+
+Usage:
+    python benchmark/benchmark_serializer.py [--fields 2000] [--rounds 10]
+
+Two bodies are measured:
+    * ProcessItemTaskDataUpdateParams: task data with a large form.
+    * ProcessItemCreateParams: a small task creation, as sent for every new task.
+"""
+
+import argparse
+import json
+import time
+
+from kuflow_rest import Serializer, models
+from kuflow_rest._serialization import KuFlowSerializer
+
+
+CLIENT_MODELS = {name: getattr(models, name) for name in models.__all__ if isinstance(getattr(models, name), type)}
+
+
+def measure(serializer: Serializer, data: object, data_type: str, rounds: int) -> tuple[float, object]:
+    best = float("inf")
+    result = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        result = serializer.body(data, data_type)
+        best = min(best, time.perf_counter() - start)
+
+    return best, result
+
+
+def main(fields: int, rounds: int) -> None:
+    form = {
+        f"field{i}": {"text": "x" * 100, "number": i, "enabled": i % 2 == 0, "options": ["a", "b", "c"]}
+        for i in range(fields)
+    }
+    bodies = {
+        "TaskDataUpdate": (
+            models.ProcessItemTaskDataUpdateParams(data=models.JsonValue(value=form)),
+            "ProcessItemTaskDataUpdateParams",
+        ),
+        "ProcessItemCreate": (
+            models.ProcessItemCreateParams(
+                type=models.ProcessItemType.TASK,
+                process_id="11111111-1111-1111-1111-111111111111",
+                process_item_definition_code="TASK",
+                task=models.ProcessItemTaskCreateParams(data=models.JsonValue(value={"name": "Homer"})),
+            ),
+            "ProcessItemCreateParams",
+        ),
+    }
+
+    print(f"form fields={fields} ({len(json.dumps(form)) // 1024} KB) rounds={rounds} (best round)")
+    print(f"{'body':>18} {'generic ms':>12} {'compiled ms':>12} {'speedup':>8}")
+    for name, (data, data_type) in bodies.items():
+        generic, expected = measure(Serializer(CLIENT_MODELS), data, data_type, rounds)
+        compiled, actual = measure(KuFlowSerializer(CLIENT_MODELS), data, data_type, rounds)
+        assert actual == expected, "Compiled serializer output differs from the generic one"
+        print(f"{name:>18} {generic * 1000:>12.3f} {compiled * 1000:>12.3f} {generic / compiled:>7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fields", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    main(args.fields, args.rounds)
@@ -22,9 +22,43 @@
 # SOFTWARE.
 #
 
-from ._generated._utils.serialization import Deserializer, Model, Serializer
-from ._kuflow_rest_client import KuBotTokenCredential, KuFlowRestClient
+from typing import TYPE_CHECKING
 
+from ._lazy_import import lazy_import
 
-__all__ = ["Deserializer", "KuBotTokenCredential", "KuFlowRestClient", "Model", "Serializer"]
+
+if TYPE_CHECKING:
+    from ._generated._utils.serialization import Deserializer, Model, Serializer
+    from ._httpx_transport import HttpxTransport
+    from ._kuflow_rest_client import KuBotTokenCredential, KuFlowRestClient
+    from ._robot_cache import RobotCache
+    from ._transport import PooledRequestsTransport, SharedTransport
+
+
+__all__ = [
+    "Deserializer",
+    "HttpxTransport",
+    "KuBotTokenCredential",
+    "KuFlowRestClient",
+    "Model",
+    "PooledRequestsTransport",
+    "RobotCache",
+    "Serializer",
+    "SharedTransport",
+]
 __version__ = "3.3.1.dev0"
+
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {
+        "Deserializer": "._generated._utils.serialization",
+        "Model": "._generated._utils.serialization",
+        "Serializer": "._generated._utils.serialization",
+        "HttpxTransport": "._httpx_transport",
+        "KuBotTokenCredential": "._kuflow_rest_client",
+        "KuFlowRestClient": "._kuflow_rest_client",
+        "PooledRequestsTransport": "._transport",
+        "RobotCache": "._robot_cache",
+        "SharedTransport": "._transport",
+    },
+)
@@ -0,0 +1,150 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+from typing import Any, Optional, Union
+
+from azure.core.pipeline.policies import SansIOHTTPPolicy
+
+from .policies import (
+    AsyncCachePolicy,
+    AsyncCircuitBreakerPolicy,
+    AsyncHedgingPolicy,
+    AsyncRateLimitPolicy,
+    AsyncSingleFlightPolicy,
+    CachePolicy,
+    CircuitBreaker,
+    CircuitBreakerPolicy,
+    CompressionPolicy,
+    DeadlinePolicy,
+    Hedging,
+    HedgingPolicy,
+    RateLimiter,
+    RateLimitPolicy,
+    ResponseCache,
+    SingleFlightPolicy,
+    accept_encoding,
+)
+
+
+class AllowHttpPolicy(SansIOHTTPPolicy):
+    """A simple policy that allows http requests adding "enforce_https" to the request context."""
+
+    def on_request(self, request):
+        """Updates with the given request id before sending the request to the next policy.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        """
+        options = {"enforce_https": False}
+        request.context.options.update(options)
+
+
+class TimeoutPolicy(SansIOHTTPPolicy):
+    """A policy that sets the connection and read timeouts of the requests that do not set their own.
+
+    Timeouts are request options, so they apply to any transport, also to one shared with other clients.
+    """
+
+    def __init__(self, connection_timeout: Optional[float] = None, read_timeout: Optional[float] = None) -> None:
+        self._timeouts = {"connection_timeout": connection_timeout, "read_timeout": read_timeout}
+
+    def on_request(self, request):
+        """Adds the timeouts to the request options.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        """
+        for option, timeout in self._timeouts.items():
+            if timeout is not None:
+                request.context.options.setdefault(option, timeout)
+
+
+class ClientPolicies:
+    """Per call and per retry policies of a sync or async client, built from the client options.
+
+    The objects that keep the state of the policies (cache, breakers, limiter...) are exposed as attributes, None
+    when the option is disabled.
+    """
+
+    def __init__(
+        self,
+        transport: Any,
+        *,
+        asynchronous: bool,
+        allow_insecure_connection: Optional[bool],
+        connection_timeout: Optional[float],
+        read_timeout: Optional[float],
+        single_flight: bool,
+        cache: Union[bool, ResponseCache],
+        rate_limit: Union[bool, RateLimiter],
+        hedging: Union[bool, Hedging],
+        circuit_breaker: Union[bool, CircuitBreaker],
+        compression: Union[bool, str],
+        compression_threshold: int,
+    ) -> None:
+        self.per_call_policies: list[Any] = []
+        if allow_insecure_connection:
+            self.per_call_policies.append(AllowHttpPolicy())
+        if connection_timeout is not None or read_timeout is not None:
+            self.per_call_policies.append(TimeoutPolicy(connection_timeout, read_timeout))
+        self.per_call_policies.append(DeadlinePolicy())
+
+        self.cache: Optional[ResponseCache] = None
+        if cache is not False:
+            self.cache = ResponseCache() if cache is True else cache
+            cache_policy = AsyncCachePolicy if asynchronous else CachePolicy
+            self.per_call_policies.append(cache_policy(self.cache))
+
+        self.single_flight_policy: Optional[Union[SingleFlightPolicy, AsyncSingleFlightPolicy]] = None
+        if single_flight:
+            self.single_flight_policy = AsyncSingleFlightPolicy() if asynchronous else SingleFlightPolicy()
+            self.per_call_policies.append(self.single_flight_policy)
+
+        self.circuit_breaker: Optional[CircuitBreaker] = None
+        if circuit_breaker is not False:
+            self.circuit_breaker = CircuitBreaker() if circuit_breaker is True else circuit_breaker
+            circuit_breaker_policy = AsyncCircuitBreakerPolicy if asynchronous else CircuitBreakerPolicy
+            self.per_call_policies.append(circuit_breaker_policy(self.circuit_breaker))
+
+        self.hedging: Optional[Hedging] = None
+        if hedging is not False:
+            self.hedging = Hedging() if hedging is True else hedging
+            hedging_policy = AsyncHedgingPolicy if asynchronous else HedgingPolicy
+            self.per_call_policies.append(hedging_policy(self.hedging))
+
+        self.compression_policy: Optional[CompressionPolicy] = None
+        if compression is not False:
+            self.compression_policy = CompressionPolicy(
+                encoding="gzip" if compression is True else compression,
+                threshold=compression_threshold,
+                accept_encoding=accept_encoding(transport),
+            )
+            self.per_call_policies.append(self.compression_policy)
+
+        self.per_retry_policies: list[Any] = []
+        self.rate_limiter: Optional[RateLimiter] = None
+        if rate_limit is not False:
+            self.rate_limiter = RateLimiter() if rate_limit is True else rate_limit
+            rate_limit_policy = AsyncRateLimitPolicy if asynchronous else RateLimitPolicy
+            self.per_retry_policies.append(rate_limit_policy(self.rate_limiter))
@@ -0,0 +1,456 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import contextvars
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, NoReturn, Optional, Union
+
+from azure.core.exceptions import (
+    ClientAuthenticationError,
+    HttpResponseError,
+    IncompleteReadError,
+    ResourceNotFoundError,
+    ServiceRequestError,
+    ServiceResponseError,
+    map_error,
+)
+from azure.core.rest import HttpRequest
+
+from .utils import parse_kuflow_file
+
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_MAX_RESUMES = 3
+
+# Errors of a connection that dropped, the download goes on from the last byte written
+RESUMABLE_ERRORS = (ServiceRequestError, ServiceResponseError, IncompleteReadError)
+
+_ERROR_MAP = {401: ClientAuthenticationError, 404: ResourceNotFoundError}
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-(\d+)/(\d+|\*)")
+
+
+def expected_document_size(document_uri: str) -> Optional[int]:
+    """Return the size of a document from its ``kuflow-file:`` URI, None when the URI has no size.
+
+    :param str document_uri: The document URI.
+    :return: The size in bytes, or None.
+    :rtype: Optional[int]
+    """
+    kuflow_file = parse_kuflow_file(document_uri)
+
+    return kuflow_file.size if kuflow_file is not None else None
+
+
+def ranged_request(
+    request: HttpRequest, start: int, end: Optional[int], validator: Optional[str] = None
+) -> HttpRequest:
+    """Return a copy of a download request for a range of bytes.
+
+    The encoding is ``identity``, byte ranges of a compressed body would not be ranges of the file. With a validator,
+    the range is sent with ``If-Range``: the server sends the whole file when it is no longer the same.
+
+    :param request: The download request.
+    :param int start: First byte.
+    :param int end: Last byte, included. None for the end of the file.
+    :param str validator: ETag or Last-Modified date of the file the range belongs to.
+    :return: The request.
+    """
+    headers = dict(request.headers)
+    headers["Accept-Encoding"] = "identity"
+    if start > 0 or end is not None:
+        headers["Range"] = f"bytes={start}-{'' if end is None else end}"
+        if validator is not None:
+            headers["If-Range"] = validator
+
+    return HttpRequest(request.method, request.url, headers=headers)
+
+
+def check_response(response: Any) -> NoReturn:
+    """Raise the error of a failed download response, whose body is already read.
+
+    :param response: The response.
+    :raises ~azure.core.exceptions.HttpResponseError:
+    """
+    map_error(status_code=response.status_code, response=response, error_map=_ERROR_MAP)
+    raise HttpResponseError(response=response)
+
+
+def parse_content_range(value: Optional[str]) -> Optional[tuple[int, int, Optional[int]]]:
+    """Parse a ``Content-Range`` header: first and last bytes and total size, None when it is not valid.
+
+    :param value: The header value.
+    :return: The range.
+    """
+    match = _CONTENT_RANGE.fullmatch(value.strip()) if value else None
+    if match is None:
+        return None
+    total = match.group(3)
+
+    return int(match.group(1)), int(match.group(2)), None if total == "*" else int(total)
+
+
+def response_validator(response: Any) -> Optional[str]:
+    """Return the validator of the file of a response: its strong ETag, else its Last-Modified date.
+
+    Weak ETags can not be used in ``If-Range``.
+
+    :param response: The response.
+    :return: The validator, None when the response has none.
+    """
+    etag = response.headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+
+    return response.headers.get("Last-Modified") or None
+
+
+def unsatisfied_range_size(response: Any) -> Optional[int]:
+    """Return the file size of a ``416 Range Not Satisfiable`` response (``Content-Range: bytes */size``)."""
+    match = re.fullmatch(r"bytes \*/(\d+)", response.headers.get("Content-Range", "").strip())
+
+    return int(match.group(1)) if match else None
+
+
+def split_ranges(start: int, total: int, part_size: int) -> list[tuple[int, int]]:
+    """Split the bytes from ``start`` to the end of a file into ranges (first and last byte) of ``part_size``."""
+    return [(offset, min(offset + part_size, total) - 1) for offset in range(start, total, part_size)]
+
+
+class DownloadPart:
+    """Range of a file, that is written in order from its first byte."""
+
+    def __init__(self, start: int, end: Optional[int]) -> None:
+        self.start = start
+        self.end = end
+        self.written = 0
+
+    @property
+    def position(self) -> int:
+        return self.start + self.written
+
+    @property
+    def complete(self) -> bool:
+        return self.end is not None and self.position > self.end
+
+
+def written_prefix(parts: list[DownloadPart]) -> int:
+    """Return the bytes written without gaps from the first byte of the first part.
+
+    :param parts: The parts, in file order.
+    :return: The end of the written prefix.
+    """
+    prefix = parts[0].start
+    for part in parts:
+        prefix = part.position
+        if not part.complete:
+            break
+
+    return prefix
+
+
+def plan_download(
+    response: Any, first: DownloadPart, part_path: str, part_size: int
+) -> Optional[tuple[list[DownloadPart], Optional[int], Optional[str]]]:
+    """Plan a download from the response to the request of its first part, and prepare the ``.part`` file and the
+    validator saved next to it.
+
+    :param response: The response to the request of the first part.
+    :param first: The first part.
+    :param str part_path: The path of the ``.part`` file.
+    :param int part_size: The size of the parts.
+    :return: The parts, the size of the file when it is known, and its validator. None when the response is an error.
+    """
+    total: Optional[int] = None
+    content_range = parse_content_range(response.headers.get("Content-Range"))
+    if response.status_code == 206 and content_range is not None and content_range[0] == first.start:
+        first.end = content_range[1]
+        total = content_range[2]
+    elif response.status_code == 200:
+        # The server does not support ranges, the whole file is sent
+        first = DownloadPart(0, None)
+        content_length = response.headers.get("Content-Length")
+        total = int(content_length) if content_length and content_length.isdigit() else None
+    else:
+        return None
+
+    validator = response_validator(response)
+    with open(part_path, "r+b" if first.start else "wb") as file:
+        file.truncate(first.start)
+    save_validator(part_path, validator)
+
+    parts = [first]
+    if total is not None and first.end is not None and first.end + 1 < total:
+        parts += [DownloadPart(start, end) for start, end in split_ranges(first.end + 1, total, part_size)]
+
+    return parts, total, validator
+
+
+def resumed(response: Any, offset: int, validator: Optional[str]) -> bool:
+    """Return whether the response to the request of a previous partial download can be used.
+
+    A ``416`` response has no byte to add, and a ``206`` response of another file, from a server that ignores
+    ``If-Range``, does not resume the partial download. A ``200`` response is the whole file, sent because it is no
+    longer the one of the partial download, the download starts again from it.
+
+    :param response: The response to the request of the first part.
+    :param int offset: The size of the partial download.
+    :param str validator: The validator of the partial download.
+    :return: True if the response can be used.
+    """
+    if response.status_code != 206:
+        return response.status_code != 416
+
+    content_range = parse_content_range(response.headers.get("Content-Range"))
+
+    return content_range is not None and content_range[0] == offset and response_validator(response) == validator
+
+
+def part_file_path(path: Union[str, "os.PathLike[str]"]) -> str:
+    return os.fspath(path) + ".part"
+
+
+def validator_file_path(part_path: str) -> str:
+    return part_path + ".validator"
+
+
+def save_validator(part_path: str, validator: Optional[str]) -> None:
+    """Save the validator of the file of a ``.part`` file next to it, or remove it when the file has none."""
+    if validator is None:
+        remove_validator(part_path)
+        return
+
+    with open(validator_file_path(part_path), "w", encoding="utf-8") as file:
+        file.write(validator)
+
+
+def remove_validator(part_path: str) -> None:
+    try:
+        os.remove(validator_file_path(part_path))
+    except FileNotFoundError:
+        pass
+
+
+def partial_download(part_path: str, expected_size: Optional[int]) -> tuple[int, Optional[str]]:
+    """Return the bytes of a previous download that can be resumed and the validator of the file they belong to.
+
+    A previous download without validator can not be checked against the file, it starts again.
+    """
+    try:
+        size = os.path.getsize(part_path)
+        with open(validator_file_path(part_path), encoding="utf-8") as file:
+            validator = file.read().strip()
+    except OSError:
+        return 0, None
+
+    if not validator or (expected_size is not None and size > expected_size):
+        return 0, None
+
+    return size, validator
+
+
+def finish_download(
+    part_path: str, path: Union[str, "os.PathLike[str]"], total: Optional[int], expected_size: Optional[int]
+) -> int:
+    """Check the size of a downloaded file and move it to its final path.
+
+    A file whose size is not the one of the response or the expected one is removed, so that the next download
+    starts from the beginning.
+
+    :return: The size of the file.
+    :raises ~azure.core.exceptions.IncompleteReadError: If the size is not the expected one.
+    """
+    size = os.path.getsize(part_path)
+    for expected in (total, expected_size):
+        if expected is not None and size != expected:
+            os.remove(part_path)
+            remove_validator(part_path)
+            raise IncompleteReadError(f"Downloaded {size} bytes, expected {expected} bytes")
+
+    os.replace(part_path, path)
+    remove_validator(part_path)
+
+    return size
+
+
+class FileDownloader:
+    """Download of a file with ranged requests: resumed from a previous partial download, in parallel parts when the
+    server supports them, and resumed again when a connection drops.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        request: HttpRequest,
+        path: Union[str, "os.PathLike[str]"],
+        *,
+        expected_size: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        part_size: int = DEFAULT_PART_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_resumes: int = DEFAULT_MAX_RESUMES,
+        **kwargs: Any,
+    ) -> None:
+        if chunk_size <= 0 or part_size <= 0 or max_concurrency <= 0:
+            raise ValueError("chunk_size, part_size and max_concurrency must be greater than 0")
+
+        self._client = client
+        self._request = request
+        self._path = path
+        self._part_path = part_file_path(path)
+        self._expected_size = expected_size
+        self._chunk_size = chunk_size
+        self._part_size = part_size
+        self._max_concurrency = max_concurrency
+        self._max_resumes = max_resumes
+        self._kwargs = kwargs
+        self._validator: Optional[str] = None
+        self._failed = threading.Event()
+
+    def download(self) -> int:
+        offset, self._validator = partial_download(self._part_path, self._expected_size)
+        first = self._first_part(offset)
+        response = self._send(first)
+        if offset and not resumed(response, offset, self._validator):
+            size = unsatisfied_range_size(response) if response.status_code == 416 else None
+            response.close()
+            if size == offset and response_validator(response) in (None, self._validator):
+                return finish_download(self._part_path, self._path, size, self._expected_size)
+            # The partial file is not a prefix of this file
+            first, self._validator = self._first_part(0), None
+            response = self._send(first)
+
+        planned = plan_download(response, first, self._part_path, self._part_size)
+        if planned is None:
+            response.read()
+            check_response(response)
+        parts, total, self._validator = planned
+
+        try:
+            self._download_parts(parts, response)
+        except BaseException:
+            # Keep the bytes written without gaps, the next download resumes from them
+            with open(self._part_path, "r+b") as file:
+                file.truncate(written_prefix(parts))
+            raise
+
+        return finish_download(self._part_path, self._path, total, self._expected_size)
+
+    def _first_part(self, offset: int) -> DownloadPart:
+        # With parallel parts, the first request asks for the first part only and tells the size of the file
+        return DownloadPart(offset, offset + self._part_size - 1 if self._max_concurrency > 1 else None)
+
+    def _download_parts(self, parts: list[DownloadPart], response: Any) -> None:
+        if len(parts) == 1 or self._max_concurrency == 1:
+            self._write_part(parts[0], response)
+            for part in parts[1:]:
+                self._write_part(part, None)
+            return
+
+        with ThreadPoolExecutor(max_workers=self._max_concurrency - 1) as executor:
+            # Context variables, ie: deadlines, are seen by the requests of the parts
+            futures = [
+                executor.submit(contextvars.copy_context().run, self._write_part, part, None) for part in parts[1:]
+            ]
+            self._write_part(parts[0], response)
+            for future in futures:
+                future.result()
+
+    def _send(self, part: DownloadPart) -> Any:
+        request = ranged_request(self._request, part.position, part.end, self._validator)
+
+        return self._client.send_request(request, stream=True, **self._kwargs)
+
+    def _write_part(self, part: DownloadPart, response: Any) -> None:
+        try:
+            with open(self._part_path, "r+b", buffering=self._chunk_size) as file:
+                self._write_part_to(file, part, response)
+        except BaseException:
+            # The other parts stop too, the download fails
+            self._failed.set()
+            raise
+
+    def _write_part_to(self, file: Any, part: DownloadPart, response: Any) -> None:
+        resumes = 0
+        while not part.complete and not self._failed.is_set():
+            if response is None:
+                response = self._send(part)
+                if response.status_code == 200 and part.start == 0 and part.end is None:
+                    # The server does not support ranges, the file starts again
+                    part.written = 0
+                elif response.status_code != 206:
+                    response.read()
+                    check_response(response)
+            try:
+                file.seek(part.position)
+                for chunk in response.iter_bytes():
+                    if self._failed.is_set():
+                        return
+                    file.write(chunk)
+                    part.written += len(chunk)
+                if part.end is None:
+                    return
+            except RESUMABLE_ERRORS:
+                resumes += 1
+                if resumes > self._max_resumes:
+                    raise
+                continue
+            finally:
+                file.flush()
+                response.close()
+                response = None
+
+            if not part.complete:
+                # The response ended before the end of the range
+                resumes += 1
+                if resumes > self._max_resumes:
+                    raise IncompleteReadError(f"The range {part.start}-{part.end} ended at byte {part.position}")
+
+
+def download_to_file(client: Any, request: HttpRequest, path: Union[str, "os.PathLike[str]"], **kwargs: Any) -> int:
+    """Download the body of a request into a file.
+
+    The file is written as ``<path>.part`` and renamed to ``path`` once it is complete, so ``path`` is never a partial
+    file. A ``.part`` file of a previous failed download is resumed with a Range request, and when the server
+    supports Range requests, large files are downloaded in parallel parts. The ETag or Last-Modified date of the file
+    is saved in ``<path>.part.validator`` and sent in ``If-Range``, a partial download of a file that changed since
+    then, or without validator, starts again from the first byte.
+
+    :param client: The generated client that sends the request.
+    :param request: The download request.
+    :param path: The file path.
+    :keyword int expected_size: Size of the file, ie: the one of its :class:`~kuflow_rest.models.KuFlowFile`.
+    :keyword int chunk_size: Size of the writes to the file. Default value is 1 MiB.
+    :keyword int part_size: Size of the parallel parts. Default value is 8 MiB.
+    :keyword int max_concurrency: Parts downloaded at the same time, 1 to download in one request. Default value is 4.
+    :keyword int max_resumes: Times a part is resumed after its connection drops. Default value is 3.
+    :return: The size of the file.
+    :rtype: int
+    :raises ~azure.core.exceptions.HttpResponseError:
+    """
+    return FileDownloader(client, request, path, **kwargs).download()
@@ -0,0 +1,264 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+from collections.abc import AsyncIterator, Iterator
+from typing import Any, Optional
+
+import httpx
+from azure.core.exceptions import (
+    ServiceRequestError,
+    ServiceRequestTimeoutError,
+    ServiceResponseError,
+    ServiceResponseTimeoutError,
+)
+from azure.core.pipeline.transport import HttpTransport
+from azure.core.rest._http_response_impl import HttpResponseImpl
+
+from ._upload import content_size
+
+
+class HttpxTransportResponse(HttpResponseImpl):
+    """Response of the :class:`HttpxTransport`."""
+
+    def __init__(self, *, request, internal_response: httpx.Response, block_size: Optional[int] = None) -> None:
+        super().__init__(
+            request=request,
+            internal_response=internal_response,
+            block_size=block_size,
+            status_code=internal_response.status_code,
+            reason=internal_response.reason_phrase,
+            content_type=internal_response.headers.get("content-type"),
+            headers=internal_response.headers,
+            stream_download_generator=_stream_download,
+        )
+
+
+def _stream_download(
+    pipeline, response: HttpxTransportResponse, *, decompress: bool = True, **kwargs
+) -> Iterator[bytes]:
+    internal_response: httpx.Response = response.internal_response
+    chunk_size = response.block_size
+    try:
+        if decompress:
+            yield from internal_response.iter_bytes(chunk_size)
+        else:
+            yield from internal_response.iter_raw(chunk_size)
+    except httpx.TransportError as err:
+        raise ServiceResponseError(err, error=err) from err
+    finally:
+        internal_response.close()
+
+
+def map_httpx_error(err: httpx.TransportError) -> Exception:
+    """Return the azure-core error of an httpx error, the one the pipeline policies know how to retry.
+
+    :param err: The httpx error.
+    :type err: httpx.TransportError
+    :return: The azure-core error.
+    """
+    if isinstance(err, httpx.ConnectTimeout):
+        return ServiceRequestTimeoutError(err, error=err)
+    if isinstance(err, httpx.TimeoutException):
+        return ServiceResponseTimeoutError(err, error=err)
+    if isinstance(err, (httpx.ConnectError, httpx.ProxyError, httpx.UnsupportedProtocol)):
+        return ServiceRequestError(err, error=err)
+    return ServiceResponseError(err, error=err)
+
+
+def httpx_request_options(
+    transport: Any, request, kwargs: dict[str, Any], *, asynchronous: bool = False
+) -> dict[str, Any]:
+    """Return the arguments of ``httpx.Client.build_request`` for an azure-core request.
+
+    :param transport: The transport, for its connection configuration.
+    :param request: The azure-core request.
+    :param dict kwargs: The options of the request, ``connection_timeout`` and ``read_timeout`` are used.
+    :param bool asynchronous: The request is sent by an ``httpx.AsyncClient``.
+    :return: The arguments.
+    :rtype: dict
+    """
+    connection_timeout = kwargs.pop("connection_timeout", transport.connection_config.timeout)
+    read_timeout = kwargs.pop("read_timeout", transport.connection_config.read_timeout)
+    options: dict[str, Any] = {
+        "method": request.method,
+        "url": request.url,
+        "headers": request.headers,
+        "timeout": httpx.Timeout(read_timeout, connect=connection_timeout),
+    }
+    data = request.data
+    if request.files:
+        options["files"] = request.files
+        if data:
+            options["data"] = data
+    elif isinstance(data, dict):
+        options["data"] = data
+    elif hasattr(data, "read"):
+        # httpx would iterate a file by lines, and an async client only takes async iterables
+        block_size = transport.connection_config.data_block_size
+        options["content"] = _aiter_file(data, block_size) if asynchronous else _iter_file(data, block_size)
+        size = content_size(data)
+        if size is not None and "Content-Length" not in request.headers:
+            options["headers"] = {**request.headers, "Content-Length": str(size)}
+    elif data is not None:
+        options["content"] = data
+
+    return options
+
+
+def _iter_file(file: Any, block_size: int) -> Iterator[bytes]:
+    while chunk := file.read(block_size):
+        yield chunk
+
+
+async def _aiter_file(file: Any, block_size: int) -> AsyncIterator[bytes]:
+    while chunk := file.read(block_size):
+        yield chunk
+
+
+class HttpxTransport(HttpTransport):
+    """Transport based on httpx, that multiplexes the requests to the same host over HTTP/2 connections.
+
+    Many small concurrent requests to one host share a few connections instead of opening one connection, and paying
+    its TLS handshake, per request in flight. HTTP/2 is negotiated with TLS, ``http1=False`` uses it over clear text
+    connections too (prior knowledge), ie: against a local server.
+
+    It requires the ``http2`` extra: ``pip install kuflow-rest[http2]``.
+
+    :keyword bool http2: Use HTTP/2 when the server supports it. Default value is True.
+    :keyword bool http1: Use HTTP/1.1 when the server does not support HTTP/2. Default value is True.
+    :keyword int connection_pool_size: Maximum number of connections. Default value is the httpx default (100).
+    :keyword bool keep_alive: Reuse the connections between requests. Default value is True.
+    :keyword float keep_alive_timeout: Seconds an idle connection is kept open. Default value is the httpx default.
+    :keyword client: httpx client to use instead of a new one, the other options are ignored.
+    :paramtype client: httpx.Client
+    """
+
+    def __init__(
+        self,
+        *,
+        http2: bool = True,
+        http1: bool = True,
+        connection_pool_size: Optional[int] = None,
+        keep_alive: bool = True,
+        keep_alive_timeout: Optional[float] = None,
+        client: Optional[httpx.Client] = None,
+        **kwargs: Any,
+    ) -> None:
+        from azure.core.configuration import ConnectionConfiguration
+
+        self.connection_config = ConnectionConfiguration(**kwargs)
+        self.client = client
+        self._client_owner = client is None
+        self._use_env_settings = kwargs.pop("use_env_settings", True)
+        self._http2 = http2
+        self._http1 = http1
+        self._limits = httpx_limits(connection_pool_size, keep_alive, keep_alive_timeout)
+
+    def __enter__(self) -> "HttpxTransport":
+        self.open()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def open(self) -> None:
+        if self.client is None:
+            self.client = httpx.Client(
+                http1=self._http1,
+                http2=self._http2,
+                limits=self._limits,
+                verify=self.connection_config.verify,
+                cert=self.connection_config.cert,
+                trust_env=self._use_env_settings,
+                follow_redirects=False,
+            )
+
+    def close(self) -> None:
+        if self._client_owner and self.client is not None:
+            self.client.close()
+            self.client = None
+
+    @property
+    def accept_encoding(self) -> str:
+        """Encodings of the responses that httpx decodes, see :func:`~kuflow_rest.policies.accept_encoding`."""
+        return httpx_accept_encoding()
+
+    def send(self, request, *, stream: bool = False, **kwargs: Any) -> HttpxTransportResponse:
+        """Send the request.
+
+        :param request: The request object to be sent.
+        :type request: ~azure.core.rest.HttpRequest
+        :keyword bool stream: Do not read the response body. Default value is False.
+        :return: The response.
+        :rtype: HttpxTransportResponse
+        """
+        self.open()
+        assert self.client is not None
+        httpx_request = self.client.build_request(**httpx_request_options(self, request, kwargs))
+        try:
+            internal_response = self.client.send(httpx_request, stream=True)
+        except httpx.TransportError as err:
+            raise map_httpx_error(err) from err
+
+        response = HttpxTransportResponse(
+            request=request, internal_response=internal_response, block_size=self.connection_config.data_block_size
+        )
+        if not stream:
+            response.read()
+            response.close()
+
+        return response
+
+
+def httpx_limits(
+    connection_pool_size: Optional[int], keep_alive: bool, keep_alive_timeout: Optional[float]
+) -> httpx.Limits:
+    """Return the httpx connection limits of the transport options.
+
+    :param int connection_pool_size: Maximum number of connections, None for the httpx default.
+    :param bool keep_alive: Reuse the connections between requests.
+    :param float keep_alive_timeout: Seconds an idle connection is kept open, None for the httpx default.
+    :return: The limits.
+    :rtype: httpx.Limits
+    """
+    defaults = httpx.Limits()
+    max_connections = defaults.max_connections if connection_pool_size is None else connection_pool_size
+
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections if keep_alive else 0,
+        keepalive_expiry=defaults.keepalive_expiry if keep_alive_timeout is None else keep_alive_timeout,
+    )
+
+
+def httpx_accept_encoding() -> str:
+    """Return the encodings of the responses that httpx decodes: gzip, deflate, and brotli and zstd when their
+    packages are installed.
+
+    :return: The ``Accept-Encoding`` header value.
+    :rtype: str
+    """
+    from httpx._decoders import SUPPORTED_DECODERS
+
+    return ", ".join(encoding for encoding in SUPPORTED_DECODERS if encoding != "identity")
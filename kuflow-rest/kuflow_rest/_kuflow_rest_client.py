@@ -25,13 +25,16 @@
 import base64
 import platform
 import sys
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 from azure.core.credentials import AccessToken, TokenCredential
-from azure.core.pipeline.policies import SansIOHTTPPolicy
 
+from ._client_policies import ClientPolicies
 from ._generated import VERSION
 from ._generated import KuFlowRestClient as KuFlowRestClientGenerated
+from ._robot_cache import RobotCache
+from ._serialization import use_kuflow_serialization
+from ._transport import create_transport
 from .operations import (
     AuthenticationOperations,
     BusinessArtifactOperations,
@@ -45,6 +48,15 @@ from .operations import (
     TenantUserOperations,
     WorkerOperations,
 )
+from .policies import (
+    CircuitBreaker,
+    CompressionPolicy,
+    Hedging,
+    RateLimiter,
+    ResponseCache,
+    SingleFlightPolicy,
+)
+from .utils._json_backend import JsonBackend
 
 
 class ClientSecretCredential:
@@ -107,19 +119,6 @@ class KuBotTokenCredential(TokenCredential):
         return self._cached_token == other._cached_token
 
 
-class AllowHttpPolicy(SansIOHTTPPolicy):
-    """A simple policy that allows http requests adding "enforce_https" to the request context."""
-
-    def on_request(self, request):
-        """Updates with the given request id before sending the request to the next policy.
-
-        :param request: The PipelineRequest object
-        :type request: ~azure.core.pipeline.PipelineRequest
-        """
-        options = {"enforce_https": False}
-        request.context.options.update(options)
-
-
 class KuFlowRestClient:  # pylint: disable=client-accepts-api-version-keyword
     API_VERSION = "v2024-06-14"
 
@@ -198,6 +197,77 @@ class KuFlowRestClient:  # pylint: disable=client-accepts-api-version-keyword
     :type endpoint: str
     :keyword allow_insecure_connection: Allow non HTTPS endpoints. Default False.
     :type allow_insecure_connection: bool
+    :keyword connection_pool_size: Number of hosts whose connection pool is kept. Default value is 10.
+    :type connection_pool_size: int
+    :keyword connection_pool_size_per_host: Maximum number of connections kept to the same host, it should be the
+                                            number of threads that use the client. Default value is 10.
+    :type connection_pool_size_per_host: int
+    :keyword keep_alive: Reuse the connections between requests, so that the TCP and TLS handshakes are only paid once
+                         per connection. Default True.
+    :type keep_alive: bool
+    :keyword connection_timeout: Seconds to wait for a connection to be established. Default value is the
+                                 azure-core default (300).
+    :type connection_timeout: float
+    :keyword read_timeout: Seconds to wait for data from the server. Default value is the azure-core default (300).
+                           Calls made inside a :func:`~kuflow_rest.policies.deadline` block use shorter timeouts
+                           when less time is left.
+    :type read_timeout: float
+    :keyword http2: Multiplex the requests over HTTP/2 connections, so that many concurrent calls share a few
+                    connections. It requires the ``http2`` extra, without it the HTTP/1.1 transport is used. It is
+                    ignored when a transport is provided. Default False.
+    :type http2: bool
+    :keyword transport: Custom azure-core transport. When provided, the pool and keep alive options are ignored. A
+                        :class:`~kuflow_rest.SharedTransport` shares its connections with the other clients that use
+                        it.
+    :type transport: ~azure.core.pipeline.transport.HttpTransport
+    :keyword json_backend: JSON implementation used to read responses and write request bodies: "json" (default) for
+                           the standard library or "orjson", which requires the ``orjson`` extra. A
+                           :class:`~kuflow_rest.utils.JsonBackend` instance is accepted too.
+    :type json_backend: str or ~kuflow_rest.utils.JsonBackend
+    :keyword lazy_deserialization: Build response models whose attributes are converted from the JSON document the
+                                   first time they are read. It saves time and memory on large listings when only a
+                                   few attributes are read, conversion errors are raised on access. Default False.
+    :type lazy_deserialization: bool
+    :keyword compact_page_items: Return the items of the listings (``ProcessPageItem``, ``ProcessItemPageItem``...) as
+                                 :class:`~kuflow_rest.models.CompactModel` objects, that store their attributes in
+                                 ``__slots__`` and take several times less memory. Default False.
+    :type compact_page_items: bool
+    :keyword single_flight: Share one HTTP call between identical read requests (GET) that are in flight at the same
+                            time, ie: many activities retrieving the same process. Hit and miss counters are kept in
+                            :attr:`single_flight_policy`. Default False.
+    :type single_flight: bool
+    :keyword cache: Cache the responses of slowly changing resources (principals, tenant users, groups, tenants,
+                    robots and KMS keys), see :class:`~kuflow_rest.policies.ResponseCache`. True to use a cache with
+                    the default settings. Statistics and invalidation are available in :attr:`cache`. Default False.
+    :type cache: bool or ~kuflow_rest.policies.ResponseCache
+    :keyword rate_limit: Limit the request rate and the requests in flight, adapting the limits to the throttling
+                         responses (429 and 503) and their ``Retry-After`` header, see
+                         :class:`~kuflow_rest.policies.RateLimiter`. True to use a limiter with the default settings,
+                         pass the same limiter to several clients to share the limits. Its metrics are available in
+                         :attr:`rate_limiter`. Default False.
+    :type rate_limit: bool or ~kuflow_rest.policies.RateLimiter
+    :keyword hedging: Send a backup request when a read request (GET) is slow and use the first successful response,
+                      see :class:`~kuflow_rest.policies.Hedging`. True to hedge with the default settings. Statistics
+                      are available in :attr:`hedging`. Default False.
+    :type hedging: bool or ~kuflow_rest.policies.Hedging
+    :keyword circuit_breaker: Fail at once with a :class:`~kuflow_rest.policies.CircuitBreakerOpenError` the calls of
+                              an operation that failed several times in a row, until the API recovers, see
+                              :class:`~kuflow_rest.policies.CircuitBreaker`. True to use breakers with the default
+                              settings. Their state is available in :attr:`circuit_breaker`. Default False.
+    :type circuit_breaker: bool or ~kuflow_rest.policies.CircuitBreaker
+    :keyword compression: Compress the JSON request bodies of ``compression_threshold`` bytes or more, ie: task data
+                          and entities, and ask for compressed responses in the encodings the transport decodes, see
+                          :class:`~kuflow_rest.policies.CompressionPolicy`. True to use gzip, or the name of the
+                          encoding: "gzip", "deflate", "br" or "zstd" ("br" and "zstd" require the ``compression``
+                          extra). Statistics are available in :attr:`compression_policy`. Default False.
+    :type compression: bool or str
+    :keyword compression_threshold: Minimum size, in bytes, of the compressed request bodies. Default value is 1024.
+    :type compression_threshold: int
+    :keyword robot_cache: Keep the robot source code and assets in a local directory, see
+                          :class:`~kuflow_rest.RobotCache` and the ``retrieve_robot_source_code_path`` and
+                          ``retrieve_robot_asset_path`` robot operations. True to use a cache in the user cache
+                          directory. It is available in :attr:`robot_cache`. Default False.
+    :type robot_cache: bool or ~kuflow_rest.RobotCache
     """
 
     def __init__(
@@ -207,15 +277,28 @@ class KuFlowRestClient:  # pylint: disable=client-accepts-api-version-keyword
         credential: Optional[TokenCredential] = None,
         endpoint: Optional[str] = None,
         allow_insecure_connection: Optional[bool] = None,
+        connection_pool_size: Optional[int] = None,
+        connection_pool_size_per_host: Optional[int] = None,
+        keep_alive: bool = True,
+        connection_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        json_backend: Optional[Union[str, JsonBackend]] = None,
+        lazy_deserialization: bool = False,
+        compact_page_items: bool = False,
+        single_flight: bool = False,
+        cache: Union[bool, ResponseCache] = False,
+        http2: bool = False,
+        rate_limit: Union[bool, RateLimiter] = False,
+        hedging: Union[bool, Hedging] = False,
+        circuit_breaker: Union[bool, CircuitBreaker] = False,
+        compression: Union[bool, str] = False,
+        compression_threshold: int = 1024,
+        robot_cache: Union[bool, RobotCache] = False,
         **kwargs: Any,
     ) -> None:
         if endpoint is None:
             endpoint = "https://api.kuflow.com/v2024-06-14"
 
-        per_call_policies = []
-        if allow_insecure_connection:
-            per_call_policies.append(AllowHttpPolicy())
-
         if not endpoint.endswith("/" + KuFlowRestClient.API_VERSION):
             endpoint = endpoint + "/" + KuFlowRestClient.API_VERSION
 
@@ -225,6 +308,36 @@ class KuFlowRestClient:  # pylint: disable=client-accepts-api-version-keyword
         if credential is None:
             raise Exception("client_id/client_secrets or credential is required")
 
+        transport = kwargs.pop("transport", None)
+        if transport is None:
+            transport = create_transport(
+                http2=http2,
+                connection_pool_size=connection_pool_size,
+                connection_pool_size_per_host=connection_pool_size_per_host,
+                keep_alive=keep_alive,
+            )
+
+        policies = ClientPolicies(
+            transport,
+            asynchronous=False,
+            allow_insecure_connection=allow_insecure_connection,
+            connection_timeout=connection_timeout,
+            read_timeout=read_timeout,
+            single_flight=single_flight,
+            cache=cache,
+            rate_limit=rate_limit,
+            hedging=hedging,
+            circuit_breaker=circuit_breaker,
+            compression=compression,
+            compression_threshold=compression_threshold,
+        )
+        self.cache: Optional[ResponseCache] = policies.cache
+        self.single_flight_policy: Optional[SingleFlightPolicy] = policies.single_flight_policy
+        self.circuit_breaker: Optional[CircuitBreaker] = policies.circuit_breaker
+        self.hedging: Optional[Hedging] = policies.hedging
+        self.rate_limiter: Optional[RateLimiter] = policies.rate_limiter
+        self.compression_policy: Optional[CompressionPolicy] = policies.compression_policy
+
         python_version = platform.python_version()
         platform_id = platform.platform()
 
@@ -233,9 +346,12 @@ class KuFlowRestClient:  # pylint: disable=client-accepts-api-version-keyword
             endpoint=endpoint,
             api_version=kwargs.pop("api_version", VERSION),
             credential_scopes="https://api.kuflow.com/v2024-06-14/.default",
-            per_call_policies=per_call_policies,
+            per_call_policies=policies.per_call_policies,
+            per_retry_policies=policies.per_retry_policies,
             base_user_agent=f"sdk-python-kuflow-rest/{VERSION} Python/{python_version} ({platform_id})",
+            transport=transport,
         )
+        use_kuflow_serialization(self._kuflow_client, json_backend, lazy_deserialization, compact_page_items)
 
         self.authentication = AuthenticationOperations(self._kuflow_client)
         self.business_artifact = BusinessArtifactOperations(self._kuflow_client)
@@ -246,7 +362,11 @@ class KuFlowRestClient:  # pylint: disable=client-accepts-api-version-keyword
         self.process = ProcessOperations(self._kuflow_client)
         self.process_item = ProcessItemOperations(self._kuflow_client)
         self.worker = WorkerOperations(self._kuflow_client)
-        self.robot = RobotOperations(self._kuflow_client)
+        self.robot_cache: Optional[RobotCache] = None
+        if robot_cache is not False:
+            self.robot_cache = RobotCache() if robot_cache is True else robot_cache
+
+        self.robot = RobotOperations(self._kuflow_client, self.robot_cache)
         self.tenant = TenantOperations(self._kuflow_client)
 
     def __enter__(self):
@@ -0,0 +1,54 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import importlib
+import sys
+from typing import Any, Callable
+
+
+def lazy_import(module_name: str, imports: dict[str, str]) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build the module ``__getattr__`` and ``__dir__`` (PEP 562) that import the public names on first access.
+
+    Importing ``kuflow_rest`` would otherwise import the generated models and operations, azure-core and isodate,
+    which every worker or robot process pays at startup even if it only needs a few names. Imported names are stored
+    in the module, so ``__getattr__`` is only called once per name.
+
+    :param str module_name: Name of the module that exposes the names, ``__name__``.
+    :param dict imports: Module, relative to ``module_name``, where each name is defined.
+    :return: The ``__getattr__`` and ``__dir__`` functions of the module.
+    """
+
+    def __getattr__(name: str) -> Any:
+        defining_module = imports.get(name)
+        if defining_module is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(defining_module, module_name), name)
+        setattr(sys.modules[module_name], name, value)
+
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*vars(sys.modules[module_name]), *imports})
+
+    return __getattr__, __dir__
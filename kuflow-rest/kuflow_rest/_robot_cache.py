@@ -0,0 +1,465 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+import tarfile
+import threading
+import time
+import zipfile
+from collections.abc import Awaitable
+from typing import IO, Any, Callable, Optional, Union
+
+
+if sys.platform == "win32":
+    import msvcrt
+
+    def _lock_file(file: IO[bytes]) -> None:
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_NBLCK, 1)
+
+    def _unlock_file(file: IO[bytes]) -> None:
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock_file(file: IO[bytes]) -> None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+    def _unlock_file(file: IO[bytes]) -> None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+
+
+DEFAULT_MAX_SIZE = 5 * 1024 * 1024 * 1024
+
+_ENTRY_FILE = "entry.json"
+_UNPACKED_DIRECTORY = "unpacked"
+_UNSAFE_FILE_NAME = re.compile(r"[^\w.-]+")
+
+
+def default_robot_cache_directory() -> str:
+    """Return the directory of the robot cache in the user cache directory of the platform."""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser(r"~\AppData\Local")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+
+    return os.path.join(base, "kuflow", "robots")
+
+
+class _FileLock:
+    """Exclusive lock of a file, between processes and between the threads of a process."""
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._file: Optional[IO[bytes]] = None
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the lock, ``timeout`` seconds at most, 0 to try once.
+
+        :return: True if the lock is acquired.
+        """
+        file = open(self._path, "a+b")
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = 0.01
+        while True:
+            try:
+                _lock_file(file)
+            except OSError:
+                if deadline is not None and time.monotonic() >= deadline:
+                    file.close()
+                    return False
+                time.sleep(delay)
+                delay = min(delay * 2, 0.5)
+                continue
+            self._file = file
+            return True
+
+    async def acquire_async(self, timeout: Optional[float] = None) -> bool:
+        """Async version of :meth:`acquire`, the lock is tried again after a sleep instead of blocking a thread.
+
+        A task cancelled while it waits does not hold the lock.
+
+        :return: True if the lock is acquired.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = 0.01
+        while not self.acquire(0):
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.5)
+
+        return True
+
+    def release(self) -> None:
+        if self._file is not None:
+            _unlock_file(self._file)
+            self._file.close()
+            self._file = None
+
+
+class RobotCache:
+    """Local cache of robot source code and robot assets, so that robots are not downloaded before every execution.
+
+    The source code of a robot is cached by robot id, ``last_modified_at`` and source file hash, a robot that is
+    updated is downloaded again. Assets are cached by type, version, platform and architecture, they are shared by
+    every robot. Files can be unpacked too (zip and tar archives), the unpacked directory is kept along with the file.
+
+    The cache is a directory that can be shared by several processes: downloads of the same file are made once, the
+    other processes wait for them. Entries are evicted, least recently used first, when their total size is greater
+    than ``max_size``. An entry in use by a process can be evicted by another one, ``max_size`` should leave room for
+    the robots that run at the same time.
+
+    :param directory: Cache directory. Default value is ``kuflow/robots`` in the user cache directory.
+    :type directory: str or ~os.PathLike
+    :param int max_size: Maximum size, in bytes, of the cached files and directories. Default value is 5 GiB.
+    :param float lock_timeout: Seconds to wait for the download of a file by another process. Default value is 600.
+    :ivar int hits: Files found in the cache.
+    :ivar int misses: Files downloaded.
+    :ivar int evictions: Entries evicted because ``max_size`` was reached.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Union[str, "os.PathLike[str]"]] = None,
+        max_size: int = DEFAULT_MAX_SIZE,
+        lock_timeout: float = 600.0,
+    ) -> None:
+        self.directory = os.fspath(directory) if directory is not None else default_robot_cache_directory()
+        self.max_size = max_size
+        self.lock_timeout = lock_timeout
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries_directory = os.path.join(self.directory, "entries")
+        self._locks_directory = os.path.join(self.directory, "locks")
+        self._lock = threading.Lock()
+        os.makedirs(self._entries_directory, exist_ok=True)
+        os.makedirs(self._locks_directory, exist_ok=True)
+
+    @staticmethod
+    def source_code_key(robot: Any) -> str:
+        """Return the cache key of the source code of a robot.
+
+        :param robot: The robot.
+        :type robot: ~kuflow_rest.models.Robot
+        :rtype: str
+        """
+        last_modified_at = robot.last_modified_at.isoformat() if robot.last_modified_at is not None else ""
+
+        return f"source-code/{robot.id}/{last_modified_at}/{robot.source_file.content_hash}"
+
+    @staticmethod
+    def asset_key(type: Any, version: str, platform: Any, architecture: Any) -> str:  # noqa: A002
+        """Return the cache key of a robot asset.
+
+        :rtype: str
+        """
+        return "asset/" + "/".join(
+            str(getattr(value, "value", value)) for value in (type, version, platform, architecture)
+        )
+
+    def lookup(self, key: str, file_name: str, unpack: bool = False) -> Optional[str]:
+        """Return the path of a cached file, or of its unpacked directory, None when it is not cached.
+
+        :param str key: The cache key.
+        :param str file_name: Name of the file.
+        :param bool unpack: Return the unpacked directory. Default False.
+        :rtype: Optional[str]
+        """
+        path = self._lookup(key, file_name, unpack)
+        if path is not None:
+            with self._lock:
+                self.hits += 1
+
+        return path
+
+    def get(self, key: str, file_name: str, download: Callable[[str], Any], unpack: bool = False) -> str:
+        """Return the path of a cached file, or of its unpacked directory, downloading it when it is not cached.
+
+        :param str key: The cache key.
+        :param str file_name: Name of the file.
+        :param download: Function that downloads the file to the path it receives.
+        :type download: Callable[[str], Any]
+        :param bool unpack: Unpack the file and return the unpacked directory. Default False.
+        :rtype: str
+        :raises TimeoutError: If another process does not finish the download in ``lock_timeout`` seconds.
+        """
+        path = self.lookup(key, file_name, unpack)
+        if path is not None:
+            return path
+
+        lock = self._entry_lock(key)
+        if not lock.acquire(self.lock_timeout):
+            raise TimeoutError(f"Timed out waiting for the robot cache entry {key}")
+        try:
+            path = self._lookup(key, file_name, unpack)
+            if path is None:
+                file_path = self._file_path(key, file_name)
+                if not os.path.exists(file_path):
+                    with self._lock:
+                        self.misses += 1
+                    download(file_path)
+                path = self._complete(key, file_name, unpack)
+        finally:
+            lock.release()
+
+        self.evict(keep=key)
+
+        return path
+
+    async def get_async(
+        self, key: str, file_name: str, download: Callable[[str], Awaitable[Any]], unpack: bool = False
+    ) -> str:
+        """Async version of :meth:`get`, ``download`` is a coroutine function.
+
+        :rtype: str
+        :raises TimeoutError: If another process does not finish the download in ``lock_timeout`` seconds.
+        """
+        path = self.lookup(key, file_name, unpack)
+        if path is not None:
+            return path
+
+        loop = asyncio.get_running_loop()
+        lock = self._entry_lock(key)
+        if not await lock.acquire_async(self.lock_timeout):
+            raise TimeoutError(f"Timed out waiting for the robot cache entry {key}")
+        try:
+            path = self._lookup(key, file_name, unpack)
+            if path is None:
+                file_path = self._file_path(key, file_name)
+                if not os.path.exists(file_path):
+                    with self._lock:
+                        self.misses += 1
+                    await download(file_path)
+                path = await loop.run_in_executor(None, self._complete, key, file_name, unpack)
+        finally:
+            lock.release()
+
+        await loop.run_in_executor(None, self.evict, key)
+
+        return path
+
+    def invalidate(self, key: str) -> bool:
+        """Remove a cached entry.
+
+        :param str key: The cache key.
+        :return: True if the entry was removed.
+        :rtype: bool
+        :raises TimeoutError: If the entry is being downloaded for more than ``lock_timeout`` seconds.
+        """
+        lock = self._entry_lock(key)
+        if not lock.acquire(self.lock_timeout):
+            raise TimeoutError(f"Timed out waiting for the robot cache entry {key}")
+        try:
+            return self._remove(self._entry_directory(key))
+        finally:
+            lock.release()
+
+    def clear(self) -> None:
+        """Remove every cached entry that is not being downloaded."""
+        with self._global_lock():
+            for digest in os.listdir(self._entries_directory):
+                self._remove_unlocked(digest)
+
+    def evict(self, keep: Optional[str] = None) -> int:
+        """Evict the least recently used entries until the size of the cache is not greater than ``max_size``.
+
+        :param str keep: Key of an entry that is not evicted. Default value is None.
+        :return: The number of evicted entries.
+        :rtype: int
+        """
+        keep_digest = None if keep is None else self._digest(keep)
+        evicted = 0
+        with self._global_lock():
+            entries = [self._entry_usage(digest) for digest in os.listdir(self._entries_directory)]
+            total = sum(size for _, size, _ in entries)
+            for digest, size, _ in sorted(entries, key=lambda entry: entry[2]):
+                if total <= self.max_size:
+                    break
+                if digest != keep_digest and self._remove_unlocked(digest):
+                    total -= size
+                    evicted += 1
+
+        with self._lock:
+            self.evictions += evicted
+
+        return evicted
+
+    def _lookup(self, key: str, file_name: str, unpack: bool) -> Optional[str]:
+        entry_directory = self._entry_directory(key)
+        path = os.path.join(entry_directory, _UNPACKED_DIRECTORY if unpack else _safe_file_name(file_name))
+        try:
+            # The modification time of the entry file is the last use of the entry
+            os.utime(os.path.join(entry_directory, _ENTRY_FILE))
+        except OSError:
+            return None
+
+        return path if os.path.exists(path) else None
+
+    def _complete(self, key: str, file_name: str, unpack: bool) -> str:
+        entry_directory = self._entry_directory(key)
+        file_path = self._file_path(key, file_name)
+        path = file_path
+        if unpack:
+            path = os.path.join(entry_directory, _UNPACKED_DIRECTORY)
+            if not os.path.isdir(path):
+                unpacking_path = path + ".tmp"
+                shutil.rmtree(unpacking_path, ignore_errors=True)
+                unpack_archive(file_path, unpacking_path)
+                os.replace(unpacking_path, path)
+
+        entry = {"key": key, "file": os.path.basename(file_path), "size": _disk_usage(entry_directory)}
+        entry_path = os.path.join(entry_directory, _ENTRY_FILE)
+        with open(entry_path + ".tmp", "w", encoding="utf-8") as file:
+            json.dump(entry, file)
+        os.replace(entry_path + ".tmp", entry_path)
+
+        return path
+
+    def _entry_usage(self, digest: str) -> tuple[str, int, float]:
+        entry_directory = os.path.join(self._entries_directory, digest)
+        entry_path = os.path.join(entry_directory, _ENTRY_FILE)
+        try:
+            with open(entry_path, encoding="utf-8") as file:
+                size = int(json.load(file)["size"])
+            return digest, size, os.path.getmtime(entry_path)
+        except (OSError, ValueError, KeyError, TypeError):
+            # Incomplete entry, being downloaded or left by a failed download
+            return digest, _disk_usage(entry_directory), _getmtime(entry_directory)
+
+    def _remove_unlocked(self, digest: str) -> bool:
+        lock = _FileLock(os.path.join(self._locks_directory, digest + ".lock"))
+        if not lock.acquire(0):
+            return False
+        try:
+            return self._remove(os.path.join(self._entries_directory, digest))
+        finally:
+            lock.release()
+
+    def _remove(self, entry_directory: str) -> bool:
+        if not os.path.isdir(entry_directory):
+            return False
+        # The entry file goes first, the entry is not found by other processes while it is removed
+        try:
+            os.remove(os.path.join(entry_directory, _ENTRY_FILE))
+        except FileNotFoundError:
+            pass
+        shutil.rmtree(entry_directory, ignore_errors=True)
+
+        return True
+
+    def _global_lock(self) -> "_LockContext":
+        return _LockContext(_FileLock(os.path.join(self.directory, "cache.lock")), self.lock_timeout)
+
+    def _entry_lock(self, key: str) -> _FileLock:
+        return _FileLock(os.path.join(self._locks_directory, self._digest(key) + ".lock"))
+
+    def _entry_directory(self, key: str) -> str:
+        return os.path.join(self._entries_directory, self._digest(key))
+
+    def _file_path(self, key: str, file_name: str) -> str:
+        entry_directory = self._entry_directory(key)
+        os.makedirs(entry_directory, exist_ok=True)
+
+        return os.path.join(entry_directory, _safe_file_name(file_name))
+
+    @staticmethod
+    def _digest(key: str) -> str:
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+class _LockContext:
+    def __init__(self, lock: _FileLock, timeout: float) -> None:
+        self._lock = lock
+        self._timeout = timeout
+
+    def __enter__(self) -> None:
+        if not self._lock.acquire(self._timeout):
+            raise TimeoutError("Timed out waiting for the robot cache")
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._lock.release()
+
+
+def unpack_archive(path: str, directory: str) -> None:
+    """Unpack a zip or tar archive, whatever its file name, into a directory.
+
+    :raises ValueError: If the file is not an archive or has members outside the directory.
+    """
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            # Members with absolute paths or ".." are extracted inside the directory
+            archive.extractall(directory)
+    elif tarfile.is_tarfile(path):
+        with tarfile.open(path) as archive:
+            if hasattr(tarfile, "data_filter"):
+                try:
+                    archive.extractall(directory, filter="data")
+                except tarfile.FilterError as e:
+                    raise ValueError(f"Unsafe member in archive {path}: {e}") from e
+            else:
+                root = os.path.realpath(directory)
+                for member in archive.getmembers():
+                    target = os.path.realpath(os.path.join(directory, member.name))
+                    if os.path.commonpath([root, target]) != root or member.issym() or member.islnk():
+                        raise ValueError(f"Unsafe member in archive {path}: {member.name}")
+                archive.extractall(directory)
+    else:
+        raise ValueError(f"The file is not a zip or tar archive: {path}")
+
+
+def _safe_file_name(file_name: str) -> str:
+    file_name = _UNSAFE_FILE_NAME.sub("_", os.path.basename(file_name or ""))
+
+    return file_name if file_name.strip(".") and file_name not in (_ENTRY_FILE, _UNPACKED_DIRECTORY) else "file"
+
+
+def _disk_usage(path: str) -> int:
+    size = 0
+    for directory, _, files in os.walk(path):
+        for file_name in files:
+            try:
+                size += os.lstat(os.path.join(directory, file_name)).st_size
+            except OSError:
+                pass
+
+    return size
+
+
+def _getmtime(path: str) -> float:
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return 0.0
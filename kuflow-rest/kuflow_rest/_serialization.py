@@ -0,0 +1,786 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import weakref
+from collections.abc import MutableMapping
+from enum import Enum
+from typing import Any, Callable, Optional, Union
+
+from azure.core.exceptions import DecodeError, DeserializationError, SerializationError
+from azure.core.pipeline import PipelineRequest, PipelineResponse
+from azure.core.pipeline.policies import ContentDecodePolicy
+from azure.core.rest import AsyncHttpResponse, HttpResponse
+from azure.core.serialization import NULL as CoreNull
+
+from ._generated._utils.serialization import (
+    _FLATTEN,
+    Deserializer,
+    Model,
+    Serializer,
+    _decode_attribute_map_key,
+    full_restapi_key_transformer,
+    rest_key_extractor,
+    xml_key_extractor,
+)
+from .models._compact import compact_model_class
+from .utils._json_backend import JsonBackend, get_json_backend
+
+
+_Converter = Callable[[Any], Any]
+
+_NOT_DECODED = object()
+
+
+class _DeserializationPlan:
+    """Everything needed to build a model from a JSON dict, computed once per model class."""
+
+    __slots__ = (
+        "model",
+        "name",
+        "polymorphic",
+        "fields",
+        "fields_by_attr",
+        "known_keys",
+        "init_attrs",
+        "readonly_attrs",
+        "deserializer",
+        "_lazy_model",
+        "_default_state",
+    )
+
+    def __init__(self, deserializer: "KuFlowDeserializer", model: type[Model]) -> None:
+        self.model = model
+        self.name = model.__name__
+        self.polymorphic = "_subtype_map" in model.__dict__
+
+        validation = getattr(model, "_validation", {})
+        subtype_attrs = getattr(model, "_subtype_map", {})
+        readonly_attrs = [attr for attr, config in validation.items() if config.get("readonly")]
+        constant_attrs = [attr for attr, config in validation.items() if config.get("constant")]
+
+        # (attribute, rest key or None when the key is flattened, attribute description, converter)
+        self.fields: list[tuple[str, Optional[str], dict[str, Any], Optional[_Converter]]] = []
+        for attr, attr_desc in model._attribute_map.items():  # pylint: disable=protected-access
+            if attr == "additional_properties" and attr_desc["key"] == "":
+                continue
+            key_parts = _FLATTEN.split(attr_desc["key"])
+            key = _decode_attribute_map_key(key_parts[0]) if len(key_parts) == 1 else None
+            self.fields.append((attr, key, attr_desc, deserializer.compile_converter(attr_desc["type"])))
+
+        # Additional properties are only detected when the model does not map them to a real key
+        self.known_keys: Optional[frozenset[str]] = None
+        if model._attribute_map.get("additional_properties", {}).get("key", "") == "":  # pylint: disable=protected-access
+            self.known_keys = frozenset(
+                _decode_attribute_map_key(_FLATTEN.split(attr_desc["key"])[0])
+                for attr_desc in model._attribute_map.values()  # pylint: disable=protected-access
+                if attr_desc["key"] != ""
+            )
+        self.init_attrs = frozenset(
+            attr
+            for attr, _, _, _ in self.fields
+            if attr not in subtype_attrs and attr not in readonly_attrs and attr not in constant_attrs
+        )
+        self.readonly_attrs = tuple(readonly_attrs)
+        self.fields_by_attr = {attr: (key, attr_desc, converter) for attr, key, attr_desc, converter in self.fields}
+        self.deserializer = deserializer
+        self._lazy_model: Optional[type[Model]] = None
+        self._default_state: Optional[dict[str, Any]] = None
+
+    def convert(self, attr: str, data: dict[str, Any]) -> Any:
+        """Convert the value of a single attribute, as the eager path does for every attribute.
+
+        :param str attr: The attribute name.
+        :param dict data: The JSON dict of the model.
+        :return: The attribute value.
+        """
+        if attr == "additional_properties":
+            if not self.deserializer.additional_properties_detection or self.known_keys is None:
+                return {}
+            return {key: data[key] for key in data.keys() - self.known_keys}
+
+        field = self.fields_by_attr.get(attr)
+        if field is None:
+            raise AttributeError(f"'{self.name}' object has no attribute '{attr}'")
+        key, attr_desc, converter = field
+        try:
+            value = data.get(key) if key is not None else rest_key_extractor(attr, attr_desc, data)
+            if value is not None and converter is not None:
+                value = converter(value)
+        except DeserializationError:
+            raise
+        except (AttributeError, TypeError, KeyError, ValueError) as err:
+            raise DeserializationError("Unable to deserialize to object: " + self.name) from err
+
+        return value
+
+    @property
+    def default_state(self) -> dict[str, Any]:
+        """Attributes that are not built from the JSON (constants, discriminators), with the values set by __init__."""
+        default_state = self._default_state
+        if default_state is None:
+            template = vars(self.model(**dict.fromkeys(self.init_attrs)))
+            default_state = self._default_state = {
+                attr: value
+                for attr, value in template.items()
+                if attr not in self.init_attrs and attr not in self.readonly_attrs and attr != "additional_properties"
+            }
+
+        return default_state
+
+    def new_lazy_model(self, data: dict[str, Any]) -> Model:
+        """Build a model whose attributes are converted from ``data`` on first access.
+
+        :param dict data: The JSON dict of the model.
+        :return: The model.
+        """
+        lazy_model = self._lazy_model
+        if lazy_model is None:
+            lazy_model = self._lazy_model = type(
+                self.model.__name__,
+                (_LazyModel, self.model),
+                {"__module__": self.model.__module__, "__qualname__": self.model.__qualname__, "_lazy_plan": self},
+            )
+
+        response_obj = lazy_model.__new__(lazy_model)
+        state = response_obj.__dict__
+        state.update(self.default_state)
+        state["_lazy_data"] = data
+
+        return response_obj
+
+
+class _LazyModel:
+    """Mixin of the models built by a lazy :class:`KuFlowDeserializer`.
+
+    The JSON dict of the model is kept and each attribute is converted, and stored, the first time it is read. Nested
+    models are lazy too. Comparing, printing, copying or pickling the model converts every pending attribute first,
+    copies and unpickled objects are instances of the generated model class.
+    """
+
+    _lazy_plan: _DeserializationPlan
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes that are not set yet
+        state = self.__dict__
+        data = state.get("_lazy_data")
+        if data is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        value = state[name] = self._lazy_plan.convert(name, data)
+
+        return value
+
+    def _materialize(self) -> None:
+        state = self.__dict__
+        if "_lazy_data" not in state:
+            return
+        for attr in [*self._lazy_plan.fields_by_attr, "additional_properties"]:
+            getattr(self, attr)
+        del state["_lazy_data"]
+
+    def __eq__(self, other: Any) -> bool:
+        self._materialize()
+        if isinstance(other, _LazyModel):
+            other._materialize()
+        return isinstance(other, self._lazy_plan.model) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other: Any) -> bool:
+        return not self.__eq__(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __str__(self) -> str:
+        self._materialize()
+        return str(self.__dict__)
+
+    def __reduce_ex__(self, protocol):
+        self._materialize()
+        return _new_model, (self._lazy_plan.model,), self.__dict__.copy()
+
+
+def _new_model(model: type[Model]) -> Model:
+    return model.__new__(model)
+
+
+class KuFlowDeserializer(Deserializer):
+    """Deserializer that builds models through a plan compiled once per model class.
+
+    The generic :class:`Deserializer` parses the attribute map of every object it reads: it copies each attribute
+    description, parses its type string and runs every key extractor. KuFlow only speaks JSON, so for dict payloads
+    this deserializer reads the keys directly and converts the values with converters resolved ahead of time. The
+    result is the same as with the generic implementation, any other payload is delegated to it.
+
+    Generic ``object`` values are plain JSON already, so they are returned as parsed instead of being copied.
+
+    :param dict classes: Class type dictionary for deserializing complex types.
+    :param bool json_only: Skip the XML key extractor. Default value is True.
+    :param JsonBackend json_backend: Backend used to parse JSON responses. Default value is None, the generic
+                                     implementation.
+    :param bool lazy: Build models whose attributes are converted on first access, see :class:`_LazyModel`. When only
+                      a few attributes of a large response are read, this saves most of the deserialization time and
+                      memory. Conversion errors are raised when the attribute is read. Default value is False.
+    :param decoded_responses: JSON documents already parsed by the :class:`KuFlowContentDecodePolicy`, by HTTP
+                              response. They are used instead of parsing the response body again.
+    :type decoded_responses: ~collections.abc.MutableMapping
+    :param bool compact: Build :class:`~kuflow_rest.models.CompactModel` objects instead of the generated models.
+                         Default value is False.
+    :param bool compact_page_items: Build page items (``ProcessPageItem``, ``ProcessItemPageItem``...), and the
+                                    models nested in them, as :class:`~kuflow_rest.models.CompactModel` objects. It
+                                    takes precedence over ``lazy`` for page items. Default value is False.
+    """
+
+    def __init__(
+        self,
+        classes: Optional[dict[str, type]] = None,
+        json_only: bool = True,
+        json_backend: Optional[JsonBackend] = None,
+        lazy: bool = False,
+        decoded_responses: Optional[MutableMapping[Any, Any]] = None,
+        compact: bool = False,
+        compact_page_items: bool = False,
+    ) -> None:
+        super().__init__(classes)
+        if json_only:
+            self.key_extractors = [rest_key_extractor]
+        self.json_backend = json_backend
+        self.lazy = lazy
+        self.decoded_responses = decoded_responses
+        self.compact = compact
+        self._compact_deserializer: Optional[KuFlowDeserializer] = None
+        if compact_page_items and not compact:
+            self._compact_deserializer = KuFlowDeserializer(classes, json_only=json_only, compact=True)
+        self._plans: dict[type, _DeserializationPlan] = {}
+        self._converters: dict[str, Optional[_Converter]] = {}
+
+    def _deserialize(self, target_obj, data):
+        if type(data) is not dict or any(
+            extractor not in (rest_key_extractor, xml_key_extractor) for extractor in self.key_extractors
+        ):
+            return super()._deserialize(target_obj, data)
+
+        model = self.dependencies.get(target_obj) if isinstance(target_obj, str) else target_obj
+        plan = self._plans.get(model)  # type: ignore[arg-type]
+        if plan is None:
+            if not (isinstance(model, type) and issubclass(model, Model)):
+                return super()._deserialize(target_obj, data)
+            plan = self._plans[model] = _DeserializationPlan(self, model)
+        if plan.polymorphic:
+            model = plan.model._classify(data, self.dependencies)  # pylint: disable=protected-access
+            if model is not plan.model:
+                return self._deserialize(model, data)
+        if self._compact_deserializer is not None and plan.name.endswith("PageItem"):
+            self._compact_deserializer.additional_properties_detection = self.additional_properties_detection
+            return self._compact_deserializer._deserialize(plan.model, data)  # pylint: disable=protected-access
+        if self.lazy:
+            return plan.new_lazy_model(data)
+
+        try:
+            attrs = {}
+            for attr, key, attr_desc, converter in plan.fields:
+                value = data.get(key) if key is not None else rest_key_extractor(attr, attr_desc, data)
+                if value is not None and converter is not None:
+                    value = converter(value)
+                attrs[attr] = value
+        except DeserializationError:
+            raise
+        except (AttributeError, TypeError, KeyError, ValueError) as err:
+            raise DeserializationError("Unable to deserialize to object: " + plan.name) from err
+
+        additional_properties = None
+        if self.additional_properties_detection and plan.known_keys is not None:
+            additional_properties = {key: data[key] for key in data.keys() - plan.known_keys}
+
+        if self.compact:
+            compact_class = compact_model_class(plan.model)
+            compact_obj = compact_class.__new__(compact_class)
+            attrs.update(plan.default_state)
+            for attr in compact_class.__slots__:
+                setattr(compact_obj, attr, attrs.get(attr))
+            compact_obj._additional_properties = additional_properties or None  # pylint: disable=protected-access
+            return compact_obj
+
+        try:
+            response_obj = plan.model(**{attr: value for attr, value in attrs.items() if attr in plan.init_attrs})
+        except TypeError as err:
+            raise DeserializationError(f"Unable to deserialize {attrs} into model {plan.model}. {err}") from err
+        for attr in plan.readonly_attrs:
+            setattr(response_obj, attr, attrs.get(attr))
+        if additional_properties:
+            response_obj.additional_properties = additional_properties
+
+        return response_obj
+
+    def _unpack_content(self, raw_data, content_type=None):
+        if getattr(raw_data, "context", None) or not hasattr(raw_data, "body"):
+            return super()._unpack_content(raw_data, content_type)
+        if self.decoded_responses is not None:
+            data = self.decoded_responses.pop(raw_data, _NOT_DECODED)
+            if data is not _NOT_DECODED:
+                return data
+        if self.json_backend is None:
+            return super()._unpack_content(raw_data, content_type)
+
+        mime_type = _mime_type(raw_data.headers.get("content-type"))
+        if not ContentDecodePolicy.JSON_REGEXP.match(mime_type):
+            return super()._unpack_content(raw_data, content_type)
+
+        body = raw_data.body()
+        if not body:
+            return None
+        try:
+            return self.json_backend.loads(body)
+        except ValueError as err:
+            raise DeserializationError(f"JSON is invalid: {err}", err) from err
+
+    def compile_converter(self, data_type: str) -> Optional[_Converter]:
+        """Resolve the function that converts a non null JSON value into ``data_type``.
+
+        :param str data_type: Type string of an attribute map entry, ie: ``[ProcessItemTaskLog]``.
+        :return: The converter, or None when the value is used as is.
+        :rtype: Optional[Callable]
+        """
+        try:
+            return self._converters[data_type]
+        except KeyError:
+            pass
+
+        converter = self._compile_converter(data_type)
+        self._converters[data_type] = converter
+
+        return converter
+
+    def _compile_converter(self, data_type: str) -> Optional[_Converter]:  # noqa: C901
+        if not data_type:
+            return None
+
+        if data_type == "str":
+            deserialize_unicode = self.deserialize_unicode
+            return lambda value: value if type(value) is str else deserialize_unicode(value)
+
+        if data_type in self.basic_types.values():
+            return self._guarded(lambda value: self.deserialize_basic(value, data_type), data_type)
+
+        if data_type == "object":
+            return None
+
+        if data_type in self.deserialize_type:
+            expected_types = self.deserialize_expected_types.get(data_type, ())
+            deserialize = self.deserialize_type[data_type]
+            return self._guarded(
+                lambda value: value if isinstance(value, expected_types) else deserialize(value), data_type
+            )
+
+        iter_type = data_type[0] + data_type[-1]
+        if iter_type == "[]":
+            item_type = data_type[1:-1]
+            item_converter = self.compile_converter(item_type)
+
+            def convert_list(value):
+                if not isinstance(value, (list, set)):
+                    raise DeserializationError(f"Cannot deserialize as [{item_type}] an object of type {type(value)}")
+                if item_converter is None:
+                    return list(value)
+                return [None if item is None else item_converter(item) for item in value]
+
+            return convert_list
+
+        if iter_type == "{}":
+            item_type = data_type[1:-1]
+            item_converter = self.compile_converter(item_type)
+
+            def convert_dict(value):
+                if isinstance(value, list):
+                    value = {item["key"]: item["value"] for item in value}
+                if item_converter is None:
+                    return dict(value)
+                return {key: None if item is None else item_converter(item) for key, item in value.items()}
+
+            return convert_dict
+
+        obj_type = self.dependencies.get(data_type)
+        if obj_type is None:
+            return lambda value: self.deserialize_data(value, data_type)
+        if issubclass(obj_type, Enum):
+            return self._guarded(lambda value: self.deserialize_enum(value, obj_type), data_type)
+
+        return lambda value: self._deserialize(obj_type, value)
+
+    @staticmethod
+    def _guarded(converter: _Converter, data_type: str) -> _Converter:
+        def guarded(value):
+            try:
+                return converter(value)
+            except DeserializationError:
+                raise
+            except (ValueError, TypeError, AttributeError) as err:
+                raise DeserializationError(f"Unable to deserialize response data. Data: {value}, {data_type}") from err
+
+        return guarded
+
+
+class _SerializationPlan:
+    """Everything needed to write a model as a JSON dict, computed once per model class."""
+
+    __slots__ = ("name", "fields")
+
+    def __init__(self, serializer: "KuFlowSerializer", model: type[Model]) -> None:
+        if model.is_xml_model():
+            raise _UnsupportedPayload()
+
+        self.name = model.__name__
+
+        validation = getattr(model, "_validation", {})
+
+        # (attribute, rest key parts or None for additional properties, converter)
+        self.fields: list[tuple[str, Optional[tuple[str, ...]], Optional[_Converter]]] = []
+        for attr, attr_desc in model._attribute_map.items():  # pylint: disable=protected-access
+            if validation.get(attr, {}).get("readonly", False):
+                continue
+            if "xml" in attr_desc:
+                raise _UnsupportedPayload()
+            if attr == "additional_properties" and attr_desc["key"] == "":
+                self.fields.append((attr, None, None))
+                continue
+            keys = tuple(_decode_attribute_map_key(key) for key in _FLATTEN.split(attr_desc["key"]))
+            self.fields.append((attr, keys, serializer.compile_converter(attr_desc["type"])))
+
+
+class _UnsupportedPayload(Exception):
+    """The payload needs the generic serializer: XML models, dicts in place of models, ..."""
+
+
+_JSON_SCALAR_TYPES = frozenset([str, int, float, bool, type(None)])
+
+
+def _is_plain_json(value: Any) -> bool:
+    """Check that a value only contains the types that the generic ``object`` serialization leaves untouched."""
+    pending = [value]
+    while pending:
+        value = pending.pop()
+        value_type = type(value)
+        if value_type is dict:
+            if any(type(key) is not str for key in value):
+                return False
+            pending.extend(value.values())
+        elif value_type is list:
+            pending.extend(value)
+        elif value_type not in _JSON_SCALAR_TYPES:
+            return False
+
+    return True
+
+
+class KuFlowSerializer(Serializer):
+    """Serializer that writes request bodies through a plan compiled once per model class.
+
+    The generic :meth:`Serializer.body` first rebuilds the models of the payload with a deserializer, then walks them
+    parsing the type string of every attribute. When the body is made of models, this serializer writes the JSON dict
+    directly with converters resolved ahead of time. Generic ``object`` values that are already plain JSON, such as
+    the form data of a ``JsonValue``, are sent as they are instead of being copied. The result is the same as with
+    the generic implementation, any other payload is delegated to it.
+
+    :param dict classes: Class type dictionary for serializing complex types.
+    :param JsonBackend json_backend: Backend used to write JSON request bodies, see :func:`encode_json_body`. Default
+                                     value is None, the generic implementation.
+    """
+
+    def __init__(self, classes: Optional[dict[str, type]] = None, json_backend: Optional[JsonBackend] = None) -> None:
+        super().__init__(classes)
+        self.json_backend = json_backend
+        self._plans: dict[type, _SerializationPlan] = {}
+        self._converters: dict[str, Optional[_Converter]] = {}
+
+    def body(self, data, data_type, **kwargs):
+        if data is not None and not kwargs and self.key_transformer is full_restapi_key_transformer:
+            try:
+                converter = self.compile_converter(data_type)
+                return data if converter is None else converter(data)
+            except _UnsupportedPayload:
+                pass
+
+        return super().body(data, data_type, **kwargs)
+
+    def compile_converter(self, data_type: str) -> Optional[_Converter]:
+        """Resolve the function that converts a non null value of ``data_type`` into JSON.
+
+        :param str data_type: Type string of an attribute map entry, ie: ``[JsonPatchOperation]``.
+        :return: The converter, or None when the value is used as is.
+        :rtype: Optional[Callable]
+        """
+        try:
+            return self._converters[data_type]
+        except KeyError:
+            pass
+
+        converter = self._compile_converter(data_type)
+        self._converters[data_type] = converter
+
+        return converter
+
+    def _compile_converter(self, data_type: str) -> Optional[_Converter]:  # noqa: C901
+        if not data_type:
+            return None
+
+        if data_type == "str":
+            serialize_unicode = self.serialize_unicode
+            return lambda value: value if type(value) is str else serialize_unicode(value)
+
+        if data_type in self.basic_types.values():
+            return self._guarded(lambda value: self.serialize_basic(value, data_type), data_type)
+
+        if data_type == "object":
+
+            def convert_object(value):
+                if _is_plain_json(value):
+                    return value
+                return self.serialize_object(value)
+
+            return convert_object
+
+        if data_type in self.serialize_type:
+            serialize = self.serialize_type[data_type]
+            return self._guarded(serialize, data_type)
+
+        obj_type = self.dependencies.get(data_type)
+        if obj_type is not None and issubclass(obj_type, Enum):
+            return self._guarded(lambda value: self.serialize_enum(value, enum_obj=obj_type), data_type)
+
+        iter_type = data_type[0] + data_type[-1]
+        if iter_type == "[]":
+            item_type = data_type[1:-1]
+            item_converter = self.compile_converter(item_type)
+
+            def convert_list(value):
+                if isinstance(value, str):
+                    raise SerializationError("Refuse str type as a valid iter type.")
+                return [None if item is None else self._convert(item_converter, item) for item in value]
+
+            return convert_list
+
+        if iter_type == "{}":
+            item_type = data_type[1:-1]
+            item_converter = self.compile_converter(item_type)
+
+            def convert_dict(value):
+                if item_type == "object" and _is_plain_json(value):
+                    return value
+                return {
+                    self.serialize_unicode(key): None if item is None else self._convert(item_converter, item)
+                    for key, item in value.items()
+                }
+
+            return convert_dict
+
+        if obj_type is not None and issubclass(obj_type, Model):
+            return self._serialize_model
+
+        return lambda value: self.serialize_data(value, data_type)
+
+    @staticmethod
+    def _convert(converter: Optional[_Converter], value: Any) -> Any:
+        if value is CoreNull:
+            return None
+        return value if converter is None else converter(value)
+
+    def _serialize_model(self, model: Any) -> dict[str, Any]:
+        if not isinstance(model, Model):
+            raise _UnsupportedPayload()
+
+        model_type = type(model)
+        plan = self._plans.get(model_type)
+        if plan is None:
+            plan = self._plans[model_type] = _SerializationPlan(self, model_type)
+
+        serialized: dict[str, Any] = {}
+        attr = None
+        try:
+            for attr, keys, converter in plan.fields:
+                value = getattr(model, attr)
+                if keys is None:
+                    if value is not None:
+                        serialized |= value
+                    continue
+                if value is None:
+                    continue
+                value = self._convert(converter, value)
+
+                target = serialized
+                for key in keys[:-1]:
+                    target = target.setdefault(key, {})
+                if keys[-1] not in target:
+                    target[keys[-1]] = value
+        except (AttributeError, KeyError, TypeError) as err:
+            raise SerializationError(f"Attribute {attr} in object {plan.name} cannot be serialized.\n{model}") from err
+
+        return serialized
+
+    @staticmethod
+    def _guarded(converter: _Converter, data_type: str) -> _Converter:
+        def guarded(value):
+            try:
+                return converter(value)
+            except SerializationError:
+                raise
+            except (ValueError, TypeError) as err:
+                raise SerializationError(f"Unable to serialize value: {value!r} as type: {data_type!r}.") from err
+
+        return guarded
+
+
+def use_kuflow_serialization(
+    client: Any,
+    json_backend: Union[str, JsonBackend, None] = None,
+    lazy_deserialization: bool = False,
+    compact_page_items: bool = False,
+) -> None:
+    """Replace the serializers shared by a generated client and its operation groups with the KuFlow ones.
+
+    The content decode policy of the client pipeline is replaced too, so that every JSON response is parsed once.
+
+    :param client: A generated ``KuFlowRestClient``, sync or async.
+    :param json_backend: JSON backend used to read responses and write request bodies, see
+                         :func:`~kuflow_rest.utils.get_json_backend`. Default value is None, the generic implementation.
+    :param bool lazy_deserialization: Build models whose attributes are converted on first access. Default value is
+                                      False.
+    :param bool compact_page_items: Build page items as :class:`~kuflow_rest.models.CompactModel` objects. Default
+                                    value is False.
+    """
+    backend = get_json_backend(json_backend) if json_backend is not None else None
+    decoded_responses: MutableMapping[Any, Any] = weakref.WeakKeyDictionary()
+    generic_serializer = client._serialize  # pylint: disable=protected-access
+    serializer = KuFlowSerializer(generic_serializer.dependencies, json_backend=backend)
+    serializer.client_side_validation = generic_serializer.client_side_validation
+    generic_deserializer = client._deserialize  # pylint: disable=protected-access
+    deserializer = KuFlowDeserializer(
+        generic_deserializer.dependencies,
+        json_backend=backend,
+        lazy=lazy_deserialization,
+        decoded_responses=decoded_responses,
+        compact_page_items=compact_page_items,
+    )
+    for operation_group in [client, *vars(client).values()]:
+        if getattr(operation_group, "_serialize", None) is generic_serializer:
+            operation_group._serialize = serializer  # pylint: disable=protected-access
+        if getattr(operation_group, "_deserialize", None) is generic_deserializer:
+            operation_group._deserialize = deserializer  # pylint: disable=protected-access
+
+    for policy in client._client._pipeline._impl_policies:  # pylint: disable=protected-access
+        # SansIO policies are wrapped by the pipeline
+        content_decode_policy = getattr(policy, "_policy", None)
+        if type(content_decode_policy) is ContentDecodePolicy:  # pylint: disable=unidiomatic-typecheck
+            policy._policy = KuFlowContentDecodePolicy(  # pylint: disable=protected-access
+                backend or get_json_backend(),
+                decoded_responses,
+                response_encoding=content_decode_policy._response_encoding,  # pylint: disable=protected-access
+            )
+
+
+def _mime_type(content_type: Optional[str]) -> str:
+    # Same rules as the ContentDecodePolicy: no content type is considered JSON
+    return content_type.split(";")[0].strip().lower() if content_type else "application/json"
+
+
+def _is_utf8(content_type: Optional[str]) -> bool:
+    for parameter in (content_type or "").split(";")[1:]:
+        name, _, value = parameter.partition("=")
+        if name.strip().lower() == "charset":
+            return value.strip().strip('"').lower() in ("utf-8", "utf8")
+
+    return True
+
+
+class KuFlowContentDecodePolicy(ContentDecodePolicy):
+    """Content decode policy that parses the JSON responses with a JSON backend.
+
+    Generated operations deserialize the HTTP response, not the pipeline response that holds the document parsed by
+    this policy, so the body would be parsed twice. The parsed documents are also kept in ``decoded_responses`` to be
+    reused by the :class:`KuFlowDeserializer`.
+
+    :param JsonBackend json_backend: Backend used to parse JSON responses.
+    :param decoded_responses: Where the parsed JSON documents are kept, by HTTP response.
+    :type decoded_responses: ~collections.abc.MutableMapping
+    """
+
+    def __init__(
+        self,
+        json_backend: JsonBackend,
+        decoded_responses: Optional[MutableMapping[Any, Any]] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.json_backend = json_backend
+        self.decoded_responses = decoded_responses
+
+    def on_response(self, request: PipelineRequest, response: PipelineResponse) -> None:
+        http_response = response.http_response
+        mime_type = _mime_type(http_response.content_type)
+        if (
+            response.context.options.get("stream", True)
+            or request.context.get("response_encoding")
+            or not self.JSON_REGEXP.match(mime_type)
+            or not _is_utf8(http_response.content_type)
+        ):
+            super().on_response(request, response)
+            return
+
+        # Responses are read by the transport, the body() method of the async ones would leave a read() unawaited
+        body = (
+            http_response.content
+            if isinstance(http_response, (HttpResponse, AsyncHttpResponse))
+            else http_response.body()
+        )
+        try:
+            data = self.json_backend.loads(body) if body else None
+        except ValueError as err:
+            raise DecodeError(message=f"JSON is invalid: {err}", response=http_response, error=err) from err
+        response.context[self.CONTEXT_NAME] = data
+        if self.decoded_responses is not None:
+            self.decoded_responses[http_response] = data
+
+
+def encode_json_body(operation_group: Any, body: Any) -> Any:
+    """Write a model request body as JSON with the JSON backend of a generated operation group.
+
+    Generated operations send ``bytes`` bodies as they are, so the body does not go through the ``json`` module of
+    the HTTP request. Any other value, or every value when the client uses the generic JSON implementation, is
+    returned unchanged.
+
+    :param operation_group: A generated operation group, sync or async.
+    :param body: The request body, a model or a list of models.
+    :return: The request body.
+    """
+    serializer = operation_group._serialize  # pylint: disable=protected-access
+    json_backend = getattr(serializer, "json_backend", None)
+    if json_backend is None:
+        return body
+
+    if isinstance(body, Model):
+        data_type = type(body).__name__
+    elif isinstance(body, list) and body and isinstance(body[0], Model):
+        data_type = f"[{type(body[0]).__name__}]"
+    else:
+        return body
+    if data_type.strip("[]") not in serializer.dependencies:
+        return body
+
+    return json_backend.dumps(serializer.body(body, data_type), ensure_ascii=False)
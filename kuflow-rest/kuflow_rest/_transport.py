@@ -0,0 +1,146 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import logging
+from typing import Any, Optional
+
+from azure.core.pipeline.transport import HttpTransport, RequestsTransport
+from azure.core.pipeline.transport._requests_basic import BiggerBlockSizeHTTPAdapter
+from urllib3 import Retry
+
+
+logger = logging.getLogger(__name__)
+
+
+class PooledRequestsTransport(RequestsTransport):
+    """Requests transport with a sized connection pool.
+
+    Requests keeps a pool of connections per host, connections are reused while ``keep_alive`` is enabled so that
+    the TCP and TLS handshakes are only paid once per connection.
+
+    :keyword int connection_pool_size: Number of hosts whose connection pool is kept. Default value is 10.
+    :keyword int connection_pool_size_per_host: Maximum number of connections kept to the same host, it should be
+                                                the number of threads that use the client. Default value is 10.
+    :keyword bool keep_alive: Reuse the connections between requests. Default value is True.
+    """
+
+    def __init__(
+        self,
+        *,
+        connection_pool_size: Optional[int] = None,
+        connection_pool_size_per_host: Optional[int] = None,
+        keep_alive: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self._connection_pool_size = connection_pool_size
+        self._connection_pool_size_per_host = connection_pool_size_per_host
+        self._keep_alive = keep_alive
+
+    def _init_session(self, session) -> None:
+        super()._init_session(session)
+
+        adapter_options = {}
+        if self._connection_pool_size is not None:
+            adapter_options["pool_connections"] = self._connection_pool_size
+        if self._connection_pool_size_per_host is not None:
+            adapter_options["pool_maxsize"] = self._connection_pool_size_per_host
+        if adapter_options:
+            # Same adapter as the azure-core one, retries are done by the pipeline
+            disable_retries = Retry(total=False, redirect=False, raise_on_status=False)
+            adapter = BiggerBlockSizeHTTPAdapter(max_retries=disable_retries, **adapter_options)
+            for protocol in self._protocols:
+                session.mount(protocol, adapter)
+        if not self._keep_alive:
+            session.headers["Connection"] = "close"
+
+
+class SharedTransport(HttpTransport):
+    """Transport shared by several clients, so that they share its connections.
+
+    Clients do not close a shared transport when they are closed, the owner closes it with :meth:`close` once every
+    client is done. Leaving its context manager does not close it either, clients use it as a context manager too.
+    Clients with different credentials can share a transport, authentication is done by each client.
+
+    :param transport: Transport to share. Default value is None, a :class:`PooledRequestsTransport` built with the
+                      keyword arguments.
+    :type transport: ~azure.core.pipeline.transport.HttpTransport
+    """
+
+    def __init__(self, transport: Optional[HttpTransport] = None, **kwargs: Any) -> None:
+        self.transport = transport if transport is not None else PooledRequestsTransport(**kwargs)
+
+    def __enter__(self) -> "SharedTransport":
+        self.transport.open()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        # Closed by its owner, not by the clients
+        pass
+
+    def open(self) -> None:
+        self.transport.open()
+
+    def close(self) -> None:
+        self.transport.close()
+
+    def send(self, request, **kwargs: Any):
+        return self.transport.send(request, **kwargs)
+
+    def sleep(self, duration: float) -> None:
+        self.transport.sleep(duration)
+
+
+def create_transport(
+    *,
+    http2: bool = False,
+    connection_pool_size: Optional[int] = None,
+    connection_pool_size_per_host: Optional[int] = None,
+    keep_alive: bool = True,
+) -> HttpTransport:
+    """Create the transport of a client.
+
+    :keyword bool http2: Use a :class:`~kuflow_rest.HttpxTransport`, with a connection per host that multiplexes the
+                         requests over HTTP/2. When the ``httpx`` package is not installed a
+                         :class:`PooledRequestsTransport` is used instead. Default value is False.
+    :keyword int connection_pool_size: Number of hosts whose connection pool is kept.
+    :keyword int connection_pool_size_per_host: Maximum number of connections kept to the same host. The HTTP/2
+                                                transport uses it as its maximum number of connections.
+    :keyword bool keep_alive: Reuse the connections between requests. Default value is True.
+    :return: The transport.
+    :rtype: ~azure.core.pipeline.transport.HttpTransport
+    """
+    if http2:
+        try:
+            from ._httpx_transport import HttpxTransport
+        except ImportError:
+            logger.warning("httpx is not installed, HTTP/1.1 connections of requests are used instead")
+        else:
+            return HttpxTransport(connection_pool_size=connection_pool_size_per_host, keep_alive=keep_alive)
+
+    return PooledRequestsTransport(
+        connection_pool_size=connection_pool_size,
+        connection_pool_size_per_host=connection_pool_size_per_host,
+        keep_alive=keep_alive,
+    )
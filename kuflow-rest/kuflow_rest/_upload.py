@@ -0,0 +1,309 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import asyncio
+import contextvars
+import io
+import threading
+import time
+from collections.abc import Awaitable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, TYPE_CHECKING, Any, Callable, Optional, TypeVar
+
+from azure.core.exceptions import HttpResponseError, ServiceRequestError, ServiceResponseError
+
+
+if TYPE_CHECKING:
+    from .models import Document, UploadProgress
+
+
+T = TypeVar("T")
+
+RETRY_BACKOFF = 0.5
+"""Seconds before the first retry of a document upload, doubled on every retry."""
+
+_RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+def content_size(content: Any) -> Optional[int]:
+    """Return the bytes left to read in a seekable file, None when it is not seekable.
+
+    :param content: A file object.
+    :return: The size in bytes, or None.
+    :rtype: Optional[int]
+    """
+    try:
+        if not content.seekable():
+            return None
+        position = content.tell()
+        end = content.seek(0, io.SEEK_END)
+        content.seek(position)
+    except (AttributeError, OSError, ValueError):
+        return None
+
+    return end - position
+
+
+class BufferReader(io.RawIOBase):
+    """Read only file over a buffer: bytes, bytearray, memoryview or mmap.
+
+    The buffer is not copied as a whole, every read copies only the chunk it returns.
+    """
+
+    def __init__(self, buffer: Any) -> None:
+        super().__init__()
+        self._view = memoryview(buffer).cast("B")
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        chunk = self._view[self._position : self._position + len(buffer)]
+        size = len(chunk)
+        buffer[:size] = chunk
+        self._position += size
+        return size
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        end = len(self._view) if size is None or size < 0 else self._position + size
+        chunk = self._view[self._position : end].tobytes()
+        self._position += len(chunk)
+        return chunk
+
+    def readall(self) -> bytes:
+        return self.read()
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        if offset < 0:
+            raise ValueError("negative seek position")
+        self._position = offset
+        return offset
+
+    def close(self) -> None:
+        if not self.closed:
+            self._view.release()
+        super().close()
+
+
+class ProgressReader(io.RawIOBase):
+    """File that reports the progress of the reads of another file.
+
+    Seeking, ie: when a request is retried, moves the progress back too. Closing it does not close the other file, that
+    can be sent again.
+    """
+
+    def __init__(
+        self, content: IO, callback: Optional[Callable[["UploadProgress"], None]], total_bytes: Optional[int] = None
+    ) -> None:
+        super().__init__()
+        self._content = content
+        self._callback = callback
+        self._start_position = content.tell() if content.seekable() else 0
+        self._start = time.monotonic()
+        self.total_bytes = total_bytes
+        self.bytes_sent = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return self._content.seekable()
+
+    def readinto(self, buffer: Any) -> int:
+        chunk = self.read(len(buffer))
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        chunk = self._content.read(-1 if size is None else size)
+        if chunk:
+            self.bytes_sent += len(chunk)
+            self._report()
+        return chunk
+
+    def readall(self) -> bytes:
+        return self.read()
+
+    def tell(self) -> int:
+        return self._content.tell()
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        position = self._content.seek(offset, whence)
+        self.bytes_sent = position - self._start_position
+        return position
+
+    def _report(self) -> None:
+        from .models import UploadProgress
+
+        if self._callback is not None:
+            self._callback(UploadProgress(self.bytes_sent, self.total_bytes, time.monotonic() - self._start))
+
+
+def upload_content(document: "Document", progress: Optional[Callable[["UploadProgress"], None]]) -> IO:
+    """Return the body of the upload request of a document.
+
+    :param document: The document.
+    :param progress: Callback of the upload progress, None for none.
+    :return: The file content of the document, wrapped to report the progress.
+    """
+    if progress is None:
+        return document.file_content
+
+    return ProgressReader(document.file_content, progress, document.size)
+
+
+def is_retryable_upload_error(error: BaseException) -> bool:
+    """Return True for the errors of an upload that can succeed if it is sent again: connection errors, timeouts,
+    throttling and server errors.
+    """
+    if isinstance(error, (ServiceRequestError, ServiceResponseError)):
+        return True
+
+    return isinstance(error, HttpResponseError) and error.status_code in _RETRYABLE_STATUS_CODES
+
+
+class _UploadSkippedError(Exception):
+    """The upload of a document did not start because the upload of another document failed."""
+
+
+def upload_documents(
+    upload: Callable[[int, "Document"], T], documents: Sequence["Document"], max_concurrency: int, max_retries: int
+) -> list[T]:
+    """Upload documents in up to ``max_concurrency`` threads, retrying each document up to ``max_retries`` times.
+
+    The error of the first document, in document order, that could not be uploaded is raised, and the documents whose
+    upload did not start are not uploaded. Documents whose content is not seekable are not retried.
+
+    :param upload: Uploads the document of an index.
+    :param documents: The documents.
+    :param int max_concurrency: Documents uploaded at the same time.
+    :param int max_retries: Retries of the upload of a document.
+    :return: The results of the uploads, in the order of the documents.
+    """
+    if max_concurrency <= 0 or max_retries < 0:
+        raise ValueError("max_concurrency must be greater than 0 and max_retries can not be negative")
+    if not documents:
+        return []
+
+    failed = threading.Event()
+
+    def upload_document(index: int) -> T:
+        if failed.is_set():
+            raise _UploadSkippedError()
+        document = documents[index]
+        start = _retry_position(document, max_retries)
+        retries = 0
+        while True:
+            try:
+                return upload(index, _attempt_document(document, start))
+            except Exception as e:
+                if retries == max_retries or start is None or not is_retryable_upload_error(e):
+                    failed.set()
+                    raise
+            time.sleep(RETRY_BACKOFF * 2**retries)
+            retries += 1
+            document.file_content.seek(start)
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_concurrency, len(documents)), thread_name_prefix="kuflow-upload"
+    ) as executor:
+        # Context variables, ie: deadlines, are seen by the uploads
+        futures = [
+            executor.submit(contextvars.copy_context().run, upload_document, index) for index in range(len(documents))
+        ]
+        try:
+            return [future.result() for future in futures]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+
+async def aupload_documents(
+    upload: Callable[[int, "Document"], Awaitable[T]],
+    documents: Sequence["Document"],
+    max_concurrency: int,
+    max_retries: int,
+) -> list[T]:
+    """Async version of :func:`upload_documents`, uploading the documents in tasks."""
+    if max_concurrency <= 0 or max_retries < 0:
+        raise ValueError("max_concurrency must be greater than 0 and max_retries can not be negative")
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    failed = False
+
+    async def upload_document(index: int) -> T:
+        nonlocal failed
+        document = documents[index]
+        async with semaphore:
+            if failed:
+                raise _UploadSkippedError()
+            start = _retry_position(document, max_retries)
+            retries = 0
+            while True:
+                try:
+                    return await upload(index, _attempt_document(document, start))
+                except Exception as e:
+                    if retries == max_retries or start is None or not is_retryable_upload_error(e):
+                        failed = True
+                        raise
+                await asyncio.sleep(RETRY_BACKOFF * 2**retries)
+                retries += 1
+                document.file_content.seek(start)
+
+    tasks = [asyncio.ensure_future(upload_document(index)) for index in range(len(documents))]
+    try:
+        return [await task for task in tasks]
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _retry_position(document: "Document", max_retries: int) -> Optional[int]:
+    if max_retries == 0 or not document.file_content.seekable():
+        return None
+
+    return document.file_content.tell()
+
+
+def _attempt_document(document: "Document", start: Optional[int]) -> "Document":
+    if start is None:
+        return document
+
+    from .models import Document
+
+    # Transports can close the body once it is sent (aiohttp), the content of the document is kept open for the retries
+    return Document(document.file_name, document.content_type, ProgressReader(document.file_content, None))
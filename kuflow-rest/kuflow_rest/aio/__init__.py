@@ -0,0 +1,55 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+from typing import TYPE_CHECKING
+
+from .._lazy_import import lazy_import
+
+
+if TYPE_CHECKING:
+    from ._httpx_transport import AsyncHttpxTransport
+    from ._kuflow_rest_client import ClientSecretCredential, KuBotTokenCredential, KuFlowRestClient
+    from ._transport import AsyncSharedTransport, PooledAioHttpTransport
+
+
+__all__ = [
+    "AsyncHttpxTransport",
+    "AsyncSharedTransport",
+    "ClientSecretCredential",
+    "KuBotTokenCredential",
+    "KuFlowRestClient",
+    "PooledAioHttpTransport",
+]
+
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {
+        "ClientSecretCredential": "._kuflow_rest_client",
+        "KuBotTokenCredential": "._kuflow_rest_client",
+        "KuFlowRestClient": "._kuflow_rest_client",
+        "AsyncHttpxTransport": "._httpx_transport",
+        "AsyncSharedTransport": "._transport",
+        "PooledAioHttpTransport": "._transport",
+    },
+)
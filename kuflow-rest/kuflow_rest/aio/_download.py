@@ -0,0 +1,193 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import asyncio
+import os
+from typing import Any, Optional, Union
+
+from azure.core.exceptions import IncompleteReadError
+from azure.core.rest import HttpRequest
+
+from .._download import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_MAX_RESUMES,
+    DEFAULT_PART_SIZE,
+    RESUMABLE_ERRORS,
+    DownloadPart,
+    check_response,
+    finish_download,
+    part_file_path,
+    partial_download,
+    plan_download,
+    ranged_request,
+    response_validator,
+    resumed,
+    unsatisfied_range_size,
+    written_prefix,
+)
+
+
+class AsyncFileDownloader:
+    """Async version of :class:`~kuflow_rest._download.FileDownloader`, the parts are downloaded by tasks.
+
+    The chunks are written to the file from the event loop, local disk writes of ``chunk_size`` bytes are short.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        request: HttpRequest,
+        path: Union[str, "os.PathLike[str]"],
+        *,
+        expected_size: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        part_size: int = DEFAULT_PART_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_resumes: int = DEFAULT_MAX_RESUMES,
+        **kwargs: Any,
+    ) -> None:
+        if chunk_size <= 0 or part_size <= 0 or max_concurrency <= 0:
+            raise ValueError("chunk_size, part_size and max_concurrency must be greater than 0")
+
+        self._client = client
+        self._request = request
+        self._path = path
+        self._part_path = part_file_path(path)
+        self._expected_size = expected_size
+        self._chunk_size = chunk_size
+        self._part_size = part_size
+        self._max_concurrency = max_concurrency
+        self._max_resumes = max_resumes
+        self._kwargs = kwargs
+        self._validator: Optional[str] = None
+
+    async def download(self) -> int:
+        offset, self._validator = partial_download(self._part_path, self._expected_size)
+        first = self._first_part(offset)
+        response = await self._send(first)
+        if offset and not resumed(response, offset, self._validator):
+            size = unsatisfied_range_size(response) if response.status_code == 416 else None
+            await response.close()
+            if size == offset and response_validator(response) in (None, self._validator):
+                return finish_download(self._part_path, self._path, size, self._expected_size)
+            # The partial file is not a prefix of this file
+            first, self._validator = self._first_part(0), None
+            response = await self._send(first)
+
+        planned = plan_download(response, first, self._part_path, self._part_size)
+        if planned is None:
+            await response.read()
+            check_response(response)
+        parts, total, self._validator = planned
+
+        try:
+            await self._download_parts(parts, response)
+        except BaseException:
+            # Keep the bytes written without gaps, the next download resumes from them
+            with open(self._part_path, "r+b") as file:
+                file.truncate(written_prefix(parts))
+            raise
+
+        return finish_download(self._part_path, self._path, total, self._expected_size)
+
+    def _first_part(self, offset: int) -> DownloadPart:
+        return DownloadPart(offset, offset + self._part_size - 1 if self._max_concurrency > 1 else None)
+
+    async def _download_parts(self, parts: list[DownloadPart], response: Any) -> None:
+        if len(parts) == 1 or self._max_concurrency == 1:
+            await self._write_part(parts[0], response)
+            for part in parts[1:]:
+                await self._write_part(part, None)
+            return
+
+        semaphore = asyncio.Semaphore(self._max_concurrency - 1)
+
+        async def write_part(part: DownloadPart) -> None:
+            async with semaphore:
+                await self._write_part(part, None)
+
+        tasks = [asyncio.ensure_future(write_part(part)) for part in parts[1:]]
+        try:
+            await self._write_part(parts[0], response)
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _send(self, part: DownloadPart) -> Any:
+        request = ranged_request(self._request, part.position, part.end, self._validator)
+
+        return await self._client.send_request(request, stream=True, **self._kwargs)
+
+    async def _write_part(self, part: DownloadPart, response: Any) -> None:
+        resumes = 0
+        with open(self._part_path, "r+b", buffering=self._chunk_size) as file:
+            while not part.complete:
+                if response is None:
+                    response = await self._send(part)
+                    if response.status_code == 200 and part.start == 0 and part.end is None:
+                        # The server does not support ranges, the file starts again
+                        part.written = 0
+                    elif response.status_code != 206:
+                        await response.read()
+                        check_response(response)
+                try:
+                    file.seek(part.position)
+                    async for chunk in response.iter_bytes():
+                        file.write(chunk)
+                        part.written += len(chunk)
+                    if part.end is None:
+                        return
+                except RESUMABLE_ERRORS:
+                    resumes += 1
+                    if resumes > self._max_resumes:
+                        raise
+                    continue
+                finally:
+                    file.flush()
+                    await response.close()
+                    response = None
+
+                if not part.complete:
+                    # The response ended before the end of the range
+                    resumes += 1
+                    if resumes > self._max_resumes:
+                        raise IncompleteReadError(f"The range {part.start}-{part.end} ended at byte {part.position}")
+
+
+async def download_to_file(
+    client: Any, request: HttpRequest, path: Union[str, "os.PathLike[str]"], **kwargs: Any
+) -> int:
+    """Async version of :func:`~kuflow_rest._download.download_to_file`.
+
+    :param client: The generated async client that sends the request.
+    :param request: The download request.
+    :param path: The file path.
+    :return: The size of the file.
+    :rtype: int
+    :raises ~azure.core.exceptions.HttpResponseError:
+    """
+    return await AsyncFileDownloader(client, request, path, **kwargs).download()
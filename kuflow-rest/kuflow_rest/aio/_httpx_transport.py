@@ -0,0 +1,166 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any, Optional
+
+import httpx
+from azure.core.exceptions import ServiceResponseError
+from azure.core.pipeline.transport import AsyncHttpTransport
+from azure.core.rest._http_response_impl_async import AsyncHttpResponseImpl
+
+from .._httpx_transport import httpx_accept_encoding, httpx_limits, httpx_request_options, map_httpx_error
+
+
+class AsyncHttpxTransportResponse(AsyncHttpResponseImpl):
+    """Response of the :class:`AsyncHttpxTransport`."""
+
+    def __init__(self, *, request, internal_response: httpx.Response, block_size: Optional[int] = None) -> None:
+        super().__init__(
+            request=request,
+            internal_response=internal_response,
+            block_size=block_size,
+            status_code=internal_response.status_code,
+            reason=internal_response.reason_phrase,
+            content_type=internal_response.headers.get("content-type"),
+            headers=internal_response.headers,
+            stream_download_generator=_stream_download,
+        )
+
+    async def close(self) -> None:
+        if not self.is_closed:
+            self._is_closed = True
+            await self._internal_response.aclose()
+
+
+async def _stream_download(
+    pipeline, response: AsyncHttpxTransportResponse, *, decompress: bool = True, **kwargs
+) -> AsyncIterator[bytes]:
+    internal_response: httpx.Response = response.internal_response
+    chunk_size = response.block_size
+    try:
+        if decompress:
+            async for chunk in internal_response.aiter_bytes(chunk_size):
+                yield chunk
+        else:
+            async for chunk in internal_response.aiter_raw(chunk_size):
+                yield chunk
+    except httpx.TransportError as err:
+        raise ServiceResponseError(err, error=err) from err
+    finally:
+        await internal_response.aclose()
+
+
+class AsyncHttpxTransport(AsyncHttpTransport):
+    """Async version of :class:`~kuflow_rest.HttpxTransport`.
+
+    The httpx client is bound to an event loop, so the clients that share the transport must run in the same loop.
+
+    :keyword bool http2: Use HTTP/2 when the server supports it. Default value is True.
+    :keyword bool http1: Use HTTP/1.1 when the server does not support HTTP/2. Default value is True.
+    :keyword int connection_pool_size: Maximum number of connections. Default value is the httpx default (100).
+    :keyword bool keep_alive: Reuse the connections between requests. Default value is True.
+    :keyword float keep_alive_timeout: Seconds an idle connection is kept open. Default value is the httpx default.
+    :keyword client: httpx client to use instead of a new one, the other options are ignored.
+    :paramtype client: httpx.AsyncClient
+    """
+
+    def __init__(
+        self,
+        *,
+        http2: bool = True,
+        http1: bool = True,
+        connection_pool_size: Optional[int] = None,
+        keep_alive: bool = True,
+        keep_alive_timeout: Optional[float] = None,
+        client: Optional[httpx.AsyncClient] = None,
+        **kwargs: Any,
+    ) -> None:
+        from azure.core.configuration import ConnectionConfiguration
+
+        self.connection_config = ConnectionConfiguration(**kwargs)
+        self.client = client
+        self._client_owner = client is None
+        self._use_env_settings = kwargs.pop("use_env_settings", True)
+        self._http2 = http2
+        self._http1 = http1
+        self._limits = httpx_limits(connection_pool_size, keep_alive, keep_alive_timeout)
+
+    async def __aenter__(self) -> "AsyncHttpxTransport":
+        await self.open()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def open(self) -> None:
+        if self.client is None:
+            self.client = httpx.AsyncClient(
+                http1=self._http1,
+                http2=self._http2,
+                limits=self._limits,
+                verify=self.connection_config.verify,
+                cert=self.connection_config.cert,
+                trust_env=self._use_env_settings,
+                follow_redirects=False,
+            )
+
+    async def close(self) -> None:
+        if self._client_owner and self.client is not None:
+            await self.client.aclose()
+            self.client = None
+
+    @property
+    def accept_encoding(self) -> str:
+        """Encodings of the responses that httpx decodes, see :func:`~kuflow_rest.policies.accept_encoding`."""
+        return httpx_accept_encoding()
+
+    async def sleep(self, duration: float) -> None:
+        await asyncio.sleep(duration)
+
+    async def send(self, request, *, stream: bool = False, **kwargs: Any) -> AsyncHttpxTransportResponse:
+        """Send the request.
+
+        :param request: The request object to be sent.
+        :type request: ~azure.core.rest.HttpRequest
+        :keyword bool stream: Do not read the response body. Default value is False.
+        :return: The response.
+        :rtype: AsyncHttpxTransportResponse
+        """
+        await self.open()
+        assert self.client is not None
+        httpx_request = self.client.build_request(**httpx_request_options(self, request, kwargs, asynchronous=True))
+        try:
+            internal_response = await self.client.send(httpx_request, stream=True)
+        except httpx.TransportError as err:
+            raise map_httpx_error(err) from err
+
+        response = AsyncHttpxTransportResponse(
+            request=request, internal_response=internal_response, block_size=self.connection_config.data_block_size
+        )
+        if not stream:
+            await response.read()
+
+        return response
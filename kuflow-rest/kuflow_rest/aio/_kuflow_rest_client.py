@@ -0,0 +1,290 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import inspect
+import platform
+from typing import Any, Optional, Union
+
+from azure.core.credentials import AccessToken, TokenCredential
+from azure.core.credentials_async import AsyncTokenCredential
+
+from .._client_policies import ClientPolicies
+from .._generated import VERSION
+from .._generated.aio import KuFlowRestClient as KuFlowRestClientGenerated
+from .._kuflow_rest_client import ClientSecretCredential as SyncClientSecretCredential
+from .._kuflow_rest_client import KuFlowRestClient as SyncKuFlowRestClient
+from .._robot_cache import RobotCache
+from .._serialization import use_kuflow_serialization
+from ..policies import (
+    AsyncSingleFlightPolicy,
+    CircuitBreaker,
+    CompressionPolicy,
+    Hedging,
+    RateLimiter,
+    ResponseCache,
+)
+from ..utils._json_backend import JsonBackend
+from ._transport import create_transport
+from .operations import (
+    AuthenticationOperations,
+    BusinessArtifactOperations,
+    GroupOperations,
+    KmsOperations,
+    PrincipalOperations,
+    ProcessItemOperations,
+    ProcessOperations,
+    RobotOperations,
+    TenantOperations,
+    TenantUserOperations,
+    WorkerOperations,
+)
+
+
+class ClientSecretCredential:
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+    ) -> None:
+        self._delegate = SyncClientSecretCredential(client_id=client_id, client_secret=client_secret)
+
+    async def get_token(
+        self,
+        *scopes: str,
+        claims: Optional[str] = None,
+        tenant_id: Optional[str] = None,
+        enable_cae: bool = False,
+        **kwargs: Any,
+    ) -> AccessToken:
+        """Request an access token for `scopes`.
+
+        :param scopes: The type of access needed.
+        :type scopes: str
+        :rtype: AccessToken
+        :return: An AccessToken instance containing the token string and its expiration time in Unix time.
+        """
+        return self._delegate.get_token(*scopes, claims=claims, tenant_id=tenant_id, enable_cae=enable_cae, **kwargs)
+
+    async def close(self) -> None:
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+
+class KuBotTokenCredential:
+    def __init__(self, token: str, expires_on: int) -> None:
+        self._cached_token = token
+        self._expires_on = expires_on
+
+    async def get_token(
+        self,
+        *scopes: str,
+        claims: Optional[str] = None,
+        tenant_id: Optional[str] = None,
+        enable_cae: bool = False,
+        **kwargs: Any,
+    ) -> AccessToken:
+        return AccessToken(token=self._cached_token, expires_on=self._expires_on)
+
+    async def close(self) -> None:
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    def __hash__(self):
+        return hash(self._cached_token)
+
+    def __eq__(self, other):
+        return self._cached_token == other._cached_token
+
+
+class SyncTokenCredentialAdapter:
+    """Expose a synchronous credential, ie: :class:`~kuflow_rest.KuBotTokenCredential`, as an async one."""
+
+    def __init__(self, credential: TokenCredential) -> None:
+        self._credential = credential
+
+    async def get_token(self, *scopes: str, **kwargs: Any) -> AccessToken:
+        return self._credential.get_token(*scopes, **kwargs)
+
+    async def close(self) -> None:
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+
+class KuFlowRestClient:  # pylint: disable=client-accepts-api-version-keyword
+    API_VERSION = SyncKuFlowRestClient.API_VERSION
+
+    """Asynchronous client for the KuFlow REST API.
+
+    Exposes the same operation groups as :class:`~kuflow_rest.KuFlowRestClient`, but every operation is a coroutine
+    so that many REST calls can be in flight from a single event loop. Use it as an async context manager, or call
+    :meth:`close`, to release the underlying connection pool.
+
+    :param client_id: Client id used to connect to KuFlow. Required if credential is provided.
+    :type client_id: str
+    :param client_secret: Client secret used to connect to KuFlow. Required if credential is provided..
+    :type client_secret: str
+    :param credential: Credential used to connect to KuFlow. Required if no client_id and client_secret are provided.
+                       Both async and sync credentials are accepted.
+    :type credential: AsyncTokenCredential or TokenCredential
+    :keyword connection_pool_size: Maximum number of simultaneous connections of the shared aiohttp pool.
+                                   Default value is the aiohttp default (100).
+    :type connection_pool_size: int
+    :keyword connection_pool_size_per_host: Maximum number of simultaneous connections to the same host.
+                                            Default value is no limit.
+    :type connection_pool_size_per_host: int
+    :keyword transport: Custom azure-core async transport. When provided, the pool and keep alive options are ignored.
+                        A :class:`~kuflow_rest.aio.AsyncSharedTransport` shares its connections with the other
+                        clients that use it.
+    :type transport: ~azure.core.pipeline.transport.AsyncHttpTransport
+
+    The other keywords (``endpoint``, ``keep_alive``, the timeouts, ``json_backend``, the policies...) are the ones
+    of :class:`~kuflow_rest.KuFlowRestClient`.
+    """
+
+    def __init__(
+        self,
+        client_id: Optional[str] = None,
+        client_secret: Optional[str] = None,
+        credential: Optional[Union[AsyncTokenCredential, TokenCredential]] = None,
+        endpoint: Optional[str] = None,
+        allow_insecure_connection: Optional[bool] = None,
+        connection_pool_size: Optional[int] = None,
+        connection_pool_size_per_host: Optional[int] = None,
+        keep_alive: bool = True,
+        connection_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        json_backend: Optional[Union[str, JsonBackend]] = None,
+        lazy_deserialization: bool = False,
+        compact_page_items: bool = False,
+        single_flight: bool = False,
+        cache: Union[bool, ResponseCache] = False,
+        http2: bool = False,
+        rate_limit: Union[bool, RateLimiter] = False,
+        hedging: Union[bool, Hedging] = False,
+        circuit_breaker: Union[bool, CircuitBreaker] = False,
+        compression: Union[bool, str] = False,
+        compression_threshold: int = 1024,
+        robot_cache: Union[bool, RobotCache] = False,
+        **kwargs: Any,
+    ) -> None:
+        if endpoint is None:
+            endpoint = "https://api.kuflow.com/v2024-06-14"
+
+        if not endpoint.endswith("/" + KuFlowRestClient.API_VERSION):
+            endpoint = endpoint + "/" + KuFlowRestClient.API_VERSION
+
+        if client_id is not None and client_secret is not None:
+            credential = ClientSecretCredential(client_id=client_id, client_secret=client_secret)
+
+        if credential is None:
+            raise Exception("client_id/client_secrets or credential is required")
+
+        if not inspect.iscoroutinefunction(credential.get_token):
+            credential = SyncTokenCredentialAdapter(credential)
+
+        transport = kwargs.pop("transport", None)
+        if transport is None:
+            transport = create_transport(
+                http2=http2,
+                connection_pool_size=connection_pool_size,
+                connection_pool_size_per_host=connection_pool_size_per_host,
+                keep_alive=keep_alive,
+            )
+
+        policies = ClientPolicies(
+            transport,
+            asynchronous=True,
+            allow_insecure_connection=allow_insecure_connection,
+            connection_timeout=connection_timeout,
+            read_timeout=read_timeout,
+            single_flight=single_flight,
+            cache=cache,
+            rate_limit=rate_limit,
+            hedging=hedging,
+            circuit_breaker=circuit_breaker,
+            compression=compression,
+            compression_threshold=compression_threshold,
+        )
+        self.cache: Optional[ResponseCache] = policies.cache
+        self.single_flight_policy: Optional[AsyncSingleFlightPolicy] = policies.single_flight_policy
+        self.circuit_breaker: Optional[CircuitBreaker] = policies.circuit_breaker
+        self.hedging: Optional[Hedging] = policies.hedging
+        self.rate_limiter: Optional[RateLimiter] = policies.rate_limiter
+        self.compression_policy: Optional[CompressionPolicy] = policies.compression_policy
+
+        python_version = platform.python_version()
+        platform_id = platform.platform()
+
+        self._kuflow_client = KuFlowRestClientGenerated(
+            credential=credential,
+            endpoint=endpoint,
+            api_version=kwargs.pop("api_version", VERSION),
+            credential_scopes=["https://api.kuflow.com/v2024-06-14/.default"],
+            per_call_policies=policies.per_call_policies,
+            per_retry_policies=policies.per_retry_policies,
+            base_user_agent=f"sdk-python-kuflow-rest/{VERSION} Python/{python_version} ({platform_id})",
+            transport=transport,
+        )
+        use_kuflow_serialization(self._kuflow_client, json_backend, lazy_deserialization, compact_page_items)
+
+        self.authentication = AuthenticationOperations(self._kuflow_client)
+        self.business_artifact = BusinessArtifactOperations(self._kuflow_client)
+        self.kms = KmsOperations(self._kuflow_client)
+        self.principal = PrincipalOperations(self._kuflow_client)
+        self.group = GroupOperations(self._kuflow_client)
+        self.tenant_user = TenantUserOperations(self._kuflow_client)
+        self.process = ProcessOperations(self._kuflow_client)
+        self.process_item = ProcessItemOperations(self._kuflow_client)
+        self.worker = WorkerOperations(self._kuflow_client)
+        self.robot_cache: Optional[RobotCache] = None
+        if robot_cache is not False:
+            self.robot_cache = RobotCache() if robot_cache is True else robot_cache
+
+        self.robot = RobotOperations(self._kuflow_client, self.robot_cache)
+        self.tenant = TenantOperations(self._kuflow_client)
+
+    async def close(self) -> None:
+        await self._kuflow_client.close()
+
+    async def __aenter__(self):
+        await self._kuflow_client.__aenter__()
+        return self
+
+    async def __aexit__(self, *args):
+        await self._kuflow_client.__aexit__(*args)
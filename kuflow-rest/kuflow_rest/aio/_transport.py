@@ -0,0 +1,151 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import logging
+from typing import Any, Optional
+
+from azure.core.pipeline.transport import AioHttpTransport, AsyncHttpTransport
+
+
+logger = logging.getLogger(__name__)
+
+
+class PooledAioHttpTransport(AioHttpTransport):
+    """AioHttp transport with a sized connection pool.
+
+    Every operation group of the client sends its requests through the same transport, so the pool size bounds how
+    many REST calls can be in flight at the same time.
+
+    :keyword int connection_pool_size: Maximum number of simultaneous connections.
+    :keyword int connection_pool_size_per_host: Maximum number of simultaneous connections to the same host.
+    :keyword bool keep_alive: Reuse the connections between requests. Default value is True.
+    :keyword float keep_alive_timeout: Seconds an idle connection is kept open. Default value is None, the aiohttp
+                                       default.
+    """
+
+    def __init__(
+        self,
+        *,
+        connection_pool_size: Optional[int] = None,
+        connection_pool_size_per_host: Optional[int] = None,
+        keep_alive: bool = True,
+        keep_alive_timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self._connection_pool_size = connection_pool_size
+        self._connection_pool_size_per_host = connection_pool_size_per_host
+        self._keep_alive = keep_alive
+        self._keep_alive_timeout = keep_alive_timeout
+
+    async def open(self):
+        if not self.session and self._session_owner and not self._has_been_opened:
+            import aiohttp
+
+            connector_options: dict[str, Any] = {}
+            if self._connection_pool_size is not None:
+                connector_options["limit"] = self._connection_pool_size
+            if self._connection_pool_size_per_host is not None:
+                connector_options["limit_per_host"] = self._connection_pool_size_per_host
+            if not self._keep_alive:
+                connector_options["force_close"] = True
+            elif self._keep_alive_timeout is not None:
+                connector_options["keepalive_timeout"] = self._keep_alive_timeout
+
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(**connector_options),
+                cookie_jar=aiohttp.DummyCookieJar(),
+                trust_env=self._use_env_settings,
+                auto_decompress=False,
+            )
+
+        await super().open()
+
+
+class AsyncSharedTransport(AsyncHttpTransport):
+    """Async version of :class:`~kuflow_rest.SharedTransport`.
+
+    An aiohttp session is bound to an event loop, so the clients that share the transport must run in the same loop.
+
+    :param transport: Transport to share. Default value is None, a :class:`PooledAioHttpTransport` built with the
+                      keyword arguments.
+    :type transport: ~azure.core.pipeline.transport.AsyncHttpTransport
+    """
+
+    def __init__(self, transport: Optional[AsyncHttpTransport] = None, **kwargs: Any) -> None:
+        self.transport = transport if transport is not None else PooledAioHttpTransport(**kwargs)
+
+    async def __aenter__(self) -> "AsyncSharedTransport":
+        await self.transport.open()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        # Closed by its owner, not by the clients
+        pass
+
+    async def open(self) -> None:
+        await self.transport.open()
+
+    async def close(self) -> None:
+        await self.transport.close()
+
+    async def send(self, request, **kwargs: Any):
+        return await self.transport.send(request, **kwargs)
+
+    async def sleep(self, duration: float) -> None:
+        await self.transport.sleep(duration)
+
+
+def create_transport(
+    *,
+    http2: bool = False,
+    connection_pool_size: Optional[int] = None,
+    connection_pool_size_per_host: Optional[int] = None,
+    keep_alive: bool = True,
+) -> AsyncHttpTransport:
+    """Async version of :func:`kuflow_rest._transport.create_transport`.
+
+    :keyword bool http2: Use a :class:`~kuflow_rest.aio.AsyncHttpxTransport`, falling back to a
+                         :class:`PooledAioHttpTransport` when the ``httpx`` package is not installed. Default value is
+                         False.
+    :keyword int connection_pool_size: Maximum number of simultaneous connections.
+    :keyword int connection_pool_size_per_host: Maximum number of simultaneous connections to the same host. The
+                                                HTTP/2 transport uses it as its maximum number of connections.
+    :keyword bool keep_alive: Reuse the connections between requests. Default value is True.
+    :return: The transport.
+    :rtype: ~azure.core.pipeline.transport.AsyncHttpTransport
+    """
+    if http2:
+        try:
+            from ._httpx_transport import AsyncHttpxTransport
+        except ImportError:
+            logger.warning("httpx is not installed, HTTP/1.1 connections of aiohttp are used instead")
+        else:
+            return AsyncHttpxTransport(connection_pool_size=connection_pool_size_per_host, keep_alive=keep_alive)
+
+    return PooledAioHttpTransport(
+        connection_pool_size=connection_pool_size,
+        connection_pool_size_per_host=connection_pool_size_per_host,
+        keep_alive=keep_alive,
+    )
@@ -0,0 +1,462 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import functools
+import os
+from collections.abc import AsyncIterator
+from typing import Any, Callable, Optional, Union
+
+from ... import models as _models
+from ..._download import expected_document_size
+from ..._generated.aio import KuFlowRestClient as KuFlowRestClientGenerated
+from ..._generated.operations._business_artifact_operations import build_download_business_artifact_document_request
+from ..._serialization import encode_json_body
+from ..._upload import upload_content
+from ...operations._pagination import aiterate_page_items
+from ...utils._json_patch import select_json_patch, to_json_value
+from .._download import download_to_file
+
+
+class BusinessArtifactOperations:
+    """
+    .. warning::
+        **DO NOT** instantiate this class directly.
+
+        Instead, you should access the following operations through
+        :class:`~kuflow_rest.aio.KuFlowRestClient`'s
+        :attr:`business_artifact` attribute.
+    """
+
+    def __init__(self, kuflow_client: KuFlowRestClientGenerated):
+        self._kuflow_client = kuflow_client
+
+    async def find_business_artifacts(
+        self,
+        size: int = 25,
+        page: int = 0,
+        sort: Optional[Union[str, list[str]]] = None,
+        tenant_id: Optional[Union[str, list[str]]] = None,
+        business_artifact_definition_id: Optional[Union[str, list[str]]] = None,
+        business_artifact_definition_code: Optional[Union[str, list[str]]] = None,
+        value: Optional[Union[str, list[str]]] = None,
+        **kwargs: Any,
+    ) -> _models.BusinessArtifactPage:
+        """Find all accessible Business Artifacts.
+
+        List all the Business Artifacts that have been created and the credentials has access.
+
+        Available sort query values: id, createdAt, lastModifiedAt.
+
+        :keyword size: The number of records returned within a single API call. Default value is 25.
+        :type size: int
+        :keyword page: The page number of the current page in the returned records, 0 is the first page.
+                       Default value is 0.
+        :type page: int
+        :keyword sort: Sorting criteria in the format: property{,asc|desc}. Example: createdAt,desc
+                       Default sort order is ascending. Multiple sort criteria are supported.
+                       Please refer to the method description for supported properties. Default value is None.
+        :type sort: Optional[Union[str, List[str]]]
+        :keyword tenant_id: Filter by tenantId. Default value is None.
+        :type tenant_id: Optional[Union[str, List[str]]]
+        :keyword business_artifact_definition_id: Filter by an array of business artifact definition ids.
+                                                  Default value is None.
+        :type business_artifact_definition_id: Optional[Union[str, List[str]]]
+        :keyword business_artifact_definition_code: Filter by an array of business artifact definition codes.
+                                                    Default value is None.
+        :type business_artifact_definition_code: Optional[Union[str, List[str]]]
+        :keyword value: Filter by an array of values. Default value is None.
+        :type value: Optional[Union[str, List[str]]]
+        :return: BusinessArtifactPage
+        :rtype: ~kuflow.rest.models.BusinessArtifactPage
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        if sort is not None and isinstance(sort, str):
+            sort = [sort]
+
+        if tenant_id is not None and isinstance(tenant_id, str):
+            tenant_id = [tenant_id]
+
+        if business_artifact_definition_id is not None and isinstance(business_artifact_definition_id, str):
+            business_artifact_definition_id = [business_artifact_definition_id]
+
+        if business_artifact_definition_code is not None and isinstance(business_artifact_definition_code, str):
+            business_artifact_definition_code = [business_artifact_definition_code]
+
+        if value is not None and isinstance(value, str):
+            value = [value]
+
+        return await self._kuflow_client.business_artifact.find_business_artifacts(
+            size=size,
+            page=page,
+            sort=sort,
+            tenant_id=tenant_id,
+            business_artifact_definition_id=business_artifact_definition_id,
+            business_artifact_definition_code=business_artifact_definition_code,
+            value=value,
+            **kwargs,
+        )
+
+    def aiter_business_artifacts(
+        self,
+        size: int = 25,
+        page: int = 0,
+        prefetch: bool = True,
+        concurrency: int = 1,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> AsyncIterator[_models.BusinessArtifactPageItem]:
+        """Iterate over all accessible Business Artifacts.
+
+        Stream the Business Artifacts of every page returned by :meth:`find_business_artifacts`,
+        starting at ``page``, until the last page is reached. While the items of a page are consumed, the next
+        page is requested in a background task. Items already delivered, that shifted to a later page because
+        they were modified during the iteration, are skipped.
+
+        :keyword size: The number of records requested within a single API call. Default value is 25.
+        :type size: int
+        :keyword page: The page number to start from, 0 is the first page. Default value is 0.
+        :type page: int
+        :keyword prefetch: Request the next page while the current one is consumed. Default value is True.
+        :type prefetch: bool
+        :keyword concurrency: Fetch-all mode. When greater than 1, once the first page reveals the total number of
+                              pages, up to ``concurrency`` of the remaining pages are requested at the same time.
+                              Default value is 1.
+        :type concurrency: int
+        :keyword ordered: Deliver the items in page order. If False, the pages are delivered as soon as they arrive.
+                          Only applies to the fetch-all mode. Default value is True.
+        :type ordered: bool
+        :keyword kwargs: Sorting criteria and filters, see :meth:`find_business_artifacts`.
+        :return: AsyncIterator of BusinessArtifactPageItem
+        :rtype: AsyncIterator[~kuflow.rest.models.BusinessArtifactPageItem]
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return aiterate_page_items(
+            functools.partial(self.find_business_artifacts, size=size, **kwargs),
+            page=page,
+            prefetch=prefetch,
+            concurrency=concurrency,
+            ordered=ordered,
+        )
+
+    async def create_business_artifact(
+        self, business_artifact_create_params: _models.BusinessArtifactCreateParams, **kwargs: Any
+    ) -> _models.BusinessArtifact:
+        """Create a new Business Artifact.
+
+        Creates a Business Artifact.
+
+        If you want the method to be idempotent, please specify the ``id`` field in the request body.
+
+        :param business_artifact_create_params: Business Artifact to create. Required.
+        :type business_artifact_create_params: ~kuflow.rest.models.BusinessArtifactCreateParams
+        :return: BusinessArtifact
+        :rtype: ~kuflow.rest.models.BusinessArtifact
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.business_artifact.create_business_artifact(
+            business_artifact_create_params=encode_json_body(
+                self._kuflow_client.business_artifact, business_artifact_create_params
+            ),
+            **kwargs,
+        )
+
+    async def retrieve_business_artifact(self, id: str, **kwargs: Any) -> _models.BusinessArtifact:
+        """Get a Business Artifact by ID.
+
+        Returns the requested Business Artifact when has access to do it.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :return: BusinessArtifact
+        :rtype: ~kuflow.rest.models.BusinessArtifact
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.business_artifact.retrieve_business_artifact(id=id, **kwargs)
+
+    async def delete_business_artifact(self, id: str, **kwargs: Any) -> None:
+        """Delete a Business Artifact by ID.
+
+        Deletes the requested Business Artifact.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :return: None
+        :rtype: None
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.business_artifact.delete_business_artifact(id=id, **kwargs)
+
+    async def update_business_artifact_data(
+        self, id: str, business_artifact_data_update_params: _models.BusinessArtifactDataUpdateParams, **kwargs: Any
+    ) -> _models.BusinessArtifact:
+        """Save JSON data.
+
+        Allow to save a JSON data validating that the data follow the related schema. If the data is
+        invalid, then the json is marked as invalid.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param business_artifact_data_update_params: Params used to update the JSON value. Required.
+        :type business_artifact_data_update_params: ~kuflow.rest.models.BusinessArtifactDataUpdateParams
+        :return: BusinessArtifact
+        :rtype: ~kuflow.rest.models.BusinessArtifact
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.business_artifact.update_business_artifact_data(
+            id=id,
+            business_artifact_data_update_params=encode_json_body(
+                self._kuflow_client.business_artifact, business_artifact_data_update_params
+            ),
+            **kwargs,
+        )
+
+    async def patch_business_artifact_data(
+        self, id: str, json_patch: list[_models.JsonPatchOperation], **kwargs: Any
+    ) -> _models.BusinessArtifact:
+        """Patch JSON data.
+
+        Allow to patch a JSON data validating that the data follow the related schema. If the data is
+        invalid, then the json is marked as invalid.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param json_patch: Params to save the JSON value. Required.
+        :type json_patch: List[~kuflow.rest.models.JsonPatchOperation]
+        :return: BusinessArtifact
+        :rtype: ~kuflow.rest.models.BusinessArtifact
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.business_artifact.patch_business_artifact_data(
+            id=id, json_patch=encode_json_body(self._kuflow_client.business_artifact, json_patch), **kwargs
+        )
+
+    async def update_business_artifact_data_smart(
+        self,
+        id: str,
+        previous_data: Optional[Union[_models.JsonValue, dict[str, Any]]],
+        data: Union[_models.JsonValue, dict[str, Any]],
+        **kwargs: Any,
+    ) -> _models.BusinessArtifact:
+        """Save JSON data with the smaller request.
+
+        Sends the JSON patch from ``previous_data`` to ``data`` when it is smaller than the whole document, see
+        :func:`~kuflow_rest.utils.select_json_patch`, and the whole document otherwise.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param previous_data: The current JSON value, ie: the ``data`` of the business artifact. None to send the whole
+                              document.
+        :type previous_data: ~kuflow.rest.models.JsonValue or dict
+        :param data: The new JSON value. Required.
+        :type data: ~kuflow.rest.models.JsonValue or dict
+        :return: BusinessArtifact
+        :rtype: ~kuflow.rest.models.BusinessArtifact
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        json_patch = select_json_patch(previous_data, data)
+        if json_patch is not None:
+            return await self.patch_business_artifact_data(id, json_patch, **kwargs)
+
+        business_artifact_data_update_params = _models.BusinessArtifactDataUpdateParams(data=to_json_value(data))
+        return await self.update_business_artifact_data(id, business_artifact_data_update_params, **kwargs)
+
+    async def create_business_artifact_action(
+        self, id: str, business_artifact_action_create_params: _models.BusinessArtifactActionCreateParams, **kwargs: Any
+    ) -> _models.BusinessArtifactAction:
+        """Invoke a Business Artifact action.
+
+        Invoke an action on a Business Artifact.
+
+        If you want the method to be idempotent, please specify the ``id`` field in the request body.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param business_artifact_action_create_params: Business Artifact action to invoke. Required.
+        :type business_artifact_action_create_params: ~kuflow.rest.models.BusinessArtifactActionCreateParams
+        :return: BusinessArtifactAction
+        :rtype: ~kuflow.rest.models.BusinessArtifactAction
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.business_artifact.create_business_artifact_action(
+            id=id,
+            business_artifact_action_create_params=encode_json_body(
+                self._kuflow_client.business_artifact, business_artifact_action_create_params
+            ),
+            **kwargs,
+        )
+
+    async def retrieve_business_artifact_action(
+        self, id: str, action_id: str, **kwargs: Any
+    ) -> _models.BusinessArtifactAction:
+        """Get a Business Artifact action by ID.
+
+        Returns a Business Artifact action by its ID.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param action_id: The Business Artifact action ID. Required.
+        :type action_id: str
+        :return: BusinessArtifactAction
+        :rtype: ~kuflow.rest.models.BusinessArtifactAction
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.business_artifact.retrieve_business_artifact_action(
+            id=id, action_id=action_id, **kwargs
+        )
+
+    async def cancel_business_artifact_action(
+        self, id: str, action_id: str, **kwargs: Any
+    ) -> _models.BusinessArtifactAction:
+        """Cancel a Business Artifact action.
+
+        Cancel a Business Artifact action by its ID.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param action_id: The Business Artifact action ID. Required.
+        :type action_id: str
+        :return: BusinessArtifactAction
+        :rtype: ~kuflow.rest.models.BusinessArtifactAction
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.business_artifact.cancel_business_artifact_action(
+            id=id, action_id=action_id, **kwargs
+        )
+
+    async def prepare_business_artifact_create_artifact(
+        self,
+        id: str,
+        business_artifact_create_artifact_prepare_params: _models.BusinessArtifactCreateArtifactPrepareParams,
+        **kwargs: Any,
+    ) -> _models.BusinessArtifactCreateArtifactPrepare:
+        """Prepare the data for a CREATE_BUSINESS_ARTIFACT action.
+
+        Compute the pre-filled value that a ``CREATE_BUSINESS_ARTIFACT`` action would produce
+        for this Business Artifact, without invoking the action or persisting any state.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param business_artifact_create_artifact_prepare_params: Params identifying the
+         CREATE_BUSINESS_ARTIFACT action to prepare. Required.
+        :type business_artifact_create_artifact_prepare_params:
+         ~kuflow.rest.models.BusinessArtifactCreateArtifactPrepareParams
+        :return: BusinessArtifactCreateArtifactPrepare
+        :rtype: ~kuflow.rest.models.BusinessArtifactCreateArtifactPrepare
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.business_artifact.prepare_business_artifact_create_artifact(
+            id=id,
+            business_artifact_create_artifact_prepare_params=encode_json_body(
+                self._kuflow_client.business_artifact, business_artifact_create_artifact_prepare_params
+            ),
+            **kwargs,
+        )
+
+    async def upload_business_artifact_document(
+        self,
+        id: str,
+        document: _models.Document,
+        *,
+        progress: Optional[Callable[[_models.UploadProgress], None]] = None,
+        **kwargs: Any,
+    ) -> _models.DocumentReference:
+        """Upload a temporal document into the business artifact that later on must be linked with a
+        business artifact domain resource.
+
+        Documents uploaded with this API will be deleted after 2 hours as long as they have not been
+        linked to a business artifact.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param document: Document to save. Required.
+        :type document: ~kuflow.rest.models.Document
+        :keyword progress: Called with the progress of the upload, bytes sent and throughput, after every
+                           chunk of the document. Default value is None.
+        :paramtype progress: Callable[[~kuflow_rest.models.UploadProgress], None]
+        :return: DocumentReference
+        :rtype: ~kuflow.rest.models.DocumentReference
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.business_artifact.upload_business_artifact_document(
+            id=id,
+            file=upload_content(document, progress),
+            file_content_type=document.content_type,
+            file_name=document.file_name,
+            **kwargs,
+        )
+
+    async def download_business_artifact_document(
+        self, id: str, *, document_uri: str, **kwargs: Any
+    ) -> AsyncIterator[bytes]:
+        """Download document.
+
+        Given a business artifact and a documentUri, download a document.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :keyword document_uri: Document URI to download. Required.
+        :type document_uri: str
+        :return: AsyncIterator[bytes]
+        :rtype: AsyncIterator[bytes]
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.business_artifact.download_business_artifact_document(
+            id=id, document_uri=document_uri, **kwargs
+        )
+
+    async def download_business_artifact_document_to_file(
+        self, id: str, path: Union[str, "os.PathLike[str]"], *, document_uri: str, **kwargs: Any
+    ) -> int:
+        """Download a document into a file.
+
+        Given a business artifact and a documentUri, download a document into a file, see the
+        ``download_business_artifact_document`` operation.
+
+        The file is written as ``<path>.part`` and renamed to ``path`` once it is complete. A ``.part`` file of a
+        failed download is resumed, and large files are downloaded in parallel parts, when the server supports
+        Range requests.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param path: Path of the file. Required.
+        :type path: str or ~os.PathLike
+        :keyword document_uri: Document URI to download. Required.
+        :type document_uri: str
+        :keyword int expected_size: Size of the document, the downloaded file is checked against it. Default value is
+         the size of the ``document_uri``.
+        :keyword int chunk_size: Size of the writes to the file. Default value is 1 MiB.
+        :keyword int part_size: Size of the parts downloaded in parallel. Default value is 8 MiB.
+        :keyword int max_concurrency: Parts downloaded at the same time, 1 to download in one request. Default value
+         is 4.
+        :return: The size of the file.
+        :rtype: int
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        kwargs.setdefault("expected_size", expected_document_size(document_uri))
+        return await download_to_file(
+            self._kuflow_client,
+            build_download_business_artifact_document_request(id=id, document_uri=document_uri),
+            path,
+            **kwargs,
+        )
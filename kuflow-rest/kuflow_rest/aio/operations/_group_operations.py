@@ -0,0 +1,153 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import functools
+from collections.abc import AsyncIterator
+from typing import Any, Optional, Union
+
+from ... import models as _models
+from ..._generated.aio import KuFlowRestClient as KuFlowRestClientGenerated
+from ...operations._pagination import aiterate_page_items
+
+
+class GroupOperations:
+    """
+    .. warning::
+        **DO NOT** instantiate this class directly.
+
+        Instead, you should access the following operations through
+        :class:`~kuflow_rest.aio.KuFlowRestClient`'s
+        :attr:`group` attribute.
+    """
+
+    def __init__(self, kuflow_client: KuFlowRestClientGenerated):
+        self._kuflow_client = kuflow_client
+
+    async def find_groups(
+        self,
+        size: int = 25,
+        page: int = 0,
+        sort: Optional[Union[str, list[str]]] = None,
+        principal_id: Optional[str] = None,
+        tenant_id: Optional[Union[str, list[str]]] = None,
+        group_id: Optional[Union[str, list[str]]] = None,
+        group_code: Optional[Union[str, list[str]]] = None,
+        **kwargs: Any,
+    ) -> _models.PrincipalPage:
+        """Find all accessible Groups.
+
+        List all the Groups that have been created and the used credentials has access.
+
+        Available sort query values: id, name.
+
+        :keyword size: The number of records returned within a single API call. Default value is 25.
+        :paramtype size: int
+        :keyword page: The page number of the current page in the returned records, 0 is the first
+         page. Default value is 0.
+        :paramtype page: int
+        :keyword sort: Sorting criteria in the format: property{,asc|desc}. Example: createdAt,desc
+
+         Default sort order is ascending. Multiple sort criteria are supported.
+
+         Please refer to the method description for supported properties. Default value is None.
+        :paramtype sort: list[str]
+        :keyword tenant_id: Filter by tenantId. Default value is None.
+        :paramtype tenant_id: list[str]
+        :keyword principal_id: Filter by principalId. Default value is None.
+        :paramtype principal_id: str
+        :keyword group_id: Filter by an array of group ids. Default value is None.
+        :paramtype group_id: list[str]
+        :keyword group_code: Filter by an array of group codes. Default value is None.
+        :paramtype group_code: list[str]
+        :return: GroupPage
+        :rtype: ~kuflow.rest.models.GroupPage
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        if sort is not None and isinstance(sort, str):
+            sort = [sort]
+
+        if principal_id is not None and isinstance(principal_id, str):
+            principal_id = [principal_id]
+
+        if tenant_id is not None and isinstance(tenant_id, str):
+            tenant_id = [tenant_id]
+
+        if group_id is not None and isinstance(group_id, str):
+            group_id = [group_id]
+
+        if group_code is not None and isinstance(group_code, str):
+            group_code = [group_code]
+
+        return await self._kuflow_client.group.find_groups(
+            size=size,
+            page=page,
+            sort=sort,
+            tenant_id=tenant_id,
+            principal_id=principal_id,
+            group_id=group_id,
+            group_code=group_code,
+            **kwargs,
+        )
+
+    def aiter_groups(
+        self,
+        size: int = 25,
+        page: int = 0,
+        prefetch: bool = True,
+        concurrency: int = 1,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> AsyncIterator[_models.GroupPageItem]:
+        """Iterate over all accessible Groups.
+
+        Stream the Groups of every page returned by :meth:`find_groups`,
+        starting at ``page``, until the last page is reached. While the items of a page are consumed, the next
+        page is requested in a background task. Items already delivered, that shifted to a later page because
+        they were modified during the iteration, are skipped.
+
+        :keyword size: The number of records requested within a single API call. Default value is 25.
+        :type size: int
+        :keyword page: The page number to start from, 0 is the first page. Default value is 0.
+        :type page: int
+        :keyword prefetch: Request the next page while the current one is consumed. Default value is True.
+        :type prefetch: bool
+        :keyword concurrency: Fetch-all mode. When greater than 1, once the first page reveals the total number of
+                              pages, up to ``concurrency`` of the remaining pages are requested at the same time.
+                              Default value is 1.
+        :type concurrency: int
+        :keyword ordered: Deliver the items in page order. If False, the pages are delivered as soon as they arrive.
+                          Only applies to the fetch-all mode. Default value is True.
+        :type ordered: bool
+        :keyword kwargs: Sorting criteria and filters, see :meth:`find_groups`.
+        :return: AsyncIterator of GroupPageItem
+        :rtype: AsyncIterator[~kuflow.rest.models.GroupPageItem]
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return aiterate_page_items(
+            functools.partial(self.find_groups, size=size, **kwargs),
+            page=page,
+            prefetch=prefetch,
+            concurrency=concurrency,
+            ordered=ordered,
+        )
@@ -0,0 +1,59 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+from typing import Any
+
+from ... import models as _models
+from ..._generated.aio import KuFlowRestClient as KuFlowRestClientGenerated
+
+
+class KmsOperations:
+    """
+    .. warning::
+        **DO NOT** instantiate this class directly.
+
+        Instead, you should access the following operations through
+        :class:`~kuflow_rest.aio.KuFlowRestClient`'s
+        :attr:`authentication` attribute.
+    """
+
+    def __init__(self, kuflow_client: KuFlowRestClientGenerated):
+        self._kuflow_client = kuflow_client
+
+    async def retrieve_kms_key(
+        self,
+        id: str,
+        **kwargs: Any,
+    ) -> _models.KmsKey:
+        """Get the requested key id.
+
+        Get the requested key id.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :return: KmsKey
+        :rtype: ~kuflow.rest.models.KmsKey
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.kms.retrieve_kms_key(key_id=id, **kwargs)
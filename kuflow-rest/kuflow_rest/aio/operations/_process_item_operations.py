@@ -0,0 +1,504 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import functools
+import os
+from collections.abc import AsyncIterator
+from typing import Any, Optional, Union
+
+from ... import models as _models
+from ..._generated.aio import KuFlowRestClient as KuFlowRestClientGenerated
+from ..._generated.operations._process_item_operations import (
+    build_download_process_item_task_data_webforms_as_document_request,
+)
+from ..._serialization import encode_json_body
+from ...operations._pagination import aiterate_page_items
+from ...utils._json_patch import select_json_patch, to_json_value
+from .._download import download_to_file
+
+
+class ProcessItemOperations:
+    """
+    .. warning::
+        **DO NOT** instantiate this class directly.
+
+        Instead, you should access the following operations through
+        :class:`~kuflow_rest.aio.KuFlowRestClient`'s
+        :attr:`task` attribute.
+    """
+
+    def __init__(self, kuflow_client: KuFlowRestClientGenerated):
+        self._kuflow_client = kuflow_client
+
+    async def find_process_items(
+        self,
+        size: int = 25,
+        page: int = 0,
+        sort: Optional[Union[str, list[str]]] = None,
+        process_id: Optional[Union[str, list[str]]] = None,
+        type: Optional[list[_models.ProcessItemType]] = None,
+        task_state: Optional[Union[_models.ProcessItemTaskState, list[_models.ProcessItemTaskState]]] = None,
+        process_item_definition_code: Optional[Union[str, list[str]]] = None,
+        process_definition_id: Optional[Union[str, list[str]]] = None,
+        process_definition_code: Optional[Union[str, list[str]]] = None,
+        tenant_id: Optional[Union[str, list[str]]] = None,
+        **kwargs: Any,
+    ) -> _models.ProcessItemPage:
+        """Find all accessible Process Items.
+
+        List all Process Items that have been created and the credentials has access.
+
+        Available sort query values: id, createdAt, lastModifiedAt, claimedAt, completedAt,
+        cancelledAt.
+
+        :keyword size: The number of records returned within a single API call. Default value is 25.
+        :type size: int
+        :keyword page: The page number of the current page in the returned records, 0 is the first page.
+                       Default value is 0.
+        :type page: int
+        :keyword sort: Sorting criteria in the format: property{,asc|desc}. Example: createdAt,desc
+                       Default sort order is ascending. Multiple sort criteria are supported.
+                       Please refer to the method description for supported properties. Default value is None.
+        :type sort: list[str]
+        :keyword process_id: Filter by an array of process ids. Default value is None.
+        :type process_id: list[str]
+        :keyword type: Filter by an array of process item types. Default value is None.
+        :type type: list[~kuflow.rest.models.ProcessItemType]
+        :keyword task_state: Filter by an array of process item task states. Default value is None.
+        :type task_state: list[~kuflow.rest.models.ProcessItemTaskState]
+        :keyword process_item_definition_code: Filter by an array of process item definition codes.
+                                               Default value is None.
+        :type process_item_definition_code: list[str]
+        :keyword process_definition_id: Filter by an array of process definition ids. Default value is None.
+        :type process_definition_id: list[str]
+        :keyword process_definition_code: Filter by an array of process definition codes. Default value is None.
+        :type process_definition_code: list[str]
+        :keyword tenant_id: Filter process items that exists in one of tenant ids. Default value is None.
+        :type tenant_id: Optional[Union[str, List[str]]]
+        :return: ProcessItemPage
+        :rtype: ~kuflow.rest.models.ProcessItemPage
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        if sort is not None and isinstance(sort, str):
+            sort = [sort]
+
+        if process_id is not None and isinstance(process_id, str):
+            process_id = [process_id]
+
+        if type is not None and isinstance(type, _models.ProcessItemType):
+            type = [type]
+
+        if task_state is not None and isinstance(task_state, _models.ProcessItemTaskState):
+            task_state = [task_state]
+
+        if process_item_definition_code is not None and isinstance(process_item_definition_code, str):
+            process_item_definition_code = [process_item_definition_code]
+
+        if process_definition_id is not None and isinstance(process_definition_id, str):
+            process_definition_id = [process_definition_id]
+
+        if process_definition_code is not None and isinstance(process_definition_code, str):
+            process_definition_code = [process_definition_code]
+
+        if tenant_id is not None and isinstance(tenant_id, str):
+            tenant_id = [tenant_id]
+
+        return await self._kuflow_client.process_item.find_process_items(
+            size=size,
+            page=page,
+            sort=sort,
+            process_id=process_id,
+            type=type,
+            task_state=task_state,
+            process_item_definition_code=process_item_definition_code,
+            process_definition_id=process_definition_id,
+            process_definition_code=process_definition_code,
+            tenant_id=tenant_id,
+            **kwargs,
+        )
+
+    def aiter_process_items(
+        self,
+        size: int = 25,
+        page: int = 0,
+        prefetch: bool = True,
+        concurrency: int = 1,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> AsyncIterator[_models.ProcessItemPageItem]:
+        """Iterate over all accessible Process Items.
+
+        Stream the Process Items of every page returned by :meth:`find_process_items`,
+        starting at ``page``, until the last page is reached. While the items of a page are consumed, the next
+        page is requested in a background task. Items already delivered, that shifted to a later page because
+        they were modified during the iteration, are skipped.
+
+        :keyword size: The number of records requested within a single API call. Default value is 25.
+        :type size: int
+        :keyword page: The page number to start from, 0 is the first page. Default value is 0.
+        :type page: int
+        :keyword prefetch: Request the next page while the current one is consumed. Default value is True.
+        :type prefetch: bool
+        :keyword concurrency: Fetch-all mode. When greater than 1, once the first page reveals the total number of
+                              pages, up to ``concurrency`` of the remaining pages are requested at the same time.
+                              Default value is 1.
+        :type concurrency: int
+        :keyword ordered: Deliver the items in page order. If False, the pages are delivered as soon as they arrive.
+                          Only applies to the fetch-all mode. Default value is True.
+        :type ordered: bool
+        :keyword kwargs: Sorting criteria and filters, see :meth:`find_process_items`.
+        :return: AsyncIterator of ProcessItemPageItem
+        :rtype: AsyncIterator[~kuflow.rest.models.ProcessItemPageItem]
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return aiterate_page_items(
+            functools.partial(self.find_process_items, size=size, **kwargs),
+            page=page,
+            prefetch=prefetch,
+            concurrency=concurrency,
+            ordered=ordered,
+        )
+
+    async def create_process_item(
+        self, process_item_create_params: _models.ProcessItemCreateParams, **kwargs: Any
+    ) -> _models.ProcessItem:
+        """Create a new Process Item in the selected Process.
+
+        Create a Process Item and optionally fill its value.
+
+        If you want to add document type elements, you can pass a reference to an existing document
+        type element
+        indicating its 'uri'. This will copy that document into the element. In case you want to add a
+        new document,
+        please use the corresponding API method.
+
+        If you want the method to be idempotent, please specify the ``id`` field in the request body.
+
+        :param process_item_create_params: Task to be created. Required.
+        :type process_item_create_params: ~kuflow.rest.models.ProcessItem
+        :return: ProcessItem
+        :rtype: ~kuflow.rest.models.ProcessItem
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.process_item.create_process_item(
+            process_item_create_params=encode_json_body(self._kuflow_client.process_item, process_item_create_params),
+            **kwargs,
+        )
+
+    async def retrieve_process_item(self, id: str, **kwargs: Any) -> _models.ProcessItem:
+        """Get a process item given it ID.
+
+        Allow to get a process item by ID.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :return: ProcessItem
+        :rtype: ~kuflow.rest.models.ProcessItem
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.process_item.retrieve_process_item(id=id, **kwargs)
+
+    async def claim_process_item_task(self, id: str, **kwargs: Any) -> _models.ProcessItem:
+        """Claim a process item task.
+
+        Allow to claim a task.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :return: ProcessItem
+        :rtype: ~kuflow.rest.models.ProcessItem
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.process_item.claim_process_item_task(id=id, **kwargs)
+
+    async def assign_process_item_task(
+        self, id: str, process_item_task_assign_params: _models.ProcessItemTaskAssignParams, **kwargs: Any
+    ) -> _models.ProcessItem:
+        """Assign a process item task.
+
+        Allow to assign a process item task to a user or application. Only one option will be
+        necessary.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param process_item_task_assign_params: Params to change the task owner. Required.
+        :type process_item_task_assign_params: ~kuflow.rest.models.ProcessItemTaskAssignParams
+        :return: ProcessItem
+        :rtype: ~kuflow.rest.models.ProcessItem
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.process_item.assign_process_item_task(
+            id=id,
+            process_item_task_assign_params=encode_json_body(
+                self._kuflow_client.process_item, process_item_task_assign_params
+            ),
+            **kwargs,
+        )
+
+    async def complete_process_item_task(self, id: str, **kwargs: Any) -> _models.ProcessItem:
+        """Complete a process item task.
+
+        Allow to complete a claimed task by the principal.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :return: ProcessItem
+        :rtype: ~kuflow.rest.models.ProcessItem
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.process_item.complete_process_item_task(id=id, **kwargs)
+
+    async def append_process_item_task_log(
+        self, id: str, process_item_task_append_log_params: _models.ProcessItemTaskAppendLogParams, **kwargs: Any
+    ) -> _models.ProcessItem:
+        """Append a log to the process item task.
+
+        A log entry is added to the task. If the number of log entries is reached, the oldest log entry
+        is removed.
+
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param process_item_task_append_log_params: Log to be created. Required.
+        :type process_item_task_append_log_params: ~kuflow.rest.models.Log
+        :return: ProcessItem
+        :rtype: ~kuflow.rest.models.ProcessItem
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.process_item.append_process_item_task_log(
+            id=id,
+            process_item_task_append_log_params=encode_json_body(
+                self._kuflow_client.process_item, process_item_task_append_log_params
+            ),
+            **kwargs,
+        )
+
+    async def update_process_item_task_data(
+        self, id: str, process_item_task_data_update_params: _models.ProcessItemTaskDataUpdateParams, **kwargs: Any
+    ) -> _models.ProcessItem:
+        """Save JSON data.
+
+        Allow to save a JSON data validating that the data follow the related schema. If the data is
+        invalid, then
+        the json form is marked as invalid.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param process_item_task_data_update_params: Params to update a process item task data. Required.
+        :type process_item_task_data_update_params: ~kuflow.rest.models.ProcessItemSaveElementCommand
+        :return: ProcessItem
+        :rtype: ~kuflow.rest.models.ProcessItem
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.process_item.update_process_item_task_data(
+            id=id,
+            process_item_task_data_update_params=encode_json_body(
+                self._kuflow_client.process_item, process_item_task_data_update_params
+            ),
+            **kwargs,
+        )
+
+    async def patch_process_item_task_data(
+        self, id: str, json_patch: list[_models.JsonPatchOperation], **kwargs: Any
+    ) -> _models.ProcessItem:
+        """Save JSON data.
+
+        Allow to save a JSON data validating that the data follow the related schema. If the data is
+        invalid, then
+        the json form is marked as invalid.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param json_patch: Params to update a process item task data. Required.
+        :type json_patch: List[~kuflow.rest.models.JsonPatchOperation]
+        :return: ProcessItem
+        :rtype: ~kuflow.rest.models.ProcessItem
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.process_item.patch_process_item_task_data(
+            id=id, json_patch=encode_json_body(self._kuflow_client.process_item, json_patch), **kwargs
+        )
+
+    async def update_process_item_task_data_smart(
+        self,
+        id: str,
+        previous_data: Optional[Union[_models.JsonValue, dict[str, Any]]],
+        data: Union[_models.JsonValue, dict[str, Any]],
+        **kwargs: Any,
+    ) -> _models.ProcessItem:
+        """Save JSON data with the smaller request.
+
+        Sends the JSON patch from ``previous_data`` to ``data`` when it is smaller than the whole document, see
+        :func:`~kuflow_rest.utils.select_json_patch`, and the whole document otherwise.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param previous_data: The current JSON value, ie: the ``task.data`` of the process item. None to send the whole
+                              document.
+        :type previous_data: ~kuflow.rest.models.JsonValue or dict
+        :param data: The new JSON value. Required.
+        :type data: ~kuflow.rest.models.JsonValue or dict
+        :return: ProcessItem
+        :rtype: ~kuflow.rest.models.ProcessItem
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        json_patch = select_json_patch(previous_data, data)
+        if json_patch is not None:
+            return await self.patch_process_item_task_data(id, json_patch, **kwargs)
+
+        process_item_task_data_update_params = _models.ProcessItemTaskDataUpdateParams(data=to_json_value(data))
+        return await self.update_process_item_task_data(id, process_item_task_data_update_params, **kwargs)
+
+    async def update_process_item_task_context_data(
+        self,
+        id: str,
+        process_item_task_context_data_update_params: _models.ProcessItemTaskContextDataUpdateParams,
+        **kwargs: Any,
+    ) -> _models.ProcessItem:
+        """Save JSON context data.
+
+        Allow to save a JSON context data validating that the data follow the related schema. If the
+        data is invalid, then the json form is marked as invalid.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param process_item_task_context_data_update_params: Params used to update the JSON context data value.
+                                                             Required.
+        :type process_item_task_context_data_update_params:
+         ~kuflow.rest.models.ProcessItemTaskContextDataUpdateParams
+        :return: ProcessItem
+        :rtype: ~kuflow.rest.models.ProcessItem
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.process_item.update_process_item_task_context_data(
+            id=id,
+            process_item_task_context_data_update_params=encode_json_body(
+                self._kuflow_client.process_item, process_item_task_context_data_update_params
+            ),
+            **kwargs,
+        )
+
+    async def retrieve_process_item_ai_assistance(self, id: str, **kwargs: Any) -> _models.ProcessItemAiAssistance:
+        """Retrieve AI assistance for a process item.
+
+        Return the latest persisted AI assistance run for a process item, if any.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :return: ProcessItemAiAssistance
+        :rtype: ~kuflow.rest.models.ProcessItemAiAssistance
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.process_item.retrieve_process_item_ai_assistance(id=id, **kwargs)
+
+    async def generate_process_item_ai_assistance(
+        self,
+        id: str,
+        process_item_ai_assistance_generate_params: _models.ProcessItemAiAssistanceGenerateParams,
+        **kwargs: Any,
+    ) -> _models.ProcessItemAiAssistance:
+        """Trigger or poll AI assistance for a process item.
+
+        Trigger an asynchronous AI assistance run for a process item and return its current state,
+        identified by a client-supplied ``requestId`` (UUID). The ``requestId`` makes the call
+        idempotent and lets a client launch successive AI assistance attempts on the same process
+        item - one at a time.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param process_item_ai_assistance_generate_params: Params identifying this AI assistance attempt.
+                                                           Required.
+        :type process_item_ai_assistance_generate_params:
+         ~kuflow.rest.models.ProcessItemAiAssistanceGenerateParams
+        :return: ProcessItemAiAssistance
+        :rtype: ~kuflow.rest.models.ProcessItemAiAssistance
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.process_item.generate_process_item_ai_assistance(
+            id=id,
+            process_item_ai_assistance_generate_params=encode_json_body(
+                self._kuflow_client.process_item, process_item_ai_assistance_generate_params
+            ),
+            **kwargs,
+        )
+
+    async def download_process_item_task_data_webforms_as_document(
+        self, id: str, property_path: str, **kwargs: Any
+    ) -> AsyncIterator[bytes]:
+        """Download a Form rendered as PDF or Zip of PDFs (when the element is multiple).
+
+        Given a task, generate a PDF from a Form type element with the data filled in, if any. If there
+        are multiple form values, they are packed into a ZIP.
+
+        Important!: To use this feature, please contact to kuflow@kuflow.com.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :keyword property_path: JSON pointer to the property with the error. See:
+         https://datatracker.ietf.org/doc/html/rfc6901
+
+         ie: /user/name or /users/1/name. Required.
+        :type property_path: str
+        :return: Iterator of the response bytes
+        :rtype: AsyncIterator[bytes]
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.process_item.download_process_item_task_data_webforms_as_document(
+            id=id, property_path=property_path, **kwargs
+        )
+
+    async def download_process_item_task_data_webforms_as_document_to_file(
+        self, id: str, path: Union[str, "os.PathLike[str]"], property_path: str, **kwargs: Any
+    ) -> int:
+        """Download a Form rendered as PDF or Zip of PDFs into a file.
+
+        See the ``download_process_item_task_data_webforms_as_document`` operation.
+
+        The file is written as ``<path>.part`` and renamed to ``path`` once it is complete. A ``.part`` file of a
+        failed download is resumed, and large files are downloaded in parallel parts, when the server supports
+        Range requests.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param path: Path of the file. Required.
+        :type path: str or ~os.PathLike
+        :keyword property_path: JSON pointer to the property with the error. See:
+         https://datatracker.ietf.org/doc/html/rfc6901
+
+         ie: /user/name or /users/1/name. Required.
+        :type property_path: str
+        :keyword int chunk_size: Size of the writes to the file. Default value is 1 MiB.
+        :keyword int part_size: Size of the parts downloaded in parallel. Default value is 8 MiB.
+        :keyword int max_concurrency: Parts downloaded at the same time, 1 to download in one request. Default value
+         is 4.
+        :return: The size of the file.
+        :rtype: int
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await download_to_file(
+            self._kuflow_client,
+            build_download_process_item_task_data_webforms_as_document_request(id=id, property_path=property_path),
+            path,
+            **kwargs,
+        )
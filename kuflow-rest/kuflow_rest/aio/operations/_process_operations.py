@@ -0,0 +1,615 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import functools
+import os
+from collections.abc import AsyncIterator, Sequence
+from typing import Any, Callable, Optional, Union
+
+from ... import models as _models
+from ..._download import expected_document_size
+from ..._generated.aio import KuFlowRestClient as KuFlowRestClientGenerated
+from ..._generated.operations._process_operations import build_download_process_document_request
+from ..._serialization import encode_json_body
+from ..._upload import aupload_documents, upload_content
+from ...operations._pagination import aiterate_page_items
+from ...utils._json_patch import select_json_patch, to_json_value
+from .._download import download_to_file
+
+
+class ProcessOperations:
+    """
+    .. warning::
+        **DO NOT** instantiate this class directly.
+
+        Instead, you should access the following operations through
+        :class:`~kuflow_rest.aio.KuFlowRestClient`'s
+        :attr:`process` attribute.
+    """
+
+    def __init__(self, kuflow_client: KuFlowRestClientGenerated):
+        self._kuflow_client = kuflow_client
+
+    async def find_processes(
+        self,
+        size: int = 25,
+        page: int = 0,
+        sort: Optional[Union[str, list[str]]] = None,
+        tenant_id: Optional[Union[str, list[str]]] = None,
+        process_definition_id: Optional[Union[str, list[str]]] = None,
+        process_definition_code: Optional[Union[str, list[str]]] = None,
+        **kwargs: Any,
+    ) -> _models.ProcessPage:
+        """Find all accessible Processes.
+
+        List all the Processes that have been created and the credentials has access.
+
+        Available sort query values: id, createdAt, lastModifiedAt.
+
+        :keyword size: The number of records returned within a single API call. Default value is 25.
+        :type size: int
+        :keyword page: The page number of the current page in the returned records, 0 is the first page.
+                       Default value is 0.
+        :type page: int
+        :keyword sort: Sorting criteria in the format: property{,asc|desc}. Example: createdAt,desc
+
+                       Default sort order is ascending. Multiple sort criteria are supported.
+
+                       Please refer to the method description for supported properties. Default value is None.
+        :type sort: Optional[Union[str, List[str]]]
+        :keyword tenant_id: Filter processes that exists in one of tenant ids. Default value is None.
+        :type tenant_id: Optional[Union[str, List[str]]]
+        :keyword process_definition_id: Filter by an array of process definition ids. Default value is None.
+        :type process_definition_id: Optional[Union[str, List[str]]]
+        :keyword process_definition_code: Filter by an array of process definition codes. Default value is None.
+        :type process_definition_code: Optional[Union[str, List[str]]]
+        :return: ProcessPage
+        :rtype: ~kuflow.rest.models.ProcessPage
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        if sort is not None and isinstance(sort, str):
+            sort = [sort]
+
+        if tenant_id is not None and isinstance(tenant_id, str):
+            tenant_id = [tenant_id]
+
+        if process_definition_id is not None and isinstance(process_definition_id, str):
+            process_definition_id = [process_definition_id]
+
+        if process_definition_code is not None and isinstance(process_definition_code, str):
+            process_definition_code = [process_definition_code]
+
+        return await self._kuflow_client.process.find_processes(
+            size=size,
+            page=page,
+            sort=sort,
+            tenant_id=tenant_id,
+            process_definition_id=process_definition_id,
+            process_definition_code=process_definition_code,
+            **kwargs,
+        )
+
+    def aiter_processes(
+        self,
+        size: int = 25,
+        page: int = 0,
+        prefetch: bool = True,
+        concurrency: int = 1,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> AsyncIterator[_models.ProcessPageItem]:
+        """Iterate over all accessible Processes.
+
+        Stream the Processes of every page returned by :meth:`find_processes`,
+        starting at ``page``, until the last page is reached. While the items of a page are consumed, the next
+        page is requested in a background task. Items already delivered, that shifted to a later page because
+        they were modified during the iteration, are skipped.
+
+        :keyword size: The number of records requested within a single API call. Default value is 25.
+        :type size: int
+        :keyword page: The page number to start from, 0 is the first page. Default value is 0.
+        :type page: int
+        :keyword prefetch: Request the next page while the current one is consumed. Default value is True.
+        :type prefetch: bool
+        :keyword concurrency: Fetch-all mode. When greater than 1, once the first page reveals the total number of
+                              pages, up to ``concurrency`` of the remaining pages are requested at the same time.
+                              Default value is 1.
+        :type concurrency: int
+        :keyword ordered: Deliver the items in page order. If False, the pages are delivered as soon as they arrive.
+                          Only applies to the fetch-all mode. Default value is True.
+        :type ordered: bool
+        :keyword kwargs: Sorting criteria and filters, see :meth:`find_processes`.
+        :return: AsyncIterator of ProcessPageItem
+        :rtype: AsyncIterator[~kuflow.rest.models.ProcessPageItem]
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return aiterate_page_items(
+            functools.partial(self.find_processes, size=size, **kwargs),
+            page=page,
+            prefetch=prefetch,
+            concurrency=concurrency,
+            ordered=ordered,
+        )
+
+    async def create_process(
+        self, process_create_params: _models.ProcessCreateParams, **kwargs: Any
+    ) -> _models.Process:
+        """Create a new process.
+
+        Creates a process. This option has direct correspondence to the action of starting a process in
+        the Kuflow GUI.
+
+        When a process is created, the current user is assigned as the process initiator, if you want
+        to change it, you can pass a valid initiator using the following options:
+
+
+        * If you know the ``principal ID`` you can assign it to ``initiator.id``
+        * If you know the ``user ID`` you can assign it to ``initiator.user.id``
+        * If you know the ``user email`` you can assign it to ``initiator.user.email``
+        * If you know the ``application ID`` you can assign it to ``initiator.application.id``
+
+        If you want the method to be idempotent, please specify the ``id`` field in the request body.
+
+        :param process_create_params: Process to create. Required.
+        :type process_create_params: ~kuflow.rest.models.ProcessCreateParams
+        :return: Process
+        :rtype: ~kuflow.rest.models.Process
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.process.create_process(
+            process_create_params=encode_json_body(self._kuflow_client.process, process_create_params), **kwargs
+        )
+
+    async def retrieve_process(self, id: str, **kwargs: Any) -> _models.Process:
+        """Get a Process by ID.
+
+        Returns the requested Process when has access to do it.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :return: Process
+        :rtype: ~kuflow.rest.models.Process
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.process.retrieve_process(id=id, **kwargs)
+
+    async def complete_process(self, id: str, **kwargs: Any) -> _models.Process:
+        """Complete a Process.
+
+        Complete a Process. The state of Process is set to 'completed'.
+
+        If you are already in this state, no action is taken.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :return: Process
+        :rtype: ~kuflow.rest.models.Process
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.process.complete_process(id=id, **kwargs)
+
+    async def cancel_process(self, id: str, **kwargs: Any) -> _models.Process:
+        """Cancel a Process.
+
+        Cancel a Process. The Process state is set to 'cancelled'.
+
+        All the active tasks will be marked as cancelled too.
+
+        If you are already in this state, no action is taken.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :return: Process
+        :rtype: ~kuflow.rest.models.Process
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.process.cancel_process(id=id, **kwargs)
+
+    async def cancel_process_items(
+        self, id: str, process_item_id: Optional[Union[str, list[str]]] = None, **kwargs: Any
+    ) -> _models.Process:
+        """Cancel Process Items.
+
+        Cancel Process Items in a Process.
+
+        When ``process_item_id`` is provided, only those specific process items are cancelled. When
+        omitted, all active process items in the process are cancelled.
+
+        For task process items, tasks in a cancellable state (ready, claimed) are set to 'cancelled'.
+        Already cancelled tasks are treated as a no-op. The Process itself is not affected.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param process_item_id: Optional list of process item IDs to cancel. If omitted, all active
+                                process items are cancelled. Default value is None.
+        :type process_item_id: Optional[Union[str, List[str]]]
+        :return: Process
+        :rtype: ~kuflow.rest.models.Process
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        if process_item_id is not None and isinstance(process_item_id, str):
+            process_item_id = [process_item_id]
+
+        return await self._kuflow_client.process.cancel_process_items(id=id, process_item_id=process_item_id, **kwargs)
+
+    async def change_process_initiator(
+        self, id: str, process_change_initiator_params: _models.ProcessChangeInitiatorParams, **kwargs: Any
+    ) -> _models.Process:
+        """Change process initiator.
+
+        Change the current initiator of a process.
+
+        Allows you to choose a user (by email or principal identifier) or an application (principal
+        identifier).
+        Only one option will be necessary.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param process_change_initiator_params: Command to change the process initiator. Required.
+        :type process_change_initiator_params: ~kuflow.rest.models.ProcessChangeInitiatorParams
+        :return: Process
+        :rtype: ~kuflow.rest.models.Process
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.process.change_process_initiator(
+            id=id,
+            process_change_initiator_params=encode_json_body(
+                self._kuflow_client.process, process_change_initiator_params
+            ),
+            **kwargs,
+        )
+
+    async def upload_process_user_action_document(
+        self,
+        id: str,
+        file: _models.Document,
+        user_action_value_id: str,
+        *,
+        progress: Optional[Callable[[_models.UploadProgress], None]] = None,
+        **kwargs: Any,
+    ) -> Optional[_models.Process]:
+        """Upload and save a document in a user action.
+
+        Allow saving a user action document uploading the content.
+
+        user_action_value_id:
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param file: Document to save. Required.
+        :type file: _models.Document
+        :keyword user_action_value_id: User action value id. Required.
+        :type user_action_value_id: _models.ProcessUserActionUploadParams
+        :keyword progress: Called with the progress of the upload, bytes sent and throughput, after every
+                           chunk of the document. Default value is None.
+        :paramtype progress: Callable[[~kuflow_rest.models.UploadProgress], None]
+        :return: Process or None
+        :rtype: ~kuflow.rest.models.Process or None
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.process.upload_process_user_action_document(
+            id=id,
+            file=upload_content(file, progress),
+            file_content_type=file.content_type,
+            file_name=file.file_name,
+            user_action_value_id=user_action_value_id,
+            **kwargs,
+        )
+
+    async def update_process_metadata(
+        self, id: str, process_metadata_update_params: _models.ProcessMetadataUpdateParams, **kwargs: Any
+    ) -> _models.Process:
+        """Save process metadata.
+
+        Save process metadata.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param process_metadata_update_params: Params to save the metadata data. Required.
+        :type process_metadata_update_params: ~kuflow.rest.models.ProcessSaveElementCommand
+        :return: Process
+        :rtype: ~kuflow.rest.models.Process
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.process.update_process_metadata(
+            id=id,
+            process_metadata_update_params=encode_json_body(
+                self._kuflow_client.process, process_metadata_update_params
+            ),
+            **kwargs,
+        )
+
+    async def patch_process_metadata(
+        self, id: str, json_patch: list[_models.JsonPatchOperation], **kwargs: Any
+    ) -> _models.Process:
+        """Patch JSON data.
+
+        Allow to patch a JSON data validating that the data follow the related schema. If the data is
+        invalid, then
+        the json is marked as invalid.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param json_patch: Params to save the metadata data. Required.
+        :type json_patch: List[~kuflow.rest.models.JsonPatchOperation]
+        :return: Process
+        :rtype: ~kuflow.rest.models.Process
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.process.patch_process_metadata(
+            id=id, json_patch=encode_json_body(self._kuflow_client.process, json_patch), **kwargs
+        )
+
+    async def update_process_metadata_smart(
+        self,
+        id: str,
+        previous_metadata: Optional[Union[_models.JsonValue, dict[str, Any]]],
+        metadata: Union[_models.JsonValue, dict[str, Any]],
+        **kwargs: Any,
+    ) -> _models.Process:
+        """Save JSON metadata with the smaller request.
+
+        Sends the JSON patch from ``previous_metadata`` to ``metadata`` when it is smaller than the whole document, see
+        :func:`~kuflow_rest.utils.select_json_patch`, and the whole document otherwise.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param previous_metadata: The current JSON value, ie: the ``metadata`` of the process. None to send the whole
+                                  document.
+        :type previous_metadata: ~kuflow.rest.models.JsonValue or dict
+        :param metadata: The new JSON value. Required.
+        :type metadata: ~kuflow.rest.models.JsonValue or dict
+        :return: Process
+        :rtype: ~kuflow.rest.models.Process
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        json_patch = select_json_patch(previous_metadata, metadata)
+        if json_patch is not None:
+            return await self.patch_process_metadata(id, json_patch, **kwargs)
+
+        process_metadata_update_params = _models.ProcessMetadataUpdateParams(metadata=to_json_value(metadata))
+        return await self.update_process_metadata(id, process_metadata_update_params, **kwargs)
+
+    async def update_process_entity(
+        self,
+        id: str,
+        process_entity_update_params: _models.ProcessEntityUpdateParams,
+        **kwargs: Any,
+    ) -> _models.Process:
+        """Save JSON data.
+
+        Allow to save a JSON validating that the data follow the related schema. If the data is
+        invalid, then
+        the json form is marked as invalid.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param process_entity_update_params: Params to save the JSON value. Required.
+        :type process_entity_update_params: ~kuflow.rest.models.ProcessEntityUpdateParams
+        :return: Process
+        :rtype: ~kuflow.rest.models.Process
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.process.update_process_entity(
+            id=id,
+            process_entity_update_params=encode_json_body(self._kuflow_client.process, process_entity_update_params),
+            **kwargs,
+        )
+
+    async def patch_process_entity(
+        self,
+        id: str,
+        json_patch: list[_models.JsonPatchOperation],
+        **kwargs: Any,
+    ) -> _models.Process:
+        """Save JSON data.
+
+        Allow to save a JSON validating that the data follow the related schema. If the data is
+        invalid, then
+        the json form is marked as invalid.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param json_patch: Params to save the JSON value. Required.
+        :type json_patch: List[~kuflow.rest.models.JsonPatchOperation]
+        :return: Process
+        :rtype: ~kuflow.rest.models.Process
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.process.patch_process_entity(
+            id=id, json_patch=encode_json_body(self._kuflow_client.process, json_patch), **kwargs
+        )
+
+    async def update_process_entity_smart(
+        self,
+        id: str,
+        previous_entity: Optional[Union[_models.JsonValue, dict[str, Any]]],
+        entity: Union[_models.JsonValue, dict[str, Any]],
+        **kwargs: Any,
+    ) -> _models.Process:
+        """Save JSON entity with the smaller request.
+
+        Sends the JSON patch from ``previous_entity`` to ``entity`` when it is smaller than the whole document, see
+        :func:`~kuflow_rest.utils.select_json_patch`, and the whole document otherwise.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param previous_entity: The current JSON value, ie: the ``entity`` of the process. None to send the whole
+                                document.
+        :type previous_entity: ~kuflow.rest.models.JsonValue or dict
+        :param entity: The new JSON value. Required.
+        :type entity: ~kuflow.rest.models.JsonValue or dict
+        :return: Process
+        :rtype: ~kuflow.rest.models.Process
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        json_patch = select_json_patch(previous_entity, entity)
+        if json_patch is not None:
+            return await self.patch_process_entity(id, json_patch, **kwargs)
+
+        process_entity_update_params = _models.ProcessEntityUpdateParams(entity=to_json_value(entity))
+        return await self.update_process_entity(id, process_entity_update_params, **kwargs)
+
+    async def upload_process_document(
+        self,
+        id: str,
+        document: _models.Document,
+        *,
+        progress: Optional[Callable[[_models.UploadProgress], None]] = None,
+        **kwargs: Any,
+    ) -> _models.DocumentReference:
+        """Upload a temporal document into the process that later on must be linked with a process domain
+        resource.
+
+        Upload a temporal document into the process that later on must be linked with a process domain
+        resource.
+
+        Documents uploaded with this API will be deleted after 24 hours as long as they have not been
+        linked to a
+        process or process item.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param document: Document to save. Required.
+        :type document: ~kuflow.rest.models.Document
+        :keyword progress: Called with the progress of the upload, bytes sent and throughput, after every
+                           chunk of the document. Default value is None.
+        :paramtype progress: Callable[[~kuflow_rest.models.UploadProgress], None]
+        :return: DocumentReference
+        :rtype: ~kuflow.rest.models.DocumentReference
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.process.upload_process_document(
+            id=id,
+            file=upload_content(document, progress),
+            file_content_type=document.content_type,
+            file_name=document.file_name,
+            **kwargs,
+        )
+
+    async def upload_process_documents(
+        self,
+        id: str,
+        documents: Sequence[_models.Document],
+        *,
+        max_concurrency: int = 4,
+        max_retries: int = 2,
+        progress: Optional[Callable[[int, _models.UploadProgress], None]] = None,
+        as_document_uris: bool = False,
+        **kwargs: Any,
+    ) -> Union[list[_models.DocumentReference], list[str]]:
+        """Upload several temporal documents into the process at the same time, see ``upload_process_document``.
+
+        Up to ``max_concurrency`` documents are uploaded at the same time in tasks. A document whose upload fails
+        with a connection error, a timeout, throttling or a server error is uploaded again, up to ``max_retries``
+        times, when its content is seekable. If a document can not be uploaded, its error is raised and the
+        documents whose upload did not start are not uploaded.
+
+        These retries replace the ones of the pipeline: while ``max_retries`` is greater than 0, ``retry_total``
+        defaults to 0 and each attempt is sent once, so a document is sent at most ``max_retries + 1`` times. With
+        ``max_retries=0`` the documents are retried by the pipeline as in ``upload_process_document``.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param documents: Documents to save. Required.
+        :type documents: list[~kuflow.rest.models.Document]
+        :keyword max_concurrency: Documents uploaded at the same time. Default value is 4.
+        :paramtype max_concurrency: int
+        :keyword max_retries: Retries of the upload of each document. Default value is 2.
+        :paramtype max_retries: int
+        :keyword progress: Called with the index of a document and the progress of its upload, after every chunk
+                           of the document. Default value is None.
+        :paramtype progress: Callable[[int, ~kuflow_rest.models.UploadProgress], None]
+        :keyword as_document_uris: Return the ``kuflow-file:`` document URIs, ready to be set in the task data,
+                                   instead of the document references. Default False.
+        :paramtype as_document_uris: bool
+        :return: The document references, or document URIs, in the order of the documents.
+        :rtype: list[~kuflow.rest.models.DocumentReference] or list[str]
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        if max_retries > 0:
+            kwargs.setdefault("retry_total", 0)
+
+        async def upload(index: int, document: _models.Document) -> _models.DocumentReference:
+            return await self.upload_process_document(
+                id,
+                document,
+                progress=None if progress is None else functools.partial(progress, index),
+                **kwargs,
+            )
+
+        references = await aupload_documents(upload, documents, max_concurrency, max_retries)
+
+        return [reference.document_uri for reference in references] if as_document_uris else references
+
+    async def download_process_document(self, id: str, *, document_uri: str, **kwargs: Any) -> AsyncIterator[bytes]:
+        """Download document.
+
+        Given a process and a documentUri, download a document.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :keyword document_uri: Document URI to download. Required.
+        :type document_uri: str
+        :return: AsyncIterator[bytes]
+        :rtype: AsyncIterator[bytes]
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.process.download_process_document(id=id, document_uri=document_uri, **kwargs)
+
+    async def download_process_document_to_file(
+        self, id: str, path: Union[str, "os.PathLike[str]"], *, document_uri: str, **kwargs: Any
+    ) -> int:
+        """Download a document into a file.
+
+        Given a process and a documentUri, download a document into a file, see the ``download_process_document``
+        operation.
+
+        The file is written as ``<path>.part`` and renamed to ``path`` once it is complete. A ``.part`` file of a
+        failed download is resumed, and large files are downloaded in parallel parts, when the server supports
+        Range requests.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param path: Path of the file. Required.
+        :type path: str or ~os.PathLike
+        :keyword document_uri: Document URI to download. Required.
+        :type document_uri: str
+        :keyword int expected_size: Size of the document, the downloaded file is checked against it. Default value is
+         the size of the ``document_uri``.
+        :keyword int chunk_size: Size of the writes to the file. Default value is 1 MiB.
+        :keyword int part_size: Size of the parts downloaded in parallel. Default value is 8 MiB.
+        :keyword int max_concurrency: Parts downloaded at the same time, 1 to download in one request. Default value
+         is 4.
+        :return: The size of the file.
+        :rtype: int
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        kwargs.setdefault("expected_size", expected_document_size(document_uri))
+        return await download_to_file(
+            self._kuflow_client,
+            build_download_process_document_request(id=id, document_uri=document_uri),
+            path,
+            **kwargs,
+        )
@@ -0,0 +1,362 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import functools
+import os
+from collections.abc import AsyncIterator
+from typing import Any, Optional, Union
+
+from ... import models as _models
+from ..._generated.aio import KuFlowRestClient as KuFlowRestClientGenerated
+from ..._generated.operations._robot_operations import (
+    build_download_robot_asset_request,
+    build_download_robot_source_code_request,
+)
+from ..._robot_cache import RobotCache
+from ...operations._pagination import aiterate_page_items
+from .._download import download_to_file
+
+
+class RobotOperations:
+    """
+    .. warning::
+        **DO NOT** instantiate this class directly.
+
+        Instead, you should access the following operations through
+        :class:`~kuflow_rest.aio.KuFlowRestClient`'s
+        :attr:`principal` attribute.
+    """
+
+    def __init__(self, kuflow_client: KuFlowRestClientGenerated, robot_cache: Optional[RobotCache] = None):
+        self._kuflow_client = kuflow_client
+        self._robot_cache = robot_cache
+
+    async def find_robots(
+        self,
+        size: int = 25,
+        page: int = 0,
+        sort: Optional[Union[str, list[str]]] = None,
+        tenant_id: Optional[Union[str, list[str]]] = None,
+        filter_context: Optional[Union[str, _models.RobotFilterContext]] = None,
+        **kwargs: Any,
+    ) -> _models.PrincipalPage:
+        """Find all accessible Robots.
+
+        List all the Robots that have been created and the credentials has access.
+
+        Available sort query values: createdAt, lastModifiedAt.
+
+        :keyword size: The number of records returned within a single API call. Default value is 25.
+        :type size: int
+        :keyword page: The page number of the current page in the returned records, 0 is the first
+         page. Default value is 0.
+        :type page: int
+        :keyword sort: Sorting criteria in the format: property{,asc|desc}. Example: createdAt,desc
+
+         Default sort order is ascending. Multiple sort criteria are supported.
+
+         Please refer to the method description for supported properties. Default value is None.
+        :type sort: Optional[Union[str, List[str]]]
+        :keyword tenant_id: Filter by tenantId. Default value is None.
+        :type tenant_id: Optional[Union[str, List[str]]]
+        :keyword filter_context: Filter by the specified context. Known values are: "READY" and "DEFAULT".
+         Default value is None.
+        :type filter_context: str or ~kuflow.rest.models.RobotFilterContext
+        :return: RobotPage
+        :rtype: ~kuflow.rest.models.RobotPage
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        if sort is not None and isinstance(sort, str):
+            sort = [sort]
+
+        if tenant_id is not None and isinstance(tenant_id, str):
+            tenant_id = [tenant_id]
+
+        return await self._kuflow_client.robot.find_robots(
+            size=size, page=page, sort=sort, tenant_id=tenant_id, filter_context=filter_context, **kwargs
+        )
+
+    def aiter_robots(
+        self,
+        size: int = 25,
+        page: int = 0,
+        prefetch: bool = True,
+        concurrency: int = 1,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> AsyncIterator[_models.RobotPageItem]:
+        """Iterate over all accessible Robots.
+
+        Stream the Robots of every page returned by :meth:`find_robots`,
+        starting at ``page``, until the last page is reached. While the items of a page are consumed, the next
+        page is requested in a background task. Items already delivered, that shifted to a later page because
+        they were modified during the iteration, are skipped.
+
+        :keyword size: The number of records requested within a single API call. Default value is 25.
+        :type size: int
+        :keyword page: The page number to start from, 0 is the first page. Default value is 0.
+        :type page: int
+        :keyword prefetch: Request the next page while the current one is consumed. Default value is True.
+        :type prefetch: bool
+        :keyword concurrency: Fetch-all mode. When greater than 1, once the first page reveals the total number of
+                              pages, up to ``concurrency`` of the remaining pages are requested at the same time.
+                              Default value is 1.
+        :type concurrency: int
+        :keyword ordered: Deliver the items in page order. If False, the pages are delivered as soon as they arrive.
+                          Only applies to the fetch-all mode. Default value is True.
+        :type ordered: bool
+        :keyword kwargs: Sorting criteria and filters, see :meth:`find_robots`.
+        :return: AsyncIterator of RobotPageItem
+        :rtype: AsyncIterator[~kuflow.rest.models.RobotPageItem]
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return aiterate_page_items(
+            functools.partial(self.find_robots, size=size, **kwargs),
+            page=page,
+            prefetch=prefetch,
+            concurrency=concurrency,
+            ordered=ordered,
+        )
+
+    async def retrieve_robot(self, id: str, **kwargs: Any) -> _models.Principal:
+        """Get a Robot by ID.
+
+        Returns the requested Robot when has access to do it.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :return: Robot
+        :rtype: ~kuflow.rest.models.Robot
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.robot.retrieve_robot(id=id, **kwargs)
+
+    async def download_robot_source_code(self, id: str, **kwargs: Any) -> AsyncIterator[bytes]:
+        """Download robot code.
+
+        Given a robot, download the source code.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :return: AsyncIterator[bytes]
+        :rtype: AsyncIterator[bytes]
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.robot.download_robot_source_code(id=id, **kwargs)
+
+    async def download_robot_source_code_to_file(
+        self, id: str, path: Union[str, "os.PathLike[str]"], **kwargs: Any
+    ) -> int:
+        """Download robot code into a file.
+
+        Given a robot, download the source code into a file.
+
+        The file is written as ``<path>.part`` and renamed to ``path`` once it is complete. A ``.part`` file of a
+        failed download is resumed, and large files are downloaded in parallel parts, when the server supports
+        Range requests.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param path: Path of the file. Required.
+        :type path: str or ~os.PathLike
+        :keyword int chunk_size: Size of the writes to the file. Default value is 1 MiB.
+        :keyword int part_size: Size of the parts downloaded in parallel. Default value is 8 MiB.
+        :keyword int max_concurrency: Parts downloaded at the same time, 1 to download in one request. Default value
+         is 4.
+        :return: The size of the file.
+        :rtype: int
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await download_to_file(
+            self._kuflow_client, build_download_robot_source_code_request(id=id), path, **kwargs
+        )
+
+    async def download_robot_asset(
+        self,
+        id: str,
+        *,
+        type: _models.RobotAssetType,
+        version: str,
+        platform: _models.RobotAssetPlatform,
+        architecture: _models.RobotAssetArchitecture,
+        **kwargs: Any,
+    ) -> AsyncIterator[bytes]:
+        """Download robot asset.
+
+        Given a robot, download the requested asset.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :keyword type: The asset type. Known values are: "PYTHON", "PYTHON_PIP", and "NODEJS".
+         Required.
+        :type type: str or ~kuflow.rest.models.RobotAssetType
+        :keyword version: The asset version. Required.
+        :type version: str
+        :keyword platform: The asset platform. Known values are: "WINDOWS", "MAC_OS", and "LINUX".
+         Required.
+        :type platform: str or ~kuflow.rest.models.RobotAssetPlatform
+        :keyword architecture: The asset platform architecture. Known values are: "X86_32" and "X86_64". Required.
+        :type architecture: str or ~kuflow.rest.models.RobotAssetArchitecture
+        :return: AsyncIterator[bytes]
+        :rtype: AsyncIterator[bytes]
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.robot.download_robot_asset(
+            id=id, type=type, version=version, platform=platform, architecture=architecture, **kwargs
+        )
+
+    async def download_robot_asset_to_file(
+        self,
+        id: str,
+        path: Union[str, "os.PathLike[str]"],
+        *,
+        type: _models.RobotAssetType,
+        version: str,
+        platform: _models.RobotAssetPlatform,
+        architecture: _models.RobotAssetArchitecture,
+        **kwargs: Any,
+    ) -> int:
+        """Download robot asset into a file.
+
+        Given a robot, download the requested asset into a file.
+
+        The file is written as ``<path>.part`` and renamed to ``path`` once it is complete. A ``.part`` file of a
+        failed download is resumed, and large files are downloaded in parallel parts, when the server supports
+        Range requests.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param path: Path of the file. Required.
+        :type path: str or ~os.PathLike
+        :keyword type: The asset type. Known values are: "PYTHON", "PYTHON_PIP", and "NODEJS".
+         Required.
+        :type type: str or ~kuflow.rest.models.RobotAssetType
+        :keyword version: The asset version. Required.
+        :type version: str
+        :keyword platform: The asset platform. Known values are: "WINDOWS", "MAC_OS", and "LINUX".
+         Required.
+        :type platform: str or ~kuflow.rest.models.RobotAssetPlatform
+        :keyword architecture: The asset platform architecture. Known values are: "X86_32" and "X86_64". Required.
+        :type architecture: str or ~kuflow.rest.models.RobotAssetArchitecture
+        :keyword int chunk_size: Size of the writes to the file. Default value is 1 MiB.
+        :keyword int part_size: Size of the parts downloaded in parallel. Default value is 8 MiB.
+        :keyword int max_concurrency: Parts downloaded at the same time, 1 to download in one request. Default value
+         is 4.
+        :return: The size of the file.
+        :rtype: int
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await download_to_file(
+            self._kuflow_client,
+            build_download_robot_asset_request(
+                id=id, type=type, version=version, platform=platform, architecture=architecture
+            ),
+            path,
+            **kwargs,
+        )
+
+    async def retrieve_robot_source_code_path(
+        self, robot: _models.Robot, *, unpack: bool = False, **kwargs: Any
+    ) -> str:
+        """Return the path of the source code of a robot in the robot cache, downloading it when it is not cached.
+
+        The source code is cached by robot id, ``last_modified_at`` and source file hash, see
+        :class:`~kuflow_rest.RobotCache`. The client must be created with a ``robot_cache``.
+
+        :param robot: The robot, ie: returned by ``retrieve_robot``. Required.
+        :type robot: ~kuflow.rest.models.Robot
+        :keyword unpack: Unpack the source code (a zip or tar archive) and return the unpacked directory. Default
+         False.
+        :paramtype unpack: bool
+        :return: Path of the source code file, or of the unpacked directory.
+        :rtype: str
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        robot_cache = self._require_robot_cache()
+        kwargs.setdefault("expected_size", robot.source_file.content_length)
+
+        return await robot_cache.get_async(
+            RobotCache.source_code_key(robot),
+            robot.source_file.name,
+            functools.partial(self.download_robot_source_code_to_file, robot.id, **kwargs),
+            unpack=unpack,
+        )
+
+    async def retrieve_robot_asset_path(
+        self,
+        id: str,
+        *,
+        type: _models.RobotAssetType,
+        version: str,
+        platform: _models.RobotAssetPlatform,
+        architecture: _models.RobotAssetArchitecture,
+        unpack: bool = False,
+        **kwargs: Any,
+    ) -> str:
+        """Return the path of a robot asset in the robot cache, downloading it when it is not cached.
+
+        Assets are cached by type, version, platform and architecture, and shared by every robot, see
+        :class:`~kuflow_rest.RobotCache`. The client must be created with a ``robot_cache``.
+
+        :param id: The resource ID of a robot that uses the asset. Required.
+        :type id: str
+        :keyword type: The asset type. Known values are: "PYTHON", "PYTHON_PIP", and "NODEJS".
+         Required.
+        :type type: str or ~kuflow.rest.models.RobotAssetType
+        :keyword version: The asset version. Required.
+        :type version: str
+        :keyword platform: The asset platform. Known values are: "WINDOWS", "MAC_OS", and "LINUX".
+         Required.
+        :type platform: str or ~kuflow.rest.models.RobotAssetPlatform
+        :keyword architecture: The asset platform architecture. Known values are: "X86_32" and "X86_64". Required.
+        :type architecture: str or ~kuflow.rest.models.RobotAssetArchitecture
+        :keyword unpack: Unpack the asset (a zip or tar archive) and return the unpacked directory. Default False.
+        :paramtype unpack: bool
+        :return: Path of the asset file, or of the unpacked directory.
+        :rtype: str
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        robot_cache = self._require_robot_cache()
+        key = RobotCache.asset_key(type, version, platform, architecture)
+
+        return await robot_cache.get_async(
+            key,
+            key.removeprefix("asset/").replace("/", "-").lower(),
+            functools.partial(
+                self.download_robot_asset_to_file,
+                id,
+                type=type,
+                version=version,
+                platform=platform,
+                architecture=architecture,
+                **kwargs,
+            ),
+            unpack=unpack,
+        )
+
+    def _require_robot_cache(self) -> RobotCache:
+        if self._robot_cache is None:
+            raise ValueError("The client has no robot cache, create it with the robot_cache argument")
+
+        return self._robot_cache
@@ -0,0 +1,146 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import functools
+from collections.abc import AsyncIterator
+from typing import Any, Optional, Union
+
+from ... import models as _models
+from ..._generated.aio import KuFlowRestClient as KuFlowRestClientGenerated
+from ...operations._pagination import aiterate_page_items
+
+
+class TenantOperations:
+    """
+    .. warning::
+        **DO NOT** instantiate this class directly.
+
+        Instead, you should access the following operations through
+        :class:`~kuflow_rest.aio.KuFlowRestClient`'s
+        :attr:`principal` attribute.
+    """
+
+    def __init__(self, kuflow_client: KuFlowRestClientGenerated):
+        self._kuflow_client = kuflow_client
+
+    async def find_tenants(
+        self,
+        *,
+        size: int = 25,
+        page: int = 0,
+        sort: Optional[Union[str, list[str]]] = None,
+        tenant_id: Optional[Union[str, list[str]]] = None,
+        **kwargs: Any,
+    ) -> _models.TenantPage:
+        """Find all accessible Tenants.
+
+        List all the Tenants that the credentials used has access to.
+
+        Available sort query values: id, name.
+
+        :keyword size: The number of records returned within a single API call. Default value is 25.
+        :paramtype size: int
+        :keyword page: The page number of the current page in the returned records, 0 is the first
+         page. Default value is 0.
+        :paramtype page: int
+        :keyword sort: Sorting criteria in the format: property{,asc|desc}. Example: createdAt,desc
+
+         Default sort order is ascending. Multiple sort criteria are supported.
+
+         Please refer to the method description for supported properties. Default value is None.
+        :paramtype sort: list[str]
+        :keyword tenant_id: Filter by tenantId. Default value is None.
+        :paramtype tenant_id: list[str]
+        :return: TenantPage
+        :rtype: ~kuflow.rest.models.TenantPage
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        if sort is not None and isinstance(sort, str):
+            sort = [sort]
+
+        if tenant_id is not None and isinstance(tenant_id, str):
+            tenant_id = [tenant_id]
+
+        return await self._kuflow_client.tenant.find_tenants(
+            size=size,
+            page=page,
+            sort=sort,
+            tenant_id=tenant_id,
+            **kwargs,
+        )
+
+    def aiter_tenants(
+        self,
+        size: int = 25,
+        page: int = 0,
+        prefetch: bool = True,
+        concurrency: int = 1,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> AsyncIterator[_models.TenantPageItem]:
+        """Iterate over all accessible Tenants.
+
+        Stream the Tenants of every page returned by :meth:`find_tenants`,
+        starting at ``page``, until the last page is reached. While the items of a page are consumed, the next
+        page is requested in a background task. Items already delivered, that shifted to a later page because
+        they were modified during the iteration, are skipped.
+
+        :keyword size: The number of records requested within a single API call. Default value is 25.
+        :type size: int
+        :keyword page: The page number to start from, 0 is the first page. Default value is 0.
+        :type page: int
+        :keyword prefetch: Request the next page while the current one is consumed. Default value is True.
+        :type prefetch: bool
+        :keyword concurrency: Fetch-all mode. When greater than 1, once the first page reveals the total number of
+                              pages, up to ``concurrency`` of the remaining pages are requested at the same time.
+                              Default value is 1.
+        :type concurrency: int
+        :keyword ordered: Deliver the items in page order. If False, the pages are delivered as soon as they arrive.
+                          Only applies to the fetch-all mode. Default value is True.
+        :type ordered: bool
+        :keyword kwargs: Sorting criteria and filters, see :meth:`find_tenants`.
+        :return: AsyncIterator of TenantPageItem
+        :rtype: AsyncIterator[~kuflow.rest.models.TenantPageItem]
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return aiterate_page_items(
+            functools.partial(self.find_tenants, size=size, **kwargs),
+            page=page,
+            prefetch=prefetch,
+            concurrency=concurrency,
+            ordered=ordered,
+        )
+
+    async def retrieve_tenant(self, id: str, **kwargs: Any) -> _models.Tenant:
+        """Get a Tenant by ID.
+
+        Returns the requested Tenant when has access to do it.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :return: Tenant
+        :rtype: ~kuflow.rest.models.Tenant
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.tenant.retrieve_tenant(id=id, **kwargs)
@@ -0,0 +1,61 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+from typing import Any
+
+from ... import models as _models
+from ..._generated.aio import KuFlowRestClient as KuFlowRestClientGenerated
+from ..._serialization import encode_json_body
+
+
+class WorkerOperations:
+    """
+    .. warning::
+        **DO NOT** instantiate this class directly.
+
+        Instead, you should access the following operations through
+        :class:`~kuflow_rest.aio.KuFlowRestClient`'s
+        :attr:`task` attribute.
+    """
+
+    def __init__(self, kuflow_client: KuFlowRestClientGenerated):
+        self._kuflow_client = kuflow_client
+
+    async def create_worker(self, worker_create_params: _models.WorkerCreateParams, **kwargs: Any) -> _models.Worker:
+        """Create or update a worker.
+
+        Register a worker in KuFlow, this allows the platform to have a catalogue of all registered
+        workers.
+
+        If already exist a worker for the same identity, the worker will be updated.
+
+        :param worker_create_params: Worker to create or update. Required.
+        :type worker_create_params: ~kuflow.rest.models.WorkerCreateParams
+        :return: Worker
+        :rtype: ~kuflow.rest.models.Worker
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return await self._kuflow_client.worker.create_worker(
+            worker_create_params=encode_json_body(self._kuflow_client.worker, worker_create_params), **kwargs
+        )
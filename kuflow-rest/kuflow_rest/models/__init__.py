@@ -22,121 +22,128 @@
 # SOFTWARE.
 #
 
-from .._generated.models import (
-    AbstractAudited,
-    Authentication,
-    AuthenticationCreateParams,
-    AuthenticationEngineCertificate,
-    AuthenticationEngineCertificateTls,
-    AuthenticationEngineToken,
-    AuthenticationType,
-    BusinessArtifact,
-    BusinessArtifactAction,
-    BusinessArtifactActionCreateArtifact,
-    BusinessArtifactActionCreateParams,
-    BusinessArtifactActionCreateParamsCreateArtifact,
-    BusinessArtifactActionCreateParamsDownloadable,
-    BusinessArtifactActionCreateParamsStartProcess,
-    BusinessArtifactActionCreateParamsStartWorkflow,
-    BusinessArtifactActionDefinitionRef,
-    BusinessArtifactActionDownloadable,
-    BusinessArtifactActionStartProcess,
-    BusinessArtifactActionStartWorkflow,
-    BusinessArtifactActionStatus,
-    BusinessArtifactActionType,
-    BusinessArtifactCreateArtifactPrepare,
-    BusinessArtifactCreateArtifactPrepareParams,
-    BusinessArtifactCreateParams,
-    BusinessArtifactDataUpdateParams,
-    BusinessArtifactDefinitionRef,
-    BusinessArtifactPage,
-    BusinessArtifactPageItem,
-    DefaultError,
-    DefaultErrorInfo,
-    DocumentReference,
-    GroupPage,
-    GroupPageItem,
-    JsonPatchOperation,
-    JsonPatchOperationType,
-    JsonValue,
-    JsonValueError,
-    KmsKey,
-    Page,
-    PageMetadata,
-    Principal,
-    PrincipalApplication,
-    PrincipalPage,
-    PrincipalPageItem,
-    PrincipalType,
-    PrincipalUser,
-    Process,
-    ProcessChangeInitiatorParams,
-    ProcessCreateParams,
-    ProcessDefinitionRef,
-    ProcessEntityUpdateParams,
-    ProcessItem,
-    ProcessItemAiAssistance,
-    ProcessItemAiAssistanceGenerateParams,
-    ProcessItemAiAssistanceState,
-    ProcessItemCreateParams,
-    ProcessItemDefinitionRef,
-    ProcessItemMessage,
-    ProcessItemMessageCreateParams,
-    ProcessItemMessagePageItem,
-    ProcessItemPage,
-    ProcessItemPageItem,
-    ProcessItemTask,
-    ProcessItemTaskAppendLogParams,
-    ProcessItemTaskAssignParams,
-    ProcessItemTaskContextDataUpdateParams,
-    ProcessItemTaskCreateParams,
-    ProcessItemTaskDataUpdateParams,
-    ProcessItemTaskLog,
-    ProcessItemTaskLogLevel,
-    ProcessItemTaskPageItem,
-    ProcessItemTaskState,
-    ProcessItemType,
-    ProcessMetadataUpdateParams,
-    ProcessPage,
-    ProcessPageItem,
-    ProcessRelated,
-    ProcessState,
-    Robot,
-    RobotAssetArchitecture,
-    RobotAssetPlatform,
-    RobotAssetType,
-    RobotFilterContext,
-    RobotPage,
-    RobotPageItem,
-    RobotSourceFile,
-    RobotSourceType,
-    Tenant,
-    TenantPage,
-    TenantPageItem,
-    TenantPricingPlan,
-    TenantUser,
-    TenantUserPage,
-    TenantUserPageItem,
-    WebhookEvent,
-    WebhookEventProcessCreated,
-    WebhookEventProcessCreatedData,
-    WebhookEventProcessItemCreated,
-    WebhookEventProcessItemCreatedData,
-    WebhookEventProcessItemTaskStateChanged,
-    WebhookEventProcessItemTaskStateChangedData,
-    WebhookEventProcessStateChanged,
-    WebhookEventProcessStateChangedData,
-    WebhookType,
-    Worker,
-    WorkerCreateParams,
-)
-from .._generated.models import __all__ as _all_generated_models
-from ._models import (
-    Document,
-    KuFlowFile,
-    KuFlowGroup,
-    KuFlowPrincipal,
-)
+from typing import TYPE_CHECKING
+
+from .._lazy_import import lazy_import
+
+
+if TYPE_CHECKING:
+    from .._generated.models import (
+        AbstractAudited,
+        Authentication,
+        AuthenticationCreateParams,
+        AuthenticationEngineCertificate,
+        AuthenticationEngineCertificateTls,
+        AuthenticationEngineToken,
+        AuthenticationType,
+        BusinessArtifact,
+        BusinessArtifactAction,
+        BusinessArtifactActionCreateArtifact,
+        BusinessArtifactActionCreateParams,
+        BusinessArtifactActionCreateParamsCreateArtifact,
+        BusinessArtifactActionCreateParamsDownloadable,
+        BusinessArtifactActionCreateParamsStartProcess,
+        BusinessArtifactActionCreateParamsStartWorkflow,
+        BusinessArtifactActionDefinitionRef,
+        BusinessArtifactActionDownloadable,
+        BusinessArtifactActionStartProcess,
+        BusinessArtifactActionStartWorkflow,
+        BusinessArtifactActionStatus,
+        BusinessArtifactActionType,
+        BusinessArtifactCreateArtifactPrepare,
+        BusinessArtifactCreateArtifactPrepareParams,
+        BusinessArtifactCreateParams,
+        BusinessArtifactDataUpdateParams,
+        BusinessArtifactDefinitionRef,
+        BusinessArtifactPage,
+        BusinessArtifactPageItem,
+        DefaultError,
+        DefaultErrorInfo,
+        DocumentReference,
+        GroupPage,
+        GroupPageItem,
+        JsonPatchOperation,
+        JsonPatchOperationType,
+        JsonValue,
+        JsonValueError,
+        KmsKey,
+        Page,
+        PageMetadata,
+        Principal,
+        PrincipalApplication,
+        PrincipalPage,
+        PrincipalPageItem,
+        PrincipalType,
+        PrincipalUser,
+        Process,
+        ProcessChangeInitiatorParams,
+        ProcessCreateParams,
+        ProcessDefinitionRef,
+        ProcessEntityUpdateParams,
+        ProcessItem,
+        ProcessItemAiAssistance,
+        ProcessItemAiAssistanceGenerateParams,
+        ProcessItemAiAssistanceState,
+        ProcessItemCreateParams,
+        ProcessItemDefinitionRef,
+        ProcessItemMessage,
+        ProcessItemMessageCreateParams,
+        ProcessItemMessagePageItem,
+        ProcessItemPage,
+        ProcessItemPageItem,
+        ProcessItemTask,
+        ProcessItemTaskAppendLogParams,
+        ProcessItemTaskAssignParams,
+        ProcessItemTaskContextDataUpdateParams,
+        ProcessItemTaskCreateParams,
+        ProcessItemTaskDataUpdateParams,
+        ProcessItemTaskLog,
+        ProcessItemTaskLogLevel,
+        ProcessItemTaskPageItem,
+        ProcessItemTaskState,
+        ProcessItemType,
+        ProcessMetadataUpdateParams,
+        ProcessPage,
+        ProcessPageItem,
+        ProcessRelated,
+        ProcessState,
+        Robot,
+        RobotAssetArchitecture,
+        RobotAssetPlatform,
+        RobotAssetType,
+        RobotFilterContext,
+        RobotPage,
+        RobotPageItem,
+        RobotSourceFile,
+        RobotSourceType,
+        Tenant,
+        TenantPage,
+        TenantPageItem,
+        TenantPricingPlan,
+        TenantUser,
+        TenantUserPage,
+        TenantUserPageItem,
+        WebhookEvent,
+        WebhookEventProcessCreated,
+        WebhookEventProcessCreatedData,
+        WebhookEventProcessItemCreated,
+        WebhookEventProcessItemCreatedData,
+        WebhookEventProcessItemTaskStateChanged,
+        WebhookEventProcessItemTaskStateChangedData,
+        WebhookEventProcessStateChanged,
+        WebhookEventProcessStateChangedData,
+        WebhookType,
+        Worker,
+        WorkerCreateParams,
+    )
+    from ._compact import CompactModel, compact_model
+    from ._models import (
+        Document,
+        KuFlowFile,
+        KuFlowGroup,
+        KuFlowPrincipal,
+        UploadProgress,
+    )
 
 
 __all__ = [
@@ -248,13 +255,28 @@ __all__ = [
     "Worker",
     "WorkerCreateParams",
     # From models
+    "CompactModel",
+    "compact_model",
     "Document",
     "KuFlowFile",
     "KuFlowGroup",
     "KuFlowPrincipal",
+    "UploadProgress",
 ]
 
 
-# For usability, we must include in __all__, all the items of the model generated package
-# So this assertion is to avoid forgetfulness.
-assert all(item in __all__ for item in _all_generated_models)
+# Every item of the model generated package is included in __all__, test_lazy_import checks that none is forgotten
+_IMPORTS = dict.fromkeys(__all__, ".._generated.models")
+_IMPORTS.update(
+    {
+        "CompactModel": "._compact",
+        "compact_model": "._compact",
+        "Document": "._models",
+        "KuFlowFile": "._models",
+        "KuFlowGroup": "._models",
+        "KuFlowPrincipal": "._models",
+        "UploadProgress": "._models",
+    }
+)
+
+__getattr__, __dir__ = lazy_import(__name__, _IMPORTS)
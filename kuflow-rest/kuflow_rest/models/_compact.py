@@ -0,0 +1,188 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+from typing import Any, Optional
+
+from .._generated._utils.serialization import Model
+
+
+class CompactModel:
+    """Memory compact representation of a generated model.
+
+    Every generated model instance carries a ``__dict__`` and an ``additional_properties`` dict. A compact model
+    stores the same attributes in ``__slots__``, nested models being compact too, which takes several times less
+    memory when hundreds of thousands of page items are kept.
+
+    Attributes are read and written as in the generated model, unknown attributes can not be added. :meth:`as_dict`
+    and :meth:`serialize` behave as in the generated model, that is built by :meth:`to_model`. Compact models are not
+    instances of their generated model class.
+    """
+
+    __slots__ = ("_additional_properties",)
+
+    _model: type[Model]
+
+    # Read by the generic serializer, compact models nested in a generated model are serialized as the generated ones
+    _attribute_map: dict[str, dict[str, Any]]
+    _validation: dict[str, Any]
+
+    @classmethod
+    def is_xml_model(cls) -> bool:
+        return cls._model.is_xml_model()
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Optional[dict[str, Any]]) -> None:
+        self._additional_properties = value
+
+    def to_model(self) -> Model:
+        """Build the generated model with the same attributes.
+
+        :return: The generated model.
+        :rtype: ~kuflow_rest.Model
+        """
+        model = self._model.__new__(self._model)
+        state = model.__dict__
+        for attr in self.__slots__:
+            state[attr] = _to_model(getattr(self, attr))
+        state["additional_properties"] = self._additional_properties or {}
+
+        return model
+
+    def as_dict(self, *args: Any, **kwargs: Any) -> Any:
+        """Return a dict that can be serialized using json.dump, see :meth:`~kuflow_rest.Model.as_dict`.
+
+        :return: A dict JSON compatible object
+        :rtype: dict
+        """
+        return self.to_model().as_dict(*args, **kwargs)
+
+    def serialize(self, *args: Any, **kwargs: Any) -> Any:
+        """Return the JSON that would be sent to server from this model, see :meth:`~kuflow_rest.Model.serialize`.
+
+        :return: A dict JSON compatible object
+        :rtype: dict
+        """
+        return self.to_model().serialize(*args, **kwargs)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, CompactModel):
+            other = other.to_model()
+        return self.to_model() == other
+
+    def __ne__(self, other: Any) -> bool:
+        return not self.__eq__(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        attrs = ", ".join(f"{attr}={getattr(self, attr)!r}" for attr in self.__slots__)
+        return f"{type(self).__name__}({attrs})"
+
+    def __reduce__(self):
+        values = tuple(getattr(self, attr) for attr in self.__slots__)
+        return _new_compact_model, (self._model, values, self._additional_properties)
+
+
+_COMPACT_MODELS: dict[type[Model], type[CompactModel]] = {}
+
+
+def compact_model_class(model: type[Model]) -> type[CompactModel]:
+    """Return the compact model class of a generated model class.
+
+    :param model: The generated model class.
+    :type model: type[~kuflow_rest.Model]
+    :return: The compact model class, named after the generated one, ie: ``CompactProcessPageItem``.
+    :rtype: type[CompactModel]
+    """
+    compact_class = _COMPACT_MODELS.get(model)
+    if compact_class is None:
+        slots = tuple(attr for attr in model._attribute_map if attr != "additional_properties")  # pylint: disable=protected-access
+        compact_class = _COMPACT_MODELS[model] = type(
+            f"Compact{model.__name__}",
+            (CompactModel,),
+            {
+                "__slots__": slots,
+                "__module__": __name__,
+                "_model": model,
+                "_attribute_map": model._attribute_map,  # pylint: disable=protected-access
+                "_validation": getattr(model, "_validation", {}),
+            },
+        )
+
+    return compact_class
+
+
+def compact_model(model: Model) -> CompactModel:
+    """Build the compact representation of a generated model, nested models included.
+
+    :param model: The generated model.
+    :type model: ~kuflow_rest.Model
+    :return: The compact model.
+    :rtype: CompactModel
+    """
+    compact_class = compact_model_class(type(model))
+    compact = compact_class.__new__(compact_class)
+    for attr in compact_class.__slots__:
+        setattr(compact, attr, _to_compact(getattr(model, attr, None)))
+    compact._additional_properties = getattr(model, "additional_properties", None) or None
+
+    return compact
+
+
+def _new_compact_model(
+    model: type[Model], values: tuple[Any, ...], additional_properties: Optional[dict[str, Any]]
+) -> CompactModel:
+    compact_class = compact_model_class(model)
+    compact = compact_class.__new__(compact_class)
+    for attr, value in zip(compact_class.__slots__, values):
+        setattr(compact, attr, value)
+    compact._additional_properties = additional_properties
+
+    return compact
+
+
+def _to_model(value: Any) -> Any:
+    if isinstance(value, CompactModel):
+        return value.to_model()
+    if isinstance(value, list):
+        return [_to_model(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _to_model(item) for key, item in value.items()}
+    return value
+
+
+def _to_compact(value: Any) -> Any:
+    if isinstance(value, Model):
+        return compact_model(value)
+    if isinstance(value, list):
+        return [_to_compact(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _to_compact(item) for key, item in value.items()}
+    return value
@@ -22,13 +22,20 @@
 # SOFTWARE.
 #
 
-from typing import IO, Optional
+import mimetypes
+import os
+from typing import IO, Any, Optional, Union
 
 from .._generated.models import PrincipalType
+from .._upload import BufferReader, content_size
 
 
 class Document:
-    """File document."""
+    """File document.
+
+    The file content is read while the document is uploaded, so large files are sent in chunks, with constant
+    memory. A document can be used as a context manager that closes its file content.
+    """
 
     def __init__(self, file_name: str, content_type: str, file_content: IO) -> None:
         """
@@ -41,6 +48,75 @@ class Document:
         self.content_type = content_type
         self.file_content = file_content
 
+    @classmethod
+    def from_path(
+        cls, path: Union[str, "os.PathLike[str]"], content_type: Optional[str] = None, file_name: Optional[str] = None
+    ) -> "Document":
+        """Document of a file on disk, that is opened now and read while it is uploaded.
+
+        The document owns the open file: use it as a context manager, or call :meth:`close`, to close the file once
+        it is uploaded, ie: ``with Document.from_path("invoice.pdf") as document:``.
+
+        Parameters:
+            path: File path
+            content_type: File content type, guessed from the file name by default
+            file_name: File name, the name in the path by default
+        """
+        if file_name is None:
+            file_name = os.path.basename(path)
+        if content_type is None:
+            content_type = mimetypes.guess_type(file_name)[0] or "application/octet-stream"
+
+        return cls(file_name=file_name, content_type=content_type, file_content=open(path, "rb"))
+
+    @classmethod
+    def from_buffer(cls, buffer: Any, file_name: str, content_type: str = "application/octet-stream") -> "Document":
+        """Document of a buffer in memory: bytes, bytearray, memoryview or a memory-mapped file (mmap).
+
+        The buffer is not copied, every chunk is read from it while the document is uploaded.
+
+        Parameters:
+            buffer: File content
+            file_name: File name
+            content_type: File content type
+        """
+        return cls(file_name=file_name, content_type=content_type, file_content=BufferReader(buffer))
+
+    @property
+    def size(self) -> Optional[int]:
+        """Size in bytes of the file content that is left to read, None when the content is not seekable."""
+        return content_size(self.file_content)
+
+    def close(self) -> None:
+        """Close the file content."""
+        self.file_content.close()
+
+    def __enter__(self) -> "Document":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class UploadProgress:
+    """Progress of a document upload, passed to the ``progress`` callback of the upload operations."""
+
+    def __init__(self, bytes_sent: int, total_bytes: Optional[int], elapsed: float) -> None:
+        """
+        Parameters:
+            bytes_sent: Bytes of the document sent so far
+            total_bytes: Size of the document, None when it is unknown
+            elapsed: Seconds since the upload started
+        """
+        self.bytes_sent = bytes_sent
+        self.total_bytes = total_bytes
+        self.elapsed = elapsed
+
+    @property
+    def throughput(self) -> float:
+        """Bytes sent per second."""
+        return self.bytes_sent / self.elapsed if self.elapsed > 0 else 0.0
+
 
 class KuFlowPrincipal:
     """JsonFormsPrincipal.
@@ -48,6 +124,8 @@ class KuFlowPrincipal:
     Principal class
     """
 
+    __slots__ = ("original", "id", "type", "name")
+
     def __init__(self, original: str, id: str, type: PrincipalType, name: str):
         """
         Parameters:
@@ -71,6 +149,8 @@ class KuFlowGroup:
     Group class
     """
 
+    __slots__ = ("original", "id", "type", "name")
+
     def __init__(self, original: str, id: str, type: str, name: str):
         """
         Parameters:
@@ -94,6 +174,8 @@ class KuFlowFile:
     File class
     """
 
+    __slots__ = ("original", "uri", "type", "name", "size", "original_name")
+
     def __init__(self, original: str, uri: str, type: str, name: str, size: int, original_name: Optional[str]):
         """
         Parameters:
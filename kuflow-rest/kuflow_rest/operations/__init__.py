@@ -23,17 +23,23 @@
 #
 
 
-from ._authentication_operations import AuthenticationOperations
-from ._business_artifact_operations import BusinessArtifactOperations
-from ._group_operations import GroupOperations
-from ._kms_operations import KmsOperations
-from ._principal_operations import PrincipalOperations
-from ._process_item_operations import ProcessItemOperations
-from ._process_operations import ProcessOperations
-from ._robot_operations import RobotOperations
-from ._tenant_operations import TenantOperations
-from ._tenant_user_operations import TenantUserOperations
-from ._worker_operations import WorkerOperations
+from typing import TYPE_CHECKING
+
+from .._lazy_import import lazy_import
+
+
+if TYPE_CHECKING:
+    from ._authentication_operations import AuthenticationOperations
+    from ._business_artifact_operations import BusinessArtifactOperations
+    from ._group_operations import GroupOperations
+    from ._kms_operations import KmsOperations
+    from ._principal_operations import PrincipalOperations
+    from ._process_item_operations import ProcessItemOperations
+    from ._process_operations import ProcessOperations
+    from ._robot_operations import RobotOperations
+    from ._tenant_operations import TenantOperations
+    from ._tenant_user_operations import TenantUserOperations
+    from ._worker_operations import WorkerOperations
 
 
 __all__ = [
@@ -49,3 +55,20 @@ __all__ = [
     "TenantUserOperations",
     "WorkerOperations",
 ]
+
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    {
+        "AuthenticationOperations": "._authentication_operations",
+        "BusinessArtifactOperations": "._business_artifact_operations",
+        "GroupOperations": "._group_operations",
+        "KmsOperations": "._kms_operations",
+        "PrincipalOperations": "._principal_operations",
+        "ProcessItemOperations": "._process_item_operations",
+        "ProcessOperations": "._process_operations",
+        "RobotOperations": "._robot_operations",
+        "TenantOperations": "._tenant_operations",
+        "TenantUserOperations": "._tenant_user_operations",
+        "WorkerOperations": "._worker_operations",
+    },
+)
@@ -26,6 +26,7 @@ from typing import Any
 
 from .. import models as _models
 from .._generated import KuFlowRestClient as KuFlowRestClientGenerated
+from .._serialization import encode_json_body
 
 
 class AuthenticationOperations:
@@ -55,5 +56,8 @@ class AuthenticationOperations:
         :raises ~azure.core.exceptions.HttpResponseError:
         """
         return self._kuflow_client.authentication.create_authentication(
-            authentication_create_params=authentication_create_params, **kwargs
+            authentication_create_params=encode_json_body(
+                self._kuflow_client.authentication, authentication_create_params
+            ),
+            **kwargs,
         )
@@ -22,11 +22,19 @@
 # SOFTWARE.
 #
 
+import functools
+import os
 from collections.abc import Iterator
-from typing import Any, Optional, Union
+from typing import Any, Callable, Optional, Union
 
 from .. import models as _models
+from .._download import download_to_file, expected_document_size
 from .._generated import KuFlowRestClient as KuFlowRestClientGenerated
+from .._generated.operations._business_artifact_operations import build_download_business_artifact_document_request
+from .._serialization import encode_json_body
+from .._upload import upload_content
+from ..utils._json_patch import select_json_patch, to_json_value
+from ._pagination import iterate_page_items
 
 
 class BusinessArtifactOperations:
@@ -108,6 +116,48 @@ class BusinessArtifactOperations:
             **kwargs,
         )
 
+    def iter_business_artifacts(
+        self,
+        size: int = 25,
+        page: int = 0,
+        prefetch: bool = True,
+        concurrency: int = 1,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[_models.BusinessArtifactPageItem]:
+        """Iterate over all accessible Business Artifacts.
+
+        Stream the Business Artifacts of every page returned by :meth:`find_business_artifacts`,
+        starting at ``page``, until the last page is reached. While the items of a page are consumed, the next
+        page is requested in a background thread. Items already delivered, that shifted to a later page because
+        they were modified during the iteration, are skipped.
+
+        :keyword size: The number of records requested within a single API call. Default value is 25.
+        :type size: int
+        :keyword page: The page number to start from, 0 is the first page. Default value is 0.
+        :type page: int
+        :keyword prefetch: Request the next page while the current one is consumed. Default value is True.
+        :type prefetch: bool
+        :keyword concurrency: Fetch-all mode. When greater than 1, once the first page reveals the total number of
+                              pages, up to ``concurrency`` of the remaining pages are requested at the same time.
+                              Default value is 1.
+        :type concurrency: int
+        :keyword ordered: Deliver the items in page order. If False, the pages are delivered as soon as they arrive.
+                          Only applies to the fetch-all mode. Default value is True.
+        :type ordered: bool
+        :keyword kwargs: Sorting criteria and filters, see :meth:`find_business_artifacts`.
+        :return: Iterator of BusinessArtifactPageItem
+        :rtype: Iterator[~kuflow.rest.models.BusinessArtifactPageItem]
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return iterate_page_items(
+            functools.partial(self.find_business_artifacts, size=size, **kwargs),
+            page=page,
+            prefetch=prefetch,
+            concurrency=concurrency,
+            ordered=ordered,
+        )
+
     def create_business_artifact(
         self, business_artifact_create_params: _models.BusinessArtifactCreateParams, **kwargs: Any
     ) -> _models.BusinessArtifact:
@@ -124,7 +174,10 @@ class BusinessArtifactOperations:
         :raises ~azure.core.exceptions.HttpResponseError:
         """
         return self._kuflow_client.business_artifact.create_business_artifact(
-            business_artifact_create_params=business_artifact_create_params, **kwargs
+            business_artifact_create_params=encode_json_body(
+                self._kuflow_client.business_artifact, business_artifact_create_params
+            ),
+            **kwargs,
         )
 
     def retrieve_business_artifact(self, id: str, **kwargs: Any) -> _models.BusinessArtifact:
@@ -170,7 +223,11 @@ class BusinessArtifactOperations:
         :raises ~azure.core.exceptions.HttpResponseError:
         """
         return self._kuflow_client.business_artifact.update_business_artifact_data(
-            id=id, business_artifact_data_update_params=business_artifact_data_update_params, **kwargs
+            id=id,
+            business_artifact_data_update_params=encode_json_body(
+                self._kuflow_client.business_artifact, business_artifact_data_update_params
+            ),
+            **kwargs,
         )
 
     def patch_business_artifact_data(
@@ -190,9 +247,39 @@ class BusinessArtifactOperations:
         :raises ~azure.core.exceptions.HttpResponseError:
         """
         return self._kuflow_client.business_artifact.patch_business_artifact_data(
-            id=id, json_patch=json_patch, **kwargs
+            id=id, json_patch=encode_json_body(self._kuflow_client.business_artifact, json_patch), **kwargs
         )
 
+    def update_business_artifact_data_smart(
+        self,
+        id: str,
+        previous_data: Optional[Union[_models.JsonValue, dict[str, Any]]],
+        data: Union[_models.JsonValue, dict[str, Any]],
+        **kwargs: Any,
+    ) -> _models.BusinessArtifact:
+        """Save JSON data with the smaller request.
+
+        Sends the JSON patch from ``previous_data`` to ``data`` when it is smaller than the whole document, see
+        :func:`~kuflow_rest.utils.select_json_patch`, and the whole document otherwise.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param previous_data: The current JSON value, ie: the ``data`` of the business artifact. None to send the whole
+                              document.
+        :type previous_data: ~kuflow.rest.models.JsonValue or dict
+        :param data: The new JSON value. Required.
+        :type data: ~kuflow.rest.models.JsonValue or dict
+        :return: BusinessArtifact
+        :rtype: ~kuflow.rest.models.BusinessArtifact
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        json_patch = select_json_patch(previous_data, data)
+        if json_patch is not None:
+            return self.patch_business_artifact_data(id, json_patch, **kwargs)
+
+        business_artifact_data_update_params = _models.BusinessArtifactDataUpdateParams(data=to_json_value(data))
+        return self.update_business_artifact_data(id, business_artifact_data_update_params, **kwargs)
+
     def create_business_artifact_action(
         self, id: str, business_artifact_action_create_params: _models.BusinessArtifactActionCreateParams, **kwargs: Any
     ) -> _models.BusinessArtifactAction:
@@ -211,7 +298,11 @@ class BusinessArtifactOperations:
         :raises ~azure.core.exceptions.HttpResponseError:
         """
         return self._kuflow_client.business_artifact.create_business_artifact_action(
-            id=id, business_artifact_action_create_params=business_artifact_action_create_params, **kwargs
+            id=id,
+            business_artifact_action_create_params=encode_json_body(
+                self._kuflow_client.business_artifact, business_artifact_action_create_params
+            ),
+            **kwargs,
         )
 
     def retrieve_business_artifact_action(
@@ -273,12 +364,19 @@ class BusinessArtifactOperations:
         """
         return self._kuflow_client.business_artifact.prepare_business_artifact_create_artifact(
             id=id,
-            business_artifact_create_artifact_prepare_params=business_artifact_create_artifact_prepare_params,
+            business_artifact_create_artifact_prepare_params=encode_json_body(
+                self._kuflow_client.business_artifact, business_artifact_create_artifact_prepare_params
+            ),
             **kwargs,
         )
 
     def upload_business_artifact_document(
-        self, id: str, document: _models.Document, **kwargs: Any
+        self,
+        id: str,
+        document: _models.Document,
+        *,
+        progress: Optional[Callable[[_models.UploadProgress], None]] = None,
+        **kwargs: Any,
     ) -> _models.DocumentReference:
         """Upload a temporal document into the business artifact that later on must be linked with a
         business artifact domain resource.
@@ -290,13 +388,16 @@ class BusinessArtifactOperations:
         :type id: str
         :param document: Document to save. Required.
         :type document: ~kuflow.rest.models.Document
+        :keyword progress: Called with the progress of the upload, bytes sent and throughput, after every
+                           chunk of the document. Default value is None.
+        :paramtype progress: Callable[[~kuflow_rest.models.UploadProgress], None]
         :return: DocumentReference
         :rtype: ~kuflow.rest.models.DocumentReference
         :raises ~azure.core.exceptions.HttpResponseError:
         """
         return self._kuflow_client.business_artifact.upload_business_artifact_document(
             id=id,
-            file=document.file_content,
+            file=upload_content(document, progress),
             file_content_type=document.content_type,
             file_name=document.file_name,
             **kwargs,
@@ -318,3 +419,39 @@ class BusinessArtifactOperations:
         return self._kuflow_client.business_artifact.download_business_artifact_document(
             id=id, document_uri=document_uri, **kwargs
         )
+
+    def download_business_artifact_document_to_file(
+        self, id: str, path: Union[str, "os.PathLike[str]"], *, document_uri: str, **kwargs: Any
+    ) -> int:
+        """Download a document into a file.
+
+        Given a business artifact and a documentUri, download a document into a file, see the
+        ``download_business_artifact_document`` operation.
+
+        The file is written as ``<path>.part`` and renamed to ``path`` once it is complete. A ``.part`` file of a
+        failed download is resumed, and large files are downloaded in parallel parts, when the server supports
+        Range requests.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param path: Path of the file. Required.
+        :type path: str or ~os.PathLike
+        :keyword document_uri: Document URI to download. Required.
+        :type document_uri: str
+        :keyword int expected_size: Size of the document, the downloaded file is checked against it. Default value is
+         the size of the ``document_uri``.
+        :keyword int chunk_size: Size of the writes to the file. Default value is 1 MiB.
+        :keyword int part_size: Size of the parts downloaded in parallel. Default value is 8 MiB.
+        :keyword int max_concurrency: Parts downloaded at the same time, 1 to download in one request. Default value
+         is 4.
+        :return: The size of the file.
+        :rtype: int
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        kwargs.setdefault("expected_size", expected_document_size(document_uri))
+        return download_to_file(
+            self._kuflow_client,
+            build_download_business_artifact_document_request(id=id, document_uri=document_uri),
+            path,
+            **kwargs,
+        )
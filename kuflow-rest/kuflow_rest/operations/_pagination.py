@@ -0,0 +1,151 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import asyncio
+import contextvars
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Union
+
+from .. import models as _models
+
+
+def iterate_page_items(
+    find_page: Callable[..., _models.Page],
+    page: int = 0,
+    prefetch: bool = True,
+    concurrency: int = 1,
+    ordered: bool = True,
+) -> Iterator[Any]:
+    """Yield the content of every page, starting at ``page``, until ``total_pages`` is reached.
+
+    Up to ``concurrency`` pages are requested in background threads while the caller consumes the current one (only
+    the next one when ``concurrency`` is 1 and ``prefetch`` is enabled). Pages are delivered in page order, or as soon
+    as they arrive when ``ordered`` is False. Items already delivered, ie: that shifted to a later page because they
+    were modified during the scan, are skipped.
+    """
+    window = _window(prefetch, concurrency)
+    executor = ThreadPoolExecutor(max_workers=window, thread_name_prefix="kuflow-page-fetch") if window else None
+    in_flight: deque[Union[int, Future]] = deque()
+    seen_ids: set[Any] = set()
+    try:
+        received_page = find_page(page=page)
+        last_page = received_page.metadata.total_pages
+        next_page = page + 1
+        while True:
+            if not received_page.content:
+                last_page = min(last_page, next_page)
+
+            while len(in_flight) < max(window, 1) and next_page < last_page:
+                # Context variables, ie: deadlines, are seen by the requests of the pages fetched in the pool
+                in_flight.append(
+                    executor.submit(contextvars.copy_context().run, find_page, page=next_page)
+                    if executor
+                    else next_page
+                )
+                next_page += 1
+
+            yield from _unique_items(received_page.content, seen_ids)
+
+            if not in_flight:
+                return
+
+            if executor is None:
+                received_page = find_page(page=in_flight.popleft())
+            elif ordered:
+                received_page = in_flight.popleft().result()
+            else:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                future = next(future for future in in_flight if future in done)
+                in_flight.remove(future)
+                received_page = future.result()
+    finally:
+        for future in in_flight:
+            if isinstance(future, Future):
+                future.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+async def aiterate_page_items(
+    find_page: Callable[..., Awaitable[_models.Page]],
+    page: int = 0,
+    prefetch: bool = True,
+    concurrency: int = 1,
+    ordered: bool = True,
+) -> AsyncIterator[Any]:
+    """Async version of :func:`iterate_page_items`, fetching the pages ahead in tasks."""
+    window = _window(prefetch, concurrency)
+    in_flight: deque[Union[int, asyncio.Future]] = deque()
+    seen_ids: set[Any] = set()
+    try:
+        received_page = await find_page(page=page)
+        last_page = received_page.metadata.total_pages
+        next_page = page + 1
+        while True:
+            if not received_page.content:
+                last_page = min(last_page, next_page)
+
+            while len(in_flight) < max(window, 1) and next_page < last_page:
+                in_flight.append(asyncio.ensure_future(find_page(page=next_page)) if window else next_page)
+                next_page += 1
+
+            for item in _unique_items(received_page.content, seen_ids):
+                yield item
+
+            if not in_flight:
+                return
+
+            if not window:
+                received_page = await find_page(page=in_flight.popleft())
+            elif ordered:
+                received_page = await in_flight.popleft()
+            else:
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                task = next(task for task in in_flight if task in done)
+                in_flight.remove(task)
+                received_page = task.result()
+    finally:
+        for task in in_flight:
+            if isinstance(task, asyncio.Future):
+                task.cancel()
+
+
+def _window(prefetch: bool, concurrency: int) -> int:
+    if concurrency > 1:
+        return concurrency
+
+    return 1 if prefetch else 0
+
+
+def _unique_items(items: Iterable[Any], seen_ids: set[Any]) -> Iterator[Any]:
+    for item in items:
+        item_id = getattr(item, "id", None)
+        if item_id is not None:
+            if item_id in seen_ids:
+                continue
+            seen_ids.add(item_id)
+
+        yield item
@@ -22,11 +22,20 @@
 # SOFTWARE.
 #
 
+import functools
+import os
 from collections.abc import Iterator
 from typing import Any, Optional, Union
 
 from .. import models as _models
+from .._download import download_to_file
 from .._generated import KuFlowRestClient as KuFlowRestClientGenerated
+from .._generated.operations._process_item_operations import (
+    build_download_process_item_task_data_webforms_as_document_request,
+)
+from .._serialization import encode_json_body
+from ..utils._json_patch import select_json_patch, to_json_value
+from ._pagination import iterate_page_items
 
 
 class ProcessItemOperations:
@@ -129,6 +138,48 @@ class ProcessItemOperations:
             **kwargs,
         )
 
+    def iter_process_items(
+        self,
+        size: int = 25,
+        page: int = 0,
+        prefetch: bool = True,
+        concurrency: int = 1,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[_models.ProcessItemPageItem]:
+        """Iterate over all accessible Process Items.
+
+        Stream the Process Items of every page returned by :meth:`find_process_items`,
+        starting at ``page``, until the last page is reached. While the items of a page are consumed, the next
+        page is requested in a background thread. Items already delivered, that shifted to a later page because
+        they were modified during the iteration, are skipped.
+
+        :keyword size: The number of records requested within a single API call. Default value is 25.
+        :type size: int
+        :keyword page: The page number to start from, 0 is the first page. Default value is 0.
+        :type page: int
+        :keyword prefetch: Request the next page while the current one is consumed. Default value is True.
+        :type prefetch: bool
+        :keyword concurrency: Fetch-all mode. When greater than 1, once the first page reveals the total number of
+                              pages, up to ``concurrency`` of the remaining pages are requested at the same time.
+                              Default value is 1.
+        :type concurrency: int
+        :keyword ordered: Deliver the items in page order. If False, the pages are delivered as soon as they arrive.
+                          Only applies to the fetch-all mode. Default value is True.
+        :type ordered: bool
+        :keyword kwargs: Sorting criteria and filters, see :meth:`find_process_items`.
+        :return: Iterator of ProcessItemPageItem
+        :rtype: Iterator[~kuflow.rest.models.ProcessItemPageItem]
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return iterate_page_items(
+            functools.partial(self.find_process_items, size=size, **kwargs),
+            page=page,
+            prefetch=prefetch,
+            concurrency=concurrency,
+            ordered=ordered,
+        )
+
     def create_process_item(
         self, process_item_create_params: _models.ProcessItemCreateParams, **kwargs: Any
     ) -> _models.ProcessItem:
@@ -151,7 +202,8 @@ class ProcessItemOperations:
         :raises ~azure.core.exceptions.HttpResponseError:
         """
         return self._kuflow_client.process_item.create_process_item(
-            process_item_create_params=process_item_create_params, **kwargs
+            process_item_create_params=encode_json_body(self._kuflow_client.process_item, process_item_create_params),
+            **kwargs,
         )
 
     def retrieve_process_item(self, id: str, **kwargs: Any) -> _models.ProcessItem:
@@ -197,7 +249,11 @@ class ProcessItemOperations:
         :raises ~azure.core.exceptions.HttpResponseError:
         """
         return self._kuflow_client.process_item.assign_process_item_task(
-            id=id, process_item_task_assign_params=process_item_task_assign_params, **kwargs
+            id=id,
+            process_item_task_assign_params=encode_json_body(
+                self._kuflow_client.process_item, process_item_task_assign_params
+            ),
+            **kwargs,
         )
 
     def complete_process_item_task(self, id: str, **kwargs: Any) -> _models.ProcessItem:
@@ -231,7 +287,11 @@ class ProcessItemOperations:
         :raises ~azure.core.exceptions.HttpResponseError:
         """
         return self._kuflow_client.process_item.append_process_item_task_log(
-            id=id, process_item_task_append_log_params=process_item_task_append_log_params, **kwargs
+            id=id,
+            process_item_task_append_log_params=encode_json_body(
+                self._kuflow_client.process_item, process_item_task_append_log_params
+            ),
+            **kwargs,
         )
 
     def update_process_item_task_data(
@@ -252,7 +312,11 @@ class ProcessItemOperations:
         :raises ~azure.core.exceptions.HttpResponseError:
         """
         return self._kuflow_client.process_item.update_process_item_task_data(
-            id=id, process_item_task_data_update_params=process_item_task_data_update_params, **kwargs
+            id=id,
+            process_item_task_data_update_params=encode_json_body(
+                self._kuflow_client.process_item, process_item_task_data_update_params
+            ),
+            **kwargs,
         )
 
     def patch_process_item_task_data(
@@ -272,7 +336,39 @@ class ProcessItemOperations:
         :rtype: ~kuflow.rest.models.ProcessItem
         :raises ~azure.core.exceptions.HttpResponseError:
         """
-        return self._kuflow_client.process_item.patch_process_item_task_data(id=id, json_patch=json_patch, **kwargs)
+        return self._kuflow_client.process_item.patch_process_item_task_data(
+            id=id, json_patch=encode_json_body(self._kuflow_client.process_item, json_patch), **kwargs
+        )
+
+    def update_process_item_task_data_smart(
+        self,
+        id: str,
+        previous_data: Optional[Union[_models.JsonValue, dict[str, Any]]],
+        data: Union[_models.JsonValue, dict[str, Any]],
+        **kwargs: Any,
+    ) -> _models.ProcessItem:
+        """Save JSON data with the smaller request.
+
+        Sends the JSON patch from ``previous_data`` to ``data`` when it is smaller than the whole document, see
+        :func:`~kuflow_rest.utils.select_json_patch`, and the whole document otherwise.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param previous_data: The current JSON value, ie: the ``task.data`` of the process item. None to send the whole
+                              document.
+        :type previous_data: ~kuflow.rest.models.JsonValue or dict
+        :param data: The new JSON value. Required.
+        :type data: ~kuflow.rest.models.JsonValue or dict
+        :return: ProcessItem
+        :rtype: ~kuflow.rest.models.ProcessItem
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        json_patch = select_json_patch(previous_data, data)
+        if json_patch is not None:
+            return self.patch_process_item_task_data(id, json_patch, **kwargs)
+
+        process_item_task_data_update_params = _models.ProcessItemTaskDataUpdateParams(data=to_json_value(data))
+        return self.update_process_item_task_data(id, process_item_task_data_update_params, **kwargs)
 
     def update_process_item_task_context_data(
         self,
@@ -296,7 +392,11 @@ class ProcessItemOperations:
         :raises ~azure.core.exceptions.HttpResponseError:
         """
         return self._kuflow_client.process_item.update_process_item_task_context_data(
-            id=id, process_item_task_context_data_update_params=process_item_task_context_data_update_params, **kwargs
+            id=id,
+            process_item_task_context_data_update_params=encode_json_body(
+                self._kuflow_client.process_item, process_item_task_context_data_update_params
+            ),
+            **kwargs,
         )
 
     def retrieve_process_item_ai_assistance(self, id: str, **kwargs: Any) -> _models.ProcessItemAiAssistance:
@@ -336,7 +436,11 @@ class ProcessItemOperations:
         :raises ~azure.core.exceptions.HttpResponseError:
         """
         return self._kuflow_client.process_item.generate_process_item_ai_assistance(
-            id=id, process_item_ai_assistance_generate_params=process_item_ai_assistance_generate_params, **kwargs
+            id=id,
+            process_item_ai_assistance_generate_params=encode_json_body(
+                self._kuflow_client.process_item, process_item_ai_assistance_generate_params
+            ),
+            **kwargs,
         )
 
     def download_process_item_task_data_webforms_as_document(
@@ -363,3 +467,38 @@ class ProcessItemOperations:
         return self._kuflow_client.process_item.download_process_item_task_data_webforms_as_document(
             id=id, property_path=property_path, **kwargs
         )
+
+    def download_process_item_task_data_webforms_as_document_to_file(
+        self, id: str, path: Union[str, "os.PathLike[str]"], property_path: str, **kwargs: Any
+    ) -> int:
+        """Download a Form rendered as PDF or Zip of PDFs into a file.
+
+        See the ``download_process_item_task_data_webforms_as_document`` operation.
+
+        The file is written as ``<path>.part`` and renamed to ``path`` once it is complete. A ``.part`` file of a
+        failed download is resumed, and large files are downloaded in parallel parts, when the server supports
+        Range requests.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param path: Path of the file. Required.
+        :type path: str or ~os.PathLike
+        :keyword property_path: JSON pointer to the property with the error. See:
+         https://datatracker.ietf.org/doc/html/rfc6901
+
+         ie: /user/name or /users/1/name. Required.
+        :type property_path: str
+        :keyword int chunk_size: Size of the writes to the file. Default value is 1 MiB.
+        :keyword int part_size: Size of the parts downloaded in parallel. Default value is 8 MiB.
+        :keyword int max_concurrency: Parts downloaded at the same time, 1 to download in one request. Default value
+         is 4.
+        :return: The size of the file.
+        :rtype: int
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return download_to_file(
+            self._kuflow_client,
+            build_download_process_item_task_data_webforms_as_document_request(id=id, property_path=property_path),
+            path,
+            **kwargs,
+        )
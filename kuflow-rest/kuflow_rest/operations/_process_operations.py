@@ -22,11 +22,19 @@
 # SOFTWARE.
 #
 
-from collections.abc import Iterator
-from typing import Any, Optional, Union
+import functools
+import os
+from collections.abc import Iterator, Sequence
+from typing import Any, Callable, Optional, Union
 
 from .. import models as _models
+from .._download import download_to_file, expected_document_size
 from .._generated import KuFlowRestClient as KuFlowRestClientGenerated
+from .._generated.operations._process_operations import build_download_process_document_request
+from .._serialization import encode_json_body
+from .._upload import upload_content, upload_documents
+from ..utils._json_patch import select_json_patch, to_json_value
+from ._pagination import iterate_page_items
 
 
 class ProcessOperations:
@@ -101,6 +109,48 @@ class ProcessOperations:
             **kwargs,
         )
 
+    def iter_processes(
+        self,
+        size: int = 25,
+        page: int = 0,
+        prefetch: bool = True,
+        concurrency: int = 1,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[_models.ProcessPageItem]:
+        """Iterate over all accessible Processes.
+
+        Stream the Processes of every page returned by :meth:`find_processes`,
+        starting at ``page``, until the last page is reached. While the items of a page are consumed, the next
+        page is requested in a background thread. Items already delivered, that shifted to a later page because
+        they were modified during the iteration, are skipped.
+
+        :keyword size: The number of records requested within a single API call. Default value is 25.
+        :type size: int
+        :keyword page: The page number to start from, 0 is the first page. Default value is 0.
+        :type page: int
+        :keyword prefetch: Request the next page while the current one is consumed. Default value is True.
+        :type prefetch: bool
+        :keyword concurrency: Fetch-all mode. When greater than 1, once the first page reveals the total number of
+                              pages, up to ``concurrency`` of the remaining pages are requested at the same time.
+                              Default value is 1.
+        :type concurrency: int
+        :keyword ordered: Deliver the items in page order. If False, the pages are delivered as soon as they arrive.
+                          Only applies to the fetch-all mode. Default value is True.
+        :type ordered: bool
+        :keyword kwargs: Sorting criteria and filters, see :meth:`find_processes`.
+        :return: Iterator of ProcessPageItem
+        :rtype: Iterator[~kuflow.rest.models.ProcessPageItem]
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return iterate_page_items(
+            functools.partial(self.find_processes, size=size, **kwargs),
+            page=page,
+            prefetch=prefetch,
+            concurrency=concurrency,
+            ordered=ordered,
+        )
+
     def create_process(self, process_create_params: _models.ProcessCreateParams, **kwargs: Any) -> _models.Process:
         """Create a new process.
 
@@ -124,7 +174,9 @@ class ProcessOperations:
         :rtype: ~kuflow.rest.models.Process
         :raises ~azure.core.exceptions.HttpResponseError:
         """
-        return self._kuflow_client.process.create_process(process_create_params=process_create_params, **kwargs)
+        return self._kuflow_client.process.create_process(
+            process_create_params=encode_json_body(self._kuflow_client.process, process_create_params), **kwargs
+        )
 
     def retrieve_process(self, id: str, **kwargs: Any) -> _models.Process:
         """Get a Process by ID.
@@ -218,7 +270,11 @@ class ProcessOperations:
         :raises ~azure.core.exceptions.HttpResponseError:
         """
         return self._kuflow_client.process.change_process_initiator(
-            id=id, process_change_initiator_params=process_change_initiator_params, **kwargs
+            id=id,
+            process_change_initiator_params=encode_json_body(
+                self._kuflow_client.process, process_change_initiator_params
+            ),
+            **kwargs,
         )
 
     def upload_process_user_action_document(
@@ -226,6 +282,8 @@ class ProcessOperations:
         id: str,
         file: _models.Document,
         user_action_value_id: str,
+        *,
+        progress: Optional[Callable[[_models.UploadProgress], None]] = None,
         **kwargs: Any,
     ) -> Optional[_models.Process]:
         """Upload and save a document in a user action.
@@ -240,13 +298,16 @@ class ProcessOperations:
         :type file: _models.Document
         :keyword user_action_value_id: User action value id. Required.
         :type user_action_value_id: _models.ProcessUserActionUploadParams
+        :keyword progress: Called with the progress of the upload, bytes sent and throughput, after every
+                           chunk of the document. Default value is None.
+        :paramtype progress: Callable[[~kuflow_rest.models.UploadProgress], None]
         :return: Process or None
         :rtype: ~kuflow.rest.models.Process or None
         :raises ~azure.core.exceptions.HttpResponseError:
         """
         return self._kuflow_client.process.upload_process_user_action_document(
             id=id,
-            file=file.file_content,
+            file=upload_content(file, progress),
             file_content_type=file.content_type,
             file_name=file.file_name,
             user_action_value_id=user_action_value_id,
@@ -269,7 +330,11 @@ class ProcessOperations:
         :raises ~azure.core.exceptions.HttpResponseError:
         """
         return self._kuflow_client.process.update_process_metadata(
-            id=id, process_metadata_update_params=process_metadata_update_params, **kwargs
+            id=id,
+            process_metadata_update_params=encode_json_body(
+                self._kuflow_client.process, process_metadata_update_params
+            ),
+            **kwargs,
         )
 
     def patch_process_metadata(
@@ -289,7 +354,39 @@ class ProcessOperations:
         :rtype: ~kuflow.rest.models.Process
         :raises ~azure.core.exceptions.HttpResponseError:
         """
-        return self._kuflow_client.process.patch_process_metadata(id=id, json_patch=json_patch, **kwargs)
+        return self._kuflow_client.process.patch_process_metadata(
+            id=id, json_patch=encode_json_body(self._kuflow_client.process, json_patch), **kwargs
+        )
+
+    def update_process_metadata_smart(
+        self,
+        id: str,
+        previous_metadata: Optional[Union[_models.JsonValue, dict[str, Any]]],
+        metadata: Union[_models.JsonValue, dict[str, Any]],
+        **kwargs: Any,
+    ) -> _models.Process:
+        """Save JSON metadata with the smaller request.
+
+        Sends the JSON patch from ``previous_metadata`` to ``metadata`` when it is smaller than the whole document, see
+        :func:`~kuflow_rest.utils.select_json_patch`, and the whole document otherwise.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param previous_metadata: The current JSON value, ie: the ``metadata`` of the process. None to send the whole
+                                  document.
+        :type previous_metadata: ~kuflow.rest.models.JsonValue or dict
+        :param metadata: The new JSON value. Required.
+        :type metadata: ~kuflow.rest.models.JsonValue or dict
+        :return: Process
+        :rtype: ~kuflow.rest.models.Process
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        json_patch = select_json_patch(previous_metadata, metadata)
+        if json_patch is not None:
+            return self.patch_process_metadata(id, json_patch, **kwargs)
+
+        process_metadata_update_params = _models.ProcessMetadataUpdateParams(metadata=to_json_value(metadata))
+        return self.update_process_metadata(id, process_metadata_update_params, **kwargs)
 
     def update_process_entity(
         self,
@@ -312,7 +409,9 @@ class ProcessOperations:
         :raises ~azure.core.exceptions.HttpResponseError:
         """
         return self._kuflow_client.process.update_process_entity(
-            id=id, process_entity_update_params=process_entity_update_params, **kwargs
+            id=id,
+            process_entity_update_params=encode_json_body(self._kuflow_client.process, process_entity_update_params),
+            **kwargs,
         )
 
     def patch_process_entity(
@@ -335,9 +434,48 @@ class ProcessOperations:
         :rtype: ~kuflow.rest.models.Process
         :raises ~azure.core.exceptions.HttpResponseError:
         """
-        return self._kuflow_client.process.patch_process_entity(id=id, json_patch=json_patch, **kwargs)
+        return self._kuflow_client.process.patch_process_entity(
+            id=id, json_patch=encode_json_body(self._kuflow_client.process, json_patch), **kwargs
+        )
 
-    def upload_process_document(self, id: str, document: _models.Document, **kwargs: Any) -> _models.DocumentReference:
+    def update_process_entity_smart(
+        self,
+        id: str,
+        previous_entity: Optional[Union[_models.JsonValue, dict[str, Any]]],
+        entity: Union[_models.JsonValue, dict[str, Any]],
+        **kwargs: Any,
+    ) -> _models.Process:
+        """Save JSON entity with the smaller request.
+
+        Sends the JSON patch from ``previous_entity`` to ``entity`` when it is smaller than the whole document, see
+        :func:`~kuflow_rest.utils.select_json_patch`, and the whole document otherwise.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param previous_entity: The current JSON value, ie: the ``entity`` of the process. None to send the whole
+                                document.
+        :type previous_entity: ~kuflow.rest.models.JsonValue or dict
+        :param entity: The new JSON value. Required.
+        :type entity: ~kuflow.rest.models.JsonValue or dict
+        :return: Process
+        :rtype: ~kuflow.rest.models.Process
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        json_patch = select_json_patch(previous_entity, entity)
+        if json_patch is not None:
+            return self.patch_process_entity(id, json_patch, **kwargs)
+
+        process_entity_update_params = _models.ProcessEntityUpdateParams(entity=to_json_value(entity))
+        return self.update_process_entity(id, process_entity_update_params, **kwargs)
+
+    def upload_process_document(
+        self,
+        id: str,
+        document: _models.Document,
+        *,
+        progress: Optional[Callable[[_models.UploadProgress], None]] = None,
+        **kwargs: Any,
+    ) -> _models.DocumentReference:
         """Upload a temporal document into the process that later on must be linked with a process domain
         resource.
 
@@ -352,18 +490,76 @@ class ProcessOperations:
         :type id: str
         :param document: Document to save. Required.
         :type document: ~kuflow.rest.models.Document
+        :keyword progress: Called with the progress of the upload, bytes sent and throughput, after every
+                           chunk of the document. Default value is None.
+        :paramtype progress: Callable[[~kuflow_rest.models.UploadProgress], None]
         :return: DocumentReference
         :rtype: ~kuflow.rest.models.DocumentReference
         :raises ~azure.core.exceptions.HttpResponseError:
         """
         return self._kuflow_client.process.upload_process_document(
             id=id,
-            file=document.file_content,
+            file=upload_content(document, progress),
             file_content_type=document.content_type,
             file_name=document.file_name,
             **kwargs,
         )
 
+    def upload_process_documents(
+        self,
+        id: str,
+        documents: Sequence[_models.Document],
+        *,
+        max_concurrency: int = 4,
+        max_retries: int = 2,
+        progress: Optional[Callable[[int, _models.UploadProgress], None]] = None,
+        as_document_uris: bool = False,
+        **kwargs: Any,
+    ) -> Union[list[_models.DocumentReference], list[str]]:
+        """Upload several temporal documents into the process at the same time, see ``upload_process_document``.
+
+        Up to ``max_concurrency`` documents are uploaded at the same time in threads. A document whose upload fails
+        with a connection error, a timeout, throttling or a server error is uploaded again, up to ``max_retries``
+        times, when its content is seekable. If a document can not be uploaded, its error is raised and the
+        documents whose upload did not start are not uploaded.
+
+        These retries replace the ones of the pipeline: while ``max_retries`` is greater than 0, ``retry_total``
+        defaults to 0 and each attempt is sent once, so a document is sent at most ``max_retries + 1`` times. With
+        ``max_retries=0`` the documents are retried by the pipeline as in ``upload_process_document``.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param documents: Documents to save. Required.
+        :type documents: list[~kuflow.rest.models.Document]
+        :keyword max_concurrency: Documents uploaded at the same time. Default value is 4.
+        :paramtype max_concurrency: int
+        :keyword max_retries: Retries of the upload of each document. Default value is 2.
+        :paramtype max_retries: int
+        :keyword progress: Called with the index of a document and the progress of its upload, after every chunk
+                           of the document, from the upload threads. Default value is None.
+        :paramtype progress: Callable[[int, ~kuflow_rest.models.UploadProgress], None]
+        :keyword as_document_uris: Return the ``kuflow-file:`` document URIs, ready to be set in the task data,
+                                   instead of the document references. Default False.
+        :paramtype as_document_uris: bool
+        :return: The document references, or document URIs, in the order of the documents.
+        :rtype: list[~kuflow.rest.models.DocumentReference] or list[str]
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        if max_retries > 0:
+            kwargs.setdefault("retry_total", 0)
+
+        def upload(index: int, document: _models.Document) -> _models.DocumentReference:
+            return self.upload_process_document(
+                id,
+                document,
+                progress=None if progress is None else functools.partial(progress, index),
+                **kwargs,
+            )
+
+        references = upload_documents(upload, documents, max_concurrency, max_retries)
+
+        return [reference.document_uri for reference in references] if as_document_uris else references
+
     def download_process_document(self, id: str, *, document_uri: str, **kwargs: Any) -> Iterator[bytes]:
         """Download document.
 
@@ -378,3 +574,39 @@ class ProcessOperations:
         :raises ~azure.core.exceptions.HttpResponseError:
         """
         return self._kuflow_client.process.download_process_document(id=id, document_uri=document_uri, **kwargs)
+
+    def download_process_document_to_file(
+        self, id: str, path: Union[str, "os.PathLike[str]"], *, document_uri: str, **kwargs: Any
+    ) -> int:
+        """Download a document into a file.
+
+        Given a process and a documentUri, download a document into a file, see the ``download_process_document``
+        operation.
+
+        The file is written as ``<path>.part`` and renamed to ``path`` once it is complete. A ``.part`` file of a
+        failed download is resumed, and large files are downloaded in parallel parts, when the server supports
+        Range requests.
+
+        :param id: The resource ID. Required.
+        :type id: str
+        :param path: Path of the file. Required.
+        :type path: str or ~os.PathLike
+        :keyword document_uri: Document URI to download. Required.
+        :type document_uri: str
+        :keyword int expected_size: Size of the document, the downloaded file is checked against it. Default value is
+         the size of the ``document_uri``.
+        :keyword int chunk_size: Size of the writes to the file. Default value is 1 MiB.
+        :keyword int part_size: Size of the parts downloaded in parallel. Default value is 8 MiB.
+        :keyword int max_concurrency: Parts downloaded at the same time, 1 to download in one request. Default value
+         is 4.
+        :return: The size of the file.
+        :rtype: int
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        kwargs.setdefault("expected_size", expected_document_size(document_uri))
+        return download_to_file(
+            self._kuflow_client,
+            build_download_process_document_request(id=id, document_uri=document_uri),
+            path,
+            **kwargs,
+        )
@@ -22,10 +22,13 @@
 # SOFTWARE.
 #
 
+import functools
+from collections.abc import Iterator
 from typing import Any, Optional, Union
 
 from .. import models as _models
 from .._generated import KuFlowRestClient as KuFlowRestClientGenerated
+from ._pagination import iterate_page_items
 
 
 class TenantUserOperations:
@@ -107,6 +110,48 @@ class TenantUserOperations:
             **kwargs,
         )
 
+    def iter_tenant_users(
+        self,
+        size: int = 25,
+        page: int = 0,
+        prefetch: bool = True,
+        concurrency: int = 1,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[_models.TenantUserPageItem]:
+        """Iterate over all accessible Tenant Users.
+
+        Stream the Tenant Users of every page returned by :meth:`find_tenant_users`,
+        starting at ``page``, until the last page is reached. While the items of a page are consumed, the next
+        page is requested in a background thread. Items already delivered, that shifted to a later page because
+        they were modified during the iteration, are skipped.
+
+        :keyword size: The number of records requested within a single API call. Default value is 25.
+        :type size: int
+        :keyword page: The page number to start from, 0 is the first page. Default value is 0.
+        :type page: int
+        :keyword prefetch: Request the next page while the current one is consumed. Default value is True.
+        :type prefetch: bool
+        :keyword concurrency: Fetch-all mode. When greater than 1, once the first page reveals the total number of
+                              pages, up to ``concurrency`` of the remaining pages are requested at the same time.
+                              Default value is 1.
+        :type concurrency: int
+        :keyword ordered: Deliver the items in page order. If False, the pages are delivered as soon as they arrive.
+                          Only applies to the fetch-all mode. Default value is True.
+        :type ordered: bool
+        :keyword kwargs: Sorting criteria and filters, see :meth:`find_tenant_users`.
+        :return: Iterator of TenantUserPageItem
+        :rtype: Iterator[~kuflow.rest.models.TenantUserPageItem]
+        :raises ~azure.core.exceptions.HttpResponseError:
+        """
+        return iterate_page_items(
+            functools.partial(self.find_tenant_users, size=size, **kwargs),
+            page=page,
+            prefetch=prefetch,
+            concurrency=concurrency,
+            ordered=ordered,
+        )
+
     def retrieve_tenant_user(self, id: str, **kwargs: Any) -> _models.TenantUser:
         """Get a Principal by ID.
 
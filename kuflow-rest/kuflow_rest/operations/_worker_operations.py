@@ -26,6 +26,7 @@ from typing import Any
 
 from .. import models as _models
 from .._generated import KuFlowRestClient as KuFlowRestClientGenerated
+from .._serialization import encode_json_body
 
 
 class WorkerOperations:
@@ -55,4 +56,6 @@ class WorkerOperations:
         :rtype: ~kuflow.rest.models.Worker
         :raises ~azure.core.exceptions.HttpResponseError:
         """
-        return self._kuflow_client.worker.create_worker(worker_create_params=worker_create_params, **kwargs)
+        return self._kuflow_client.worker.create_worker(
+            worker_create_params=encode_json_body(self._kuflow_client.worker, worker_create_params), **kwargs
+        )
@@ -0,0 +1,63 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+from ._cache import CACHEABLE_OPERATIONS, CachePolicy, ResponseCache
+from ._cache_async import AsyncCachePolicy
+from ._circuit_breaker import CircuitBreaker, CircuitBreakerOpenError, CircuitBreakerPolicy, CircuitState
+from ._circuit_breaker_async import AsyncCircuitBreakerPolicy
+from ._compression import CompressionPolicy, accept_encoding
+from ._deadline import DeadlineExceededError, DeadlinePolicy, deadline, remaining_time
+from ._hedging import Hedging, HedgingPolicy
+from ._hedging_async import AsyncHedgingPolicy
+from ._rate_limit import RateLimiter, RateLimitPolicy
+from ._rate_limit_async import AsyncRateLimitPolicy
+from ._single_flight import SingleFlightPolicy
+from ._single_flight_async import AsyncSingleFlightPolicy
+
+
+__all__ = [
+    "CACHEABLE_OPERATIONS",
+    "AsyncCachePolicy",
+    "AsyncCircuitBreakerPolicy",
+    "AsyncHedgingPolicy",
+    "AsyncRateLimitPolicy",
+    "AsyncSingleFlightPolicy",
+    "CachePolicy",
+    "CircuitBreaker",
+    "CircuitBreakerOpenError",
+    "CircuitBreakerPolicy",
+    "CircuitState",
+    "CompressionPolicy",
+    "DeadlineExceededError",
+    "DeadlinePolicy",
+    "Hedging",
+    "HedgingPolicy",
+    "RateLimitPolicy",
+    "RateLimiter",
+    "ResponseCache",
+    "SingleFlightPolicy",
+    "accept_encoding",
+    "deadline",
+    "remaining_time",
+]
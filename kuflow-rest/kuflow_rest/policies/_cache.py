@@ -0,0 +1,265 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+from urllib.parse import quote, urlsplit
+
+from azure.core.pipeline import PipelineRequest, PipelineResponse
+from azure.core.pipeline.policies import HTTPPolicy
+
+
+CACHEABLE_OPERATIONS: dict[str, str] = {
+    "retrieve_principal": "/principals/{id}",
+    "retrieve_tenant_user": "/tenant-users/{id}",
+    "retrieve_tenant": "/tenants/{id}",
+    "retrieve_robot": "/robots/{id}",
+    "retrieve_kms_key": "/kms/keys/{id}",
+    "find_principals": "/principals",
+    "find_tenant_users": "/tenant-users",
+    "find_tenants": "/tenants",
+    "find_groups": "/groups",
+    "find_robots": "/robots",
+}
+"""Operations whose responses can be cached, with the path of their requests."""
+
+_CONDITIONAL_HEADERS = ("if-none-match", "if-modified-since", "if-match", "if-unmodified-since", "if-range")
+
+
+class _CacheEntry:
+    __slots__ = ("operation", "path", "response", "expires_at", "etag", "last_modified")
+
+    def __init__(self, operation: str, path: str, response: PipelineResponse, expires_at: float) -> None:
+        self.operation = operation
+        self.path = path
+        self.response = response
+        self.expires_at = expires_at
+        headers = response.http_response.headers
+        self.etag: Optional[str] = headers.get("ETag")
+        self.last_modified: Optional[str] = headers.get("Last-Modified")
+
+
+class ResponseCache:
+    """Read-through cache of the responses of slowly changing resources: principals, tenants, robots...
+
+    Responses are kept for ``ttl`` seconds, the least recently used ones are evicted when ``max_size`` is reached.
+    Once expired, responses with an ``ETag`` or a ``Last-Modified`` header are revalidated with a conditional request,
+    and reused if the server answers ``304 Not Modified``. Requests that modify a resource through the same client
+    invalidate its cached responses and the listings that contain it, other changes are seen when the TTL expires or
+    after :meth:`invalidate`.
+
+    Responses are cached by URL, a cache shared by several clients must only be shared by clients with the same
+    credential.
+
+    :param int max_size: Maximum number of cached responses. Default value is 1024.
+    :param float ttl: Seconds a response is used without revalidation. Default value is 60.
+    :param operations: Operations to cache, see :data:`CACHEABLE_OPERATIONS`, with their own TTL or None to use
+                       ``ttl``. Default value is None, all of them.
+    :type operations: dict[str, Optional[float]]
+    :ivar int hits: Requests answered from the cache.
+    :ivar int revalidations: Requests answered from the cache after a ``304 Not Modified`` response.
+    :ivar int misses: Requests of cached operations answered by the server.
+    :ivar int evictions: Responses evicted because ``max_size`` was reached.
+    """
+
+    def __init__(
+        self, max_size: int = 1024, ttl: float = 60.0, operations: Optional[dict[str, Optional[float]]] = None
+    ) -> None:
+        if operations is None:
+            operations = dict.fromkeys(CACHEABLE_OPERATIONS)
+        unknown_operations = operations.keys() - CACHEABLE_OPERATIONS.keys()
+        if unknown_operations:
+            raise ValueError(f"Operations can not be cached: {', '.join(sorted(unknown_operations))}")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+        self.evictions = 0
+        self._operations = [
+            (operation, _path_pattern(CACHEABLE_OPERATIONS[operation]), ttl if operation_ttl is None else operation_ttl)
+            for operation, operation_ttl in operations.items()
+        ]
+        self._entries: OrderedDict[tuple[Any, ...], _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def invalidate(self, operation: Optional[str] = None, id: Optional[str] = None) -> int:  # noqa: A002
+        """Remove cached responses.
+
+        :param str operation: Operation whose responses are removed, ie: ``retrieve_principal``. Default value is
+                              None, every operation.
+        :param str id: Id of the resource whose responses are removed. Default value is None, every resource.
+        :return: The number of removed responses.
+        :rtype: int
+        """
+        suffix = None if id is None else "/" + quote(id, safe="")
+        with self._lock:
+            keys = [
+                key
+                for key, entry in self._entries.items()
+                if (operation is None or entry.operation == operation)
+                and (suffix is None or entry.path.endswith(suffix))
+            ]
+            for key in keys:
+                del self._entries[key]
+
+        return len(keys)
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._lock:
+            self._entries.clear()
+
+    def before_send(self, request: PipelineRequest) -> tuple[Optional[tuple[Any, ...]], Optional[PipelineResponse]]:
+        """Look up the response of a request.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :return: The cache key of the request, None if it is not cached, and the cached response if it can be used.
+        :rtype: tuple
+        """
+        http_request = request.http_request
+        method = http_request.method.upper()
+        if method not in ("GET", "HEAD") or request.context.options.get("stream", False):
+            return None, None
+        headers = {name.lower(): value for name, value in http_request.headers.items()}
+        if any(name in headers for name in _CONDITIONAL_HEADERS):
+            return None, None
+        path = urlsplit(http_request.url).path
+        match = next(((operation, ttl) for operation, pattern, ttl in self._operations if pattern.search(path)), None)
+        if match is None:
+            return None, None
+
+        operation, ttl = match
+        key = (method, http_request.url, headers.get("accept"), headers.get("accept-encoding"), operation, path, ttl)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return key, None
+            self._entries.move_to_end(key)
+            if entry.expires_at > time.monotonic():
+                self.hits += 1
+                return key, _cached_response(request, entry)
+
+        if entry.etag:
+            http_request.headers["If-None-Match"] = entry.etag
+        elif entry.last_modified:
+            http_request.headers["If-Modified-Since"] = entry.last_modified
+
+        return key, None
+
+    def after_send(
+        self, request: PipelineRequest, key: Optional[tuple[Any, ...]], response: PipelineResponse
+    ) -> PipelineResponse:
+        """Store the response of a request, or invalidate the responses of the resource the request modified.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :param key: The cache key returned by :meth:`before_send`.
+        :param response: The PipelineResponse object returned by the server.
+        :type response: ~azure.core.pipeline.PipelineResponse
+        :return: The PipelineResponse object, the cached one when the server answered ``304 Not Modified``.
+        :rtype: ~azure.core.pipeline.PipelineResponse
+        """
+        http_request = request.http_request
+        if key is None:
+            if http_request.method.upper() not in ("GET", "HEAD", "OPTIONS"):
+                self._invalidate_path(urlsplit(http_request.url).path)
+            return response
+
+        _, _, _, _, operation, path, ttl = key
+        status_code = response.http_response.status_code
+        with self._lock:
+            entry = self._entries.get(key)
+            if status_code == 304 and entry is not None:
+                self.revalidations += 1
+                entry.expires_at = time.monotonic() + ttl
+                return _cached_response(request, entry)
+
+            self.misses += 1
+            cache_control = response.http_response.headers.get("Cache-Control", "").lower()
+            if status_code != 200 or "no-store" in cache_control:
+                self._entries.pop(key, None)
+                return response
+
+            self._entries[key] = _CacheEntry(operation, path, response, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+        return response
+
+    def _invalidate_path(self, path: str) -> None:
+        # The modified resource, and the listings (or parent resources) that contain it
+        with self._lock:
+            keys = [
+                key
+                for key, entry in self._entries.items()
+                if path == entry.path or path.startswith(entry.path + "/") or entry.path.startswith(path + "/")
+            ]
+            for key in keys:
+                del self._entries[key]
+
+
+def _path_pattern(path: str) -> re.Pattern:
+    return re.compile(re.escape(path).replace(re.escape("{id}"), "[^/]+") + "$")
+
+
+def _cached_response(request: PipelineRequest, entry: _CacheEntry) -> PipelineResponse:
+    # Every caller deserializes its own models from the body
+    return PipelineResponse(request.http_request, entry.response.http_response, request.context)
+
+
+class CachePolicy(HTTPPolicy):
+    """Policy that answers read requests from a :class:`ResponseCache`.
+
+    :param cache: The cache.
+    :type cache: ~kuflow_rest.policies.ResponseCache
+    """
+
+    def __init__(self, cache: ResponseCache) -> None:
+        super().__init__()
+        self.cache = cache
+
+    def send(self, request: PipelineRequest) -> PipelineResponse:
+        """Answer the request from the cache, or send it and cache the response.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :return: The PipelineResponse object.
+        :rtype: ~azure.core.pipeline.PipelineResponse
+        """
+        key, response = self.cache.before_send(request)
+        if response is not None:
+            return response
+
+        return self.cache.after_send(request, key, self.next.send(request))
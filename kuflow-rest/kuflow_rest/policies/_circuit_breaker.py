@@ -0,0 +1,291 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import re
+import threading
+import time
+from collections.abc import Iterable
+from enum import Enum
+from typing import Optional
+from urllib.parse import urlsplit
+
+from azure.core.exceptions import ServiceRequestError, ServiceResponseError
+from azure.core.pipeline import PipelineRequest, PipelineResponse
+from azure.core.pipeline.policies import HTTPPolicy
+
+
+# Path segments that identify a resource, so that all the requests of an operation share a breaker
+_ID_SEGMENT = re.compile(r"^(?:[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}|[0-9]+)$")
+
+# 5xx status codes of a server that does not work, 501 and 505 are answers of a working server
+_FAILURE_STATUS_CODES = frozenset(status_code for status_code in range(500, 600) if status_code not in (501, 505))
+
+
+class CircuitState(str, Enum):
+    CLOSED = "CLOSED"
+    """Requests are sent."""
+
+    OPEN = "OPEN"
+    """Requests fail with :class:`CircuitBreakerOpenError` without being sent."""
+
+    HALF_OPEN = "HALF_OPEN"
+    """A few probe requests are sent to decide whether the circuit is closed or opened again."""
+
+
+class CircuitBreakerOpenError(ServiceRequestError):
+    """The request was not sent because the circuit breaker of its operation is open.
+
+    :param str key: The breaker key, the operation or the endpoint.
+    :param float retry_after: Seconds until the breaker lets a request through again.
+    """
+
+    def __init__(self, key: str, retry_after: float) -> None:
+        super().__init__(f"Circuit breaker of {key} is open, retry in {retry_after:.1f} seconds")
+        self.key = key
+        self.retry_after = retry_after
+
+
+class _Circuit:
+    __slots__ = ("state", "failures", "opened_at", "probes")
+
+    def __init__(self) -> None:
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+
+
+class CircuitBreaker:
+    """Circuit breakers of the operations of the KuFlow API.
+
+    A breaker opens after ``failure_threshold`` consecutive failed calls of an operation: transport errors, timeouts
+    and 5xx responses (but 501 and 505). While open, calls fail at once with a :class:`CircuitBreakerOpenError`,
+    without load on the API nor waiting for timeouts and retries. After ``reset_timeout`` seconds,
+    ``half_open_max_calls`` probe calls are sent: the breaker closes if they succeed, and opens again otherwise.
+
+    The outcome of a call is the one after the retries of the client. Operations are identified by the method and the
+    path of their requests with the resource ids replaced, ie: ``GET /v2024-06-14/processes/{id}``, or by the
+    endpoint (scheme and host) with ``per_operation=False``.
+
+    It can be shared by the sync and async clients of a process.
+
+    :param int failure_threshold: Consecutive failures that open a breaker. Default value is 5.
+    :param float reset_timeout: Seconds a breaker stays open. Default value is 30.
+    :param int half_open_max_calls: Probe calls sent in parallel while half open. Default value is 1.
+    :param bool per_operation: One breaker per operation, or one per endpoint. Default value is True.
+    :param failure_status_codes: Status codes of failed calls. Default value is the 5xx codes but 501 and 505.
+    :type failure_status_codes: Iterable[int]
+    :ivar int opened: Times a breaker was opened.
+    :ivar int rejected: Calls rejected by an open breaker.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        per_operation: bool = True,
+        failure_status_codes: Optional[Iterable[int]] = None,
+    ) -> None:
+        if failure_threshold < 1 or half_open_max_calls < 1:
+            raise ValueError("failure_threshold and half_open_max_calls must be greater than 0")
+
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.per_operation = per_operation
+        self.failure_status_codes = (
+            _FAILURE_STATUS_CODES if failure_status_codes is None else frozenset(failure_status_codes)
+        )
+        self.opened = 0
+        self.rejected = 0
+        self._circuits: dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def state(self, key: str) -> CircuitState:
+        """Return the state of a breaker.
+
+        :param str key: The breaker key.
+        :return: The state, closed for unknown keys.
+        :rtype: CircuitState
+        """
+        with self._lock:
+            circuit = self._circuits.get(key)
+            return CircuitState.CLOSED if circuit is None else self._current_state(circuit, time.monotonic())
+
+    def states(self) -> dict[str, CircuitState]:
+        """Return the state of the breakers that have seen a request.
+
+        :return: The state of every breaker key.
+        :rtype: dict[str, CircuitState]
+        """
+        now = time.monotonic()
+        with self._lock:
+            return {key: self._current_state(circuit, now) for key, circuit in self._circuits.items()}
+
+    def metrics(self) -> dict[str, int]:
+        """Return the number of breakers in every state and the counters.
+
+        :return: ``closed``, ``open``, ``half_open``, ``opened`` and ``rejected``.
+        :rtype: dict[str, int]
+        """
+        states = list(self.states().values())
+        return {
+            "closed": states.count(CircuitState.CLOSED),
+            "open": states.count(CircuitState.OPEN),
+            "half_open": states.count(CircuitState.HALF_OPEN),
+            "opened": self.opened,
+            "rejected": self.rejected,
+        }
+
+    def reset(self, key: Optional[str] = None) -> None:
+        """Close a breaker, or all of them.
+
+        :param str key: The breaker key. Default value is None, every breaker.
+        """
+        with self._lock:
+            if key is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(key, None)
+
+    def key(self, request: PipelineRequest) -> str:
+        """Return the breaker key of a request.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :return: The key.
+        :rtype: str
+        """
+        url = urlsplit(request.http_request.url)
+        if not self.per_operation:
+            return f"{url.scheme}://{url.netloc}"
+
+        path = "/".join("{id}" if _ID_SEGMENT.match(segment) else segment for segment in url.path.split("/"))
+        return f"{request.http_request.method.upper()} {path}"
+
+    def before_send(self, request: PipelineRequest) -> str:
+        """Check that the breaker of a request lets it through.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :return: The breaker key, to pass to :meth:`after_send`.
+        :rtype: str
+        :raises CircuitBreakerOpenError: If the breaker is open.
+        """
+        key = self.key(request)
+        now = time.monotonic()
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                circuit = self._circuits[key] = _Circuit()
+            state = self._current_state(circuit, now)
+            if state is CircuitState.CLOSED:
+                return key
+            if state is CircuitState.HALF_OPEN and circuit.probes < self.half_open_max_calls:
+                circuit.state = CircuitState.HALF_OPEN
+                circuit.probes += 1
+                return key
+
+            self.rejected += 1
+            retry_after = max(0.0, circuit.opened_at + self.reset_timeout - now) or self.reset_timeout
+
+        raise CircuitBreakerOpenError(key, retry_after)
+
+    def after_send(self, key: str, response: Optional[PipelineResponse], error: Optional[BaseException]) -> None:
+        """Record the outcome of a call.
+
+        :param str key: The key returned by :meth:`before_send`.
+        :param response: The PipelineResponse object, None if the call raised an error.
+        :type response: ~azure.core.pipeline.PipelineResponse
+        :param error: The error raised by the call.
+        :type error: BaseException
+        """
+        if response is not None:
+            failed: Optional[bool] = response.http_response.status_code in self.failure_status_codes
+        elif isinstance(error, (ServiceRequestError, ServiceResponseError)):
+            failed = True
+        elif isinstance(error, Exception):
+            # The server answered, ie: with a response that could not be decoded
+            failed = False
+        else:
+            # Cancelled call, the outcome is unknown
+            failed = None
+
+        with self._lock:
+            circuit = self._circuits[key]
+            if circuit.state is CircuitState.HALF_OPEN:
+                # Calls sent before the breaker opened complete as probes too
+                circuit.probes = max(0, circuit.probes - 1)
+            if failed is None:
+                return
+            if not failed:
+                circuit.state = CircuitState.CLOSED
+                circuit.failures = 0
+                return
+
+            circuit.failures += 1
+            if circuit.state is CircuitState.HALF_OPEN or (
+                circuit.state is CircuitState.CLOSED and circuit.failures >= self.failure_threshold
+            ):
+                circuit.state = CircuitState.OPEN
+                circuit.opened_at = time.monotonic()
+                circuit.probes = 0
+                self.opened += 1
+
+    def _current_state(self, circuit: _Circuit, now: float) -> CircuitState:
+        if circuit.state is CircuitState.OPEN and now - circuit.opened_at >= self.reset_timeout:
+            return CircuitState.HALF_OPEN
+        return circuit.state
+
+
+class CircuitBreakerPolicy(HTTPPolicy):
+    """Policy that sends the requests through a :class:`CircuitBreaker`.
+
+    :param breaker: The circuit breaker, it can be shared with other clients.
+    :type breaker: ~kuflow_rest.policies.CircuitBreaker
+    """
+
+    def __init__(self, breaker: CircuitBreaker) -> None:
+        super().__init__()
+        self.breaker = breaker
+
+    def send(self, request: PipelineRequest) -> PipelineResponse:
+        """Send the request if its breaker is closed.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :return: The PipelineResponse object.
+        :rtype: ~azure.core.pipeline.PipelineResponse
+        :raises CircuitBreakerOpenError: If the breaker of the request is open.
+        """
+        key = self.breaker.before_send(request)
+        try:
+            response = self.next.send(request)
+        except BaseException as err:
+            self.breaker.after_send(key, None, err)
+            raise
+        self.breaker.after_send(key, response, None)
+
+        return response
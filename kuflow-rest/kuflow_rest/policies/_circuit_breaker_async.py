@@ -0,0 +1,59 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+from azure.core.pipeline import PipelineRequest, PipelineResponse
+from azure.core.pipeline.policies import AsyncHTTPPolicy
+
+from ._circuit_breaker import CircuitBreaker
+
+
+class AsyncCircuitBreakerPolicy(AsyncHTTPPolicy):
+    """Async version of :class:`~kuflow_rest.policies.CircuitBreakerPolicy`.
+
+    :param breaker: The circuit breaker, it can be shared with sync clients.
+    :type breaker: ~kuflow_rest.policies.CircuitBreaker
+    """
+
+    def __init__(self, breaker: CircuitBreaker) -> None:
+        super().__init__()
+        self.breaker = breaker
+
+    async def send(self, request: PipelineRequest) -> PipelineResponse:
+        """Send the request if its breaker is closed.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :return: The PipelineResponse object.
+        :rtype: ~azure.core.pipeline.PipelineResponse
+        :raises CircuitBreakerOpenError: If the breaker of the request is open.
+        """
+        key = self.breaker.before_send(request)
+        try:
+            response = await self.next.send(request)
+        except BaseException as err:
+            self.breaker.after_send(key, None, err)
+            raise
+        self.breaker.after_send(key, response, None)
+
+        return response
@@ -0,0 +1,191 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import gzip
+import logging
+import threading
+import zlib
+from collections.abc import Callable
+from typing import Any, Optional
+
+from azure.core.pipeline import PipelineRequest
+from azure.core.pipeline.policies import SansIOHTTPPolicy
+from azure.core.pipeline.transport import RequestsTransport
+from azure.core.rest import HttpRequest
+
+
+logger = logging.getLogger(__name__)
+
+# Encodings that every transport decodes
+DEFAULT_ACCEPT_ENCODING = "gzip, deflate"
+
+_DEFAULT_LEVELS = {"gzip": 6, "deflate": 6, "br": 5, "zstd": 3}
+
+
+def _gzip_encoder(level: int) -> Callable[[bytes], bytes]:
+    # mtime=0 keeps the output of a body the same across calls
+    return lambda data: gzip.compress(data, compresslevel=level, mtime=0)
+
+
+def _deflate_encoder(level: int) -> Callable[[bytes], bytes]:
+    return lambda data: zlib.compress(data, level)
+
+
+def _brotli_encoder(level: int) -> Callable[[bytes], bytes]:
+    import brotli
+
+    return lambda data: brotli.compress(data, quality=level)
+
+
+def _zstd_encoder(level: int) -> Callable[[bytes], bytes]:
+    import zstandard
+
+    # Compressors are not thread safe, one per body is cheap compared with a large body
+    return lambda data: zstandard.ZstdCompressor(level=level).compress(data)
+
+
+_ENCODERS: dict[str, Callable[[int], Callable[[bytes], bytes]]] = {
+    "gzip": _gzip_encoder,
+    "deflate": _deflate_encoder,
+    "br": _brotli_encoder,
+    "zstd": _zstd_encoder,
+}
+
+
+def accept_encoding(transport: Any) -> str:
+    """Encodings of the responses that a transport decodes, as an ``Accept-Encoding`` value.
+
+    The requests transport decodes what urllib3 supports: brotli and zstd when the ``brotli`` and ``zstandard``
+    packages are installed. The httpx transports tell their own encodings. The aiohttp transport of azure-core, and
+    any other transport, only decode gzip and deflate.
+
+    :param transport: An azure-core transport, also a :class:`~kuflow_rest.SharedTransport`.
+    :return: The ``Accept-Encoding`` header value.
+    :rtype: str
+    """
+    transport = getattr(transport, "transport", transport)
+    encodings = getattr(transport, "accept_encoding", None)
+    if encodings:
+        return encodings
+    if isinstance(transport, RequestsTransport):
+        from urllib3.util.request import ACCEPT_ENCODING
+
+        return ", ".join(encoding.strip() for encoding in ACCEPT_ENCODING.split(","))
+
+    return DEFAULT_ACCEPT_ENCODING
+
+
+def _is_compressible(content_type: Optional[str]) -> bool:
+    if not content_type:
+        return False
+    media_type = content_type.split(";", 1)[0].strip().lower()
+
+    return media_type.startswith("text/") or media_type == "application/json" or media_type.endswith("+json")
+
+
+class CompressionPolicy(SansIOHTTPPolicy):
+    """Compress the large JSON bodies of the requests and ask for compressed responses.
+
+    The JSON and text bodies of ``threshold`` bytes or more are compressed with ``encoding`` and sent with a
+    ``Content-Encoding`` header, ie: the task data of ``update_process_item_task_data`` or the entity of
+    ``update_process_entity``. Bodies that do not get smaller, streams and multipart bodies (documents) are sent as
+    they are. The body is compressed once per call, the retries send the compressed body again.
+
+    The ``Accept-Encoding`` header asks for the encodings in ``accept_encoding``, that should be the ones the
+    transport decodes, see :func:`accept_encoding`. The transports decode the responses as they are read, also the
+    streamed downloads, so large pages of process items travel compressed without any change in the callers.
+
+    :param str encoding: Encoding of the request bodies: "gzip" (default), "deflate", "br" or "zstd". "br" requires
+                         the ``brotli`` package and "zstd" the ``zstandard`` package, both in the ``compression``
+                         extra; without them gzip is used.
+    :param int threshold: Minimum size, in bytes, of the compressed bodies. Default value is 1024.
+    :param int level: Compression level. Default value is a fast level of the encoding (6 for gzip).
+    :param str accept_encoding: ``Accept-Encoding`` header value, None to keep the header of the transport. Default
+                                value is "gzip, deflate".
+    :ivar int compressed: Request bodies compressed.
+    :ivar int bytes_in: Size of the compressed request bodies before compression.
+    :ivar int bytes_out: Size of the compressed request bodies after compression.
+    :raises ValueError: If the encoding is unknown.
+    """
+
+    def __init__(
+        self,
+        encoding: str = "gzip",
+        threshold: int = 1024,
+        level: Optional[int] = None,
+        accept_encoding: Optional[str] = DEFAULT_ACCEPT_ENCODING,
+    ) -> None:
+        if encoding not in _ENCODERS:
+            raise ValueError(f"Unknown compression encoding: {encoding}")
+
+        try:
+            encoder = _ENCODERS[encoding](_DEFAULT_LEVELS[encoding] if level is None else level)
+        except ImportError:
+            logger.warning("The package of the %s encoding is not installed, gzip is used instead", encoding)
+            encoding = "gzip"
+            encoder = _gzip_encoder(_DEFAULT_LEVELS[encoding] if level is None else level)
+
+        self.encoding = encoding
+        self.threshold = threshold
+        self.accept_encoding = accept_encoding
+        self._encoder = encoder
+        self._lock = threading.Lock()
+
+        self.compressed = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def on_request(self, request: PipelineRequest) -> None:
+        """Compresses the body and sets the encoding headers.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        """
+        http_request = request.http_request
+        headers = http_request.headers
+        if self.accept_encoding and "Accept-Encoding" not in headers:
+            headers["Accept-Encoding"] = self.accept_encoding
+
+        if "Content-Encoding" in headers or not _is_compressible(headers.get("Content-Type")):
+            return
+
+        content = http_request.content
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        if not isinstance(content, bytes) or len(content) < self.threshold:
+            return
+
+        compressed = self._encoder(content)
+        if len(compressed) >= len(content):
+            return
+
+        # The request body is read only, so the request is replaced by one with the compressed body and the headers
+        headers["Content-Length"] = str(len(compressed))
+        headers["Content-Encoding"] = self.encoding
+        request.http_request = HttpRequest(http_request.method, http_request.url, headers=headers, content=compressed)
+
+        with self._lock:
+            self.compressed += 1
+            self.bytes_in += len(content)
+            self.bytes_out += len(compressed)
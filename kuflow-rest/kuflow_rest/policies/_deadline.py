@@ -0,0 +1,98 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import contextlib
+import time
+from collections.abc import Iterator
+from contextvars import ContextVar
+from typing import Optional
+
+from azure.core.exceptions import ServiceRequestTimeoutError
+from azure.core.pipeline import PipelineRequest
+from azure.core.pipeline.policies import SansIOHTTPPolicy
+
+
+# Deadline of the calls made in the current context, in time.monotonic() seconds
+_deadline: ContextVar[Optional[float]] = ContextVar("kuflow_rest_deadline", default=None)
+
+
+@contextlib.contextmanager
+def deadline(timeout: Optional[float]) -> Iterator[None]:
+    """Limit the time of the REST calls made inside the block, with their retries.
+
+    The deadline is kept in a context variable, so it applies to the calls of the current thread or asyncio task,
+    and to the ones they start in other threads with a copy of the context. A nested deadline can only be earlier.
+
+    :param float timeout: Seconds from now. None does not change the deadline.
+    """
+    if timeout is None:
+        yield
+        return
+
+    current = _deadline.get()
+    new = time.monotonic() + timeout
+    token = _deadline.set(new if current is None else min(current, new))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> Optional[float]:
+    """Return the seconds left until the deadline of the current context.
+
+    :return: The seconds, negative once expired, or None without deadline.
+    :rtype: Optional[float]
+    """
+    current = _deadline.get()
+    return None if current is None else current - time.monotonic()
+
+
+class DeadlineExceededError(ServiceRequestTimeoutError):
+    """The request was not sent because the deadline of the call expired."""
+
+
+class DeadlinePolicy(SansIOHTTPPolicy):
+    """Policy that fits the timeouts of a call into the deadline of its context, see :func:`deadline`.
+
+    The connection and read timeouts of the request, and the total timeout of the retries, are limited to the time
+    left. Calls made once the deadline expired fail with a :class:`DeadlineExceededError`.
+    """
+
+    def on_request(self, request: PipelineRequest) -> None:
+        remaining = remaining_time()
+        if remaining is None:
+            return
+        if remaining <= 0:
+            raise DeadlineExceededError("Deadline exceeded before the request was sent")
+
+        options = request.context.options
+        connection_config = getattr(request.context.transport, "connection_config", None)
+        for option, default in (
+            ("timeout", None),
+            ("connection_timeout", getattr(connection_config, "timeout", None)),
+            ("read_timeout", getattr(connection_config, "read_timeout", None)),
+        ):
+            current = options.get(option, default)
+            options[option] = remaining if current is None else min(current, remaining)
@@ -0,0 +1,287 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Optional
+
+from azure.core.pipeline import PipelineContext, PipelineRequest, PipelineResponse
+from azure.core.pipeline.policies import HTTPPolicy
+
+from ._single_flight import shared_response
+
+
+_HEDGED_METHODS = frozenset(["GET", "HEAD"])
+
+# Maximum number of backup requests saved up by the budget
+_MAX_BUDGET_TOKENS = 10.0
+
+
+class Hedging:
+    """Settings, budget and statistics of the hedged read requests.
+
+    A read request (GET) that has not completed after a delay is sent again, a backup request, and the first
+    successful response is used: a single slow server response no longer sets the latency of the call. The delay is
+    ``delay`` seconds or, with ``percentile``, the given percentile of the latency observed in the last
+    ``window`` requests, once ``min_samples`` of them completed. The backup requests are limited to a ``budget``
+    fraction of the requests, so a slow server gets a little more load and not twice the load.
+
+    Responses of 5xx status codes and requests that failed without response are not successful: the other request
+    is waited for and used if it succeeds.
+
+    It can be shared by the sync and async clients of a process, that then share its budget.
+
+    :param float delay: Seconds to wait before the backup request. Default value is 0.05.
+    :param float percentile: Percentile, from 0 to 100, of the observed latency used as delay. Default value is None,
+                             ``delay`` is always used.
+    :param float budget: Maximum ratio of backup requests to requests. Default value is 0.05, 5%.
+    :param int min_samples: Observed latencies required to use ``percentile``. Default value is 50.
+    :param int window: Number of latencies observed. Default value is 1000.
+    :ivar int requests: Read requests sent.
+    :ivar int hedged: Backup requests sent.
+    :ivar int backup_wins: Calls answered with the response of the backup request.
+    """
+
+    def __init__(
+        self,
+        delay: float = 0.05,
+        percentile: Optional[float] = None,
+        budget: float = 0.05,
+        min_samples: int = 50,
+        window: int = 1000,
+    ) -> None:
+        if percentile is not None and not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100")
+        if not 0 <= budget <= 1:
+            raise ValueError("budget must be between 0 and 1")
+
+        self.percentile = percentile
+        self.budget = budget
+        self.min_samples = min_samples
+        self.requests = 0
+        self.hedged = 0
+        self.backup_wins = 0
+        self._delay = delay
+        self._percentile_delay: Optional[float] = None
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._new_latencies = 0
+        self._tokens = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def delay(self) -> float:
+        """Seconds to wait before the backup request."""
+        if self._percentile_delay is None:
+            return self._delay
+        return self._percentile_delay
+
+    def hedgeable(self, request: PipelineRequest) -> bool:
+        """Return whether the request is a read request that can be hedged.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :return: True if a backup request can be sent for it.
+        :rtype: bool
+        """
+        return request.http_request.method.upper() in _HEDGED_METHODS and not request.context.options.get(
+            "stream", False
+        )
+
+    def add_request(self) -> None:
+        """Add a hedgeable request to the statistics and its share to the budget."""
+        with self._lock:
+            self.requests += 1
+            self._tokens = min(_MAX_BUDGET_TOKENS, self._tokens + self.budget)
+
+    def try_hedge(self) -> bool:
+        """Take a backup request from the budget.
+
+        :return: True if the backup request can be sent.
+        :rtype: bool
+        """
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            self.hedged += 1
+
+        return True
+
+    def record(self, latency: float) -> None:
+        """Record the latency of a successful primary request.
+
+        :param float latency: Seconds the request took.
+        """
+        with self._lock:
+            self._latencies.append(latency)
+            self._new_latencies += 1
+            # Sorting the window on every request would cost more than the requests saved
+            if (
+                self.percentile is not None
+                and len(self._latencies) >= self.min_samples
+                and (self._percentile_delay is None or self._new_latencies >= self.min_samples)
+            ):
+                latencies = sorted(self._latencies)
+                self._percentile_delay = latencies[min(len(latencies) - 1, int(len(latencies) * self.percentile / 100))]
+                self._new_latencies = 0
+
+    def record_backup_win(self) -> None:
+        """Record a call answered with the response of the backup request."""
+        with self._lock:
+            self.backup_wins += 1
+
+
+def snapshot_request(request: PipelineRequest) -> Callable[[], PipelineRequest]:
+    """Keep what is needed to send a request again, and return the function that creates the backup request.
+
+    The next policies modify the headers and consume the options of the request while it is sent, so they are kept
+    before. The backup request is created only when it is sent. Read requests have no body.
+
+    :param request: The PipelineRequest object
+    :type request: ~azure.core.pipeline.PipelineRequest
+    :return: The function that creates the backup PipelineRequest object.
+    :rtype: Callable[[], ~azure.core.pipeline.PipelineRequest]
+    """
+    http_request = request.http_request
+    method, url, headers = http_request.method, http_request.url, dict(http_request.headers)
+    transport, options, items = request.context.transport, dict(request.context.options), dict(request.context)
+
+    def backup_request() -> PipelineRequest:
+        context = PipelineContext(transport, **options)
+        for key, value in items.items():
+            context[key] = value
+        return PipelineRequest(type(http_request)(method, url, headers=headers), context)
+
+    return backup_request
+
+
+def call_succeeded(call: Any) -> bool:
+    """Return whether a completed hedged request succeeded.
+
+    :param call: The completed request, a future or a task.
+    :return: True if it returned a response that is not a 5xx error.
+    :rtype: bool
+    """
+    return call.exception() is None and call.result().http_response.status_code < 500
+
+
+class HedgingPolicy(HTTPPolicy):
+    """Policy that hedges the read requests, see :class:`Hedging`.
+
+    A sync HTTP call can not be abandoned, so both requests are sent from a thread pool of ``max_workers`` threads and
+    the delay is counted from the moment the request is sent, not from the moment it is queued. When every thread is
+    busy the request is sent from the calling thread, without backup request: the pool does not limit the number of
+    read requests at the same time. The losing request runs until it completes and its response is closed then.
+
+    :param hedging: The settings and budget.
+    :type hedging: ~kuflow_rest.policies.Hedging
+    :param int max_workers: Threads that send the hedged requests. Default value is 32.
+    """
+
+    def __init__(self, hedging: Hedging, max_workers: int = 32) -> None:
+        super().__init__()
+        self.hedging = hedging
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._busy = 0
+
+    def send(self, request: PipelineRequest) -> PipelineResponse:
+        """Send the request, and a backup request if it is slow.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :return: The PipelineResponse object.
+        :rtype: ~azure.core.pipeline.PipelineResponse
+        """
+        if not self.hedging.hedgeable(request):
+            return self.next.send(request)
+
+        self.hedging.add_request()
+        backup_request = snapshot_request(request)
+        sent = threading.Event()
+        primary = self._submit(self._send_primary, request, sent)
+        if primary is None:
+            return self._send_primary(request, sent)
+
+        sent.wait()
+        if wait([primary], timeout=self.hedging.delay).done or not self.hedging.try_hedge():
+            return primary.result()
+
+        backup = self._submit(self.next.send, backup_request())
+        if backup is None:
+            return primary.result()
+
+        done = wait([primary, backup], return_when=FIRST_COMPLETED).done
+        first, second = (primary, backup) if primary in done else (backup, primary)
+        winner = first
+        if not call_succeeded(first):
+            wait([second])
+            # When both fail, the error of the request is the one of the primary request
+            winner = second if call_succeeded(second) else primary
+
+        if winner is primary:
+            backup.add_done_callback(_discard)
+            return primary.result()
+
+        primary.add_done_callback(_discard)
+        self.hedging.record_backup_win()
+
+        return shared_response(request, backup.result())
+
+    def _send_primary(self, request: PipelineRequest, sent: threading.Event) -> PipelineResponse:
+        # The latency of the server, not the one of the hedged call, sets the delay
+        sent.set()
+        start = time.monotonic()
+        response = self.next.send(request)
+        if response.http_response.status_code < 500:
+            self.hedging.record(time.monotonic() - start)
+
+        return response
+
+    def _submit(self, send: Callable[..., PipelineResponse], *args: Any) -> Optional[Future]:
+        with self._executor_lock:
+            if self._busy >= self._max_workers:
+                return None
+            self._busy += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self._max_workers, thread_name_prefix="kuflow-hedging")
+
+        # Context variables, ie: deadlines, are seen by the policies that run in the pool
+        call = self._executor.submit(contextvars.copy_context().run, send, *args)
+        call.add_done_callback(self._release)
+
+        return call
+
+    def _release(self, _: Future) -> None:
+        with self._executor_lock:
+            self._busy -= 1
+
+
+def _discard(call: Future) -> None:
+    if call.exception() is None:
+        call.result().http_response.close()
@@ -0,0 +1,99 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import asyncio
+import time
+
+from azure.core.pipeline import PipelineRequest, PipelineResponse
+from azure.core.pipeline.policies import AsyncHTTPPolicy
+
+from ._hedging import Hedging, call_succeeded, snapshot_request
+from ._single_flight import shared_response
+
+
+class AsyncHedgingPolicy(AsyncHTTPPolicy):
+    """Async version of :class:`~kuflow_rest.policies.HedgingPolicy`.
+
+    The losing request is cancelled.
+
+    :param hedging: The settings and budget, they can be shared with sync clients.
+    :type hedging: ~kuflow_rest.policies.Hedging
+    """
+
+    def __init__(self, hedging: Hedging) -> None:
+        super().__init__()
+        self.hedging = hedging
+
+    async def send(self, request: PipelineRequest) -> PipelineResponse:
+        """Send the request, and a backup request if it is slow.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :return: The PipelineResponse object.
+        :rtype: ~azure.core.pipeline.PipelineResponse
+        """
+        if not self.hedging.hedgeable(request):
+            return await self.next.send(request)
+
+        self.hedging.add_request()
+        backup_request = snapshot_request(request)
+        start = time.monotonic()
+        primary = asyncio.ensure_future(self.next.send(request))
+        primary.add_done_callback(lambda call: self._record(start, call))
+        backup = None
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=self.hedging.delay)
+            if done or not self.hedging.try_hedge():
+                return await primary
+
+            backup = asyncio.ensure_future(self.next.send(backup_request()))
+            done, _ = await asyncio.wait({primary, backup}, return_when=asyncio.FIRST_COMPLETED)
+            first, second = (primary, backup) if primary in done else (backup, primary)
+            winner = first
+            if not call_succeeded(first):
+                await asyncio.wait({second})
+                # When both fail, the error of the request is the one of the primary request
+                winner = second if call_succeeded(second) else primary
+
+            if winner is primary:
+                return primary.result()
+
+            self.hedging.record_backup_win()
+            return shared_response(request, backup.result())
+        finally:
+            for call in (primary, backup):
+                if call is not None and not call.done():
+                    call.cancel()
+                if call is not None:
+                    call.add_done_callback(_retrieve_exception)
+
+    def _record(self, start: float, call: asyncio.Future) -> None:
+        if not call.cancelled() and call_succeeded(call):
+            self.hedging.record(time.monotonic() - start)
+
+
+def _retrieve_exception(call: asyncio.Future) -> None:
+    # The error of the losing request is not raised, it is retrieved so that asyncio does not log it
+    if not call.cancelled():
+        call.exception()
@@ -0,0 +1,302 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import asyncio
+import threading
+import time
+from collections.abc import Iterable
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from azure.core.pipeline import PipelineRequest, PipelineResponse
+from azure.core.pipeline.policies import HTTPPolicy
+
+from ._deadline import DeadlineExceededError, remaining_time
+
+
+# Headers with the pause requested by a throttled response, and the seconds of their unit
+_RETRY_AFTER_HEADERS = (("retry-after-ms", 0.001), ("x-ms-retry-after-ms", 0.001), ("Retry-After", 1.0))
+
+
+class RateLimiter:
+    """Client side limit of the requests sent to KuFlow, that adapts to the throttling of the server.
+
+    Two limits apply to every request:
+
+    * A token bucket of ``rate`` requests per second, that allows bursts of ``burst`` requests.
+    * An AIMD (additive increase, multiplicative decrease) window of requests in flight. Every successful response
+      grows the window by ``increase / window``, so by ``increase`` per window of responses, up to
+      ``max_concurrency``. A throttled response (``429 Too Many Requests`` or ``503 Service Unavailable``) multiplies
+      it by ``decrease``, down to ``min_concurrency``. Responses to requests sent before the last decrease do not
+      decrease it again, so a burst of throttled responses is a single decrease.
+
+    A ``Retry-After`` header of a throttled response pauses every request until it elapses, up to
+    ``max_retry_after`` seconds.
+
+    The limiter can be shared by the sync and async clients of a process, so that all of them stay under the capacity
+    of the server together. It is used in every attempt of a request, the retries of the client wait for it too.
+
+    :param float rate: Requests per second. Default value is None, no rate limit.
+    :param int burst: Requests that can be sent at once when the bucket is full. Default value is ``rate``.
+    :param int concurrency: Initial window of requests in flight. Default value is 16.
+    :param int min_concurrency: Minimum window. Default value is 1.
+    :param int max_concurrency: Maximum window. Default value is 64.
+    :param float increase: Growth of the window per window of successful responses. Default value is 1.
+    :param float decrease: Factor applied to the window on throttled responses. Default value is 0.5.
+    :param float max_retry_after: Maximum pause, in seconds, of a ``Retry-After`` header. Default value is 60.
+    :param throttle_status_codes: Status codes of throttled responses. Default value is (429, 503).
+    :type throttle_status_codes: Iterable[int]
+    :ivar int requests: Requests sent through the limiter.
+    :ivar int throttled: Throttled responses.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        concurrency: int = 16,
+        min_concurrency: int = 1,
+        max_concurrency: int = 64,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        max_retry_after: float = 60.0,
+        throttle_status_codes: Iterable[int] = (429, 503),
+    ) -> None:
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        if not 1 <= min_concurrency <= concurrency <= max_concurrency:
+            raise ValueError("min_concurrency <= concurrency <= max_concurrency is required, and all of them >= 1")
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be between 0 and 1")
+
+        if burst is None:
+            burst = 1 if rate is None else max(1, int(rate))
+
+        self.rate = rate
+        self.burst = burst
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.increase = increase
+        self.decrease = decrease
+        self.max_retry_after = max_retry_after
+        self.throttle_status_codes = frozenset(throttle_status_codes)
+        self.requests = 0
+        self.throttled = 0
+        self._window = float(concurrency)
+        self._in_flight = 0
+        self._tokens = float(self.burst)
+        self._refilled_at = time.monotonic()
+        self._paused_until = 0.0
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._released = threading.Condition(self._lock)
+        self._async_waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+    @property
+    def concurrency_limit(self) -> int:
+        """Current window of requests in flight."""
+        return int(self._window)
+
+    @property
+    def in_flight(self) -> int:
+        """Requests in flight."""
+        return self._in_flight
+
+    def metrics(self) -> dict[str, float]:
+        """Return the current limits and counters.
+
+        :return: ``concurrency_limit``, ``in_flight``, ``rate`` (0 without rate limit), ``tokens`` available,
+                 ``paused`` seconds left of a ``Retry-After``, ``requests`` and ``throttled``.
+        :rtype: dict[str, float]
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            return {
+                "concurrency_limit": int(self._window),
+                "in_flight": self._in_flight,
+                "rate": self.rate or 0.0,
+                "tokens": self._tokens,
+                "paused": max(0.0, self._paused_until - now),
+                "requests": self.requests,
+                "throttled": self.throttled,
+            }
+
+    def acquire(self) -> int:
+        """Wait until a request can be sent, at most until the deadline of the context, see
+        :func:`~kuflow_rest.policies.deadline`.
+
+        :return: The ticket of the request, to pass to :meth:`release`.
+        :rtype: int
+        :raises ~kuflow_rest.policies.DeadlineExceededError: If the deadline expires first.
+        """
+        with self._released:
+            while True:
+                ticket, wait = self._try_acquire()
+                if ticket is not None:
+                    return ticket
+                self._released.wait(_wait_until_deadline(wait))
+
+    async def acquire_async(self) -> int:
+        """Async version of :meth:`acquire`.
+
+        :return: The ticket of the request, to pass to :meth:`release`.
+        :rtype: int
+        :raises ~kuflow_rest.policies.DeadlineExceededError: If the deadline expires first.
+        """
+        while True:
+            released = None
+            with self._lock:
+                ticket, wait = self._try_acquire()
+                if ticket is not None:
+                    return ticket
+                if wait is None:
+                    loop = asyncio.get_running_loop()
+                    released = loop.create_future()
+                    self._async_waiters.append((loop, released))
+                wait = _wait_until_deadline(wait)
+
+            if released is None:
+                await asyncio.sleep(wait)
+            else:
+                await asyncio.wait({released}, timeout=wait)
+
+    def release(self, ticket: int, response: Optional[PipelineResponse]) -> None:
+        """Record the end of a request and adapt the limits to its response.
+
+        :param int ticket: The ticket returned by :meth:`acquire`.
+        :param response: The PipelineResponse object, None when the request failed without response.
+        :type response: ~azure.core.pipeline.PipelineResponse
+        """
+        throttled = response is not None and response.http_response.status_code in self.throttle_status_codes
+        retry_after = _get_retry_after(response) if throttled else None
+
+        with self._lock:
+            self._in_flight -= 1
+            if throttled:
+                self.throttled += 1
+                if ticket == self._generation:
+                    self._generation += 1
+                    self._window = max(float(self.min_concurrency), self._window * self.decrease)
+                if retry_after:
+                    pause = min(retry_after, self.max_retry_after)
+                    self._paused_until = max(self._paused_until, time.monotonic() + pause)
+            elif response is not None:
+                self._window = min(float(self.max_concurrency), self._window + self.increase / self._window)
+
+            self._released.notify_all()
+            waiters, self._async_waiters = self._async_waiters, []
+
+        for loop, released in waiters:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(_set_released, released)
+
+    def _try_acquire(self) -> tuple[Optional[int], Optional[float]]:
+        # The ticket when the request can be sent, or the seconds to wait (None until a request is released)
+        now = time.monotonic()
+        if now < self._paused_until:
+            return None, self._paused_until - now
+        if self._in_flight >= int(self._window):
+            return None, None
+        if self.rate is not None:
+            self._refill(now)
+            if self._tokens < 1:
+                return None, (1 - self._tokens) / self.rate
+            self._tokens -= 1
+
+        self._in_flight += 1
+        self.requests += 1
+
+        return self._generation, 0.0
+
+    def _refill(self, now: float) -> None:
+        if self.rate is not None:
+            self._tokens = min(float(self.burst), self._tokens + (now - self._refilled_at) * self.rate)
+        self._refilled_at = now
+
+
+def _wait_until_deadline(wait: Optional[float]) -> Optional[float]:
+    # The seconds to wait, None for no limit, bounded by the deadline of the context
+    remaining = remaining_time()
+    if remaining is None:
+        return wait
+    if remaining <= 0:
+        raise DeadlineExceededError("Deadline exceeded while waiting for the rate limiter")
+
+    return remaining if wait is None else min(wait, remaining)
+
+
+def _get_retry_after(response: PipelineResponse) -> Optional[float]:
+    # The seconds of the Retry-After headers: a number of milliseconds or seconds, or an HTTP date
+    headers = response.http_response.headers
+    for header, unit in _RETRY_AFTER_HEADERS:
+        value = headers.get(header)
+        if not value:
+            continue
+        try:
+            return max(0.0, float(value) * unit)
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            continue
+        if retry_at.tzinfo is not None:
+            return max(0.0, retry_at.timestamp() - time.time())
+
+    return None
+
+
+def _set_released(released: asyncio.Future) -> None:
+    if not released.done():
+        released.set_result(None)
+
+
+class RateLimitPolicy(HTTPPolicy):
+    """Policy that sends every attempt of a request through a :class:`RateLimiter`.
+
+    :param limiter: The limiter, it can be shared with other clients.
+    :type limiter: ~kuflow_rest.policies.RateLimiter
+    """
+
+    def __init__(self, limiter: RateLimiter) -> None:
+        super().__init__()
+        self.limiter = limiter
+
+    def send(self, request: PipelineRequest) -> PipelineResponse:
+        """Wait for the limiter and send the request.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :return: The PipelineResponse object.
+        :rtype: ~azure.core.pipeline.PipelineResponse
+        """
+        ticket = self.limiter.acquire()
+        response = None
+        try:
+            response = self.next.send(request)
+        finally:
+            self.limiter.release(ticket, response)
+
+        return response
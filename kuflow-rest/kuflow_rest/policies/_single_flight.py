@@ -0,0 +1,134 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import copy
+import threading
+from concurrent.futures import Future
+from typing import Any, Optional
+
+from azure.core.pipeline import PipelineRequest, PipelineResponse
+from azure.core.pipeline.policies import ContentDecodePolicy, HTTPPolicy
+
+
+_COALESCED_METHODS = frozenset(["GET", "HEAD"])
+
+# Headers that change the response of a read request, the request id header is unique for every request
+_KEY_HEADERS = ("accept", "accept-encoding", "range")
+
+
+def single_flight_key(request: PipelineRequest) -> Optional[tuple[Any, ...]]:
+    """Return the key that identifies the requests sharing one HTTP call, None if the request can not be shared.
+
+    Only read requests whose response is loaded in memory are shared, a streamed body can only be read once.
+
+    :param request: The PipelineRequest object
+    :type request: ~azure.core.pipeline.PipelineRequest
+    :return: The key of the request.
+    :rtype: Optional[tuple]
+    """
+    http_request = request.http_request
+    if http_request.method.upper() not in _COALESCED_METHODS or request.context.options.get("stream", False):
+        return None
+    headers = {name.lower(): value for name, value in http_request.headers.items()}
+
+    return (http_request.method.upper(), http_request.url, *(headers.get(name) for name in _KEY_HEADERS))
+
+
+def shared_response(request: PipelineRequest, response: PipelineResponse) -> PipelineResponse:
+    """Return the response of a shared HTTP call for one of the requests that waited for it.
+
+    :param request: The PipelineRequest object of the waiting request.
+    :type request: ~azure.core.pipeline.PipelineRequest
+    :param response: The PipelineResponse object of the shared call.
+    :type response: ~azure.core.pipeline.PipelineResponse
+    :return: The PipelineResponse object.
+    :rtype: ~azure.core.pipeline.PipelineResponse
+    """
+    # Error models are built from the JSON parsed by the content decode policy, that only ran for the shared call
+    deserialized_data = response.context.get(ContentDecodePolicy.CONTEXT_NAME)
+    if deserialized_data is not None:
+        request.context[ContentDecodePolicy.CONTEXT_NAME] = copy.deepcopy(deserialized_data)
+
+    return PipelineResponse(request.http_request, response.http_response, request.context)
+
+
+class SingleFlightPolicy(HTTPPolicy):
+    """Policy that shares one HTTP call between identical read requests that are in flight at the same time.
+
+    The first request of a key (a miss) is sent, the ones that arrive before it completes (hits) wait for it and get
+    the same HTTP response, or the same error. Every caller deserializes its own models from the response.
+
+    The policy is the first one of the pipeline, so the retries of the shared call are shared too.
+
+    :ivar int hits: Requests that were answered with the HTTP call of another request.
+    :ivar int misses: Requests that made an HTTP call.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._in_flight: dict[tuple[Any, ...], Future] = {}
+
+    def send(self, request: PipelineRequest) -> PipelineResponse:
+        """Send the request, or wait for the identical request that is in flight.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :return: The PipelineResponse object.
+        :rtype: ~azure.core.pipeline.PipelineResponse
+        """
+        key = single_flight_key(request)
+        if key is None:
+            return self.next.send(request)
+
+        with self._lock:
+            call = self._in_flight.get(key)
+            if call is None:
+                call = self._in_flight[key] = Future()
+                self.misses += 1
+                leader = True
+            else:
+                self.hits += 1
+                leader = False
+
+        if not leader:
+            return shared_response(request, call.result())
+
+        try:
+            response = self.next.send(request)
+        except BaseException as err:
+            self._complete(key)
+            call.set_exception(err)
+            raise
+        self._complete(key)
+        call.set_result(response)
+
+        return response
+
+    def _complete(self, key: tuple[Any, ...]) -> None:
+        # Requests that arrive from now on make their own HTTP call
+        with self._lock:
+            del self._in_flight[key]
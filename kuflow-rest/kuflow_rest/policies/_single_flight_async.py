@@ -0,0 +1,89 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import asyncio
+from typing import Any
+
+from azure.core.pipeline import PipelineRequest, PipelineResponse
+from azure.core.pipeline.policies import AsyncHTTPPolicy
+
+from ._single_flight import shared_response, single_flight_key
+
+
+class AsyncSingleFlightPolicy(AsyncHTTPPolicy):
+    """Async version of :class:`~kuflow_rest.policies.SingleFlightPolicy`.
+
+    When the task that sends the shared call is cancelled, the requests waiting for it send their own.
+
+    :ivar int hits: Requests that were answered with the HTTP call of another request.
+    :ivar int misses: Requests that made an HTTP call.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.hits = 0
+        self.misses = 0
+        self._in_flight: dict[tuple[Any, ...], asyncio.Future] = {}
+
+    async def send(self, request: PipelineRequest) -> PipelineResponse:
+        """Send the request, or wait for the identical request that is in flight.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :return: The PipelineResponse object.
+        :rtype: ~azure.core.pipeline.PipelineResponse
+        """
+        key = single_flight_key(request)
+        if key is None:
+            return await self.next.send(request)
+
+        call = self._in_flight.get(key)
+        if call is not None:
+            self.hits += 1
+            try:
+                response = await asyncio.shield(call)
+            except asyncio.CancelledError:
+                if not call.cancelled():
+                    raise
+                return await self.send(request)
+            return shared_response(request, response)
+
+        self.misses += 1
+        call = self._in_flight[key] = asyncio.get_running_loop().create_future()
+        try:
+            response = await self.next.send(request)
+        except asyncio.CancelledError:
+            call.cancel()
+            raise
+        except BaseException as err:
+            call.set_exception(err)
+            # Nobody may be waiting for the shared call
+            call.exception()
+            raise
+        else:
+            call.set_result(response)
+        finally:
+            del self._in_flight[key]
+
+        return response
@@ -22,19 +22,29 @@
 # SOFTWARE.
 #
 
+from ._json_backend import JsonBackend, get_json_backend
+from ._json_patch import generate_json_patch, select_json_patch
 from ._parser import (
+    find_kuflow_references,
     generate_kuflow_group_string,
     generate_kuflow_principal_string,
     parse_kuflow_file,
     parse_kuflow_group,
     parse_kuflow_principal,
+    parse_kuflow_references,
 )
 
 
 __all__ = [
+    "JsonBackend",
+    "find_kuflow_references",
+    "get_json_backend",
+    "generate_json_patch",
     "generate_kuflow_group_string",
     "generate_kuflow_principal_string",
     "parse_kuflow_file",
     "parse_kuflow_group",
     "parse_kuflow_principal",
+    "parse_kuflow_references",
+    "select_json_patch",
 ]
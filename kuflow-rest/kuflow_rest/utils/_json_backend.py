@@ -0,0 +1,186 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import codecs
+import json
+import logging
+import re
+from typing import Any, Optional, Union
+
+
+logger = logging.getLogger(__name__)
+
+
+class JsonBackend:
+    """JSON implementation used to read and write KuFlow payloads.
+
+    This default backend relies on the standard library ``json`` module. Subclass it to plug another implementation
+    and pass the instance wherever a ``json_backend`` is accepted.
+    """
+
+    name = "json"
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """Parse a JSON document.
+
+        :param data: The JSON document.
+        :type data: Union[str, bytes]
+        :return: The parsed value.
+        :rtype: Any
+        :raises ValueError: If the document is not valid JSON.
+        """
+        return json.loads(data)
+
+    def dumps(
+        self,
+        value: Any,
+        *,
+        encoder: Optional[type[json.JSONEncoder]] = None,
+        sort_keys: bool = False,
+        ensure_ascii: bool = True,
+    ) -> bytes:
+        """Write a value as compact JSON, ie: without spaces after separators.
+
+        :param value: The value to write.
+        :type value: Any
+        :keyword encoder: Encoder whose ``default`` method converts the values that are not natively supported.
+        :type encoder: Optional[type[json.JSONEncoder]]
+        :keyword sort_keys: Write the keys of the objects sorted.
+        :type sort_keys: bool
+        :keyword ensure_ascii: Escape the non ASCII characters, otherwise they are written as UTF-8.
+        :type ensure_ascii: bool
+        :return: The JSON document, UTF-8 encoded.
+        :rtype: bytes
+        :raises TypeError: If the value can not be written as JSON.
+        """
+        return json.dumps(
+            value, cls=encoder, separators=(",", ":"), sort_keys=sort_keys, ensure_ascii=ensure_ascii
+        ).encode()
+
+
+class OrjsonJsonBackend(JsonBackend):
+    """JSON backend built on `orjson <https://github.com/ijl/orjson>`_.
+
+    The output is byte to byte the one of the standard library: non ASCII characters are escaped, values that orjson
+    writes differently (floats in exponent notation, integers out of the 64 bits range, non string keys...) are
+    written with the standard library and the encoder ``default`` method also handles dates and dataclasses. The
+    exceptions are NaN and infinite floats, which are not valid JSON and that orjson writes as ``null``, and enums
+    that are neither ``str`` nor ``int``, that orjson writes by value instead of passing them to the encoder.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        try:
+            return self._orjson.loads(data)
+        except self._orjson.JSONDecodeError:
+            # Let the standard library decide, ie: it accepts NaN, big integers and byte order marks
+            return super().loads(data)
+
+    def dumps(
+        self,
+        value: Any,
+        *,
+        encoder: Optional[type[json.JSONEncoder]] = None,
+        sort_keys: bool = False,
+        ensure_ascii: bool = True,
+    ) -> bytes:
+        option = self._orjson.OPT_PASSTHROUGH_DATETIME | self._orjson.OPT_PASSTHROUGH_DATACLASS
+        if sort_keys:
+            option |= self._orjson.OPT_SORT_KEYS
+        try:
+            data = self._orjson.dumps(value, default=encoder().default if encoder else None, option=option)
+        except self._orjson.JSONEncodeError:
+            return super().dumps(value, encoder=encoder, sort_keys=sort_keys, ensure_ascii=ensure_ascii)
+
+        if _FLOAT_LEADING_ZEROS in data or _FLOAT_EXPONENT.search(data):
+            return super().dumps(value, encoder=encoder, sort_keys=sort_keys, ensure_ascii=ensure_ascii)
+        if ensure_ascii:
+            if not data.isascii():
+                data = data.decode().encode("ascii", "kuflow.json_escape")
+            if b"\x7f" in data:
+                data = data.replace(b"\x7f", b"\\u007f")
+
+        return data
+
+
+# orjson writes 1e16, 1e-7 and 0.00001 where the standard library writes 1e+16, 1e-07 and 1e-05. Both patterns
+# are searched without parsing the document, so they may match text inside strings too: these documents are just
+# written by the standard library. UUIDs never match, their hexadecimal groups are not followed by a separator.
+_FLOAT_EXPONENT = re.compile(rb"e[-0-9][0-9]*(?:[,\]}]|$)")
+_FLOAT_LEADING_ZEROS = b"0.0000"
+
+
+def _escape_non_ascii(error: UnicodeEncodeError) -> tuple[str, int]:
+    # Same escapes as json.dumps(ensure_ascii=True): lowercase, with surrogate pairs out of the BMP
+    escaped = []
+    for char in error.object[error.start : error.end]:
+        code = ord(char)
+        if code > 0xFFFF:
+            code -= 0x10000
+            escaped.append(f"\\u{0xD800 | (code >> 10):04x}\\u{0xDC00 | (code & 0x3FF):04x}")
+        else:
+            escaped.append(f"\\u{code:04x}")
+
+    return "".join(escaped), error.end
+
+
+codecs.register_error("kuflow.json_escape", _escape_non_ascii)
+
+
+_JSON_BACKENDS: dict[str, JsonBackend] = {"json": JsonBackend()}
+
+
+def get_json_backend(json_backend: Union[str, JsonBackend, None] = None) -> JsonBackend:
+    """Resolve a JSON backend setting.
+
+    :param json_backend: ``"json"`` (default) for the standard library, ``"orjson"`` or a JsonBackend instance. When
+                         the orjson package is not installed the standard library is used.
+    :type json_backend: Union[str, JsonBackend, None]
+    :return: The JSON backend.
+    :rtype: JsonBackend
+    :raises ValueError: If the backend is unknown.
+    """
+    if isinstance(json_backend, JsonBackend):
+        return json_backend
+
+    name = json_backend or "json"
+    if name in _JSON_BACKENDS:
+        return _JSON_BACKENDS[name]
+    if name != "orjson":
+        raise ValueError(f"Unknown JSON backend: {name}")
+
+    try:
+        backend = OrjsonJsonBackend()
+    except ImportError:
+        logger.warning("orjson is not installed, the json module is used instead")
+        backend = _JSON_BACKENDS["json"]
+    _JSON_BACKENDS[name] = backend
+
+    return backend
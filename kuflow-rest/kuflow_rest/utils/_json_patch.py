@@ -0,0 +1,177 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import json
+from collections import Counter
+from typing import Any, Optional
+
+from azure.core.serialization import NULL
+
+from ..models import JsonPatchOperation, JsonPatchOperationType, JsonValue
+from ._json_pointer import escape_token
+
+
+def generate_json_patch(source: Any, target: Any) -> list[JsonPatchOperation]:
+    """Generate the JSON patch (RFC 6902) that transforms a JSON document into another one.
+
+    Objects are compared member by member, so only the members that changed are added, removed or replaced. Array
+    elements that changed their position are moved instead of being removed and added again, and elements that
+    changed in place are patched in turn.
+
+    Values that are None are sent as JSON ``null``.
+
+    :param source: The current document, a :class:`~kuflow_rest.models.JsonValue` or its value.
+    :param target: The new document, a :class:`~kuflow_rest.models.JsonValue` or its value.
+    :return: The patch operations, an empty list when the documents are equal.
+    :rtype: list[~kuflow_rest.models.JsonPatchOperation]
+    """
+    operations: list[JsonPatchOperation] = []
+    _diff(_json_value(source), _json_value(target), "", operations)
+
+    return operations
+
+
+def select_json_patch(source: Any, target: Any, max_ratio: float = 1.0) -> Optional[list[JsonPatchOperation]]:
+    """Generate the JSON patch between two documents when it is smaller than the new document.
+
+    :param source: The current document, a :class:`~kuflow_rest.models.JsonValue` or its value. None when it is
+                   unknown.
+    :param target: The new document, a :class:`~kuflow_rest.models.JsonValue` or its value.
+    :param float max_ratio: Maximum size of the patch, in JSON, relative to the size of the new document. Default
+                            value is 1.
+    :return: The patch operations, or None when the whole document should be sent: the source is unknown, the patch
+             is empty or bigger, or it replaces the root of the document.
+    :rtype: Optional[list[~kuflow_rest.models.JsonPatchOperation]]
+    """
+    if source is None:
+        return None
+
+    target = _json_value(target)
+    json_patch = generate_json_patch(source, target)
+    if not json_patch or any(operation.path == "" for operation in json_patch):
+        return None
+
+    patch_size = len(_dumps([_operation_document(operation) for operation in json_patch]))
+    if patch_size > len(_dumps(target)) * max_ratio:
+        return None
+
+    return json_patch
+
+
+def to_json_value(document: Any) -> JsonValue:
+    """Return a document as the :class:`~kuflow_rest.models.JsonValue` of an update request.
+
+    :param document: A :class:`~kuflow_rest.models.JsonValue` or its value.
+    :return: A JsonValue with the value of the document.
+    :rtype: ~kuflow_rest.models.JsonValue
+    """
+    return JsonValue(value=_json_value(document))
+
+
+def _json_value(document: Any) -> Any:
+    return document.value if isinstance(document, JsonValue) else document
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def _key(value: Any) -> str:
+    # Canonical form of a value, that does not take True for 1 as ==
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def _operation_document(operation: JsonPatchOperation) -> dict[str, Any]:
+    document = {"op": operation.op, "path": operation.path}
+    if operation.from_property is not None:
+        document["from"] = operation.from_property
+    if operation.value is not None:
+        document["value"] = None if operation.value is NULL else operation.value
+
+    return document
+
+
+def _value_operation(op: JsonPatchOperationType, path: str, value: Any) -> JsonPatchOperation:
+    return JsonPatchOperation(op=op, path=path, value=NULL if value is None else value)
+
+
+def _diff(source: Any, target: Any, path: str, operations: list[JsonPatchOperation]) -> None:
+    if isinstance(source, dict) and isinstance(target, dict):
+        for key in source:
+            if key not in target:
+                operations.append(
+                    JsonPatchOperation(op=JsonPatchOperationType.REMOVE, path=f"{path}/{escape_token(key)}")
+                )
+        for key, value in target.items():
+            if key in source:
+                _diff(source[key], value, f"{path}/{escape_token(key)}", operations)
+            else:
+                operations.append(_value_operation(JsonPatchOperationType.ADD, f"{path}/{escape_token(key)}", value))
+    elif isinstance(source, list) and isinstance(target, list):
+        _diff_array(source, target, path, operations)
+    elif _key(source) != _key(target):
+        operations.append(_value_operation(JsonPatchOperationType.REPLACE, path, target))
+
+
+def _diff_array(source: list, target: list, path: str, operations: list[JsonPatchOperation]) -> None:
+    # The source is transformed into the target element by element, so the array always matches the patch applied
+    # so far: after the step of an index, the elements up to it are the ones of the target.
+    current = list(source)
+    current_keys = [_key(value) for value in current]
+    target_keys = [_key(value) for value in target]
+    pending = Counter(target_keys)
+
+    for index, (value, key) in enumerate(zip(target, target_keys)):
+        pending[key] -= 1
+        if index < len(current) and current_keys[index] == key:
+            continue
+
+        found = _index(current_keys, key, index + 1)
+        if found is not None:
+            operations.append(
+                JsonPatchOperation(
+                    op=JsonPatchOperationType.MOVE, from_property=f"{path}/{found}", path=f"{path}/{index}"
+                )
+            )
+            current.insert(index, current.pop(found))
+            current_keys.insert(index, current_keys.pop(found))
+        elif index < len(current) and pending[current_keys[index]] <= 0:
+            # The element is not used later on, it is patched into the new one
+            _diff(current[index], value, f"{path}/{index}", operations)
+            current[index] = value
+            current_keys[index] = key
+        else:
+            operations.append(_value_operation(JsonPatchOperationType.ADD, f"{path}/{index}", value))
+            current.insert(index, value)
+            current_keys.insert(index, key)
+
+    for index in range(len(current) - 1, len(target) - 1, -1):
+        operations.append(JsonPatchOperation(op=JsonPatchOperationType.REMOVE, path=f"{path}/{index}"))
+
+
+def _index(keys: list[str], key: str, start: int) -> Optional[int]:
+    try:
+        return keys.index(key, start)
+    except ValueError:
+        return None
@@ -22,112 +22,146 @@
 # SOFTWARE.
 #
 
+import functools
 import urllib.parse
-from typing import Optional, Union
+from collections.abc import Iterable
+from typing import Any, Optional, Union
 
 from ..models import KuFlowFile, KuFlowGroup, KuFlowPrincipal, PrincipalType
+from ._json_pointer import escape_token
+
+
+PARSER_CACHE_SIZE = 4096
+"""Parsed reference strings kept, per reference type, for the strings that repeat in task data."""
+
+KuFlowReference = Union[KuFlowFile, KuFlowPrincipal, KuFlowGroup]
+
+_FILE_PREFIX = "kuflow-file:"
+_PRINCIPAL_PREFIX = "kuflow-principal:"
+_GROUP_PREFIX = "kuflow-group:"
 
 
 def parse_kuflow_file(original: str) -> Optional[KuFlowFile]:
-    if original is None or not isinstance(original, str) or not original.startswith("kuflow-file:"):
+    if not isinstance(original, str) or not original.startswith(_FILE_PREFIX):
         return None
 
-    original_transformed = original.replace("kuflow-file:", "")
+    fields = _parse_file(original)
 
-    key_value_pairs = original_transformed.split(";")
+    return KuFlowFile(original, *fields) if fields is not None else None
 
-    key_value_map = {}
-    for pair in key_value_pairs:
-        if pair.find("=") is -1:
-            continue
 
-        key, value = pair.split("=")
-        if key is None or value is None:
-            return None
+def parse_kuflow_principal(original: str) -> Optional[KuFlowPrincipal]:
+    if not isinstance(original, str) or not original.startswith(_PRINCIPAL_PREFIX):
+        return None
 
-        key_value_map[key] = urllib.parse.unquote(value)
+    fields = _parse_principal_or_group(original, len(_PRINCIPAL_PREFIX))
 
-    uri: Optional[str] = str(key_value_map["uri"]) if "uri" in key_value_map else None
-    type: Optional[str] = str(key_value_map["type"]) if "type" in key_value_map else None
-    name: Optional[str] = str(key_value_map["name"]) if "name" in key_value_map else None
-    try:
-        size: Optional[int] = int(key_value_map["size"]) if "size" in key_value_map else None
-    except ValueError:
-        size = None
-    original_name: Optional[str] = str(key_value_map["original-name"]) if "original-name" in key_value_map else None
+    return KuFlowPrincipal(original, *fields) if fields is not None else None
 
-    if (uri is None) or (type is None) or (name is None) or (size is None):
+
+def parse_kuflow_group(original: str) -> Optional[KuFlowGroup]:
+    if not isinstance(original, str) or not original.startswith(_GROUP_PREFIX):
         return None
 
-    return KuFlowFile(original=original, uri=uri, type=type, name=name, size=size, original_name=original_name)
+    fields = _parse_principal_or_group(original, len(_GROUP_PREFIX))
 
+    return KuFlowGroup(original, *fields) if fields is not None else None
 
-def parse_kuflow_principal(original: str) -> Optional[KuFlowPrincipal]:
-    if original is None or not isinstance(original, str) or not original.startswith("kuflow-principal:"):
-        return None
 
-    original_transformed = original.replace("kuflow-principal:", "")
+def parse_kuflow_references(values: Iterable[Any]) -> list[Optional[KuFlowReference]]:
+    """Parse many ``kuflow-file:``, ``kuflow-principal:`` and ``kuflow-group:`` references at once.
 
-    key_value_pairs = original_transformed.split(";")
+    :param values: The values to parse, of any type.
+    :return: The references, in the order of the values, None for the values that are not valid references.
+    :rtype: list[Optional[Union[KuFlowFile, KuFlowPrincipal, KuFlowGroup]]]
+    """
+    return [_parse_reference(value) if isinstance(value, str) else None for value in values]
 
-    key_value_map = {}
-    for pair in key_value_pairs:
-        if pair.find("=") is -1:
-            continue
 
-        key, value = pair.split("=")
-        if key is None or value is None:
-            return None
+def find_kuflow_references(data: Any) -> dict[str, KuFlowReference]:
+    """Find the references of a JSON document, ie: the task data of a form.
+
+    :param data: The JSON document.
+    :return: The references, by the JSON pointer of their values, ie: ``/documents/0``.
+    :rtype: dict[str, Union[KuFlowFile, KuFlowPrincipal, KuFlowGroup]]
+    """
+    references: dict[str, KuFlowReference] = {}
+    pending = [("", data)]
+    while pending:
+        pointer, value = pending.pop()
+        if isinstance(value, str):
+            reference = _parse_reference(value)
+            if reference is not None:
+                references[pointer] = reference
+        elif isinstance(value, dict):
+            pending.extend((f"{pointer}/{escape_token(str(key))}", item) for key, item in value.items())
+        elif isinstance(value, list):
+            pending.extend((f"{pointer}/{index}", item) for index, item in enumerate(value))
 
-        key_value_map[key] = urllib.parse.unquote(value)
+    return references
 
-    id: Optional[str] = str(key_value_map["id"]) if "id" in key_value_map else None
-    type: Optional[PrincipalType] = str(key_value_map["type"]) if "type" in key_value_map else None
-    name: Optional[str] = str(key_value_map["name"]) if "name" in key_value_map else None
 
-    if (id is None) or (type is None) or (name is None):
+def _parse_reference(value: str) -> Optional[KuFlowReference]:
+    if not value.startswith("kuflow-"):
         return None
+    if value.startswith(_FILE_PREFIX):
+        return parse_kuflow_file(value)
+    if value.startswith(_PRINCIPAL_PREFIX):
+        return parse_kuflow_principal(value)
+    if value.startswith(_GROUP_PREFIX):
+        return parse_kuflow_group(value)
 
-    return KuFlowPrincipal(
-        original=original,
-        id=id,
-        type=type,
-        name=name,
-    )
+    return None
 
 
-def parse_kuflow_group(original: str) -> Optional[KuFlowGroup]:
-    if original is None or not isinstance(original, str) or not original.startswith("kuflow-group:"):
+@functools.lru_cache(maxsize=PARSER_CACHE_SIZE)
+def _parse_file(original: str) -> Optional[tuple[str, str, str, int, Optional[str]]]:
+    fields = _parse_fields(original, len(_FILE_PREFIX))
+    if fields is None:
         return None
 
-    original_transformed = original.replace("kuflow-group:", "")
+    uri = fields.get("uri")
+    type = fields.get("type")
+    name = fields.get("name")
+    size = fields.get("size")
+    if uri is None or type is None or name is None or size is None:
+        return None
+    try:
+        return uri, type, name, int(size), fields.get("original-name")
+    except ValueError:
+        return None
 
-    key_value_pairs = original_transformed.split(";")
 
-    key_value_map = {}
-    for pair in key_value_pairs:
-        if pair.find("=") is -1:
-            continue
+@functools.lru_cache(maxsize=PARSER_CACHE_SIZE)
+def _parse_principal_or_group(original: str, prefix_length: int) -> Optional[tuple[str, str, str]]:
+    fields = _parse_fields(original, prefix_length)
+    if fields is None:
+        return None
 
-        key, value = pair.split("=")
-        if key is None or value is None:
-            return None
+    id = fields.get("id")
+    type = fields.get("type")
+    name = fields.get("name")
+    if id is None or type is None or name is None:
+        return None
 
-        key_value_map[key] = urllib.parse.unquote(value)
+    return id, type, name
 
-    id: Optional[str] = str(key_value_map["id"]) if "id" in key_value_map else None
-    type: Optional[str] = str(key_value_map["type"]) if "type" in key_value_map else None
-    name: Optional[str] = str(key_value_map["name"]) if "name" in key_value_map else None
 
-    if (id is None) or (type is None) or (name is None):
-        return None
+def _parse_fields(original: str, prefix_length: int) -> Optional[dict[str, str]]:
+    """Parse the ``key=value;`` pairs that follow the prefix of a reference, None when a pair is not valid.
+
+    Pairs without ``=`` are ignored, values are URL decoded.
+    """
+    fields = {}
+    for pair in original[prefix_length:].split(";"):
+        key, separator, value = pair.partition("=")
+        if not separator:
+            continue
+        if "=" in value:
+            return None
+        fields[key] = urllib.parse.unquote(value) if "%" in value else value
 
-    return KuFlowGroup(
-        original=original,
-        id=id,
-        type=type,
-        name=name,
-    )
+    return fields
 
 
 def generate_kuflow_principal_string(id: str, principal_type: Union[str, PrincipalType], name: Optional[str]) -> str:
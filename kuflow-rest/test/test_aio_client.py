@@ -0,0 +1,133 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import asyncio
+import io
+import time
+import unittest
+
+from aiohttp import web
+
+from kuflow_rest import KuBotTokenCredential, models
+from kuflow_rest.aio import KuFlowRestClient
+
+from ._stub_server import StubServer, page_metadata
+
+
+PROCESS_ID = "11111111-1111-1111-1111-111111111111"
+
+
+def process_json(**overrides) -> dict:
+    return {
+        "id": PROCESS_ID,
+        "tenantId": "22222222-2222-2222-2222-222222222222",
+        "state": "RUNNING",
+        "processDefinitionRef": {
+            "id": "33333333-3333-3333-3333-333333333333",
+            "version": "44444444-4444-4444-4444-444444444444",
+            "code": "CODE",
+        },
+        **overrides,
+    }
+
+
+class AioKuFlowRestClientTest(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        async def find_processes(request: web.Request):
+            return web.json_response({"metadata": page_metadata(), "content": []})
+
+        async def retrieve_process(request: web.Request):
+            await asyncio.sleep(0.2)
+            return web.json_response(process_json(id=request.match_info["id"]))
+
+        async def upload_process_document(request: web.Request):
+            content = await request.read()
+            return web.json_response({"documentUri": f"kf:{request.query['fileName']}:{len(content)}"})
+
+        cls.server = StubServer()
+        cls.server.route("GET", "/processes", find_processes)
+        cls.server.route("GET", "/processes/{id}", retrieve_process)
+        cls.server.route("POST", "/processes/{id}/~actions/upload-document", upload_process_document)
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.requests.clear()
+
+    def create_client(self, **kwargs) -> KuFlowRestClient:
+        return KuFlowRestClient(
+            client_id="CLIENT_ID",
+            client_secret="CLIENT_SECRET",
+            endpoint=self.server.endpoint,
+            allow_insecure_connection=True,
+            **kwargs,
+        )
+
+    async def test_find_processes_coerces_str_filters(self):
+        async with self.create_client() as client:
+            page = await client.process.find_processes(tenant_id="tenant-1", sort="createdAt,desc")
+
+        self.assertIsInstance(page, models.ProcessPage)
+        request = self.server.requests[0]
+        self.assertEqual(request.query.getall("tenantId"), ["tenant-1"])
+        self.assertEqual(request.query.getall("sort"), ["createdAt,desc"])
+        self.assertTrue(request.headers["Authorization"].startswith("Bearer "))
+
+    async def test_sync_credential_is_accepted(self):
+        client = KuFlowRestClient(
+            credential=KuBotTokenCredential("TOKEN", 0),
+            endpoint=self.server.endpoint,
+            allow_insecure_connection=True,
+        )
+        async with client:
+            process = await client.process.retrieve_process(PROCESS_ID)
+
+        self.assertEqual(process.id, PROCESS_ID)
+        self.assertEqual(self.server.requests[0].headers["Authorization"], "Bearer TOKEN")
+
+    async def test_upload_document(self):
+        document = models.Document(file_name="hello.txt", content_type="text/plain", file_content=io.BytesIO(b"hello"))
+
+        async with self.create_client() as client:
+            document_reference = await client.process.upload_process_document(PROCESS_ID, document)
+
+        self.assertEqual(document_reference.document_uri, "kf:hello.txt:5")
+
+    async def test_requests_are_in_flight_concurrently(self):
+        async with self.create_client(connection_pool_size=50) as client:
+            start = time.monotonic()
+            processes = await asyncio.gather(*[client.process.retrieve_process(str(i)) for i in range(20)])
+            elapsed = time.monotonic() - start
+
+        self.assertEqual([process.id for process in processes], [str(i) for i in range(20)])
+        # 20 sequential calls would take at least 4 seconds
+        self.assertLess(elapsed, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
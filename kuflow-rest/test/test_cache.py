@@ -0,0 +1,149 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import time
+import unittest
+
+from aiohttp import web
+from azure.core.rest import HttpRequest
+
+from kuflow_rest import KuFlowRestClient
+from kuflow_rest.aio import KuFlowRestClient as AsyncKuFlowRestClient
+from kuflow_rest.policies import ResponseCache
+
+from ._stub_server import StubServer
+
+
+def principal_json(principal_id: str) -> dict:
+    return {"id": principal_id, "type": "USER", "name": f"User {principal_id}"}
+
+
+class ResponseCacheTest(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        async def retrieve_principal(request: web.Request):
+            etag = f'"{request.match_info["id"]}-v1"'
+            if request.headers.get("If-None-Match") == etag:
+                return web.Response(status=304, headers={"ETag": etag})
+            return web.json_response(principal_json(request.match_info["id"]), headers={"ETag": etag})
+
+        async def retrieve_tenant(request: web.Request):
+            return web.json_response({"id": request.match_info["id"], "name": "Tenant", "plan": "FREE"})
+
+        async def delete_principal(request: web.Request):
+            return web.Response(status=204)
+
+        cls.server = StubServer()
+        cls.server.route("GET", "/principals/{id}", retrieve_principal)
+        cls.server.route("DELETE", "/principals/{id}", delete_principal)
+        cls.server.route("GET", "/tenants/{id}", retrieve_tenant)
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.requests.clear()
+
+    def create_client(self, client_class=KuFlowRestClient, **kwargs):
+        return client_class(
+            client_id="CLIENT_ID",
+            client_secret="CLIENT_SECRET",
+            endpoint=self.server.endpoint,
+            allow_insecure_connection=True,
+            **kwargs,
+        )
+
+    def test_responses_are_cached(self):
+        client = self.create_client(cache=True)
+
+        first = client.principal.retrieve_principal("1")
+        second = client.principal.retrieve_principal("1")
+        client.principal.retrieve_principal("2")
+
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual((client.cache.hits, client.cache.misses), (1, 2))
+        self.assertEqual(second, first)
+        self.assertIsNot(second, first)
+
+    def test_expired_responses_are_revalidated(self):
+        client = self.create_client(cache=ResponseCache(ttl=0.05))
+
+        client.principal.retrieve_principal("1")
+        time.sleep(0.1)
+        principal = client.principal.retrieve_principal("1")
+        client.principal.retrieve_principal("1")
+
+        self.assertEqual(principal.name, "User 1")
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual(self.server.requests[1].headers["If-None-Match"], '"1-v1"')
+        self.assertEqual((client.cache.hits, client.cache.revalidations, client.cache.misses), (1, 1, 1))
+
+    def test_operation_ttl_and_least_recently_used_eviction(self):
+        client = self.create_client(cache=ResponseCache(max_size=2, operations={"retrieve_principal": None}))
+
+        for principal_id in ["1", "2", "1", "3", "1", "2"]:
+            client.principal.retrieve_principal(principal_id)
+        client.tenant.retrieve_tenant("1")
+        client.tenant.retrieve_tenant("1")
+
+        principal_paths = [request.path.rsplit("/", 1)[-1] for request in self.server.requests[:-2]]
+        self.assertEqual(principal_paths, ["1", "2", "3", "2"])
+        self.assertEqual((client.cache.evictions, len(client.cache)), (2, 2))
+
+    def test_invalidation(self):
+        client = self.create_client(cache=True)
+        client.principal.retrieve_principal("1")
+        client.principal.retrieve_principal("2")
+
+        self.assertEqual(client.cache.invalidate("retrieve_principal", "1"), 1)
+        client.principal.retrieve_principal("1")
+        client.principal.retrieve_principal("2")
+        self.assertEqual(len(self.server.requests), 3)
+
+        client._kuflow_client.send_request(HttpRequest("DELETE", f"{self.server.endpoint}/v2024-06-14/principals/2"))
+        client.principal.retrieve_principal("2")
+        self.assertEqual(len(self.server.requests), 5)
+
+        client.cache.clear()
+        self.assertEqual(len(client.cache), 0)
+
+    def test_unknown_operations_are_rejected(self):
+        with self.assertRaises(ValueError):
+            ResponseCache(operations={"retrieve_process": None})
+
+    async def test_async_responses_are_cached(self):
+        cache = ResponseCache()
+        async with self.create_client(AsyncKuFlowRestClient, cache=cache) as client:
+            first = await client.principal.retrieve_principal("1")
+            second = await client.principal.retrieve_principal("1")
+
+        self.assertEqual(second, first)
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
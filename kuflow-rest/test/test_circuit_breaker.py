@@ -0,0 +1,160 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import time
+import unittest
+
+from aiohttp import web
+from azure.core.exceptions import HttpResponseError
+
+from kuflow_rest import KuFlowRestClient
+from kuflow_rest.aio import KuFlowRestClient as AsyncKuFlowRestClient
+from kuflow_rest.policies import CircuitBreaker, CircuitBreakerOpenError, CircuitState
+
+from ._stub_server import StubServer
+
+
+PROCESS_ID = "11111111-1111-1111-1111-111111111111"
+
+RETRIEVE_PROCESS = "GET /v2024-06-14/processes/{id}"
+
+
+class CircuitBreakerTest(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.status = 200
+
+        async def retrieve_process(request: web.Request):
+            if cls.status != 200:
+                return web.json_response({"status": cls.status, "message": "Error", "errors": []}, status=cls.status)
+            return web.json_response(
+                {
+                    "id": request.match_info["id"],
+                    "tenantId": "22222222-2222-2222-2222-222222222222",
+                    "state": "RUNNING",
+                    "processDefinitionRef": {"id": PROCESS_ID, "version": "1", "code": "CODE"},
+                }
+            )
+
+        async def retrieve_tenant(request: web.Request):
+            return web.json_response({"id": request.match_info["id"], "name": "Tenant", "plan": "FREE"})
+
+        cls.server = StubServer()
+        cls.server.route("GET", "/processes/{id}", retrieve_process)
+        cls.server.route("GET", "/tenants/{id}", retrieve_tenant)
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        type(self).status = 200
+        self.server.requests.clear()
+
+    def create_client(self, client_class=KuFlowRestClient, **kwargs):
+        return client_class(
+            client_id="CLIENT_ID",
+            client_secret="CLIENT_SECRET",
+            endpoint=self.server.endpoint,
+            allow_insecure_connection=True,
+            **kwargs,
+        )
+
+    def test_breaker_opens_after_consecutive_failures(self):
+        type(self).status = 501
+        client = self.create_client(circuit_breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60))
+
+        for _ in range(2):
+            with self.assertRaises(HttpResponseError):
+                client.process.retrieve_process(PROCESS_ID)
+        self.assertEqual(client.circuit_breaker.state(RETRIEVE_PROCESS), CircuitState.CLOSED)
+
+        type(self).status = 500
+        for _ in range(2):
+            with self.assertRaises(HttpResponseError):
+                client.process.retrieve_process(PROCESS_ID, retry_total=0)
+        requests = len(self.server.requests)
+
+        with self.assertRaises(CircuitBreakerOpenError) as context:
+            client.process.retrieve_process("33333333-3333-3333-3333-333333333333")
+
+        self.assertEqual(context.exception.key, RETRIEVE_PROCESS)
+        self.assertGreater(context.exception.retry_after, 59)
+        self.assertEqual(len(self.server.requests), requests)
+        self.assertEqual(client.circuit_breaker.states(), {RETRIEVE_PROCESS: CircuitState.OPEN})
+        # Other operations are not affected
+        self.assertEqual(client.tenant.retrieve_tenant("1").name, "Tenant")
+        self.assertEqual(
+            client.circuit_breaker.metrics(), {"closed": 1, "open": 1, "half_open": 0, "opened": 1, "rejected": 1}
+        )
+
+    def test_breaker_closes_after_a_successful_probe(self):
+        type(self).status = 503
+        client = self.create_client(circuit_breaker=CircuitBreaker(failure_threshold=1, reset_timeout=0.1))
+
+        with self.assertRaises(HttpResponseError):
+            client.process.retrieve_process(PROCESS_ID, retry_total=0)
+        with self.assertRaises(CircuitBreakerOpenError):
+            client.process.retrieve_process(PROCESS_ID)
+
+        time.sleep(0.1)
+        self.assertEqual(client.circuit_breaker.state(RETRIEVE_PROCESS), CircuitState.HALF_OPEN)
+        with self.assertRaises(HttpResponseError):
+            client.process.retrieve_process(PROCESS_ID, retry_total=0)
+        self.assertEqual(client.circuit_breaker.state(RETRIEVE_PROCESS), CircuitState.OPEN)
+
+        time.sleep(0.1)
+        type(self).status = 200
+        client.process.retrieve_process(PROCESS_ID)
+
+        self.assertEqual(client.circuit_breaker.state(RETRIEVE_PROCESS), CircuitState.CLOSED)
+        self.assertEqual(client.circuit_breaker.opened, 2)
+
+    def test_breaker_per_endpoint(self):
+        breaker = CircuitBreaker(failure_threshold=1, per_operation=False)
+        type(self).status = 500
+        client = self.create_client(circuit_breaker=breaker)
+
+        with self.assertRaises(HttpResponseError):
+            client.process.retrieve_process(PROCESS_ID, retry_total=0)
+        with self.assertRaises(CircuitBreakerOpenError):
+            client.tenant.retrieve_tenant("1")
+
+        breaker.reset()
+        self.assertEqual(client.tenant.retrieve_tenant("1").name, "Tenant")
+
+    async def test_async_breaker_shared_with_a_sync_client(self):
+        breaker = CircuitBreaker(failure_threshold=1)
+        type(self).status = 500
+        with self.assertRaises(HttpResponseError):
+            self.create_client(circuit_breaker=breaker).process.retrieve_process(PROCESS_ID, retry_total=0)
+
+        async with self.create_client(AsyncKuFlowRestClient, circuit_breaker=breaker) as client:
+            with self.assertRaises(CircuitBreakerOpenError):
+                await client.process.retrieve_process(PROCESS_ID)
+
+
+if __name__ == "__main__":
+    unittest.main()
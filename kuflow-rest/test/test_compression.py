@@ -0,0 +1,161 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import gzip
+import importlib.util
+import json
+import unittest
+
+from aiohttp import web
+from azure.core.pipeline.transport import RequestsTransport
+
+from kuflow_rest import KuFlowRestClient, SharedTransport, models
+from kuflow_rest.aio import KuFlowRestClient as AsyncKuFlowRestClient
+from kuflow_rest.aio._transport import PooledAioHttpTransport
+from kuflow_rest.policies import CompressionPolicy, accept_encoding
+
+from ._stub_server import StubServer
+from .test_serialization import process_item
+
+
+PROCESS_ITEM_ID = "00000000-0000-0000-0000-000000000001"
+
+
+def task_data_params(fields: int) -> models.ProcessItemTaskDataUpdateParams:
+    value = {f"field{index}": f"value of the field {index}" for index in range(fields)}
+
+    return models.ProcessItemTaskDataUpdateParams(data=models.JsonValue(value=value))
+
+
+class CompressionTest(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.bodies = []
+
+        async def update_process_item_task_data(request: web.Request):
+            # aiohttp decodes the request body
+            cls.bodies.append(await request.json())
+            return web.json_response(process_item(1))
+
+        async def find_process_items(request: web.Request):
+            page = {
+                "metadata": {"size": 100, "page": 0, "totalElements": 100, "totalPages": 1},
+                "content": [process_item(index) for index in range(100)],
+            }
+            body = json.dumps(page).encode()
+            headers = {"Content-Type": "application/json"}
+            if "gzip" in request.headers.get("Accept-Encoding", ""):
+                body = gzip.compress(body)
+                headers["Content-Encoding"] = "gzip"
+            return web.Response(body=body, headers=headers)
+
+        cls.server = StubServer()
+        cls.server.route("PUT", "/process-items/{id}/task/data", update_process_item_task_data)
+        cls.server.route("GET", "/process-items", find_process_items)
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.requests.clear()
+        self.bodies.clear()
+
+    def create_client(self, client_class=KuFlowRestClient, **kwargs):
+        return client_class(
+            client_id="CLIENT_ID",
+            client_secret="CLIENT_SECRET",
+            endpoint=self.server.endpoint,
+            allow_insecure_connection=True,
+            **kwargs,
+        )
+
+    def test_large_body_is_compressed(self):
+        client = self.create_client(compression=True)
+
+        client.process_item.update_process_item_task_data(PROCESS_ITEM_ID, task_data_params(200))
+
+        request = self.server.requests[0]
+        self.assertEqual(request.headers["Content-Encoding"], "gzip")
+        self.assertEqual(int(request.headers["Content-Length"]), client.compression_policy.bytes_out)
+        self.assertEqual(self.bodies[0]["data"]["value"]["field199"], "value of the field 199")
+        policy = client.compression_policy
+        self.assertEqual(policy.compressed, 1)
+        self.assertLess(policy.bytes_out, policy.bytes_in / 4)
+
+    def test_small_body_is_not_compressed(self):
+        client = self.create_client(compression="deflate", compression_threshold=4096)
+
+        client.process_item.update_process_item_task_data(PROCESS_ITEM_ID, task_data_params(2))
+
+        self.assertNotIn("Content-Encoding", self.server.requests[0].headers)
+        self.assertEqual(self.bodies[0]["data"]["value"]["field1"], "value of the field 1")
+        self.assertEqual(client.compression_policy.compressed, 0)
+
+    def test_compressed_response_is_decoded(self):
+        client = self.create_client(compression=True)
+
+        page = client.process_item.find_process_items(size=100)
+
+        self.assertIn("gzip", self.server.requests[0].headers["Accept-Encoding"])
+        self.assertEqual(len(page.content), 100)
+        self.assertEqual(page.content[99].id, "00000000-0000-0000-0000-000000000099")
+
+    def test_no_compression_by_default(self):
+        client = self.create_client()
+
+        client.process_item.update_process_item_task_data(PROCESS_ITEM_ID, task_data_params(200))
+
+        self.assertNotIn("Content-Encoding", self.server.requests[0].headers)
+        self.assertIsNone(client.compression_policy)
+
+    async def test_async_compression(self):
+        async with self.create_client(AsyncKuFlowRestClient, compression=True) as client:
+            await client.process_item.update_process_item_task_data(PROCESS_ITEM_ID, task_data_params(200))
+            page = await client.process_item.find_process_items(size=100)
+
+        self.assertEqual(self.server.requests[0].headers["Content-Encoding"], "gzip")
+        self.assertEqual(self.bodies[0]["data"]["value"]["field199"], "value of the field 199")
+        self.assertEqual(self.server.requests[1].headers["Accept-Encoding"], "gzip, deflate")
+        self.assertEqual(len(page.content), 100)
+
+    def test_accept_encoding_of_the_transport(self):
+        self.assertIn("gzip", accept_encoding(SharedTransport(RequestsTransport())))
+        self.assertEqual(accept_encoding(PooledAioHttpTransport()), "gzip, deflate")
+
+    def test_unknown_encoding(self):
+        with self.assertRaises(ValueError):
+            CompressionPolicy(encoding="lzma")
+
+    @unittest.skipIf(importlib.util.find_spec("brotli") is not None, "brotli is installed")
+    def test_missing_encoding_package_falls_back_to_gzip(self):
+        with self.assertLogs("kuflow_rest.policies._compression", "WARNING"):
+            policy = CompressionPolicy(encoding="br")
+
+        self.assertEqual(policy.encoding, "gzip")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import asyncio
+import time
+import unittest
+
+from aiohttp import web
+from azure.core.exceptions import ServiceResponseError
+from azure.core.pipeline.transport import RequestsTransport
+
+from kuflow_rest import KuFlowRestClient, SharedTransport
+from kuflow_rest.aio import KuFlowRestClient as AsyncKuFlowRestClient
+from kuflow_rest.policies import DeadlineExceededError, deadline, remaining_time
+
+from ._stub_server import StubServer
+
+
+class RecordingTransport(RequestsTransport):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.options = []
+
+    def send(self, request, **kwargs):
+        self.options.append(kwargs)
+        return super().send(request, **kwargs)
+
+
+class DeadlineTest(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        async def retrieve_tenant(request: web.Request):
+            if request.match_info["id"] == "slow":
+                await asyncio.sleep(2)
+            return web.json_response({"id": request.match_info["id"], "name": "Tenant", "plan": "FREE"})
+
+        cls.server = StubServer()
+        cls.server.route("GET", "/tenants/{id}", retrieve_tenant)
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.requests.clear()
+
+    def create_client(self, client_class=KuFlowRestClient, **kwargs):
+        return client_class(
+            client_id="CLIENT_ID",
+            client_secret="CLIENT_SECRET",
+            endpoint=self.server.endpoint,
+            allow_insecure_connection=True,
+            **kwargs,
+        )
+
+    def test_nested_deadline_can_only_be_earlier(self):
+        self.assertIsNone(remaining_time())
+
+        with deadline(10):
+            with deadline(60):
+                self.assertLessEqual(remaining_time(), 10)
+            with deadline(1):
+                self.assertLessEqual(remaining_time(), 1)
+            with deadline(None):
+                self.assertGreater(remaining_time(), 1)
+
+        self.assertIsNone(remaining_time())
+
+    def test_timeouts_are_limited_by_the_deadline(self):
+        transport = RecordingTransport()
+        client = self.create_client(transport=SharedTransport(transport), read_timeout=30)
+
+        client.tenant.retrieve_tenant("1")
+        with deadline(5):
+            client.tenant.retrieve_tenant("2")
+
+        self.assertEqual(transport.options[0]["read_timeout"], 30)
+        self.assertLessEqual(transport.options[1]["read_timeout"], 5)
+        self.assertLessEqual(transport.options[1]["connection_timeout"], 5)
+
+    def test_slow_call_is_aborted_at_the_deadline(self):
+        client = self.create_client()
+
+        start = time.monotonic()
+        with deadline(0.3), self.assertRaises(ServiceResponseError):
+            client.tenant.retrieve_tenant("slow")
+
+        self.assertLess(time.monotonic() - start, 1.5)
+
+    def test_expired_deadline_fails_without_request(self):
+        client = self.create_client()
+
+        with deadline(0), self.assertRaises(DeadlineExceededError):
+            client.tenant.retrieve_tenant("1")
+
+        self.assertEqual(self.server.requests, [])
+
+    async def test_async_slow_call_is_aborted_at_the_deadline(self):
+        async with self.create_client(AsyncKuFlowRestClient) as client:
+            start = time.monotonic()
+            with deadline(0.3), self.assertRaises(ServiceResponseError):
+                await client.tenant.retrieve_tenant("slow")
+
+        self.assertLess(time.monotonic() - start, 1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,286 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from aiohttp import web
+from azure.core.exceptions import IncompleteReadError, ResourceNotFoundError
+
+from kuflow_rest import KuFlowRestClient
+from kuflow_rest._download import FileDownloader, parse_content_range
+from kuflow_rest.aio import KuFlowRestClient as AsyncKuFlowRestClient
+from kuflow_rest.policies import deadline, remaining_time
+
+from ._stub_server import StubServer
+
+
+PROCESS_ID = "00000000-0000-0000-0000-000000000001"
+ROBOT_ID = "00000000-0000-0000-0000-000000000002"
+CONTENT = os.urandom(1000_000)
+DOCUMENT_URI = f"kuflow-file:uri=x;type=application/octet-stream;name=document.bin;size={len(CONTENT)};"
+ETAG = '"v2"'
+
+
+class FileDownloadTest(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ranges = []
+        cls.if_ranges = []
+        cls.drops = []
+
+        async def download_process_document(request: web.Request):
+            if request.query["documentUri"] == "missing":
+                return web.json_response({"status": 404, "message": "Not found"}, status=404)
+
+            range_header = request.headers.get("Range")
+            cls.ranges.append(range_header)
+            cls.if_ranges.append(request.headers.get("If-Range"))
+            if range_header is None or request.headers.get("If-Range", ETAG) != ETAG:
+                return web.Response(body=CONTENT, content_type="application/octet-stream", headers={"ETag": ETAG})
+
+            start, _, end = range_header.removeprefix("bytes=").partition("-")
+            start, end = int(start), min(int(end) if end else len(CONTENT) - 1, len(CONTENT) - 1)
+            if start >= len(CONTENT):
+                return web.Response(status=416, headers={"Content-Range": f"bytes */{len(CONTENT)}"})
+
+            response = web.StreamResponse(
+                status=206,
+                headers={
+                    "Content-Type": "application/octet-stream",
+                    "Content-Range": f"bytes {start}-{end}/{len(CONTENT)}",
+                    "Content-Length": str(end - start + 1),
+                    "ETag": ETAG,
+                },
+            )
+            await response.prepare(request)
+            if cls.drops and start == cls.drops[0]:
+                # The connection drops in the middle of the range
+                cls.drops.pop(0)
+                await response.write(CONTENT[start : start + (end - start + 1) // 2])
+                request.transport.close()
+                return response
+            await response.write(CONTENT[start : end + 1])
+            await response.write_eof()
+            return response
+
+        async def download_robot_source_code(request: web.Request):
+            # Range requests are not supported
+            cls.ranges.append(request.headers.get("Range"))
+            return web.Response(body=CONTENT, content_type="application/octet-stream")
+
+        cls.server = StubServer()
+        cls.server.route("GET", "/processes/{id}/~actions/download-document", download_process_document)
+        cls.server.route("GET", "/robots/{id}/~actions/download-source-code", download_robot_source_code)
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.ranges.clear()
+        self.if_ranges.clear()
+        self.drops.clear()
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "document.bin")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def create_client(self, client_class=KuFlowRestClient, **kwargs):
+        return client_class(
+            client_id="CLIENT_ID",
+            client_secret="CLIENT_SECRET",
+            endpoint=self.server.endpoint,
+            allow_insecure_connection=True,
+            **kwargs,
+        )
+
+    def write_partial_download(self, content, validator=ETAG):
+        with open(self.path + ".part", "wb") as file:
+            file.write(content)
+        if validator is not None:
+            with open(self.path + ".part.validator", "w") as file:
+                file.write(validator)
+
+    def assert_downloaded(self):
+        with open(self.path, "rb") as file:
+            self.assertEqual(file.read(), CONTENT)
+        self.assertFalse(os.path.exists(self.path + ".part"))
+        self.assertFalse(os.path.exists(self.path + ".part.validator"))
+
+    def test_parse_content_range(self):
+        self.assertEqual(parse_content_range("bytes 0-99/1000"), (0, 99, 1000))
+        self.assertEqual(parse_content_range("bytes 100-199/*"), (100, 199, None))
+        self.assertIsNone(parse_content_range("bytes */1000"))
+        self.assertIsNone(parse_content_range(None))
+
+    def test_download_in_parallel_parts(self):
+        client = self.create_client()
+
+        size = client.process.download_process_document_to_file(
+            PROCESS_ID, self.path, document_uri=DOCUMENT_URI, part_size=300_000, chunk_size=64 * 1024
+        )
+
+        self.assertEqual(size, len(CONTENT))
+        self.assert_downloaded()
+        self.assertCountEqual(
+            self.ranges, ["bytes=0-299999", "bytes=300000-599999", "bytes=600000-899999", "bytes=900000-999999"]
+        )
+        # The parts after the first one are checked to be of the same file
+        self.assertCountEqual(self.if_ranges, [None, ETAG, ETAG, ETAG])
+
+    def test_download_parts_with_the_deadline(self):
+        client = self.create_client()
+        remaining = []
+        send = FileDownloader._send
+
+        def record_send(downloader, part):
+            remaining.append(remaining_time())
+            return send(downloader, part)
+
+        with mock.patch.object(FileDownloader, "_send", record_send), deadline(60):
+            client.process.download_process_document_to_file(
+                PROCESS_ID, self.path, document_uri=DOCUMENT_URI, part_size=300_000
+            )
+
+        self.assert_downloaded()
+        self.assertEqual(len(remaining), 4)
+        self.assertTrue(all(value is not None and value <= 60 for value in remaining), remaining)
+
+    def test_download_in_one_request(self):
+        client = self.create_client()
+
+        client.process.download_process_document_to_file(
+            PROCESS_ID, self.path, document_uri=DOCUMENT_URI, max_concurrency=1
+        )
+
+        self.assert_downloaded()
+        self.assertEqual(self.ranges, [None])
+
+    def test_resume_partial_download(self):
+        client = self.create_client()
+        self.write_partial_download(CONTENT[:400_000])
+
+        client.process.download_process_document_to_file(
+            PROCESS_ID, self.path, document_uri=DOCUMENT_URI, part_size=400_000
+        )
+
+        self.assert_downloaded()
+        self.assertCountEqual(self.ranges, ["bytes=400000-799999", "bytes=800000-999999"])
+        self.assertEqual(self.if_ranges, [ETAG, ETAG])
+
+    def test_resume_partial_download_of_a_changed_file(self):
+        client = self.create_client()
+        self.write_partial_download(os.urandom(400_000), validator='"v1"')
+
+        client.process.download_process_document_to_file(
+            PROCESS_ID, self.path, document_uri=DOCUMENT_URI, part_size=400_000
+        )
+
+        # The server sends the whole file, the old bytes are not kept
+        self.assert_downloaded()
+        self.assertEqual(self.ranges, ["bytes=400000-799999"])
+
+    def test_partial_download_without_validator_starts_again(self):
+        client = self.create_client()
+        self.write_partial_download(os.urandom(400_000), validator=None)
+
+        client.process.download_process_document_to_file(
+            PROCESS_ID, self.path, document_uri=DOCUMENT_URI, part_size=400_000, max_concurrency=1
+        )
+
+        self.assert_downloaded()
+        self.assertEqual(self.ranges, [None])
+
+    def test_resume_complete_partial_download(self):
+        client = self.create_client()
+        self.write_partial_download(CONTENT)
+
+        client.process.download_process_document_to_file(PROCESS_ID, self.path, document_uri="kuflow-file:uri=x;")
+
+        self.assert_downloaded()
+        self.assertEqual(self.ranges, [f"bytes={len(CONTENT)}-{len(CONTENT) + 8 * 1024 * 1024 - 1}"])
+
+    def test_resume_dropped_connection(self):
+        client = self.create_client()
+        self.drops.append(300_000)
+
+        client.process.download_process_document_to_file(
+            PROCESS_ID, self.path, document_uri=DOCUMENT_URI, part_size=300_000
+        )
+
+        self.assert_downloaded()
+        # The part is resumed from the last byte received
+        self.assertEqual(len(self.ranges), 5)
+        self.assertEqual(self.ranges.count("bytes=300000-599999"), 1)
+        self.assertEqual(len([r for r in self.ranges if r.endswith("-599999")]), 2)
+
+    def test_size_mismatch(self):
+        client = self.create_client()
+
+        with self.assertRaises(IncompleteReadError):
+            client.process.download_process_document_to_file(
+                PROCESS_ID, self.path, document_uri=DOCUMENT_URI.replace(f"size={len(CONTENT)}", "size=10")
+            )
+
+        self.assertFalse(os.path.exists(self.path))
+        self.assertFalse(os.path.exists(self.path + ".part"))
+
+    def test_download_error(self):
+        client = self.create_client()
+
+        with self.assertRaises(ResourceNotFoundError):
+            client.process.download_process_document_to_file(PROCESS_ID, self.path, document_uri="missing")
+
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_download_without_range_support(self):
+        client = self.create_client()
+        self.write_partial_download(b"stale")
+
+        size = client.robot.download_robot_source_code_to_file(ROBOT_ID, self.path)
+
+        self.assertEqual(size, len(CONTENT))
+        self.assert_downloaded()
+
+    async def test_async_download(self):
+        async with self.create_client(AsyncKuFlowRestClient) as client:
+            self.drops.append(600_000)
+            size = await client.process.download_process_document_to_file(
+                PROCESS_ID, self.path, document_uri=DOCUMENT_URI, part_size=300_000
+            )
+            self.assertEqual(size, len(CONTENT))
+            self.assert_downloaded()
+
+            os.remove(self.path)
+            await client.robot.download_robot_source_code_to_file(ROBOT_ID, self.path)
+            self.assert_downloaded()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import asyncio
+import threading
+import time
+import unittest
+from unittest import mock
+
+from aiohttp import web
+from azure.core.pipeline import PipelineContext, PipelineRequest, PipelineResponse
+from azure.core.rest import HttpRequest
+
+from kuflow_rest import KuFlowRestClient
+from kuflow_rest.aio import KuFlowRestClient as AsyncKuFlowRestClient
+from kuflow_rest.policies import Hedging, HedgingPolicy
+
+from ._stub_server import StubServer
+
+
+class StubResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+    def close(self):
+        pass
+
+
+def create_request():
+    return PipelineRequest(HttpRequest("GET", "https://api.kuflow.com/v2022-10-08/tenants/1"), PipelineContext(None))
+
+
+class HedgingTest(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.calls = {}
+
+        async def retrieve_tenant(request: web.Request):
+            # The first request of a "slow-" tenant is slow, the one of an "error-" tenant fails
+            tenant_id = request.match_info["id"]
+            cls.calls[tenant_id] = cls.calls.get(tenant_id, 0) + 1
+            if cls.calls[tenant_id] == 1 and tenant_id.startswith("error-"):
+                return web.json_response({"status": 503, "message": "Unavailable"}, status=503)
+            if cls.calls[tenant_id] == 1 and tenant_id.startswith("slow-"):
+                await asyncio.sleep(1)
+            return web.json_response({"id": tenant_id, "name": f"Tenant {cls.calls[tenant_id]}", "plan": "FREE"})
+
+        cls.server = StubServer()
+        cls.server.route("GET", "/tenants/{id}", retrieve_tenant)
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def create_client(self, client_class=KuFlowRestClient, **kwargs):
+        return client_class(
+            client_id="CLIENT_ID",
+            client_secret="CLIENT_SECRET",
+            endpoint=self.server.endpoint,
+            allow_insecure_connection=True,
+            **kwargs,
+        )
+
+    def test_slow_request_is_hedged(self):
+        client = self.create_client(hedging=Hedging(delay=0.05, budget=1))
+
+        start = time.monotonic()
+        tenant = client.tenant.retrieve_tenant("slow-1")
+
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual(tenant.name, "Tenant 2")
+        self.assertEqual((client.hedging.requests, client.hedging.hedged, client.hedging.backup_wins), (1, 1, 1))
+
+    def test_fast_request_is_not_hedged(self):
+        client = self.create_client(hedging=Hedging(delay=0.5, budget=1))
+
+        client.tenant.retrieve_tenant("fast")
+        client.tenant.retrieve_tenant("fast")
+
+        self.assertEqual(self.calls["fast"], 2)
+        # No backup request is created and the budget is untouched before the delay
+        self.assertEqual(client.hedging.hedged, 0)
+        self.assertEqual(client.hedging._tokens, 2)
+
+    def test_backup_requests_are_limited_by_the_budget(self):
+        client = self.create_client(hedging=Hedging(delay=0.05, budget=0.5))
+
+        tenant = client.tenant.retrieve_tenant("slow-budget")
+
+        self.assertEqual(tenant.name, "Tenant 1")
+        self.assertEqual((client.hedging.requests, client.hedging.hedged), (1, 0))
+
+    def test_request_is_sent_from_the_calling_thread_when_the_pool_is_busy(self):
+        policy = HedgingPolicy(Hedging(delay=0, budget=1), max_workers=1)
+        release = threading.Event()
+        threads = []
+
+        def send(request):
+            threads.append(threading.current_thread())
+            if threading.current_thread().name.startswith("kuflow-hedging"):
+                release.wait()
+            return PipelineResponse(request.http_request, StubResponse(200), request.context)
+
+        policy.next = mock.Mock(send=send)
+        busy = threading.Thread(target=policy.send, args=(create_request(),))
+        busy.start()
+        # The primary request of the busy thread blocks the only thread of the pool, and there is none for its backup
+        while not policy.hedging.hedged:
+            time.sleep(0.01)
+
+        policy.send(create_request())
+        release.set()
+        busy.join()
+
+        self.assertEqual(threads[1], threading.current_thread())
+        self.assertEqual((policy.hedging.requests, policy.hedging.hedged), (2, 1))
+
+    def test_failed_response_waits_for_the_other_request(self):
+        client = self.create_client(hedging=Hedging(delay=0, budget=1))
+
+        tenant = client.tenant.retrieve_tenant("error-1")
+
+        # The first answer is the failed one, the primary request is retried too
+        self.assertIn(tenant.name, ("Tenant 2", "Tenant 3"))
+        self.assertEqual(client.hedging.hedged, 1)
+
+    def test_delay_is_a_percentile_of_the_latency(self):
+        hedging = Hedging(delay=1, percentile=50, min_samples=4)
+
+        for latency in (0.1, 0.2, 0.3):
+            hedging.record(latency)
+        self.assertEqual(hedging.delay, 1)
+
+        hedging.record(0.4)
+        self.assertEqual(hedging.delay, 0.3)
+
+    def test_invalid_settings(self):
+        with self.assertRaises(ValueError):
+            Hedging(percentile=100)
+        with self.assertRaises(ValueError):
+            Hedging(budget=2)
+
+    async def test_async_slow_request_is_hedged_and_the_loser_cancelled(self):
+        async with self.create_client(AsyncKuFlowRestClient, hedging=Hedging(delay=0.05, budget=1)) as client:
+            start = time.monotonic()
+            tenant = await client.tenant.retrieve_tenant("slow-async")
+
+            self.assertLess(time.monotonic() - start, 0.5)
+            await asyncio.sleep(0)
+            self.assertEqual(asyncio.all_tasks(), {asyncio.current_task()})
+
+        self.assertEqual(tenant.name, "Tenant 2")
+        self.assertEqual(client.hedging.backup_wins, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
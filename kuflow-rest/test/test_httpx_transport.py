@@ -0,0 +1,162 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import asyncio
+import sys
+import unittest
+from unittest import mock
+
+from aiohttp import web
+from azure.core.exceptions import HttpResponseError, ServiceResponseTimeoutError
+from azure.core.rest import HttpRequest
+
+from kuflow_rest import HttpxTransport, KuBotTokenCredential, KuFlowRestClient, PooledRequestsTransport, models
+from kuflow_rest import _transport as transport_module
+from kuflow_rest.aio import AsyncHttpxTransport
+from kuflow_rest.aio import KuFlowRestClient as AsyncKuFlowRestClient
+
+from ._stub_server import StubServer
+
+
+PROCESS_ID = "11111111-1111-1111-1111-111111111111"
+
+
+def url(server: StubServer, path: str) -> str:
+    return server.endpoint + StubServer.API_PREFIX + path
+
+
+class HttpxTransportTest(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.client_ports = []
+
+        async def create_process(request: web.Request):
+            cls.client_ports.append(request.transport.get_extra_info("peername")[1])
+            params = await request.json()
+            return web.json_response(
+                {
+                    "id": params["id"],
+                    "tenantId": "22222222-2222-2222-2222-222222222222",
+                    "state": "RUNNING",
+                    "processDefinitionRef": {"id": params["processDefinitionId"], "version": "1", "code": "CODE"},
+                    "metadata": {"value": params["metadata"]["value"], "valid": True},
+                }
+            )
+
+        async def retrieve_tenant(request: web.Request):
+            cls.client_ports.append(request.transport.get_extra_info("peername")[1])
+            return web.json_response({"id": request.match_info["id"], "name": "Tenant", "plan": "FREE"})
+
+        async def retrieve_process(request: web.Request):
+            return web.json_response({"status": 400, "message": "Invalid process", "errors": []}, status=400)
+
+        async def slow(request: web.Request):
+            await asyncio.sleep(1)
+            return web.Response()
+
+        cls.server = StubServer()
+        cls.server.route("POST", "/processes", create_process)
+        cls.server.route("GET", "/processes/{id}", retrieve_process)
+        cls.server.route("GET", "/tenants/{id}", retrieve_tenant)
+        cls.server.route("GET", "/slow", slow)
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.requests.clear()
+        self.client_ports.clear()
+
+    def create_client(self, client_class=KuFlowRestClient, **kwargs):
+        return client_class(
+            credential=KuBotTokenCredential("TOKEN", 0),
+            endpoint=self.server.endpoint,
+            allow_insecure_connection=True,
+            http2=True,
+            **kwargs,
+        )
+
+    def test_client_sends_requests_through_httpx(self):
+        params = models.ProcessCreateParams(
+            id=PROCESS_ID,
+            process_definition_id="33333333-3333-3333-3333-333333333333",
+            metadata=models.JsonValue(value={"name": "Ñandú"}),
+        )
+
+        with self.create_client() as client:
+            self.assertIsInstance(client._kuflow_client._client._pipeline._transport, HttpxTransport)
+            process = client.process.create_process(params)
+            tenant = client.tenant.retrieve_tenant("1")
+
+        self.assertEqual(process.metadata.value, {"name": "Ñandú"})
+        self.assertEqual(tenant.name, "Tenant")
+        self.assertEqual(self.server.requests[0].headers["Authorization"], "Bearer TOKEN")
+        self.assertEqual(len(set(self.client_ports)), 1)
+
+    def test_error_response(self):
+        with self.create_client() as client, self.assertRaises(HttpResponseError) as context:
+            client.process.retrieve_process(PROCESS_ID)
+
+        self.assertEqual(context.exception.status_code, 400)
+        self.assertEqual(context.exception.model.message, "Invalid process")
+
+    def test_read_timeout(self):
+        with HttpxTransport() as transport, self.assertRaises(ServiceResponseTimeoutError):
+            transport.send(HttpRequest("GET", url(self.server, "/slow")), read_timeout=0.1)
+
+    def test_stream_response(self):
+        with HttpxTransport() as transport:
+            response = transport.send(HttpRequest("GET", url(self.server, "/tenants/1")), stream=True)
+
+            self.assertEqual(response.status_code, 200)
+            self.assertIn(b'"name": "Tenant"', b"".join(response.iter_bytes()))
+            self.assertTrue(response.is_closed)
+
+    def test_fallback_without_httpx(self):
+        with mock.patch.dict(sys.modules, {"httpx": None, "kuflow_rest._httpx_transport": None}):
+            with self.assertLogs(transport_module.logger, "WARNING"):
+                client = self.create_client()
+
+        self.assertIsInstance(client._kuflow_client._client._pipeline._transport, PooledRequestsTransport)
+
+    async def test_async_client_sends_requests_through_httpx(self):
+        async with self.create_client(AsyncKuFlowRestClient) as client:
+            self.assertIsInstance(client._kuflow_client._client._pipeline._transport, AsyncHttpxTransport)
+            tenants = await asyncio.gather(*(client.tenant.retrieve_tenant(str(i)) for i in range(5)))
+            with self.assertRaises(HttpResponseError) as context:
+                await client.process.retrieve_process(PROCESS_ID)
+
+        self.assertEqual([tenant.id for tenant in tenants], ["0", "1", "2", "3", "4"])
+        self.assertEqual(context.exception.model.message, "Invalid process")
+
+    async def test_async_read_timeout(self):
+        async with AsyncHttpxTransport() as transport:
+            with self.assertRaises(ServiceResponseTimeoutError):
+                await transport.send(HttpRequest("GET", url(self.server, "/slow")), read_timeout=0.1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,203 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import datetime
+import enum
+import json
+import sys
+import unittest
+from unittest import mock
+
+from aiohttp import web
+from azure.core.exceptions import HttpResponseError
+
+from kuflow_rest import KuFlowRestClient, Model, models
+from kuflow_rest._serialization import KuFlowContentDecodePolicy
+from kuflow_rest.utils import JsonBackend, _json_backend, get_json_backend
+
+from ._stub_server import StubServer
+
+
+PROCESS_ID = "11111111-1111-1111-1111-111111111111"
+
+
+class Color(str, enum.Enum):
+    RED = "RED"
+
+
+class ModelEncoder(json.JSONEncoder):
+    def default(self, o):
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        if isinstance(o, Model):
+            return o.as_dict()
+        return super().default(o)
+
+
+class JsonBackendTest(unittest.TestCase):
+    VALUES = [
+        {"name": "Ñandú 😀", "control": '\x00\x1f\x7f\n"\\/', "empty": "", "none": None, "bool": True},
+        {"b": [1, -0.0, 0.1, 1.5, 1e15, 1e16, 1e-7, 2**70, 12345678901234567.0]},
+        {"color": Color.RED, "date": datetime.datetime(2024, 6, 14, 10, 20, 30)},
+        {"principal": models.Principal(id="44444444-4444-4444-4444-444444444444", type="USER")},
+        {2: "non str key", 1: {"z": 1, "a": [{"y": 2, "x": 3}]}},
+        "\ud800",
+    ]
+
+    def test_orjson_writes_the_same_bytes_as_json(self):
+        stdlib = get_json_backend()
+        orjson = get_json_backend("orjson")
+
+        for value in self.VALUES:
+            for sort_keys in (False, True):
+                with self.subTest(value=value, sort_keys=sort_keys):
+                    self.assertEqual(
+                        orjson.dumps(value, encoder=ModelEncoder, sort_keys=sort_keys),
+                        stdlib.dumps(value, encoder=ModelEncoder, sort_keys=sort_keys),
+                    )
+
+    def test_orjson_writes_utf8(self):
+        value = {"name": "Ñandú 😀", "control": "\x7f", "ratio": 1e-7}
+
+        self.assertEqual(
+            get_json_backend("orjson").dumps(value, ensure_ascii=False),
+            get_json_backend().dumps(value, ensure_ascii=False),
+        )
+
+    def test_orjson_reads_the_same_values_as_json(self):
+        orjson = get_json_backend("orjson")
+
+        for data in [b'{"a":[1,2.5,"\\u00f1",null]}', '{"a":1}', b'\xef\xbb\xbf{"a":1}', b"[NaN]"]:
+            with self.subTest(data=data):
+                self.assertEqual(repr(orjson.loads(data)), repr(json.loads(data)))
+        with self.assertRaises(ValueError):
+            orjson.loads(b"{")
+
+    def test_get_json_backend(self):
+        backend = JsonBackend()
+
+        self.assertEqual(get_json_backend().name, "json")
+        self.assertEqual(get_json_backend("orjson").name, "orjson")
+        self.assertIs(get_json_backend(backend), backend)
+        with self.assertRaises(ValueError):
+            get_json_backend("simplejson")
+
+    def test_get_json_backend_without_orjson(self):
+        with mock.patch.dict(sys.modules, {"orjson": None}), mock.patch.dict(_json_backend._JSON_BACKENDS):
+            _json_backend._JSON_BACKENDS.pop("orjson", None)
+            with self.assertLogs(_json_backend.logger, "WARNING"):
+                backend = get_json_backend("orjson")
+
+        self.assertEqual(backend.name, "json")
+
+
+class KuFlowRestClientJsonBackendTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        async def create_process(request: web.Request):
+            params = await request.json()
+            return web.json_response(
+                {
+                    "id": params["id"],
+                    "tenantId": "22222222-2222-2222-2222-222222222222",
+                    "state": "RUNNING",
+                    "processDefinitionRef": {"id": params["processDefinitionId"], "version": "1", "code": "CODE"},
+                    "metadata": {"value": params["metadata"]["value"], "valid": True},
+                }
+            )
+
+        async def retrieve_process(request: web.Request):
+            return web.json_response({"status": 400, "message": "Invalid ñ", "errors": []}, status=400)
+
+        cls.server = StubServer()
+        cls.server.route("POST", "/processes", create_process)
+        cls.server.route("GET", "/processes/{id}", retrieve_process)
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def create_client(self, json_backend="orjson", **kwargs) -> KuFlowRestClient:
+        return KuFlowRestClient(
+            client_id="CLIENT_ID",
+            client_secret="CLIENT_SECRET",
+            endpoint=self.server.endpoint,
+            allow_insecure_connection=True,
+            json_backend=json_backend,
+            **kwargs,
+        )
+
+    def test_client_uses_json_backend(self):
+        client = self.create_client()
+
+        policies = [
+            getattr(policy, "_policy", policy) for policy in client._kuflow_client._client._pipeline._impl_policies
+        ]
+        self.assertEqual(sum(isinstance(policy, KuFlowContentDecodePolicy) for policy in policies), 1)
+        self.assertEqual(client._kuflow_client.process._deserialize.json_backend.name, "orjson")
+
+    def test_create_process(self):
+        params = models.ProcessCreateParams(
+            id=PROCESS_ID,
+            process_definition_id="33333333-3333-3333-3333-333333333333",
+            metadata=models.JsonValue(value={"name": "Ñandú", "tags": ["a", {"b": 1.5}]}),
+        )
+
+        with self.create_client() as client:
+            process = client.process.create_process(params)
+
+        self.assertEqual(process.id, PROCESS_ID)
+        self.assertEqual(process.metadata.value, {"name": "Ñandú", "tags": ["a", {"b": 1.5}]})
+
+    def test_responses_are_parsed_once(self):
+        class CountingJsonBackend(JsonBackend):
+            parsed = 0
+
+            def loads(self, data):
+                CountingJsonBackend.parsed += 1
+                return super().loads(data)
+
+        params = models.ProcessCreateParams(
+            id=PROCESS_ID,
+            process_definition_id="33333333-3333-3333-3333-333333333333",
+            metadata=models.JsonValue(value={}),
+        )
+
+        with self.create_client(CountingJsonBackend(), lazy_deserialization=True) as client:
+            process = client.process.create_process(params)
+
+        self.assertEqual(CountingJsonBackend.parsed, 1)
+        self.assertEqual(process.id, PROCESS_ID)
+        self.assertEqual(process.metadata.valid, True)
+
+    def test_error_response(self):
+        with self.create_client() as client, self.assertRaises(HttpResponseError) as context:
+            client.process.retrieve_process(PROCESS_ID)
+
+        self.assertEqual(context.exception.model.message, "Invalid ñ")
+
+
+if __name__ == "__main__":
+    unittest.main()
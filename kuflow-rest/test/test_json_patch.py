@@ -0,0 +1,265 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import copy
+import random
+import unittest
+
+from aiohttp import web
+from azure.core.serialization import NULL
+
+from kuflow_rest import KuFlowRestClient, models
+from kuflow_rest.aio import KuFlowRestClient as AsyncKuFlowRestClient
+from kuflow_rest.utils import generate_json_patch, select_json_patch
+
+from ._stub_server import StubServer
+from .test_serialization import process_item
+
+
+PROCESS_ITEM_ID = "00000000-0000-0000-0000-000000000001"
+
+
+def apply_json_patch(document, json_patch):
+    document = copy.deepcopy(document)
+
+    def resolve(path):
+        tokens = [token.replace("~1", "/").replace("~0", "~") for token in path.split("/")[1:]]
+        parent = document
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+        last = tokens[-1]
+        return parent, int(last) if isinstance(parent, list) else last
+
+    for operation in json_patch:
+        value = None if operation.value is NULL else operation.value
+        if operation.path == "":
+            document = copy.deepcopy(value)
+            continue
+        if operation.op == "move":
+            parent, key = resolve(operation.from_property)
+            value = parent.pop(key)
+        parent, key = resolve(operation.path)
+        if operation.op == "remove":
+            parent.pop(key)
+        elif operation.op == "replace":
+            parent[key] = copy.deepcopy(value)
+        elif isinstance(parent, list):
+            parent.insert(key, copy.deepcopy(value))
+        else:
+            parent[key] = copy.deepcopy(value)
+
+    return document
+
+
+def random_value(rng: random.Random, depth: int = 0):
+    kind = rng.randrange(6 if depth < 3 else 4)
+    if kind == 0:
+        return rng.choice([None, True, False])
+    if kind == 1:
+        return rng.randrange(5)
+    if kind == 2:
+        return rng.choice(["a", "b", "c/d", "e~f"])
+    if kind == 3:
+        return rng.random()
+    if kind == 4:
+        return [random_value(rng, depth + 1) for _ in range(rng.randrange(6))]
+    return {rng.choice("abcdef"): random_value(rng, depth + 1) for _ in range(rng.randrange(5))}
+
+
+def mutate(rng: random.Random, value):
+    if isinstance(value, list):
+        value = [mutate(rng, item) if rng.random() < 0.3 else item for item in value]
+        if value and rng.random() < 0.3:
+            value.insert(rng.randrange(len(value)), value.pop(rng.randrange(len(value))))
+        if rng.random() < 0.3:
+            value.insert(rng.randrange(len(value) + 1), random_value(rng, 2))
+        if value and rng.random() < 0.3:
+            value.pop(rng.randrange(len(value)))
+        return value
+    if isinstance(value, dict):
+        value = {key: mutate(rng, item) if rng.random() < 0.3 else item for key, item in value.items()}
+        if rng.random() < 0.3:
+            value[rng.choice("abcdefg")] = random_value(rng, 2)
+        if value and rng.random() < 0.3:
+            value.pop(rng.choice(list(value)))
+        return value
+    return random_value(rng, 2) if rng.random() < 0.5 else value
+
+
+class GenerateJsonPatchTest(unittest.TestCase):
+    def assert_patch(self, source, target, expected):
+        json_patch = generate_json_patch(source, target)
+
+        actual = [
+            {
+                key: value
+                for key, value in vars(operation).items()
+                if value is not None and key != "additional_properties"
+            }
+            for operation in json_patch
+        ]
+        self.assertEqual(actual, expected)
+        self.assertEqual(apply_json_patch(source, json_patch), target)
+
+    def test_object_members(self):
+        self.assert_patch(
+            {"name": "Homer", "age": 39, "job": "Safety inspector", "address": {"city": "Springfield"}},
+            {"name": "Homer", "age": 40, "address": {"city": "Springfield", "street": "Evergreen"}, "kids": 3},
+            [
+                {"op": "remove", "path": "/job"},
+                {"op": "replace", "path": "/age", "value": 40},
+                {"op": "add", "path": "/address/street", "value": "Evergreen"},
+                {"op": "add", "path": "/kids", "value": 3},
+            ],
+        )
+
+    def test_null_values_and_types(self):
+        self.assert_patch(
+            {"a": 1, "b": None, "c": 1},
+            {"a": None, "b": None, "c": True},
+            [{"op": "replace", "path": "/a", "value": NULL}, {"op": "replace", "path": "/c", "value": True}],
+        )
+
+    def test_escaped_keys(self):
+        self.assert_patch(
+            {"a/b": 1, "m~n": 1},
+            {"a/b": 2, "m~n": 2},
+            [
+                {"op": "replace", "path": "/a~1b", "value": 2},
+                {"op": "replace", "path": "/m~0n", "value": 2},
+            ],
+        )
+
+    def test_array_elements_are_moved(self):
+        rows = [{"row": index} for index in range(5)]
+
+        self.assert_patch(
+            {"rows": rows},
+            {"rows": rows[4:] + rows[:4]},
+            [
+                {"op": "move", "from_property": "/rows/4", "path": "/rows/0"},
+            ],
+        )
+
+    def test_array_elements_are_added_patched_and_removed(self):
+        self.assert_patch(
+            {"rows": [{"name": "a", "value": 1}, {"name": "b", "value": 2}, {"name": "c", "value": 3}]},
+            {"rows": [{"name": "new", "value": 0}, {"name": "a", "value": 1}, {"name": "b", "value": 20}]},
+            [
+                {"op": "add", "path": "/rows/0", "value": {"name": "new", "value": 0}},
+                {"op": "replace", "path": "/rows/2/value", "value": 20},
+                {"op": "remove", "path": "/rows/3"},
+            ],
+        )
+
+    def test_json_value_documents(self):
+        source = models.JsonValue(value={"name": "Homer"}, valid=True)
+        target = models.JsonValue(value={"name": "Marge"})
+
+        self.assertEqual(generate_json_patch(source, target)[0].path, "/name")
+        self.assertEqual(generate_json_patch(source, source), [])
+
+    def test_random_documents(self):
+        rng = random.Random(20241017)
+        for iteration in range(300):
+            source = {"root": random_value(rng)}
+            target = mutate(rng, source)
+            with self.subTest(iteration=iteration):
+                self.assertEqual(apply_json_patch(source, generate_json_patch(source, target)), target)
+
+    def test_select_json_patch(self):
+        source = {f"field{index}": f"value {index}" for index in range(50)}
+        target = dict(source, field7="changed")
+
+        self.assertEqual(len(select_json_patch(source, target)), 1)
+        self.assertIsNone(select_json_patch(None, target))
+        self.assertIsNone(select_json_patch(source, source))
+        self.assertIsNone(select_json_patch(source, {"other": 1}))
+        self.assertIsNone(select_json_patch({"a": 1}, [1]))
+
+
+class SmartUpdateTest(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.bodies = []
+
+        async def save_task_data(request: web.Request):
+            cls.bodies.append(await request.json())
+            return web.json_response(process_item(1))
+
+        cls.server = StubServer()
+        cls.server.route("PUT", "/process-items/{id}/task/data", save_task_data)
+        cls.server.route("PATCH", "/process-items/{id}/task/data", save_task_data)
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.requests.clear()
+        self.bodies.clear()
+        self.previous_data = models.JsonValue(value={f"field{index}": f"value {index}" for index in range(50)})
+        self.data = dict(self.previous_data.value, field7=None)
+
+    def create_client(self, client_class=KuFlowRestClient, **kwargs):
+        return client_class(
+            client_id="CLIENT_ID",
+            client_secret="CLIENT_SECRET",
+            endpoint=self.server.endpoint,
+            allow_insecure_connection=True,
+            **kwargs,
+        )
+
+    def assert_request(self, method, body):
+        self.assertEqual(self.server.requests[-1].method, method)
+        self.assertEqual(self.bodies[-1], body)
+
+    def test_small_change_is_patched(self):
+        client = self.create_client(json_backend="json")
+
+        client.process_item.update_process_item_task_data_smart(PROCESS_ITEM_ID, self.previous_data, self.data)
+
+        self.assert_request("PATCH", [{"op": "replace", "path": "/field7", "value": None}])
+
+    def test_whole_document_without_previous_data(self):
+        client = self.create_client()
+
+        client.process_item.update_process_item_task_data_smart(PROCESS_ITEM_ID, None, self.data)
+
+        self.assert_request("PUT", {"data": {"value": self.data}})
+
+    async def test_async_small_change_is_patched(self):
+        async with self.create_client(AsyncKuFlowRestClient) as client:
+            await client.process_item.update_process_item_task_data_smart(
+                PROCESS_ITEM_ID, self.previous_data, self.data
+            )
+            await client.process_item.update_process_item_task_data_smart(PROCESS_ITEM_ID, self.data, {"other": 1})
+
+        self.assertEqual(self.server.requests[0].method, "PATCH")
+        self.assert_request("PUT", {"data": {"value": {"other": 1}}})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import subprocess
+import sys
+import unittest
+
+import kuflow_rest
+from kuflow_rest import aio, models, operations
+from kuflow_rest._generated import models as generated_models
+from kuflow_rest.aio import operations as aio_operations
+
+
+class LazyImportTest(unittest.TestCase):
+    def test_import_does_not_load_the_implementation(self):
+        code = (
+            "import sys\n"
+            "import kuflow_rest, kuflow_rest.models, kuflow_rest.operations, kuflow_rest.aio\n"
+            "print(' '.join(sorted(sys.modules)))\n"
+        )
+
+        loaded = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout.split()
+
+        for module in ["azure.core", "isodate", "kuflow_rest._generated.models", "kuflow_rest._kuflow_rest_client"]:
+            self.assertNotIn(module, loaded)
+
+    def test_names_are_imported_on_access(self):
+        from kuflow_rest._kuflow_rest_client import KuFlowRestClient
+        from kuflow_rest.aio._kuflow_rest_client import KuFlowRestClient as AsyncKuFlowRestClient
+        from kuflow_rest.operations._process_operations import ProcessOperations
+
+        self.assertIs(kuflow_rest.KuFlowRestClient, KuFlowRestClient)
+        self.assertIs(aio.KuFlowRestClient, AsyncKuFlowRestClient)
+        self.assertIs(operations.ProcessOperations, ProcessOperations)
+        self.assertIs(models.Process, generated_models.Process)
+        self.assertIn("Process", dir(models))
+        with self.assertRaises(AttributeError):
+            _ = models.Unknown
+
+    def test_every_name_can_be_imported(self):
+        for module in [kuflow_rest, models, operations, aio, aio_operations]:
+            for name in module.__all__:
+                self.assertIsNotNone(getattr(module, name))
+
+    def test_every_generated_model_is_exported(self):
+        # For usability, we must include in __all__, all the items of the model generated package
+        self.assertLessEqual(set(generated_models.__all__), set(models.__all__))
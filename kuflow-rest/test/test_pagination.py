@@ -0,0 +1,175 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import time
+import unittest
+from types import SimpleNamespace
+
+from aiohttp import web
+
+from kuflow_rest import KuFlowRestClient
+from kuflow_rest.aio import KuFlowRestClient as KuFlowRestClientAsync
+from kuflow_rest.operations._pagination import iterate_page_items
+from kuflow_rest.policies import deadline, remaining_time
+
+from ._stub_server import StubServer, page_metadata
+
+
+TOTAL_ELEMENTS = 23
+
+
+def process_page_item(index: int) -> dict:
+    return {
+        "id": f"00000000-0000-0000-0000-{index:012d}",
+        "tenantId": "22222222-2222-2222-2222-222222222222",
+        "state": "RUNNING",
+        "processDefinitionRef": {"id": "33333333-3333-3333-3333-333333333333", "version": "1", "code": "CODE"},
+    }
+
+
+def find_processes(request: web.Request):
+    size = int(request.query["size"])
+    page = int(request.query["page"])
+    total_pages = (TOTAL_ELEMENTS + size - 1) // size
+    content = [process_page_item(i) for i in range(page * size, min((page + 1) * size, TOTAL_ELEMENTS))]
+
+    return web.json_response(
+        {"metadata": page_metadata(size, page, TOTAL_ELEMENTS, total_pages), "content": content},
+    )
+
+
+class PaginationTest(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = StubServer()
+        cls.server.route("GET", "/processes", find_processes)
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.requests.clear()
+
+    def client_options(self) -> dict:
+        return {
+            "client_id": "CLIENT_ID",
+            "client_secret": "CLIENT_SECRET",
+            "endpoint": self.server.endpoint,
+            "allow_insecure_connection": True,
+        }
+
+    def requested_pages(self) -> list[int]:
+        return sorted(int(request.query["page"]) for request in self.server.requests)
+
+    def test_iter_processes(self):
+        client = KuFlowRestClient(**self.client_options())
+
+        items = list(client.process.iter_processes(size=5, tenant_id="tenant"))
+
+        self.assertEqual([item.id for item in items], [process_page_item(i)["id"] for i in range(TOTAL_ELEMENTS)])
+        self.assertEqual(self.requested_pages(), [0, 1, 2, 3, 4])
+        self.assertTrue(all(request.query["tenantId"] == "tenant" for request in self.server.requests))
+
+    def test_iter_processes_from_page_without_prefetch(self):
+        client = KuFlowRestClient(**self.client_options())
+
+        items = list(client.process.iter_processes(size=10, page=1, prefetch=False))
+
+        self.assertEqual([item.id for item in items], [process_page_item(i)["id"] for i in range(10, TOTAL_ELEMENTS)])
+        self.assertEqual(self.requested_pages(), [1, 2])
+
+    def test_iter_processes_prefetches_next_page(self):
+        client = KuFlowRestClient(**self.client_options())
+
+        iterator = client.process.iter_processes(size=5)
+        next(iterator)
+        time.sleep(0.5)
+
+        self.assertEqual(self.requested_pages(), [0, 1])
+        iterator.close()
+
+    def test_iter_processes_fetch_all(self):
+        client = KuFlowRestClient(**self.client_options())
+
+        items = list(client.process.iter_processes(size=2, concurrency=4))
+
+        self.assertEqual([item.id for item in items], [process_page_item(i)["id"] for i in range(TOTAL_ELEMENTS)])
+        self.assertEqual(self.requested_pages(), list(range(12)))
+
+    def test_iter_page_items_fetch_all_unordered(self):
+        def find_page(page: int):
+            time.sleep(0.1 * (4 - page))
+            return SimpleNamespace(
+                metadata=SimpleNamespace(total_pages=4), content=[SimpleNamespace(id=f"{page}-{i}") for i in range(2)]
+            )
+
+        items = list(iterate_page_items(find_page, concurrency=3, ordered=False))
+
+        self.assertEqual([item.id for item in items], ["0-0", "0-1", "3-0", "3-1", "2-0", "2-1", "1-0", "1-1"])
+
+    def test_iter_page_items_skips_shifted_items(self):
+        # Item "b" was modified after reading page 0, so it is returned again at the end of page 1.
+        pages = [["a", "b"], ["c", "b"], ["d"]]
+
+        def find_page(page: int):
+            return SimpleNamespace(
+                metadata=SimpleNamespace(total_pages=len(pages)), content=[SimpleNamespace(id=id) for id in pages[page]]
+            )
+
+        items = list(iterate_page_items(find_page, concurrency=2))
+
+        self.assertEqual([item.id for item in items], ["a", "b", "c", "d"])
+
+    def test_iter_page_items_fetches_pages_with_the_deadline(self):
+        remaining = {}
+
+        def find_page(page: int):
+            remaining[page] = remaining_time()
+            return SimpleNamespace(metadata=SimpleNamespace(total_pages=4), content=[SimpleNamespace(id=page)])
+
+        with deadline(60):
+            items = list(iterate_page_items(find_page, concurrency=2))
+
+        self.assertEqual([item.id for item in items], [0, 1, 2, 3])
+        self.assertTrue(all(value is not None and value <= 60 for value in remaining.values()), remaining)
+
+    async def test_aiter_processes(self):
+        async with KuFlowRestClientAsync(**self.client_options()) as client:
+            items = [item async for item in client.process.aiter_processes(size=5)]
+
+        self.assertEqual([item.id for item in items], [process_page_item(i)["id"] for i in range(TOTAL_ELEMENTS)])
+        self.assertEqual(self.requested_pages(), [0, 1, 2, 3, 4])
+
+    async def test_aiter_processes_fetch_all_unordered(self):
+        async with KuFlowRestClientAsync(**self.client_options()) as client:
+            items = [item async for item in client.process.aiter_processes(size=2, concurrency=4, ordered=False)]
+
+        self.assertEqual(sorted(item.id for item in items), [process_page_item(i)["id"] for i in range(TOTAL_ELEMENTS)])
+        self.assertEqual(self.requested_pages(), list(range(12)))
+
+
+if __name__ == "__main__":
+    unittest.main()
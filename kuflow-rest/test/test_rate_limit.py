@@ -0,0 +1,220 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import asyncio
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
+from types import SimpleNamespace
+
+from aiohttp import web
+
+from kuflow_rest import KuFlowRestClient
+from kuflow_rest.aio import KuFlowRestClient as AsyncKuFlowRestClient
+from kuflow_rest.policies import DeadlineExceededError, RateLimiter, deadline
+
+from ._stub_server import StubServer
+
+
+def response(status_code: int, headers=None):
+    return SimpleNamespace(http_response=SimpleNamespace(status_code=status_code, headers=headers or {}))
+
+
+class RateLimiterTest(unittest.TestCase):
+    def test_token_bucket(self):
+        limiter = RateLimiter(rate=20, burst=2)
+
+        start = time.monotonic()
+        for _ in range(4):
+            limiter.release(limiter.acquire(), response(200))
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+        self.assertEqual(limiter.requests, 4)
+
+    def test_window_grows_with_successful_responses(self):
+        limiter = RateLimiter(concurrency=2, max_concurrency=3)
+
+        for _ in range(4):
+            limiter.release(limiter.acquire(), response(200))
+        self.assertEqual(limiter.concurrency_limit, 3)
+
+        for _ in range(10):
+            limiter.release(limiter.acquire(), response(200))
+        self.assertEqual(limiter.concurrency_limit, 3)
+
+    def test_throttled_responses_of_the_same_window_decrease_it_once(self):
+        limiter = RateLimiter(concurrency=8)
+
+        tickets = [limiter.acquire() for _ in range(4)]
+        for ticket in tickets:
+            limiter.release(ticket, response(429))
+        self.assertEqual(limiter.concurrency_limit, 4)
+
+        limiter.release(limiter.acquire(), response(503))
+        self.assertEqual(limiter.concurrency_limit, 2)
+        self.assertEqual(limiter.throttled, 5)
+
+        for _ in range(3):
+            limiter.release(limiter.acquire(), response(429))
+        self.assertEqual(limiter.concurrency_limit, 1)
+
+    def test_failed_requests_do_not_change_the_window(self):
+        limiter = RateLimiter(concurrency=4)
+
+        limiter.release(limiter.acquire(), None)
+
+        self.assertEqual(limiter.metrics()["concurrency_limit"], 4)
+        self.assertEqual(limiter.in_flight, 0)
+
+    def test_retry_after_pauses_the_requests(self):
+        limiter = RateLimiter(max_retry_after=0.2)
+
+        limiter.release(limiter.acquire(), response(429, {"Retry-After": "10"}))
+        self.assertGreater(limiter.metrics()["paused"], 0.1)
+
+        start = time.monotonic()
+        limiter.release(limiter.acquire(), response(200))
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.15)
+
+    def test_retry_after_date(self):
+        limiter = RateLimiter()
+
+        retry_at = formatdate(time.time() + 10, usegmt=True)
+        limiter.release(limiter.acquire(), response(429, {"Retry-After": retry_at}))
+
+        self.assertGreater(limiter.metrics()["paused"], 5)
+
+    def test_acquire_waits_until_the_deadline(self):
+        limiter = RateLimiter(concurrency=1, max_concurrency=1)
+        limiter.acquire()
+
+        start = time.monotonic()
+        with deadline(0.1), self.assertRaises(DeadlineExceededError):
+            limiter.acquire()
+
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertEqual(limiter.in_flight, 1)
+
+    def test_acquire_async_waits_until_the_deadline(self):
+        limiter = RateLimiter()
+        limiter.release(limiter.acquire(), response(429, {"Retry-After": "10"}))
+
+        async def acquire():
+            with deadline(0.1):
+                await limiter.acquire_async()
+
+        start = time.monotonic()
+        with self.assertRaises(DeadlineExceededError):
+            asyncio.run(acquire())
+
+        self.assertLess(time.monotonic() - start, 1)
+
+    def test_invalid_settings(self):
+        with self.assertRaises(ValueError):
+            RateLimiter(rate=0)
+        with self.assertRaises(ValueError):
+            RateLimiter(concurrency=100)
+        with self.assertRaises(ValueError):
+            RateLimiter(decrease=1)
+
+
+class RateLimitPolicyTest(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.in_flight = 0
+        cls.max_in_flight = 0
+        cls.throttle = 0
+
+        async def retrieve_tenant(request: web.Request):
+            if cls.throttle:
+                cls.throttle -= 1
+                return web.json_response(
+                    {"status": 429, "message": "Slow down"}, status=429, headers={"Retry-After": "0"}
+                )
+
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+            await asyncio.sleep(0.02)
+            cls.in_flight -= 1
+            return web.json_response({"id": request.match_info["id"], "name": "Tenant", "plan": "FREE"})
+
+        cls.server = StubServer()
+        cls.server.route("GET", "/tenants/{id}", retrieve_tenant)
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        type(self).max_in_flight = 0
+        type(self).throttle = 0
+
+    def create_client(self, client_class=KuFlowRestClient, **kwargs):
+        return client_class(
+            client_id="CLIENT_ID",
+            client_secret="CLIENT_SECRET",
+            endpoint=self.server.endpoint,
+            allow_insecure_connection=True,
+            **kwargs,
+        )
+
+    def test_requests_in_flight_are_limited(self):
+        limiter = RateLimiter(concurrency=2, max_concurrency=2)
+        clients = [self.create_client(rate_limit=limiter) for _ in range(2)]
+
+        with ThreadPoolExecutor(8) as executor:
+            tenants = list(executor.map(lambda i: clients[i % 2].tenant.retrieve_tenant(str(i)), range(16)))
+
+        self.assertEqual(len(tenants), 16)
+        self.assertEqual(self.max_in_flight, 2)
+        self.assertEqual(limiter.requests, 16)
+        self.assertEqual(limiter.in_flight, 0)
+
+    def test_throttled_requests_are_retried_through_the_limiter(self):
+        type(self).throttle = 1
+        client = self.create_client(rate_limit=True)
+
+        tenant = client.tenant.retrieve_tenant("1")
+
+        self.assertEqual(tenant.id, "1")
+        self.assertEqual(client.rate_limiter.requests, 2)
+        self.assertEqual(client.rate_limiter.throttled, 1)
+        self.assertEqual(client.rate_limiter.concurrency_limit, 8)
+
+    async def test_async_requests_in_flight_are_limited(self):
+        limiter = RateLimiter(concurrency=3, max_concurrency=3)
+
+        async with self.create_client(AsyncKuFlowRestClient, rate_limit=limiter) as client:
+            tenants = await asyncio.gather(*(client.tenant.retrieve_tenant(str(i)) for i in range(12)))
+
+        self.assertEqual(len(tenants), 12)
+        self.assertEqual(self.max_in_flight, 3)
+        self.assertEqual(limiter.in_flight, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
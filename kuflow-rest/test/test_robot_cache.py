@@ -0,0 +1,260 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import asyncio
+import io
+import os
+import tarfile
+import tempfile
+import threading
+import time
+import unittest
+import zipfile
+from datetime import datetime, timezone
+from unittest import mock
+
+from aiohttp import web
+
+from kuflow_rest import KuFlowRestClient, RobotCache, models
+from kuflow_rest.aio import KuFlowRestClient as AsyncKuFlowRestClient
+
+from ._stub_server import StubServer
+
+
+ROBOT_ID = "00000000-0000-0000-0000-000000000001"
+
+
+def zip_archive(files: dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, content in files.items():
+            archive.writestr(name, content)
+    return buffer.getvalue()
+
+
+def tar_archive(files: dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        for name, content in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            archive.addfile(info, io.BytesIO(content))
+    return buffer.getvalue()
+
+
+SOURCE_CODE = zip_archive({"robot.robot": b"*** Tasks ***\n", "resources/keywords.resource": b"*** Keywords ***\n"})
+ASSET = tar_archive({"python/bin/python": b"#!/bin/sh\n"})
+
+
+def create_robot(last_modified_at: datetime) -> models.Robot:
+    return models.Robot(
+        id=ROBOT_ID,
+        code="ROBOT",
+        name="Robot",
+        source_type="PACKAGE",
+        source_file=models.RobotSourceFile(
+            id=ROBOT_ID,
+            name="robot.zip",
+            content_type="application/zip",
+            content_length=len(SOURCE_CODE),
+            content_hash="hash",
+        ),
+        tenant_id="00000000-0000-0000-0000-000000000002",
+        last_modified_at=last_modified_at,
+    )
+
+
+class RobotCacheTest(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        async def download_robot_source_code(request: web.Request):
+            return web.Response(body=SOURCE_CODE, content_type="application/octet-stream")
+
+        async def download_robot_asset(request: web.Request):
+            return web.Response(body=ASSET, content_type="application/octet-stream")
+
+        cls.server = StubServer()
+        cls.server.route("GET", "/robots/{id}/~actions/download-source-code", download_robot_source_code)
+        cls.server.route("GET", "/robots/{id}/~actions/download-asset", download_robot_asset)
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.requests.clear()
+        self.directory = tempfile.TemporaryDirectory()
+        self.robot_cache = RobotCache(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def create_client(self, client_class=KuFlowRestClient, **kwargs):
+        return client_class(
+            client_id="CLIENT_ID",
+            client_secret="CLIENT_SECRET",
+            endpoint=self.server.endpoint,
+            allow_insecure_connection=True,
+            robot_cache=self.robot_cache,
+            **kwargs,
+        )
+
+    def test_source_code(self):
+        client = self.create_client()
+        robot = create_robot(datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+        path = client.robot.retrieve_robot_source_code_path(robot)
+        self.assertEqual(os.path.basename(path), "robot.zip")
+        with open(path, "rb") as file:
+            self.assertEqual(file.read(), SOURCE_CODE)
+
+        directory = client.robot.retrieve_robot_source_code_path(robot, unpack=True)
+        with open(os.path.join(directory, "resources", "keywords.resource"), "rb") as file:
+            self.assertEqual(file.read(), b"*** Keywords ***\n")
+
+        self.assertEqual(client.robot.retrieve_robot_source_code_path(robot), path)
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual((self.robot_cache.hits, self.robot_cache.misses), (1, 1))
+
+        # A modified robot is downloaded again
+        robot = create_robot(datetime(2024, 2, 1, tzinfo=timezone.utc))
+        self.assertNotEqual(client.robot.retrieve_robot_source_code_path(robot), path)
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_asset(self):
+        client = self.create_client()
+        kwargs = {"type": "PYTHON", "version": "3.12", "platform": "LINUX", "architecture": "X86_64"}
+
+        directory = client.robot.retrieve_robot_asset_path(ROBOT_ID, unpack=True, **kwargs)
+        with open(os.path.join(directory, "python", "bin", "python"), "rb") as file:
+            self.assertEqual(file.read(), b"#!/bin/sh\n")
+
+        # Assets are shared by every robot
+        other_robot_id = "00000000-0000-0000-0000-000000000003"
+        self.assertEqual(client.robot.retrieve_robot_asset_path(other_robot_id, unpack=True, **kwargs), directory)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_eviction(self):
+        robot_cache = RobotCache(self.directory.name, max_size=250)
+        paths = []
+        for index in range(3):
+            if index == 2:
+                # The first entry is used again, the second one is the least recently used
+                robot_cache.lookup("key-0", "file.bin")
+            paths.append(robot_cache.get(f"key-{index}", "file.bin", lambda path: write_file(path, b"x" * 100)))
+            time.sleep(0.01)
+
+        self.assertEqual(robot_cache.evictions, 1)
+        self.assertTrue(os.path.exists(paths[0]))
+        self.assertFalse(os.path.exists(paths[1]))
+        self.assertTrue(os.path.exists(paths[2]))
+        self.assertIsNone(robot_cache.lookup("key-1", "file.bin"))
+
+    def test_concurrent_downloads(self):
+        downloads = []
+
+        def download(path):
+            downloads.append(path)
+            time.sleep(0.1)
+            write_file(path, b"content")
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(RobotCache(self.directory.name).get("key", "a", download)))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(downloads), 1)
+        self.assertEqual(len(set(results)), 1)
+
+    def test_invalidate(self):
+        path = self.robot_cache.get("key", "file.bin", lambda path: write_file(path, b"content"))
+
+        self.assertTrue(self.robot_cache.invalidate("key"))
+        self.assertFalse(os.path.exists(path))
+        self.assertFalse(self.robot_cache.invalidate("key"))
+
+    def test_unsafe_archive(self):
+        archive = tar_archive({"../outside": b"content"})
+
+        with self.assertRaises(ValueError):
+            self.robot_cache.get("key", "asset.tar.gz", lambda path: write_file(path, archive), unpack=True)
+
+        self.assertFalse(os.path.exists(os.path.join(self.directory.name, "entries", "outside")))
+
+    def test_without_robot_cache(self):
+        client = self.create_client()
+        client.robot._robot_cache = None
+
+        with self.assertRaises(ValueError):
+            client.robot.retrieve_robot_source_code_path(create_robot(datetime(2024, 1, 1, tzinfo=timezone.utc)))
+
+    async def test_async_get_cancelled_while_waiting_for_the_lock(self):
+        holder = self.robot_cache._entry_lock("key")
+        self.assertTrue(holder.acquire(0))
+        entry_lock = self.robot_cache._entry_lock
+        locks = []
+
+        def create_entry_lock(key):
+            locks.append(entry_lock(key))
+            return locks[-1]
+
+        with mock.patch.object(self.robot_cache, "_entry_lock", create_entry_lock):
+            task = asyncio.ensure_future(self.robot_cache.get_async("key", "file.bin", None))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+        holder.release()
+        # Longer than the longest wait between two tries of the lock
+        await asyncio.sleep(0.6)
+
+        # The cancelled task does not take the lock, the entry is not locked until the lock timeout
+        self.assertTrue(holder.acquire(0))
+        holder.release()
+
+    async def test_async_source_code(self):
+        robot = create_robot(datetime(2024, 1, 1, tzinfo=timezone.utc))
+        async with self.create_client(AsyncKuFlowRestClient) as client:
+            paths = await asyncio.gather(
+                *(client.robot.retrieve_robot_source_code_path(robot, unpack=True) for _ in range(3))
+            )
+
+        self.assertEqual(len(set(paths)), 1)
+        self.assertTrue(os.path.isfile(os.path.join(paths[0], "robot.robot")))
+        self.assertEqual(len(self.server.requests), 1)
+
+
+def write_file(path: str, content: bytes) -> None:
+    with open(path, "wb") as file:
+        file.write(content)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,287 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import copy
+import datetime
+import pickle
+import unittest
+
+from azure.core.exceptions import DeserializationError
+
+from kuflow_rest import Deserializer, KuFlowRestClient, Serializer, models
+from kuflow_rest._serialization import KuFlowDeserializer, KuFlowSerializer
+
+
+CLIENT_MODELS = {name: getattr(models, name) for name in models.__all__ if isinstance(getattr(models, name), type)}
+
+
+def process_item(index: int) -> dict:
+    return {
+        "id": f"00000000-0000-0000-0000-{index:012d}",
+        "type": "TASK",
+        "processId": "11111111-1111-1111-1111-111111111111",
+        "tenantId": "22222222-2222-2222-2222-222222222222",
+        "createdAt": "2024-06-14T10:20:30.123456789Z",
+        "processItemDefinitionRef": {"id": "33333333-3333-3333-3333-333333333333", "version": "1", "code": "TASK"},
+        "task": {
+            "state": "READY",
+            "data": {
+                "valid": False,
+                "value": {"name": "Homer", "age": 39, "ratio": 0.5, "tags": ["a", None, {"nested": True}]},
+                "errors": [{"propertyPath": "/name", "type": "required"}],
+            },
+            "logs": [
+                {"id": "44444444-4444-4444-4444-444444444444", "timestamp": "2024-06-14T10:20:30Z", "message": "m"},
+            ],
+        },
+        "unknownProperty": "value",
+    }
+
+
+class KuFlowDeserializerTest(unittest.TestCase):
+    def assert_same_as_generic(self, target: str, data):
+        expected = Deserializer(CLIENT_MODELS)._deserialize(target, data)
+        actual = KuFlowDeserializer(CLIENT_MODELS)._deserialize(target, data)
+
+        self.assertEqual(type(actual), type(expected))
+        self.assertEqual(actual, expected)
+
+        return actual
+
+    def test_deserialize_process_item(self):
+        process_item_model = self.assert_same_as_generic("ProcessItem", process_item(1))
+
+        self.assertEqual(
+            process_item_model.created_at, datetime.datetime(2024, 6, 14, 10, 20, 30, 123456, datetime.timezone.utc)
+        )
+        self.assertEqual(process_item_model.task.data.value["tags"], ["a", None, {"nested": True}])
+        self.assertEqual(process_item_model.task.logs[0].message, "m")
+        self.assertEqual(process_item_model.additional_properties, {"unknownProperty": "value"})
+
+    def test_deserialize_page(self):
+        page = {
+            "metadata": {"size": 2, "page": 0, "totalElements": 2, "totalPages": 1},
+            "content": [process_item(1), process_item(2)],
+        }
+
+        self.assert_same_as_generic("ProcessItemPage", page)
+
+    def test_deserialize_polymorphic_model(self):
+        event = {
+            "id": "55555555-5555-5555-5555-555555555555",
+            "version": "1",
+            "type": "PROCESS.CREATED",
+            "timestamp": "2024-06-14T10:20:30Z",
+            "data": {"processId": "11111111-1111-1111-1111-111111111111", "processState": "RUNNING"},
+        }
+
+        webhook_event = self.assert_same_as_generic("WebhookEvent", event)
+
+        self.assertIsInstance(webhook_event, models.WebhookEventProcessCreated)
+
+    def test_deserialize_invalid_data(self):
+        with self.assertRaises(DeserializationError):
+            KuFlowDeserializer(CLIENT_MODELS)._deserialize("PageMetadata", {"size": "not a number"})
+
+        with self.assertRaises(DeserializationError):
+            KuFlowDeserializer(CLIENT_MODELS)._deserialize("ProcessItemTask", {"logs": {"id": "1"}})
+
+
+class KuFlowLazyDeserializerTest(unittest.TestCase):
+    def test_attributes_are_converted_on_access(self):
+        page = {
+            "metadata": {"size": 2, "page": 0, "totalElements": 2, "totalPages": 1},
+            "content": [process_item(1), process_item(2)],
+        }
+
+        lazy_page = KuFlowDeserializer(CLIENT_MODELS, lazy=True)._deserialize("ProcessItemPage", page)
+        item = lazy_page.content[0]
+
+        self.assertIsInstance(item, models.ProcessItemPageItem)
+        self.assertEqual(type(item).__name__, "ProcessItemPageItem")
+        self.assertEqual(item.task.state, models.ProcessItemTaskState.READY)
+        self.assertNotIn("created_at", vars(item))
+        self.assertNotIn("logs", vars(item.task))
+        self.assertNotIn("content", vars(lazy_page.content[1]))
+        self.assertEqual(item.additional_properties, {"unknownProperty": "value"})
+
+    def test_lazy_models_behave_as_eager_ones(self):
+        page = {
+            "metadata": {"size": 2, "page": 0, "totalElements": 2, "totalPages": 1},
+            "content": [process_item(1), process_item(2)],
+        }
+        expected = KuFlowDeserializer(CLIENT_MODELS)._deserialize("ProcessItemPage", page)
+
+        self.assertEqual(KuFlowDeserializer(CLIENT_MODELS, lazy=True)._deserialize("ProcessItemPage", page), expected)
+        self.assertEqual(expected, KuFlowDeserializer(CLIENT_MODELS, lazy=True)._deserialize("ProcessItemPage", page))
+        lazy_page = KuFlowDeserializer(CLIENT_MODELS, lazy=True)._deserialize("ProcessItemPage", page)
+        self.assertEqual(lazy_page.as_dict(), expected.as_dict())
+        self.assertEqual(lazy_page.serialize(), expected.serialize())
+        for copied in [copy.deepcopy(lazy_page), pickle.loads(pickle.dumps(lazy_page))]:
+            self.assertIs(type(copied), models.ProcessItemPage)
+            self.assertIs(type(copied.content[0].task), models.ProcessItemTaskPageItem)
+            self.assertEqual(copied, expected)
+
+    def test_polymorphic_model(self):
+        event = {
+            "id": "55555555-5555-5555-5555-555555555555",
+            "version": "1",
+            "type": "PROCESS.CREATED",
+            "timestamp": "2024-06-14T10:20:30Z",
+            "data": {"processId": "11111111-1111-1111-1111-111111111111", "processState": "RUNNING"},
+        }
+
+        webhook_event = KuFlowDeserializer(CLIENT_MODELS, lazy=True)._deserialize("WebhookEvent", event)
+
+        self.assertIsInstance(webhook_event, models.WebhookEventProcessCreated)
+        self.assertEqual(webhook_event.type, "PROCESS.CREATED")
+        self.assertEqual(webhook_event, KuFlowDeserializer(CLIENT_MODELS)._deserialize("WebhookEvent", event))
+
+    def test_invalid_data_is_raised_on_access(self):
+        metadata = KuFlowDeserializer(CLIENT_MODELS, lazy=True)._deserialize("PageMetadata", {"size": "not a number"})
+
+        with self.assertRaises(DeserializationError):
+            _ = metadata.size
+        with self.assertRaises(AttributeError):
+            _ = metadata.unknown
+
+
+class KuFlowCompactDeserializerTest(unittest.TestCase):
+    def test_page_items_are_compact(self):
+        page = {
+            "metadata": {"size": 2, "page": 0, "totalElements": 2, "totalPages": 1},
+            "content": [process_item(1), process_item(2)],
+        }
+
+        compact_page = KuFlowDeserializer(CLIENT_MODELS, compact_page_items=True)._deserialize("ProcessItemPage", page)
+        item = compact_page.content[0]
+
+        self.assertIsInstance(compact_page, models.ProcessItemPage)
+        self.assertIsInstance(item, models.CompactModel)
+        self.assertEqual(type(item).__name__, "CompactProcessItemPageItem")
+        self.assertFalse(hasattr(item, "__dict__"))
+        self.assertIsInstance(item.task, models.CompactModel)
+        self.assertEqual(item.task.state, models.ProcessItemTaskState.READY)
+        self.assertEqual(item.process_item_definition_ref.code, "TASK")
+        self.assertEqual(item.additional_properties, {"unknownProperty": "value"})
+        item.owner_id = "66666666-6666-6666-6666-666666666666"
+        self.assertEqual(item.owner_id, "66666666-6666-6666-6666-666666666666")
+        with self.assertRaises(AttributeError):
+            item.unknown = "value"
+
+    def test_compact_models_behave_as_eager_ones(self):
+        page = {
+            "metadata": {"size": 2, "page": 0, "totalElements": 2, "totalPages": 1},
+            "content": [process_item(1), process_item(2)],
+        }
+        expected = KuFlowDeserializer(CLIENT_MODELS)._deserialize("ProcessItemPage", page)
+
+        compact_page = KuFlowDeserializer(CLIENT_MODELS, compact_page_items=True)._deserialize("ProcessItemPage", page)
+        item = compact_page.content[0]
+
+        self.assertEqual(item, expected.content[0])
+        self.assertNotEqual(item, compact_page.content[1])
+        self.assertEqual(item.to_model(), expected.content[0])
+        self.assertIs(type(item.to_model().task), models.ProcessItemTaskPageItem)
+        self.assertEqual(item, models.compact_model(expected.content[0]))
+        self.assertEqual(compact_page.as_dict(), expected.as_dict())
+        self.assertEqual(compact_page.serialize(), expected.serialize())
+        for copied in [copy.deepcopy(item), pickle.loads(pickle.dumps(item))]:
+            self.assertIs(type(copied), type(item))
+            self.assertEqual(copied, item)
+
+    def test_polymorphic_model(self):
+        event = {
+            "id": "55555555-5555-5555-5555-555555555555",
+            "version": "1",
+            "type": "PROCESS.CREATED",
+            "timestamp": "2024-06-14T10:20:30Z",
+            "data": {"processId": "11111111-1111-1111-1111-111111111111", "processState": "RUNNING"},
+        }
+
+        webhook_event = KuFlowDeserializer(CLIENT_MODELS, compact=True)._deserialize("WebhookEvent", event)
+
+        self.assertEqual(type(webhook_event).__name__, "CompactWebhookEventProcessCreated")
+        self.assertEqual(webhook_event.type, "PROCESS.CREATED")
+        self.assertEqual(webhook_event, KuFlowDeserializer(CLIENT_MODELS)._deserialize("WebhookEvent", event))
+
+
+class KuFlowSerializerTest(unittest.TestCase):
+    def assert_same_as_generic(self, data, data_type: str):
+        expected = Serializer(CLIENT_MODELS).body(data, data_type)
+        actual = KuFlowSerializer(CLIENT_MODELS).body(data, data_type)
+
+        self.assertEqual(actual, expected)
+
+        return actual
+
+    def test_serialize_process_item_create_params(self):
+        params = models.ProcessItemCreateParams(
+            type=models.ProcessItemType.TASK,
+            process_id="11111111-1111-1111-1111-111111111111",
+            process_item_definition_code="TASK",
+            task=models.ProcessItemTaskCreateParams(
+                data=models.JsonValue(value={"name": "Homer", "tags": ["a", None, {"nested": 1.5}], "empty": None})
+            ),
+        )
+
+        body = self.assert_same_as_generic(params, "ProcessItemCreateParams")
+
+        self.assertEqual(body["type"], "TASK")
+        self.assertNotIn("ownerId", body)
+        self.assertIs(body["task"]["data"]["value"], params.task.data.value)
+
+    def test_serialize_json_value_with_non_json_types(self):
+        value = {"date": datetime.datetime(2024, 6, 14, 10, 20, 30, tzinfo=datetime.timezone.utc), "number": 1}
+        params = models.ProcessItemTaskDataUpdateParams(data=models.JsonValue(value=value))
+
+        body = self.assert_same_as_generic(params, "ProcessItemTaskDataUpdateParams")
+
+        self.assertEqual(body["data"]["value"]["date"], "2024-06-14T10:20:30.000Z")
+
+    def test_serialize_json_patch(self):
+        json_patch = [
+            models.JsonPatchOperation(op=models.JsonPatchOperationType.ADD, path="/name", value="Homer"),
+            models.JsonPatchOperation(op=models.JsonPatchOperationType.REMOVE, path="/age"),
+        ]
+
+        self.assert_same_as_generic(json_patch, "[JsonPatchOperation]")
+
+    def test_serialize_dict_payloads_with_generic_serializer(self):
+        params = models.ProcessItemTaskDataUpdateParams(data={"value": {"name": "Homer"}})
+
+        self.assert_same_as_generic(params, "ProcessItemTaskDataUpdateParams")
+        self.assert_same_as_generic({"data": {"value": {"name": "Homer"}}}, "ProcessItemTaskDataUpdateParams")
+
+
+class KuFlowRestClientSerializationTest(unittest.TestCase):
+    def test_client_uses_kuflow_serialization(self):
+        client = KuFlowRestClient(client_id="CLIENT_ID", client_secret="CLIENT_SECRET")
+
+        self.assertIsInstance(client._kuflow_client.process_item._serialize, KuFlowSerializer)
+        self.assertIsInstance(client._kuflow_client.process_item._deserialize, KuFlowDeserializer)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from aiohttp import web
+from azure.core.exceptions import HttpResponseError
+
+from kuflow_rest import KuFlowRestClient
+from kuflow_rest.aio import KuFlowRestClient as AsyncKuFlowRestClient
+
+from ._stub_server import StubServer
+
+
+def process_json(process_id: str) -> dict:
+    return {
+        "id": process_id,
+        "tenantId": "22222222-2222-2222-2222-222222222222",
+        "state": "RUNNING",
+        "processDefinitionRef": {
+            "id": "33333333-3333-3333-3333-333333333333",
+            "version": "44444444-4444-4444-4444-444444444444",
+            "code": "CODE",
+        },
+        "entity": {"value": {"name": "Homer"}},
+    }
+
+
+class SingleFlightTest(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        async def retrieve_process(request: web.Request):
+            await asyncio.sleep(0.5)
+            if request.match_info["id"] == "error":
+                return web.json_response({"status": 400, "message": "Invalid id", "errors": []}, status=400)
+            return web.json_response(process_json(request.match_info["id"]))
+
+        cls.server = StubServer()
+        cls.server.route("GET", "/processes/{id}", retrieve_process)
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.requests.clear()
+
+    def create_client(self, client_class=KuFlowRestClient, **kwargs):
+        return client_class(
+            client_id="CLIENT_ID",
+            client_secret="CLIENT_SECRET",
+            endpoint=self.server.endpoint,
+            allow_insecure_connection=True,
+            **{"single_flight": True, **kwargs},
+        )
+
+    def test_concurrent_reads_share_one_call(self):
+        client = self.create_client()
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            processes = list(executor.map(lambda _: client.process.retrieve_process("1"), range(10)))
+
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual((client.single_flight_policy.hits, client.single_flight_policy.misses), (9, 1))
+        self.assertEqual({process.id for process in processes}, {"1"})
+        # Every caller gets its own models
+        processes[0].entity.value["name"] = "Bart"
+        self.assertEqual(processes[1].entity.value["name"], "Homer")
+
+        client.process.retrieve_process("1")
+
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual(client.single_flight_policy.misses, 2)
+
+    def test_errors_are_shared(self):
+        client = self.create_client()
+
+        def retrieve_process(_):
+            with self.assertRaises(HttpResponseError) as context:
+                client.process.retrieve_process("error")
+            return context.exception.model.message
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            messages = list(executor.map(retrieve_process, range(4)))
+
+        self.assertEqual(messages, ["Invalid id"] * 4)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_disabled_by_default(self):
+        client = KuFlowRestClient(
+            client_id="CLIENT_ID",
+            client_secret="CLIENT_SECRET",
+            endpoint=self.server.endpoint,
+            allow_insecure_connection=True,
+        )
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            list(executor.map(lambda _: client.process.retrieve_process("1"), range(3)))
+
+        self.assertIsNone(client.single_flight_policy)
+        self.assertEqual(len(self.server.requests), 3)
+
+    async def test_async_concurrent_reads_share_one_call(self):
+        async with self.create_client(AsyncKuFlowRestClient) as client:
+            processes = await asyncio.gather(*[client.process.retrieve_process(str(i % 2)) for i in range(10)])
+
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual((client.single_flight_policy.hits, client.single_flight_policy.misses), (8, 2))
+        self.assertEqual([process.id for process in processes], [str(i % 2) for i in range(10)])
+
+    async def test_async_waiters_send_the_call_when_the_leader_is_cancelled(self):
+        async with self.create_client(AsyncKuFlowRestClient) as client:
+            leader = asyncio.ensure_future(client.process.retrieve_process("1"))
+            await asyncio.sleep(0.1)
+            waiter = asyncio.ensure_future(client.process.retrieve_process("1"))
+            await asyncio.sleep(0.1)
+            leader.cancel()
+
+            process = await waiter
+
+        self.assertEqual(process.id, "1")
+        self.assertEqual(client.single_flight_policy.misses, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
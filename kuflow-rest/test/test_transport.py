@@ -0,0 +1,127 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import unittest
+
+from aiohttp import web
+from azure.core.pipeline.transport import RequestsTransport
+
+from kuflow_rest import KuBotTokenCredential, KuFlowRestClient, PooledRequestsTransport, SharedTransport
+from kuflow_rest.aio import AsyncSharedTransport
+from kuflow_rest.aio import KuFlowRestClient as AsyncKuFlowRestClient
+
+from ._stub_server import StubServer
+
+
+class RecordingTransport(RequestsTransport):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.options = []
+
+    def send(self, request, **kwargs):
+        self.options.append(kwargs)
+        return super().send(request, **kwargs)
+
+
+class TransportTest(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.client_ports = []
+
+        async def retrieve_tenant(request: web.Request):
+            cls.client_ports.append(request.transport.get_extra_info("peername")[1])
+            return web.json_response({"id": request.match_info["id"], "name": "Tenant", "plan": "FREE"})
+
+        cls.server = StubServer()
+        cls.server.route("GET", "/tenants/{id}", retrieve_tenant)
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.requests.clear()
+        self.client_ports.clear()
+
+    def create_client(self, client_class=KuFlowRestClient, token="TOKEN", **kwargs):
+        return client_class(
+            credential=KuBotTokenCredential(token, 0),
+            endpoint=self.server.endpoint,
+            allow_insecure_connection=True,
+            **kwargs,
+        )
+
+    def test_clients_share_the_connections_of_a_shared_transport(self):
+        transport = SharedTransport()
+
+        with self.create_client(token="TOKEN-1", transport=transport) as client:
+            client.tenant.retrieve_tenant("1")
+        self.create_client(token="TOKEN-2", transport=transport).tenant.retrieve_tenant("2")
+        transport.close()
+
+        authorizations = [request.headers["Authorization"] for request in self.server.requests]
+        self.assertEqual(authorizations, ["Bearer TOKEN-1", "Bearer TOKEN-2"])
+        self.assertEqual(len(set(self.client_ports)), 1)
+
+    def test_connections_are_not_reused_without_keep_alive(self):
+        client = self.create_client(keep_alive=False)
+
+        client.tenant.retrieve_tenant("1")
+        client.tenant.retrieve_tenant("2")
+
+        self.assertEqual(len(set(self.client_ports)), 2)
+
+    def test_connection_pool_size(self):
+        transport = PooledRequestsTransport(connection_pool_size=2, connection_pool_size_per_host=50)
+        transport.open()
+
+        adapter = transport.session.get_adapter("https://api.kuflow.com")
+        self.assertEqual((adapter._pool_connections, adapter._pool_maxsize), (2, 50))
+        transport.close()
+
+    def test_timeouts_are_request_options(self):
+        transport = RecordingTransport()
+        client = self.create_client(transport=SharedTransport(transport), connection_timeout=5, read_timeout=30)
+
+        client.tenant.retrieve_tenant("1")
+        client.tenant.retrieve_tenant("2", read_timeout=60)
+
+        self.assertEqual(transport.options[0]["connection_timeout"], 5)
+        self.assertEqual([options["read_timeout"] for options in transport.options], [30, 60])
+
+    async def test_async_clients_share_the_connections_of_a_shared_transport(self):
+        async with AsyncSharedTransport(connection_pool_size=10) as transport:
+            async with self.create_client(AsyncKuFlowRestClient, token="TOKEN-1", transport=transport) as client:
+                await client.tenant.retrieve_tenant("1")
+            async with self.create_client(AsyncKuFlowRestClient, token="TOKEN-2", transport=transport) as client:
+                await client.tenant.retrieve_tenant("2")
+            await transport.close()
+
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual(len(set(self.client_ports)), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,233 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import asyncio
+import mmap
+import os
+import tempfile
+import unittest
+
+from aiohttp import web
+from azure.core.exceptions import HttpResponseError
+
+from kuflow_rest import KuFlowRestClient, models
+from kuflow_rest._upload import upload_documents
+from kuflow_rest.aio import KuFlowRestClient as AsyncKuFlowRestClient
+from kuflow_rest.policies import deadline, remaining_time
+
+from ._stub_server import StubServer
+
+
+PROCESS_ID = "00000000-0000-0000-0000-000000000001"
+CONTENT = bytes(range(256)) * 4096
+
+
+class DocumentUploadTest(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.uploads = []
+        cls.failures = {}
+        cls.in_flight = [0, 0]
+
+        async def upload_process_document(request: web.Request):
+            content = await request.read()
+            file_name = request.query["fileName"]
+            if cls.failures.get(file_name):
+                status = cls.failures[file_name].pop(0)
+                return web.json_response({"status": status, "message": "Failed"}, status=status)
+
+            cls.in_flight[0] += 1
+            cls.in_flight[1] = max(cls.in_flight)
+            await asyncio.sleep(0.02)
+            cls.in_flight[0] -= 1
+            cls.uploads.append((file_name, request.query["fileContentType"], content))
+            uri = "x" if file_name == "report.pdf" else file_name
+            return web.json_response({"documentUri": f"kuflow-file:uri={uri};size={len(content)};"})
+
+        cls.server = StubServer()
+        cls.server.route("POST", "/processes/{id}/~actions/upload-document", upload_process_document)
+        cls.server.start()
+
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.directory.name, "report.pdf")
+        with open(cls.path, "wb") as file:
+            file.write(CONTENT)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+        cls.directory.cleanup()
+
+    def setUp(self):
+        self.server.requests.clear()
+        self.uploads.clear()
+        self.failures.clear()
+        self.in_flight[:] = [0, 0]
+
+    def create_client(self, client_class=KuFlowRestClient, **kwargs):
+        return client_class(
+            client_id="CLIENT_ID",
+            client_secret="CLIENT_SECRET",
+            endpoint=self.server.endpoint,
+            allow_insecure_connection=True,
+            **kwargs,
+        )
+
+    def test_document_from_path(self):
+        with models.Document.from_path(self.path) as document:
+            self.assertEqual(document.file_name, "report.pdf")
+            self.assertEqual(document.content_type, "application/pdf")
+            self.assertEqual(document.size, len(CONTENT))
+
+        self.assertTrue(document.file_content.closed)
+
+    def test_document_from_buffer(self):
+        buffer = bytearray(CONTENT)
+        with models.Document.from_buffer(memoryview(buffer)[256:], "data.bin") as document:
+            self.assertEqual(document.size, len(CONTENT) - 256)
+            self.assertEqual(document.file_content.read(3), bytes([0, 1, 2]))
+            document.file_content.seek(-2, os.SEEK_END)
+            self.assertEqual(document.file_content.read(), bytes([254, 255]))
+
+    def test_upload_with_progress(self):
+        client = self.create_client()
+        progress = []
+
+        with models.Document.from_path(self.path) as document:
+            reference = client.process.upload_process_document(PROCESS_ID, document, progress=progress.append)
+
+        self.assertEqual(reference.document_uri, f"kuflow-file:uri=x;size={len(CONTENT)};")
+        self.assertEqual(self.uploads, [("report.pdf", "application/pdf", CONTENT)])
+        self.assertEqual(self.server.requests[0].headers["Content-Length"], str(len(CONTENT)))
+        self.assertGreater(len(progress), 1)
+        self.assertEqual(progress[-1].bytes_sent, len(CONTENT))
+        self.assertEqual(progress[-1].total_bytes, len(CONTENT))
+        self.assertGreater(progress[-1].throughput, 0)
+
+    def test_upload_memory_mapped_file(self):
+        client = self.create_client(http2=True)
+
+        with open(self.path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with models.Document.from_buffer(mapped, "report.pdf", "application/pdf") as document:
+                client.process.upload_process_document(PROCESS_ID, document)
+
+        self.assertEqual(self.uploads, [("report.pdf", "application/pdf", CONTENT)])
+
+    async def test_async_upload(self):
+        for http2 in (False, True):
+            progress = []
+            async with self.create_client(AsyncKuFlowRestClient, http2=http2) as client:
+                with models.Document.from_path(self.path) as document:
+                    await client.process.upload_process_document(PROCESS_ID, document, progress=progress.append)
+
+            self.assertEqual(self.uploads.pop(), ("report.pdf", "application/pdf", CONTENT))
+            self.assertEqual(progress[-1].bytes_sent, len(CONTENT))
+
+    def test_bulk_upload(self):
+        client = self.create_client()
+        documents = [models.Document.from_buffer(CONTENT[:index], f"scan-{index}.pdf") for index in range(10)]
+        progress = {}
+
+        references = client.process.upload_process_documents(
+            PROCESS_ID, documents, max_concurrency=3, progress=lambda index, value: progress.update({index: value})
+        )
+
+        self.assertEqual(
+            [reference.document_uri for reference in references],
+            [f"kuflow-file:uri=scan-{index}.pdf;size={index};" for index in range(10)],
+        )
+        self.assertEqual(self.in_flight[1], 3)
+        self.assertEqual(progress[9].bytes_sent, 9)
+
+    def test_bulk_upload_retries(self):
+        client = self.create_client()
+        self.failures.update({"scan-1.pdf": [503, 500], "scan-2.pdf": [429]})
+        documents = [models.Document.from_buffer(CONTENT[:100], f"scan-{index}.pdf") for index in range(3)]
+
+        document_uris = client.process.upload_process_documents(PROCESS_ID, documents, as_document_uris=True)
+
+        self.assertEqual(document_uris, [f"kuflow-file:uri=scan-{index}.pdf;size=100;" for index in range(3)])
+        self.assertEqual(len(self.server.requests), 6)
+
+    def test_bulk_upload_retries_are_not_added_to_the_pipeline_retries(self):
+        client = self.create_client()
+        self.failures.update({"scan-0.pdf": [503, 503, 503]})
+        documents = [models.Document.from_buffer(CONTENT[:100], "scan-0.pdf")]
+
+        with self.assertRaises(HttpResponseError) as context:
+            client.process.upload_process_documents(PROCESS_ID, documents, max_retries=1)
+
+        self.assertEqual(context.exception.status_code, 503)
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_bulk_upload_error(self):
+        client = self.create_client()
+        self.failures.update({"scan-0.pdf": [400]})
+        documents = [models.Document.from_buffer(CONTENT[:100], f"scan-{index}.pdf") for index in range(3)]
+
+        with self.assertRaises(HttpResponseError) as context:
+            client.process.upload_process_documents(PROCESS_ID, documents, max_concurrency=1)
+
+        self.assertEqual(context.exception.status_code, 400)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_bulk_upload_with_the_deadline(self):
+        remaining = []
+
+        def upload(index, document):
+            remaining.append(remaining_time())
+            return index
+
+        with deadline(60):
+            results = upload_documents(upload, [models.Document.from_buffer(b"", "empty")] * 4, 2, 0)
+
+        self.assertEqual(results, [0, 1, 2, 3])
+        self.assertTrue(all(value is not None and value <= 60 for value in remaining), remaining)
+
+    async def test_async_bulk_upload_error(self):
+        async with self.create_client(AsyncKuFlowRestClient) as client:
+            self.failures.update({"scan-0.pdf": [400]})
+            documents = [models.Document.from_buffer(CONTENT[:100], f"scan-{index}.pdf") for index in range(3)]
+
+            with self.assertRaises(HttpResponseError) as context:
+                await client.process.upload_process_documents(PROCESS_ID, documents, max_concurrency=1)
+
+        self.assertEqual(context.exception.status_code, 400)
+        self.assertEqual(len(self.server.requests), 1)
+
+    async def test_async_bulk_upload(self):
+        async with self.create_client(AsyncKuFlowRestClient) as client:
+            self.failures.update({"scan-4.pdf": [502]})
+            documents = [models.Document.from_buffer(CONTENT[:index], f"scan-{index}.pdf") for index in range(8)]
+
+            document_uris = await client.process.upload_process_documents(
+                PROCESS_ID, documents, max_concurrency=4, as_document_uris=True
+            )
+
+        self.assertEqual(document_uris, [f"kuflow-file:uri=scan-{index}.pdf;size={index};" for index in range(8)])
+        self.assertEqual(self.in_flight[1], 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -24,12 +24,15 @@
 
 import unittest
 
+from kuflow_rest.models import KuFlowFile, KuFlowGroup, KuFlowPrincipal
 from kuflow_rest.utils import (
+    find_kuflow_references,
     generate_kuflow_group_string,
     generate_kuflow_principal_string,
     parse_kuflow_file,
     parse_kuflow_group,
     parse_kuflow_principal,
+    parse_kuflow_references,
 )
 
 
@@ -199,6 +202,66 @@ class UtilsParserTest(unittest.TestCase):
         kuflow_group = generate_kuflow_group_string("id=xxx-ssss-yyyy;", "OTHERS", None)
         self.assertEqual(kuflow_group, "kuflow-group:id=id%3Dxxx-ssss-yyyy%3B;type=OTHERS;name=;")
 
+    def test_parse_kuflow_file_incorrect_malformed_value(self):
+        kuflow_file = parse_kuflow_file(
+            "kuflow-file:uri=ku:dummy/xxx-ssss-yyyy;type=application/pdf;size=11111;name=dummy=.pdf;"
+        )
+        self.assertIsNone(kuflow_file)
+
+    def test_parse_cached_reference(self):
+        original = "kuflow-principal:id=xxx-ssss-yyyy;type=USER;name=Homer%20Simpson;"
+
+        first = parse_kuflow_principal(original)
+        second = parse_kuflow_principal(original)
+
+        # Parsed values are cached, every call returns its own object
+        self.assertIsNot(first, second)
+        self.assertEqual((second.id, second.type, second.name), ("xxx-ssss-yyyy", "USER", "Homer Simpson"))
+        self.assertEqual(str(second), original)
+        self.assertIsNone(parse_kuflow_group(original))
+        with self.assertRaises(AttributeError):
+            first.other = "value"
+
+    def test_parse_kuflow_references(self):
+        references = parse_kuflow_references(
+            [
+                "kuflow-file:uri=ku:dummy/xxx;type=application/pdf;size=10;name=dummy.pdf;",
+                "kuflow-principal:id=xxx;type=USER;name=Homer;",
+                "kuflow-group:id=yyy;type=OTHERS;name=Group;",
+                "kuflow-group:id=yyy;type=OTHERS;",
+                "text",
+                10,
+                None,
+            ]
+        )
+
+        self.assertIsInstance(references[0], KuFlowFile)
+        self.assertEqual(references[0].size, 10)
+        self.assertIsInstance(references[1], KuFlowPrincipal)
+        self.assertIsInstance(references[2], KuFlowGroup)
+        self.assertEqual(references[3:], [None, None, None, None])
+
+    def test_find_kuflow_references(self):
+        references = find_kuflow_references(
+            {
+                "documents": [
+                    "kuflow-file:uri=ku:dummy/xxx;type=application/pdf;size=10;name=dummy.pdf;",
+                    "kuflow-file:uri=ku:dummy/yyy;type=application/pdf;size=20;name=other.pdf;",
+                ],
+                "approval": {"user/name": "kuflow-principal:id=xxx;type=USER;name=Homer;", "comment": "kuflow-"},
+                "count": 2,
+            }
+        )
+
+        self.assertEqual(
+            {pointer: str(reference) for pointer, reference in references.items()},
+            {
+                "/documents/0": "kuflow-file:uri=ku:dummy/xxx;type=application/pdf;size=10;name=dummy.pdf;",
+                "/documents/1": "kuflow-file:uri=ku:dummy/yyy;type=application/pdf;size=20;name=other.pdf;",
+                "/approval/user~1name": "kuflow-principal:id=xxx;type=USER;name=Homer;",
+            },
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -24,7 +24,6 @@
 
 import json
 import logging
-import os
 from typing import Any, Optional
 from uuid import UUID
 
@@ -32,13 +31,15 @@ import magic
 from robot.api.deco import keyword
 from robot.utils import is_dict_like, is_string, type_name
 
-from kuflow_rest import KuBotTokenCredential, KuFlowRestClient, models
+from kuflow_rest import KuBotTokenCredential, KuFlowRestClient, SharedTransport, models
 
 
 class Keywords:
     def __init__(self) -> None:
         self.logger = logging.getLogger(__name__)
         self._client: Optional[KuFlowRestClient] = None
+        # Shared by the clients of every "Set Client Authentication", so that their connections are reused
+        self._transport: Optional[SharedTransport] = None
 
     @keyword(tags=("settings",))
     def get_kuBot_token_credential(
@@ -71,12 +72,16 @@ class Keywords:
         if is_string(endpoint) and (endpoint.strip() == "" or endpoint.lower() == "none"):
             endpoint = None
 
+        if self._transport is None:
+            self._transport = SharedTransport()
+
         self._client = KuFlowRestClient(
             client_id=client_id,
             client_secret=client_secret,
             credential=credential,
             endpoint=endpoint,
             allow_insecure_connection=allow_insecure_connection,
+            transport=self._transport,
         )
 
     @keyword(tags=("settings",))
@@ -186,55 +191,43 @@ class Keywords:
         return self._client.process_item.update_process_item_task_data(process_item_id, params)
 
     @keyword()
-    def upload_process_item_task_data_document(self, task_id: UUID, path_in_schema: str, path: str) -> str:
+    def upload_process_item_task_data_document(
+        self, task_id: UUID, path_in_schema: Optional[str] = None, path: Optional[str] = None
+    ) -> str:
         """Upload a JSON Forms value document
 
         Allows you to upload a document to the referenced task and then include a reference to it
-        in the task's JSON Forms.
-
-        You must provide the path within the JSON schema that defines the document you wish to upload.
-        This schema is found in your task definition in KuFlow. For example, given this schema:
-
-        {
-            "type": "object",
-            "properties": {
-                "file": {
-                    "type": "string",
-                    "format": "kuflow-file",
-                    "accept": "image/*,application/pdf,.pdf",
-                    "maxSize": 20000000
-                }
-            }
-        }
-
-        The path is as follows: #/properties/file
+        in the task's JSON Forms. The document is uploaded to the process of the task, streaming the
+        file from disk, and the file is closed once it is sent. The returned document reference is
+        saved in the task data with Update Process Item Task Data.
 
-        Note that in RobotFramework, the hash indicates a comment, so you should escape it
+        The path within the JSON schema is no longer needed: the document is not bound to a schema
+        property until its reference is saved in the task data. The path_in_schema argument is
+        deprecated and ignored, it is still accepted so that existing suites keep working.
 
         Example:
-        | Upload Process Item Task Data Document | ${PROCESS_ITEM_ID} | ${PATH_IN_SCHEMA} | ${PATH}
+        | Upload Process Item Task Data Document | ${PROCESS_ITEM_ID} | ${PATH}
         =>
         | ${document_reference}=
-        | ... Upload Json Forms Value document | ${PROCESS_ITEM_ID} | \\#/properties/file | hello.jpg
+        | ... Upload Process Item Task Data Document | ${PROCESS_ITEM_ID} | hello.jpg
         | &{json_data}=    Create Dictionary    my_file=${document_reference}
         | Update Process Item Task Data    ${KUFLOW_TASK_ID}    ${json_data}
         """
 
-        file_name = os.path.basename(path)
-        file = open(path, "rb")
-        content_type = magic.from_file(path, mime=True)
+        if path is None:
+            path, path_in_schema = path_in_schema, None
+        if path is None:
+            raise TypeError("Expected the path of the document to upload.")
+        if path_in_schema is not None:
+            self.logger.warning("The path_in_schema argument is deprecated and ignored.")
 
-        file = models.Document(
-            file_name=file_name,
-            content_type=content_type,
-            file_content=file,
-        )
+        process_item = self._client.process_item.retrieve_process_item(id=task_id)
+        content_type = magic.from_file(path, mime=True)
 
-        response = self._client.process_item.upload_process_item_task_data_document(
-            id=task_id, file=file, schema_path=path_in_schema
-        )
+        with models.Document.from_path(path, content_type=content_type) as document:
+            response = self._client.process.upload_process_document(id=process_item.process_id, document=document)
 
-        return response.value
+        return response.document_uri
 
     @keyword()
     def convert_json_string_to_object(self, json_string):
@@ -0,0 +1,139 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+"""Throughput of KuFlowActivities against a local KuFlow API stand-in with a fixed latency per call.
+
+Usage:
+    python benchmark/benchmark_activities.py [--latency 0.05] [--calls 200]
+
+Three setups are measured for several concurrency levels:
+    * blocking: the synchronous client called from the event loop (the behaviour before offloading).
+    * executor: the synchronous client offloaded to a thread pool.
+    * async: the ``kuflow_rest.aio`` client.
+"""
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from kuflow_rest import KuFlowRestClient
+from kuflow_rest.aio import KuFlowRestClient as KuFlowRestClientAsync
+from kuflow_temporal_activity_kuflow import KuFlowActivities
+from kuflow_temporal_activity_kuflow import models as models_temporal
+
+
+PROCESS = {
+    "id": "11111111-1111-1111-1111-111111111111",
+    "tenantId": "22222222-2222-2222-2222-222222222222",
+    "state": "RUNNING",
+    "processDefinitionRef": {"id": "33333333-3333-3333-3333-333333333333", "version": "1", "code": "CODE"},
+}
+
+
+class InlineExecutor(Executor):
+    """Run the submitted callable right away, in the caller thread."""
+
+    def submit(self, fn, /, *args, **kwargs):
+        future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+def start_server(latency: float) -> ThreadingHTTPServer:
+    body = json.dumps(PROCESS).encode()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    class Server(ThreadingHTTPServer):
+        daemon_threads = True
+        request_queue_size = 1024
+
+    server = Server(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    return server
+
+
+async def run(activities: KuFlowActivities, calls: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+    request = models_temporal.ProcessRetrieveRequest(process_id=PROCESS["id"])
+
+    async def one():
+        async with semaphore:
+            await activities.retrieve_process(request)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[one() for _ in range(calls)])
+
+    return calls / (time.perf_counter() - start)
+
+
+async def main(latency: float, calls: int) -> None:
+    server = start_server(latency)
+    endpoint = f"http://127.0.0.1:{server.server_address[1]}"
+    options = {"client_id": "id", "client_secret": "secret", "endpoint": endpoint, "allow_insecure_connection": True}
+
+    sync_client = KuFlowRestClient(**options)
+    async_client = KuFlowRestClientAsync(**options, connection_pool_size=200)
+
+    setups = {
+        "blocking": KuFlowActivities(sync_client, executor=InlineExecutor()),
+        "executor": KuFlowActivities(sync_client, executor=ThreadPoolExecutor(max_workers=100)),
+        "async": KuFlowActivities(async_client),
+    }
+
+    print(f"latency={latency * 1000:.0f}ms calls={calls}")
+    print(f"{'concurrency':>12} " + " ".join(f"{name + ' req/s':>16}" for name in setups))
+    async with async_client:
+        for concurrency in (1, 10, 50, 100):
+            results = [await run(activities, calls, concurrency) for activities in setups.values()]
+            print(f"{concurrency:>12} " + " ".join(f"{result:>16.1f}" for result in results))
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.latency, args.calls))
@@ -22,19 +22,61 @@
 # SOFTWARE.
 #
 
+import asyncio
+import contextvars
+import functools
+import inspect
+from concurrent.futures import Executor, ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+
 from temporalio import activity
 
 from kuflow_rest import KuFlowRestClient
 from kuflow_rest import models as models_rest
+from kuflow_rest.policies import deadline
 from kuflow_temporal_common import create_application_error
 
 from . import _validation as validation
 from . import models as models_temporal
 
 
+if TYPE_CHECKING:
+    from kuflow_rest.aio import KuFlowRestClient as KuFlowRestClientAsync
+
+
+# Maximum seconds that the REST calls leave before the activity timeout, to report their error before it expires
+_DEADLINE_MARGIN = 1.0
+
+# Threads of the default executor, the max_concurrent_activities default of the Temporal workers
+_DEFAULT_MAX_WORKERS = 100
+
+
 class KuFlowActivities:
-    def __init__(self, kuflow_client: KuFlowRestClient) -> None:
+    def __init__(
+        self,
+        kuflow_client: Union[KuFlowRestClient, "KuFlowRestClientAsync"],
+        executor: Optional[Executor] = None,
+        max_workers: int = _DEFAULT_MAX_WORKERS,
+    ) -> None:
+        """
+        Parameters:
+            kuflow_client: KuFlow rest client. With a ``kuflow_rest.aio.KuFlowRestClient`` the REST calls are awaited
+              directly. With the synchronous ``kuflow_rest.KuFlowRestClient`` they are offloaded to ``executor``, so
+              they never block the worker event loop.
+            executor: Executor used to run the REST calls of a synchronous client. The caller is responsible for
+              shutting it down. Defaults to a ``ThreadPoolExecutor`` of ``max_workers`` threads, owned by the
+              activities and shut down by :meth:`close`.
+            max_workers: Threads of the default executor, set it to the ``max_concurrent_activities`` of the worker.
+              Default value is 100, the default of the worker.
+        """
         self._kuflow_client = kuflow_client
+        self._executor = executor
+        self._owned_executor: Optional[ThreadPoolExecutor] = None
+        if self._executor is None and isinstance(kuflow_client, KuFlowRestClient):
+            self._owned_executor = ThreadPoolExecutor(max_workers, thread_name_prefix="kuflow-activities")
+            self._executor = self._owned_executor
+
         self.activities = [
             self.retrieve_principal,
             self.retrieve_tenant_user,
@@ -70,6 +112,17 @@ class KuFlowActivities:
             self.prepare_business_artifact_create_artifact,
         ]
 
+    def close(self) -> None:
+        """Shut down the default executor, once the worker that runs the activities is shut down."""
+        if self._owned_executor is not None:
+            self._owned_executor.shutdown()
+
+    def __enter__(self) -> "KuFlowActivities":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
     @activity.defn(name="KuFlow_Engine_retrievePrincipal")
     async def retrieve_principal(
         self,
@@ -78,7 +131,7 @@ class KuFlowActivities:
         try:
             validation.validate_retrieve_principal_request(request)
 
-            principal = self._kuflow_client.principal.retrieve_principal(id=request.principal_id)
+            principal = await self._invoke(self._kuflow_client.principal.retrieve_principal, id=request.principal_id)
 
             return models_temporal.PrincipalRetrieveResponse(principal=principal)
         except Exception as err:
@@ -92,7 +145,9 @@ class KuFlowActivities:
         try:
             validation.validate_retrieve_tenant_user_request(request)
 
-            tenant_user = self._kuflow_client.tenant_user.retrieve_tenant_user(id=request.tenant_user_id)
+            tenant_user = await self._invoke(
+                self._kuflow_client.tenant_user.retrieve_tenant_user, id=request.tenant_user_id
+            )
 
             return models_temporal.TenantUserRetrieveResponse(tenant_user=tenant_user)
         except Exception as err:
@@ -106,7 +161,7 @@ class KuFlowActivities:
         try:
             # Get all non-None properties of the object to avoid overwrite defaults
             non_none_props = {k: v for k, v in vars(request).items() if v is not None}
-            proces_page = self._kuflow_client.process.find_processes(**non_none_props)
+            proces_page = await self._invoke(self._kuflow_client.process.find_processes, **non_none_props)
 
             return models_temporal.ProcessFindResponse(processes=proces_page)
         except Exception as err:
@@ -120,7 +175,7 @@ class KuFlowActivities:
         try:
             validation.validate_retrieve_process_request(request)
 
-            process = self._kuflow_client.process.retrieve_process(id=request.process_id)
+            process = await self._invoke(self._kuflow_client.process.retrieve_process, id=request.process_id)
 
             return models_temporal.ProcessRetrieveResponse(process=process)
         except Exception as err:
@@ -136,8 +191,10 @@ class KuFlowActivities:
 
             params = models_rest.ProcessEntityUpdateParams(entity=request.entity)
 
-            process = self._kuflow_client.process.update_process_entity(
-                id=request.process_id, process_entity_update_params=params
+            process = await self._invoke(
+                self._kuflow_client.process.update_process_entity,
+                id=request.process_id,
+                process_entity_update_params=params,
             )
 
             return models_temporal.ProcessEntityUpdateResponse(process=process)
@@ -154,7 +211,9 @@ class KuFlowActivities:
 
             json_patch = request.json_patch
 
-            process = self._kuflow_client.process.patch_process_entity(id=request.process_id, json_patch=json_patch)
+            process = await self._invoke(
+                self._kuflow_client.process.patch_process_entity, id=request.process_id, json_patch=json_patch
+            )
 
             return models_temporal.ProcessEntityPatchResponse(process=process)
         except Exception as err:
@@ -170,8 +229,10 @@ class KuFlowActivities:
 
             params = models_rest.ProcessMetadataUpdateParams(metadata=request.metadata)
 
-            process = self._kuflow_client.process.update_process_metadata(
-                id=request.process_id, process_metadata_update_params=params
+            process = await self._invoke(
+                self._kuflow_client.process.update_process_metadata,
+                id=request.process_id,
+                process_metadata_update_params=params,
             )
 
             return models_temporal.ProcessMetadataUpdateResponse(process=process)
@@ -186,8 +247,8 @@ class KuFlowActivities:
         try:
             validation.validate_process_metadata_patch_request(request)
 
-            process = self._kuflow_client.process.patch_process_metadata(
-                id=request.process_id, json_patch=request.json_patch
+            process = await self._invoke(
+                self._kuflow_client.process.patch_process_metadata, id=request.process_id, json_patch=request.json_patch
             )
 
             return models_temporal.ProcessMetadataPatchResponse(process=process)
@@ -206,8 +267,10 @@ class KuFlowActivities:
                 initiator_id=request.initiator_id, initiator_email=request.initiator_email
             )
 
-            process = self._kuflow_client.process.change_process_initiator(
-                id=request.process_id, process_change_initiator_params=params
+            process = await self._invoke(
+                self._kuflow_client.process.change_process_initiator,
+                id=request.process_id,
+                process_change_initiator_params=params,
             )
 
             return models_temporal.ProcessInitiatorChangeResponse(process=process)
@@ -220,7 +283,8 @@ class KuFlowActivities:
         request: models_temporal.ProcessItemFindRequest,
     ) -> models_temporal.ProcessItemFindResponse:
         try:
-            process_items = self._kuflow_client.process_item.find_process_items(
+            process_items = await self._invoke(
+                self._kuflow_client.process_item.find_process_items,
                 size=request.size,
                 page=request.page,
                 sort=request.sorts,
@@ -245,7 +309,9 @@ class KuFlowActivities:
         try:
             validation.validate_process_item_retrieve_request(request)
 
-            process_item = self._kuflow_client.process_item.retrieve_process_item(id=request.process_item_id)
+            process_item = await self._invoke(
+                self._kuflow_client.process_item.retrieve_process_item, id=request.process_item_id
+            )
 
             return models_temporal.ProcessItemRetrieveResponse(process_item=process_item)
         except Exception as err:
@@ -270,7 +336,9 @@ class KuFlowActivities:
                 message=request.message,
             )
 
-            process_item = self._kuflow_client.process_item.create_process_item(process_item_create_params=params)
+            process_item = await self._invoke(
+                self._kuflow_client.process_item.create_process_item, process_item_create_params=params
+            )
 
             return models_temporal.ProcessItemCreateResponse(process_item=process_item)
         except Exception as err:
@@ -284,7 +352,9 @@ class KuFlowActivities:
         try:
             validation.validate_process_item_task_complete_request(request)
 
-            process_item = self._kuflow_client.process_item.complete_process_item_task(id=request.process_item_id)
+            process_item = await self._invoke(
+                self._kuflow_client.process_item.complete_process_item_task, id=request.process_item_id
+            )
 
             return models_temporal.ProcessItemTaskCompleteResponse(process_item=process_item)
         except Exception as err:
@@ -298,7 +368,9 @@ class KuFlowActivities:
         try:
             validation.validate_process_item_task_claim_request(request)
 
-            process_item = self._kuflow_client.process_item.claim_process_item_task(id=request.process_item_id)
+            process_item = await self._invoke(
+                self._kuflow_client.process_item.claim_process_item_task, id=request.process_item_id
+            )
 
             return models_temporal.ProcessItemTaskClaimResponse(process_item=process_item)
         except Exception as err:
@@ -314,8 +386,10 @@ class KuFlowActivities:
 
             params = models_rest.ProcessItemTaskAssignParams(owner_id=request.owner_id, owner_email=request.owner_email)
 
-            process_item = self._kuflow_client.process_item.assign_process_item_task(
-                id=request.process_item_id, process_item_task_assign_params=params
+            process_item = await self._invoke(
+                self._kuflow_client.process_item.assign_process_item_task,
+                id=request.process_item_id,
+                process_item_task_assign_params=params,
             )
 
             return models_temporal.ProcessItemTaskAssignResponse(process_item=process_item)
@@ -332,8 +406,10 @@ class KuFlowActivities:
 
             params = models_rest.ProcessItemTaskDataUpdateParams(data=request.data)
 
-            process_item = self._kuflow_client.process_item.update_process_item_task_data(
-                id=request.process_item_id, process_item_task_data_update_params=params
+            process_item = await self._invoke(
+                self._kuflow_client.process_item.update_process_item_task_data,
+                id=request.process_item_id,
+                process_item_task_data_update_params=params,
             )
 
             return models_temporal.ProcessItemTaskDataUpdateResponse(process_item=process_item)
@@ -348,8 +424,10 @@ class KuFlowActivities:
         try:
             validation.validate_process_item_task_data_patch_request(request)
 
-            process_item = self._kuflow_client.process_item.patch_process_item_task_data(
-                id=request.process_item_id, json_patch=request.json_patch
+            process_item = await self._invoke(
+                self._kuflow_client.process_item.patch_process_item_task_data,
+                id=request.process_item_id,
+                json_patch=request.json_patch,
             )
 
             return models_temporal.ProcessItemTaskDataPatchResponse(process_item=process_item)
@@ -366,8 +444,10 @@ class KuFlowActivities:
 
             params = models_rest.ProcessItemTaskAppendLogParams(level=request.level, message=request.message)
 
-            process_item = self._kuflow_client.process_item.append_process_item_task_log(
-                id=request.process_item_id, process_item_task_append_log_params=params
+            process_item = await self._invoke(
+                self._kuflow_client.process_item.append_process_item_task_log,
+                id=request.process_item_id,
+                process_item_task_append_log_params=params,
             )
 
             return models_temporal.ProcessItemTaskLogAppendResponse(process_item=process_item)
@@ -384,8 +464,10 @@ class KuFlowActivities:
 
             params = models_rest.ProcessItemTaskContextDataUpdateParams(data=request.data)
 
-            process_item = self._kuflow_client.process_item.update_process_item_task_context_data(
-                id=request.process_item_id, process_item_task_context_data_update_params=params
+            process_item = await self._invoke(
+                self._kuflow_client.process_item.update_process_item_task_context_data,
+                id=request.process_item_id,
+                process_item_task_context_data_update_params=params,
             )
 
             return models_temporal.ProcessItemTaskContextDataUpdateResponse(process_item=process_item)
@@ -400,8 +482,8 @@ class KuFlowActivities:
         try:
             validation.validate_process_item_ai_assistance_retrieve_request(request)
 
-            process_item_ai_assistance = self._kuflow_client.process_item.retrieve_process_item_ai_assistance(
-                id=request.process_item_id
+            process_item_ai_assistance = await self._invoke(
+                self._kuflow_client.process_item.retrieve_process_item_ai_assistance, id=request.process_item_id
             )
 
             return models_temporal.ProcessItemAiAssistanceRetrieveResponse(
@@ -420,8 +502,10 @@ class KuFlowActivities:
 
             params = models_rest.ProcessItemAiAssistanceGenerateParams(request_id=request.request_id)
 
-            process_item_ai_assistance = self._kuflow_client.process_item.generate_process_item_ai_assistance(
-                id=request.process_item_id, process_item_ai_assistance_generate_params=params
+            process_item_ai_assistance = await self._invoke(
+                self._kuflow_client.process_item.generate_process_item_ai_assistance,
+                id=request.process_item_id,
+                process_item_ai_assistance_generate_params=params,
             )
 
             return models_temporal.ProcessItemAiAssistanceGenerateResponse(
@@ -438,8 +522,10 @@ class KuFlowActivities:
         try:
             validation.validate_process_items_cancel_request(request)
 
-            process = self._kuflow_client.process.cancel_process_items(
-                id=request.process_id, process_item_id=request.process_item_ids
+            process = await self._invoke(
+                self._kuflow_client.process.cancel_process_items,
+                id=request.process_id,
+                process_item_id=request.process_item_ids,
             )
 
             return models_temporal.ProcessItemsCancelResponse(process=process)
@@ -452,7 +538,8 @@ class KuFlowActivities:
         request: models_temporal.BusinessArtifactFindRequest,
     ) -> models_temporal.BusinessArtifactFindResponse:
         try:
-            business_artifacts = self._kuflow_client.business_artifact.find_business_artifacts(
+            business_artifacts = await self._invoke(
+                self._kuflow_client.business_artifact.find_business_artifacts,
                 size=request.size,
                 page=request.page,
                 sort=request.sorts,
@@ -482,8 +569,8 @@ class KuFlowActivities:
                 data=request.data,
             )
 
-            business_artifact = self._kuflow_client.business_artifact.create_business_artifact(
-                business_artifact_create_params=params
+            business_artifact = await self._invoke(
+                self._kuflow_client.business_artifact.create_business_artifact, business_artifact_create_params=params
             )
 
             return models_temporal.BusinessArtifactCreateResponse(business_artifact=business_artifact)
@@ -498,8 +585,8 @@ class KuFlowActivities:
         try:
             validation.validate_business_artifact_retrieve_request(request)
 
-            business_artifact = self._kuflow_client.business_artifact.retrieve_business_artifact(
-                id=request.business_artifact_id
+            business_artifact = await self._invoke(
+                self._kuflow_client.business_artifact.retrieve_business_artifact, id=request.business_artifact_id
             )
 
             return models_temporal.BusinessArtifactRetrieveResponse(business_artifact=business_artifact)
@@ -514,7 +601,9 @@ class KuFlowActivities:
         try:
             validation.validate_business_artifact_delete_request(request)
 
-            self._kuflow_client.business_artifact.delete_business_artifact(id=request.business_artifact_id)
+            await self._invoke(
+                self._kuflow_client.business_artifact.delete_business_artifact, id=request.business_artifact_id
+            )
 
             return models_temporal.BusinessArtifactDeleteResponse()
         except Exception as err:
@@ -530,8 +619,10 @@ class KuFlowActivities:
 
             params = models_rest.BusinessArtifactDataUpdateParams(data=request.data)
 
-            business_artifact = self._kuflow_client.business_artifact.update_business_artifact_data(
-                id=request.business_artifact_id, business_artifact_data_update_params=params
+            business_artifact = await self._invoke(
+                self._kuflow_client.business_artifact.update_business_artifact_data,
+                id=request.business_artifact_id,
+                business_artifact_data_update_params=params,
             )
 
             return models_temporal.BusinessArtifactUpdateResponse(business_artifact=business_artifact)
@@ -546,8 +637,10 @@ class KuFlowActivities:
         try:
             validation.validate_business_artifact_patch_request(request)
 
-            business_artifact = self._kuflow_client.business_artifact.patch_business_artifact_data(
-                id=request.business_artifact_id, json_patch=request.json_patch
+            business_artifact = await self._invoke(
+                self._kuflow_client.business_artifact.patch_business_artifact_data,
+                id=request.business_artifact_id,
+                json_patch=request.json_patch,
             )
 
             return models_temporal.BusinessArtifactPatchResponse(business_artifact=business_artifact)
@@ -571,8 +664,10 @@ class KuFlowActivities:
                 create_artifact=request.create_artifact,
             )
 
-            business_artifact_action = self._kuflow_client.business_artifact.create_business_artifact_action(
-                id=request.business_artifact_id, business_artifact_action_create_params=params
+            business_artifact_action = await self._invoke(
+                self._kuflow_client.business_artifact.create_business_artifact_action,
+                id=request.business_artifact_id,
+                business_artifact_action_create_params=params,
             )
 
             return models_temporal.BusinessArtifactActionCreateResponse(
@@ -589,8 +684,10 @@ class KuFlowActivities:
         try:
             validation.validate_business_artifact_action_retrieve_request(request)
 
-            business_artifact_action = self._kuflow_client.business_artifact.retrieve_business_artifact_action(
-                id=request.business_artifact_id, action_id=request.business_artifact_action_id
+            business_artifact_action = await self._invoke(
+                self._kuflow_client.business_artifact.retrieve_business_artifact_action,
+                id=request.business_artifact_id,
+                action_id=request.business_artifact_action_id,
             )
 
             return models_temporal.BusinessArtifactActionRetrieveResponse(
@@ -607,8 +704,10 @@ class KuFlowActivities:
         try:
             validation.validate_business_artifact_action_cancel_request(request)
 
-            business_artifact_action = self._kuflow_client.business_artifact.cancel_business_artifact_action(
-                id=request.business_artifact_id, action_id=request.business_artifact_action_id
+            business_artifact_action = await self._invoke(
+                self._kuflow_client.business_artifact.cancel_business_artifact_action,
+                id=request.business_artifact_id,
+                action_id=request.business_artifact_action_id,
             )
 
             return models_temporal.BusinessArtifactActionCancelResponse(
@@ -629,11 +728,10 @@ class KuFlowActivities:
                 business_artifact_action_definition_code=request.business_artifact_action_definition_code
             )
 
-            business_artifact_create_artifact_prepare = (
-                self._kuflow_client.business_artifact.prepare_business_artifact_create_artifact(
-                    id=request.business_artifact_id,
-                    business_artifact_create_artifact_prepare_params=params,
-                )
+            business_artifact_create_artifact_prepare = await self._invoke(
+                self._kuflow_client.business_artifact.prepare_business_artifact_create_artifact,
+                id=request.business_artifact_id,
+                business_artifact_create_artifact_prepare_params=params,
             )
 
             return models_temporal.BusinessArtifactCreateArtifactPrepareResponse(
@@ -641,3 +739,43 @@ class KuFlowActivities:
             )
         except Exception as err:
             raise create_application_error(err)  # noqa: B904
+
+    async def _invoke(self, operation: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        # The REST calls, with their retries, end before Temporal times the activity out
+        with deadline(_activity_time_left()):
+            if inspect.iscoroutinefunction(operation):
+                return await operation(*args, **kwargs)
+
+            # Run the blocking call in the executor, keeping the context vars (ie: activity info) of the caller
+            context = contextvars.copy_context()
+            loop = asyncio.get_running_loop()
+
+            return await loop.run_in_executor(
+                self._executor, functools.partial(context.run, operation, *args, **kwargs)
+            )
+
+
+def _activity_time_left() -> Optional[float]:
+    """Return the seconds that the REST calls of the current activity can take, None without timeouts.
+
+    It is the time left to the start to close and schedule to close timeouts, and at most the heartbeat timeout,
+    because the activities do not heartbeat while a REST call is in flight.
+    """
+    if not activity.in_activity():
+        return None
+
+    info = activity.info()
+    now = datetime.now(timezone.utc)
+    limits = []
+    if info.start_to_close_timeout:
+        limits.append((info.started_time + info.start_to_close_timeout - now).total_seconds())
+    if info.schedule_to_close_timeout:
+        limits.append((info.scheduled_time + info.schedule_to_close_timeout - now).total_seconds())
+    if info.heartbeat_timeout:
+        limits.append(info.heartbeat_timeout.total_seconds())
+    if not limits:
+        return None
+
+    time_left = min(limits)
+
+    return time_left - min(_DEADLINE_MARGIN, time_left * 0.1)
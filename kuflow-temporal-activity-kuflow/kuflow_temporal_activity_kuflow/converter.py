@@ -40,7 +40,12 @@ from . import models as models_temporal
 class KuFlowComposableEncodingPayloadConverter(EncodingPayloadConverter):
     def __init__(self, default_json_converter=JSONPlainPayloadConverter()) -> None:
         self._default_json_converter = default_json_converter
-        client_models_rest = {k: v for k, v in models_rest.__dict__.items() if isinstance(v, type)}
+        # Models of kuflow_rest are imported on first access, so they are not in its __dict__ yet
+        client_models_rest = {
+            name: getattr(models_rest, name)
+            for name in models_rest.__all__
+            if isinstance(getattr(models_rest, name), type)
+        }
         client_models_temporal = {k: v for k, v in models_temporal.__dict__.items() if isinstance(v, type)}
         client_models = {**client_models_rest, **client_models_temporal}
         self._serialize = Serializer(client_models)
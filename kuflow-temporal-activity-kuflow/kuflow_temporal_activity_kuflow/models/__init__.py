@@ -163,5 +163,6 @@ from kuflow_temporal_common import register_serializable_models
 from .. import models as models_activity
 
 
-register_serializable_models(models_rest.__dict__)
+# kuflow_rest.models imports its models on first access, its __dict__ only has the ones already imported
+register_serializable_models({name: getattr(models_rest, name) for name in models_rest.__all__})
 register_serializable_models(models_activity.__dict__)
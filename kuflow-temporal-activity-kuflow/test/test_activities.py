@@ -0,0 +1,183 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import asyncio
+import dataclasses
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from temporalio.testing import ActivityEnvironment
+
+from kuflow_rest import KuFlowRestClient, models
+from kuflow_rest.policies import remaining_time
+from kuflow_temporal_activity_kuflow import KuFlowActivities
+from kuflow_temporal_activity_kuflow import models as models_temporal
+
+
+def create_process(id: str) -> models.Process:
+    return models.Process(id=id, tenant_id="tenant", process_definition_ref=None, state="RUNNING")
+
+
+class BlockingProcessOperations:
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self.threads: set[str] = set()
+
+    def retrieve_process(self, id: str, **kwargs) -> models.Process:
+        self.threads.add(threading.current_thread().name)
+        time.sleep(self.delay)
+        return create_process(id)
+
+
+class AsyncProcessOperations:
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+
+    async def retrieve_process(self, id: str, **kwargs) -> models.Process:
+        await asyncio.sleep(self.delay)
+        return create_process(id)
+
+
+class AsyncClient:
+    def __init__(self, delay: float) -> None:
+        self.process = AsyncProcessOperations(delay)
+
+
+class DeadlineRecordingProcessOperations:
+    def __init__(self) -> None:
+        self.remaining_time: Optional[float] = None
+
+    def retrieve_process(self, id: str, **kwargs) -> models.Process:
+        self.remaining_time = remaining_time()
+        return create_process(id)
+
+
+class KuFlowActivitiesConcurrencyTest(unittest.IsolatedAsyncioTestCase):
+    async def retrieve_processes(self, activities: KuFlowActivities, count: int) -> tuple[list[str], float]:
+        requests = [models_temporal.ProcessRetrieveRequest(process_id=str(i)) for i in range(count)]
+
+        start = time.monotonic()
+        responses = await asyncio.gather(*[activities.retrieve_process(request) for request in requests])
+        elapsed = time.monotonic() - start
+
+        return [response.process.id for response in responses], elapsed
+
+    async def test_sync_client_calls_are_offloaded(self):
+        kuflow_client = KuFlowRestClient(client_id="id", client_secret="secret")
+        kuflow_client.process = BlockingProcessOperations(delay=0.2)
+        activities = KuFlowActivities(kuflow_client)
+
+        ids, elapsed = await self.retrieve_processes(activities, 10)
+
+        self.assertEqual(ids, [str(i) for i in range(10)])
+        self.assertLess(elapsed, 1)
+        self.assertNotIn(threading.current_thread().name, kuflow_client.process.threads)
+
+    async def test_default_executor_is_bounded_and_closed(self):
+        kuflow_client = KuFlowRestClient(client_id="id", client_secret="secret")
+        kuflow_client.process = BlockingProcessOperations(delay=0.2)
+
+        with KuFlowActivities(kuflow_client, max_workers=2) as activities:
+            ids, elapsed = await self.retrieve_processes(activities, 4)
+
+        self.assertEqual(ids, [str(i) for i in range(4)])
+        self.assertGreaterEqual(elapsed, 0.4)
+        self.assertEqual(len(kuflow_client.process.threads), 2)
+        with self.assertRaises(RuntimeError):
+            activities._executor.submit(time.sleep, 0)
+
+    async def test_provided_executor_is_not_closed(self):
+        kuflow_client = KuFlowRestClient(client_id="id", client_secret="secret")
+        kuflow_client.process = BlockingProcessOperations(delay=0)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with KuFlowActivities(kuflow_client, executor=executor) as activities:
+                await self.retrieve_processes(activities, 1)
+
+            self.assertEqual(executor.submit(lambda: "still open").result(), "still open")
+
+    async def test_async_client_calls_are_awaited(self):
+        activities = KuFlowActivities(AsyncClient(delay=0.2))
+
+        ids, elapsed = await self.retrieve_processes(activities, 50)
+
+        self.assertEqual(ids, [str(i) for i in range(50)])
+        self.assertLess(elapsed, 1)
+
+
+class KuFlowActivitiesDeadlineTest(unittest.IsolatedAsyncioTestCase):
+    def create_environment(self, **timeouts: Optional[timedelta]) -> ActivityEnvironment:
+        now = datetime.now(timezone.utc)
+        environment = ActivityEnvironment()
+        environment.info = dataclasses.replace(
+            environment.info,
+            scheduled_time=now,
+            started_time=now,
+            **{
+                "schedule_to_close_timeout": None,
+                "start_to_close_timeout": None,
+                "heartbeat_timeout": None,
+                **timeouts,
+            },
+        )
+
+        return environment
+
+    async def retrieve_process(self, environment: ActivityEnvironment) -> Optional[float]:
+        kuflow_client = KuFlowRestClient(client_id="id", client_secret="secret")
+        kuflow_client.process = DeadlineRecordingProcessOperations()
+        activities = KuFlowActivities(kuflow_client)
+
+        await environment.run(activities.retrieve_process, models_temporal.ProcessRetrieveRequest(process_id="1"))
+
+        return kuflow_client.process.remaining_time
+
+    async def test_rest_calls_end_before_the_activity_timeout(self):
+        environment = self.create_environment(start_to_close_timeout=timedelta(seconds=20))
+
+        time_left = await self.retrieve_process(environment)
+
+        self.assertGreater(time_left, 18)
+        self.assertLessEqual(time_left, 19)
+
+    async def test_rest_calls_end_before_the_heartbeat_timeout(self):
+        environment = self.create_environment(
+            start_to_close_timeout=timedelta(days=1), heartbeat_timeout=timedelta(seconds=5)
+        )
+
+        time_left = await self.retrieve_process(environment)
+
+        self.assertGreater(time_left, 4)
+        self.assertLessEqual(time_left, 4.5)
+
+    async def test_rest_calls_without_activity_timeouts_have_no_deadline(self):
+        self.assertIsNone(await self.retrieve_process(self.create_environment()))
+
+
+if __name__ == "__main__":
+    unittest.main()
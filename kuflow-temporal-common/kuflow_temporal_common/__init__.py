@@ -24,6 +24,7 @@
 
 from ._auto_heartbeater import auto_heartbeater
 from ._converter import (
+    KuFlowJSONPlainPayloadConverter,
     KuFlowModelJSONEncoder,
     KuFlowModelJSONTypeConverter,
     register_serializable_models,
@@ -35,6 +36,7 @@ __all__ = [
     "auto_heartbeater",
     "create_application_error",
     "KuFlowFailureType",
+    "KuFlowJSONPlainPayloadConverter",
     "KuFlowModelJSONEncoder",
     "KuFlowModelJSONTypeConverter",
     "register_serializable_models",
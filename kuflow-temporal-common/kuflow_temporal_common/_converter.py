@@ -22,15 +22,21 @@
 # SOFTWARE.
 #
 
+import json
+from collections.abc import Sequence
 from typing import Any, Optional, Union
 
+from temporalio.api.common.v1 import Payload
 from temporalio.converter import (
     AdvancedJSONEncoder,
+    JSONPlainPayloadConverter,
     JSONTypeConverter,
     _JSONTypeConverterUnhandled,
+    value_to_type,
 )
 
 from kuflow_rest import Deserializer, Model, Serializer
+from kuflow_rest.utils import JsonBackend, get_json_backend
 
 
 temporal_models: dict[str, type] = {}
@@ -68,3 +74,51 @@ class KuFlowModelJSONTypeConverter(JSONTypeConverter):
 
         # Means: continue with defaults one. See: temporalio#converter.py#value_to_type
         return JSONTypeConverter.Unhandled
+
+
+class KuFlowJSONPlainPayloadConverter(JSONPlainPayloadConverter):
+    """'json/plain' payload converter that supports KuFlow models and a pluggable JSON backend.
+
+    With the default JSON backend it behaves as a ``JSONPlainPayloadConverter`` configured with the KuFlow encoder
+    and type converter. The orjson backend writes the same payload bytes, so workers using different backends can
+    exchange payloads and workflow histories replay the same way.
+    """
+
+    def __init__(
+        self,
+        *,
+        json_backend: Union[str, JsonBackend, None] = None,
+        encoder: Optional[type[json.JSONEncoder]] = KuFlowModelJSONEncoder,
+        decoder: Optional[type[json.JSONDecoder]] = None,
+        encoding: str = "json/plain",
+        custom_type_converters: Optional[Sequence[JSONTypeConverter]] = None,
+    ) -> None:
+        if custom_type_converters is None:
+            custom_type_converters = [KuFlowModelJSONTypeConverter()]
+        super().__init__(
+            encoder=encoder, decoder=decoder, encoding=encoding, custom_type_converters=custom_type_converters
+        )
+        self._json_backend = get_json_backend(json_backend)
+
+    def to_payload(self, value: Any) -> Optional[Payload]:
+        if hasattr(value, "parse_obj"):
+            # Pydantic v1 models: keep the warning of the base class
+            return super().to_payload(value)
+
+        return Payload(
+            metadata={"encoding": self.encoding.encode()},
+            data=self._json_backend.dumps(value, encoder=self._encoder, sort_keys=True),
+        )
+
+    def from_payload(self, payload: Payload, type_hint: Optional[type] = None) -> Any:
+        if self._decoder is not None:
+            return super().from_payload(payload, type_hint)
+
+        try:
+            obj = self._json_backend.loads(payload.data)
+        except ValueError as err:
+            raise RuntimeError("Failed parsing") from err
+        if type_hint:
+            obj = value_to_type(type_hint, obj, self._custom_type_converters)
+
+        return obj
@@ -22,17 +22,22 @@
 # SOFTWARE.
 #
 
+from datetime import timedelta
 from enum import Enum
 
 from azure.core.exceptions import HttpResponseError
 from temporalio.exceptions import ApplicationError
 
+from kuflow_rest.policies import CircuitBreakerOpenError
+
 
 class KuFlowFailureType(str, Enum):
     ACTIVITIES_FAILURE = "KuFlowActivities.Failure"
 
     ACTIVITIES_REST_FAILURE = "KuFlowActivities.RestFailure"
 
+    ACTIVITIES_REST_CIRCUIT_OPEN = "KuFlowActivities.RestCircuitOpen"
+
     ACTIVITIES_VALIDATION_FAILURE = "KuFlowActivities.ValidationFailure"
 
 
@@ -41,7 +46,15 @@ def create_application_error(e: Exception) -> ApplicationError:
         return e
 
     error: ApplicationError
-    if isinstance(e, HttpResponseError):
+    if isinstance(e, CircuitBreakerOpenError):
+        # Retried by Temporal once the circuit breaker lets requests through again
+        error = ApplicationError(
+            "Rest circuit open",
+            e,
+            type=KuFlowFailureType.ACTIVITIES_REST_CIRCUIT_OPEN,
+            next_retry_delay=timedelta(seconds=e.retry_after),
+        )
+    elif isinstance(e, HttpResponseError):
         error = ApplicationError("Rest Invocation error", e, type=KuFlowFailureType.ACTIVITIES_REST_FAILURE)
     else:
         error = ApplicationError("Invocation error", e, type=KuFlowFailureType.ACTIVITIES_FAILURE)
@@ -34,6 +34,7 @@ from temporalio.converter import JSONPlainPayloadConverter
 from kuflow_rest import Model
 from kuflow_rest import models as models_rest
 from kuflow_temporal_common._converter import (
+    KuFlowJSONPlainPayloadConverter,
     KuFlowModelJSONEncoder,
     KuFlowModelJSONTypeConverter,
     register_serializable_models,
@@ -159,7 +160,7 @@ class TestKuFlowModelRoundTrip:
     @pytest.fixture(autouse=True)
     def _register_models(self):
         # Models must be registered before the converter is constructed (it captures them in __init__).
-        register_serializable_models(models_rest.__dict__)
+        register_serializable_models({name: getattr(models_rest, name) for name in models_rest.__all__})
 
     @pytest.fixture
     def converter(self):
@@ -200,3 +201,51 @@ class TestKuFlowModelRoundTrip:
             process_definition_ref=process_definition_ref,
             state="RUNNING",
         )
+
+
+class TestKuFlowJSONPlainPayloadConverter:
+    """The orjson backend must write the same payloads as the standard library one"""
+
+    @pytest.fixture(autouse=True)
+    def _register_models(self):
+        register_serializable_models({name: getattr(models_rest, name) for name in models_rest.__all__})
+
+    @pytest.fixture(params=["json", "orjson"])
+    def converter(self, request):
+        return KuFlowJSONPlainPayloadConverter(json_backend=request.param)
+
+    @pytest.fixture
+    def reference_converter(self):
+        return JSONPlainPayloadConverter(
+            encoder=KuFlowModelJSONEncoder,
+            custom_type_converters=[KuFlowModelJSONTypeConverter()],
+        )
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            {"name": "Ñandú 😀", "b": 1, "a": [1.5, 1e16, None, True]},
+            [UUID("12345678-1234-5678-1234-567812345678")],
+            SampleEnum.VALUE_ONE,
+            b"Hello, World!",
+        ],
+    )
+    def test_same_payload_as_json_plain_payload_converter(self, converter, reference_converter, value):
+        assert converter.to_payload(value) == reference_converter.to_payload(value)
+
+    def test_process_model_roundtrip(self, converter, reference_converter):
+        original = TestKuFlowModelRoundTrip._build_process()
+
+        payload = converter.to_payload(original)
+        result = converter.from_payload(payload, models_rest.Process)
+
+        assert payload == reference_converter.to_payload(original)
+        assert isinstance(result, models_rest.Process)
+        assert result.process_definition_ref.code == original.process_definition_ref.code
+
+    def test_invalid_payload(self, converter, reference_converter):
+        payload = reference_converter.to_payload("value")
+        payload.data = b"{"
+
+        with pytest.raises(RuntimeError, match="Failed parsing"):
+            converter.from_payload(payload, str)
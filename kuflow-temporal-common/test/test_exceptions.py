@@ -0,0 +1,62 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+from datetime import timedelta
+
+from azure.core.exceptions import HttpResponseError
+from temporalio.exceptions import ApplicationError
+
+from kuflow_rest.policies import CircuitBreakerOpenError
+from kuflow_temporal_common import KuFlowFailureType, create_application_error
+
+
+class TestCreateApplicationError:
+    def test_application_error_is_returned(self):
+        error = ApplicationError("Error", non_retryable=True)
+
+        assert create_application_error(error) is error
+
+    def test_rest_error(self):
+        cause = HttpResponseError("Not found")
+
+        error = create_application_error(cause)
+
+        assert error.type == KuFlowFailureType.ACTIVITIES_REST_FAILURE
+        assert error.__cause__ is cause
+        assert not error.non_retryable
+
+    def test_open_circuit_error_is_retried_when_the_circuit_allows_it(self):
+        cause = CircuitBreakerOpenError("GET /v2024-06-14/processes/{id}", 12.5)
+
+        error = create_application_error(cause)
+
+        assert error.type == KuFlowFailureType.ACTIVITIES_REST_CIRCUIT_OPEN
+        assert error.next_retry_delay == timedelta(seconds=12.5)
+        assert error.__cause__ is cause
+        assert not error.non_retryable
+
+    def test_other_error(self):
+        error = create_application_error(ValueError("Invalid"))
+
+        assert error.type == KuFlowFailureType.ACTIVITIES_FAILURE
@@ -63,24 +63,24 @@ async def main():
         allow_insecure_connection=True,
     )
 
-    kuflow_activities = KuFlowActivities(kuflow_rest_client)
-
-    kuflow_temporal_connection = KuFlowTemporalConnection(
-        kuflow=KuFlowConfig(rest_client=kuflow_rest_client),
-        temporal=TemporalConfig(
-            client=TemporalClientConfig(
-                target_host=temporal_host,
-            ),
-            worker=TemporalWorkerConfig(
-                task_queue=temporal_queue,
-                workflows=[SampleEngineWorkerLoanWorkflow],
-                activities=kuflow_activities.activities,
-                debug_mode=True,
+    # The activities shut down the threads that run their REST calls when the worker stops
+    with KuFlowActivities(kuflow_rest_client) as kuflow_activities:
+        kuflow_temporal_connection = KuFlowTemporalConnection(
+            kuflow=KuFlowConfig(rest_client=kuflow_rest_client),
+            temporal=TemporalConfig(
+                client=TemporalClientConfig(
+                    target_host=temporal_host,
+                ),
+                worker=TemporalWorkerConfig(
+                    task_queue=temporal_queue,
+                    workflows=[SampleEngineWorkerLoanWorkflow],
+                    activities=kuflow_activities.activities,
+                    debug_mode=True,
+                ),
             ),
-        ),
-    )
+        )
 
-    await kuflow_temporal_connection.run_worker()
+        await kuflow_temporal_connection.run_worker()
 
 
 if __name__ == "__main__":
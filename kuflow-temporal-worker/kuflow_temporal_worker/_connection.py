@@ -23,6 +23,7 @@
 #
 
 import dataclasses
+import functools
 from typing import Optional
 
 import temporalio.activity
@@ -34,10 +35,7 @@ from temporalio.client import Client, TLSConfig
 from temporalio.worker import Worker
 
 from kuflow_rest import models
-from kuflow_temporal_common import (
-    KuFlowModelJSONEncoder,
-    KuFlowModelJSONTypeConverter,
-)
+from kuflow_temporal_common import KuFlowJSONPlainPayloadConverter
 
 from ._authentication import KuFlowAuthorizationTokenProvider
 from ._connection_config import (
@@ -85,9 +83,12 @@ class KuFlowTemporalConnection:
 
         client_config = self._temporal.client.__dict__.copy()
         client_config.pop("target_host", None)
+        payload_converter_class = KuFlowConverterClass
+        if self._kuflow.json_backend is not None:
+            payload_converter_class = functools.partial(KuFlowConverterClass, json_backend=self._kuflow.json_backend)
         client_config["data_converter"] = dataclasses.replace(
             temporalio.converter.DataConverter.default,
-            payload_converter_class=KuFlowConverterClass,
+            payload_converter_class=payload_converter_class,
             payload_codec=KuFlowEncryptionPayloadCodec(
                 rest_client=self._kuflow.rest_client,
             ),
@@ -174,15 +175,11 @@ class KuFlowTemporalConnection:
 
 
 class KuFlowConverterClass(temporalio.converter.CompositePayloadConverter):
-    def __init__(self) -> None:
+    def __init__(self, json_backend: Optional[str] = None) -> None:
         super().__init__(
             temporalio.converter.BinaryNullPayloadConverter(),
             temporalio.converter.BinaryPlainPayloadConverter(),
             temporalio.converter.JSONProtoPayloadConverter(),
             temporalio.converter.BinaryProtoPayloadConverter(),
-            KuFlowEncryptionPayloadConverter(
-                delegate=temporalio.converter.JSONPlainPayloadConverter(
-                    encoder=KuFlowModelJSONEncoder, custom_type_converters=[KuFlowModelJSONTypeConverter()]
-                )
-            ),
+            KuFlowEncryptionPayloadConverter(delegate=KuFlowJSONPlainPayloadConverter(json_backend=json_backend)),
         )
@@ -92,6 +92,11 @@ class KuFlowConfig:
     tenant_id: Optional[list[str]] = None
     """Tenant ids"""
 
+    json_backend: Optional[str] = None
+    """JSON implementation used by the Temporal payload converter: "json" (default) for the standard library or
+    "orjson", which requires the ``orjson`` package. Both write the same payloads. To use it in the REST calls too,
+    pass the same value to the ``KuFlowRestClient``."""
+
 
 @dataclass
 class TemporalClientConfig:
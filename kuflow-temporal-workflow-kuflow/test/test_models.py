@@ -0,0 +1,57 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 KuFlow
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import subprocess
+import sys
+import textwrap
+
+
+def test_rest_models_round_trip_in_a_new_process():
+    # kuflow_rest.models imports its models on first access, Process must be registered without being imported
+    code = textwrap.dedent(
+        """
+        from temporalio.converter import JSONPlainPayloadConverter
+
+        import kuflow_temporal_workflow_kuflow.models
+        from kuflow_rest import models
+        from kuflow_temporal_common import KuFlowModelJSONEncoder, KuFlowModelJSONTypeConverter
+
+        converter = JSONPlainPayloadConverter(
+            encoder=KuFlowModelJSONEncoder, custom_type_converters=[KuFlowModelJSONTypeConverter()]
+        )
+        process = models.Process(
+            id="11111111-1111-1111-1111-111111111111",
+            tenant_id="22222222-2222-2222-2222-222222222222",
+            process_definition_ref=models.ProcessDefinitionRef(
+                id="33333333-3333-3333-3333-333333333333", version="1", code="CODE"
+            ),
+            state="RUNNING",
+        )
+        result = converter.from_payload(converter.to_payload(process), models.Process)
+        assert isinstance(result, models.Process), result
+        assert str(result.process_definition_ref.id) == "33333333-3333-3333-3333-333333333333"
+        """
+    )
+
+    subprocess.run([sys.executable, "-c", code], check=True)